@@ -0,0 +1,4 @@
+"""KOSIS 적재 경로 벤치마크 — 합성 KOSIS 페이로드 생성기 + 단계별 처리량 측정.
+
+실행: ``python -m benchmarks.run_bench --cells 1000,100000 [--db]`` (README "벤치마크" 참고)
+"""
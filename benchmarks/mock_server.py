@@ -0,0 +1,369 @@
+"""로컬 외부 API 모의 서버 — KOSIS(data/meta/latest) + GBIS/KORAIL_CONV/KOWSI_FACL/TOUR_BF_API.
+
+HTTP 경로(동시성·레이트리밋·재시도)를 오프라인으로 부하 측정하기 위한 서버다.
+실제 응답과 같은 구조(키·XML 태그·페이징 필드)를 합성해서 돌려주며, 라우팅은
+호스트/접두 경로와 무관하게 마지막 경로 조각(오퍼레이션명)과 KOSIS method/type 파라미터로 한다.
+
+사용:
+    python -m benchmarks.mock_server --port 8765 --latency-ms 80 --latency-dist exp \\
+        --rate-429 0.02 --rate-5xx 0.01 --payload-scale 2
+
+수집기 연결:
+- 이동편의: ``GBIS_BASE_URL=http://127.0.0.1:8765/6410000`` (KORAIL_CONV / KOWSI_FACL /
+  TOUR_BF_API 도 ``<EXT_SYS>_BASE_URL``), API 키는 아무 값(``DATA_GO_KR_API_KEY=mock``)
+- KOSIS: ``sys_ext_api_info.ext_url`` 을 ``http://127.0.0.1:8765`` 로 두고 통계표 URL 템플릿을
+  base 경로 기준(use_base_url_yn='Y')으로 쓰거나, 템플릿 호스트를 모의 서버로 바꾼다.
+
+KOSIS 동작:
+- method=getList : 통계자료. startPrdDe~endPrdDe 가 --kosis-max-years 를 넘으면 {"err": "31"}
+- method=getMeta&type=NCD : 최신 변경일 [{"SendDe": ...}]
+- method=getMeta (그 외) : 메타 XML(MetaRow)
+
+``GET /__stats`` 는 오퍼레이션/상태코드별 요청 수를 JSON 으로 돌려준다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks import synthetic  # noqa: E402
+
+LATENCY_DISTS = ('fixed', 'uniform', 'exp', 'lognormal')
+
+DEFAULT_CONFIG = {
+    'latency_ms': 0.0,
+    'latency_dist': 'fixed',
+    'rate_429': 0.0,
+    'rate_5xx': 0.0,
+    'payload_scale': 1.0,
+    'seed': 0,
+    'kosis_max_years': 5,
+    'kosis_cells_per_year': 2000,
+    'gbis_routes': 40,
+    'gbis_stations_per_route': 20,
+    'korail_stations': 300,
+    'kowsi_facilities': 5000,
+    'tour_items': 30,
+}
+
+
+def _scaled(config, key):
+    return max(1, int(config[key] * config['payload_scale']))
+
+
+class MockState:
+    """설정 + 요청 통계 + 난수원 (핸들러 스레드 공유)."""
+
+    def __init__(self, config=None):
+        self.config = dict(DEFAULT_CONFIG)
+        self.config.update(config or {})
+        if self.config['latency_dist'] not in LATENCY_DISTS:
+            raise ValueError(f"latency_dist 는 {LATENCY_DISTS} 중 하나여야 합니다")
+        self._rnd = random.Random(self.config['seed'])
+        self._lock = threading.Lock()
+        self.stats = {}
+
+    def record(self, op, status):
+        with self._lock:
+            key = f'{op}:{status}'
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def latency_sec(self):
+        mean = self.config['latency_ms'] / 1000.0
+        if mean <= 0:
+            return 0.0
+        dist = self.config['latency_dist']
+        with self._lock:
+            if dist == 'uniform':
+                return self._rnd.uniform(0, 2 * mean)
+            if dist == 'exp':
+                return self._rnd.expovariate(1.0 / mean)
+            if dist == 'lognormal':
+                # 평균이 mean 이 되도록 sigma=1 로그정규 — 긴 꼬리 지연 재현
+                return self._rnd.lognormvariate(math.log(mean) - 0.5, 1.0)
+        return mean
+
+    def fault(self):
+        """주입할 오류 상태코드 또는 None."""
+        with self._lock:
+            roll = self._rnd.random()
+        if roll < self.config['rate_429']:
+            return 429
+        if roll < self.config['rate_429'] + self.config['rate_5xx']:
+            return 503
+        return None
+
+
+# --- KOSIS ------------------------------------------------------------------
+def kosis_data(state, q):
+    try:
+        start = int(str(q.get('startPrdDe', ['2016'])[0])[:4])
+        end = int(str(q.get('endPrdDe', ['2025'])[0])[:4])
+    except ValueError:
+        return 200, 'json', {'err': '20', 'errMsg': '필수요청변수값이 누락되었습니다.'}
+    if end - start + 1 > state.config['kosis_max_years']:
+        return 200, 'json', {'err': '31', 'errMsg': '조회결과가 많습니다. 조회기간을 줄여주세요.'}
+    tbl_id = q.get('tblId', [synthetic.DEFAULT_TBL_ID])[0]
+    per_year = _scaled(state.config, 'kosis_cells_per_year')
+    rows = []
+    for year in range(start, end + 1):
+        rows.extend(synthetic.iter_data_rows(per_year, tbl_id=tbl_id, seed=year, start_year=year, periods=1))
+    return 200, 'json', rows
+
+
+def kosis_meta(state, q):
+    if q.get('type', [''])[0].upper() == 'NCD':
+        return 200, 'json', synthetic.make_latest(tbl_id=q.get('tblId', [synthetic.DEFAULT_TBL_ID])[0])
+    cells = _scaled(state.config, 'kosis_cells_per_year')
+    return 200, 'xml', synthetic.make_meta_xml(cells, periods=1)
+
+
+# --- data.go.kr 공통 -----------------------------------------------------------
+def _page(q, default_rows):
+    page_no = max(1, int(q.get('pageNo', ['1'])[0] or 1))
+    num_rows = max(1, int(q.get('numOfRows', [str(default_rows)])[0] or default_rows))
+    return page_no, num_rows
+
+
+def _paged_body(items, total):
+    return {'response': {
+        'header': {'resultCode': '00', 'resultMsg': 'NORMAL SERVICE.'},
+        'body': {'items': {'item': items}, 'totalCount': total},
+    }}
+
+
+# --- GBIS ---------------------------------------------------------------------
+def _gbis(body):
+    return {'response': {'msgHeader': {'resultCode': 0}, 'msgBody': body}}
+
+
+def gbis_route_list(state, q):
+    keyword = q.get('keyword', ['0'])[0]
+    routes = _scaled(state.config, 'gbis_routes')
+    items = [
+        {'routeId': 200000000 + i, 'routeName': str(i), 'regionName': '안양' if i % 2 == 0 else '수원'}
+        for i in range(routes) if keyword in str(i)
+    ]
+    return 200, 'json', _gbis({'busRouteList': items})
+
+
+def gbis_route_info(state, q):
+    rid = int(q.get('routeId', ['200000000'])[0])
+    return 200, 'json', _gbis({'busRouteInfoItem': {
+        'routeId': rid, 'routeName': str(rid - 200000000), 'routeTypeCd': 13, 'routeTypeName': '일반형시내버스',
+        'regionName': '안양', 'adminName': '안양시', 'startStationId': 1, 'startStationName': '기점',
+        'endStationId': 2, 'endStationName': '종점', 'companyName': '모의운수', 'peekAlloc': 10,
+        'nPeekAlloc': 15, 'upFirstTime': '05:30', 'upLastTime': '23:00',
+    }})
+
+
+def gbis_route_stations(state, q):
+    rid = int(q.get('routeId', ['200000000'])[0])
+    per_route = _scaled(state.config, 'gbis_stations_per_route')
+    items = [
+        {'stationId': 210000000 + (rid + s) % 5000, 'stationSeq': s + 1, 'stationName': f'정류장{s}',
+         'mobileNo': f' {s:05d}', 'regionName': '안양', 'x': 126.95 + s * 1e-4, 'y': 37.39 + s * 1e-4,
+         'centerYn': 'N', 'turnYn': 'N', 'turnSeq': per_route // 2}
+        for s in range(per_route)
+    ]
+    return 200, 'json', _gbis({'busRouteStationList': items})
+
+
+# --- KORAIL_CONV --------------------------------------------------------------
+def korail_facilities(op):
+    def handler(state, q):
+        total = _scaled(state.config, 'korail_stations')
+        page_no, num_rows = _page(q, 500)
+        start = (page_no - 1) * num_rows
+        items = []
+        for i in range(start, min(total, start + num_rows)):
+            item = {'stn_cd': f'S{i:04d}', 'stn_nm': '안양' if i == 0 else f'역{i}'}
+            if op == 'stationFacilities':
+                item.update({'elevt_cnt': i % 4, 'esclt_cnt': i % 3, 'gen_tolt_estnc': 'Y'})
+            else:
+                item.update({'whlch_liftt_cnt': i % 2, 'pwdbs_slwy_estnc': 'Y', 'pwdbs_tolt_estnc': 'N'})
+            items.append(item)
+        return 200, 'json', _paged_body(items, total)
+    return handler
+
+
+# --- KOWSI_FACL ---------------------------------------------------------------
+def kowsi_list(state, q):
+    total = _scaled(state.config, 'kowsi_facilities')
+    page_no, num_rows = _page(q, 1000)
+    start = (page_no - 1) * num_rows
+    parts = ['<?xml version="1.0" encoding="UTF-8"?><facInfoList>',
+             '<resultCode>0</resultCode><resultMessage>SUCCESS</resultMessage>',
+             f'<totalCount>{total}</totalCount>']
+    for i in range(start, min(total, start + num_rows)):
+        city = '안양시' if i % 10 == 0 else '수원시'
+        parts.append(
+            '<servList>'
+            f'<faclInfId>F{i:07d}</faclInfId><faclNm>{escape(f"시설{i}")}</faclNm><faclTyCd>UC0B01</faclTyCd>'
+            f'<lcMnad>{escape(f"경기도 {city} 모의로 {i}")}</lcMnad>'
+            f'<faclLat>{37.39 + i * 1e-5:.6f}</faclLat><faclLng>{126.95 + i * 1e-5:.6f}</faclLng>'
+            f'<estbDate>20200101</estbDate><wfcltId>W{i:07d}</wfcltId>'
+            '</servList>'
+        )
+    parts.append('</facInfoList>')
+    return 200, 'xml', ''.join(parts)
+
+
+def kowsi_eval(state, q):
+    return 200, 'xml', (
+        '<?xml version="1.0" encoding="UTF-8"?><facInfoList><resultCode>0</resultCode>'
+        '<servList><evalInfo>승강기,장애인사용가능화장실</evalInfo></servList></facInfoList>'
+    )
+
+
+# --- TOUR_BF_API --------------------------------------------------------------
+def tour_area_list(state, q):
+    total = _scaled(state.config, 'tour_items')
+    page_no, num_rows = _page(q, 100)
+    start = (page_no - 1) * num_rows
+    items = [
+        {'contentid': str(100000 + i), 'title': f'관광지{i}', 'addr1': '경기도 안양시', 'addr2': '',
+         'mapx': f'{126.95 + i * 1e-4:.6f}', 'mapy': f'{37.39 + i * 1e-4:.6f}'}
+        for i in range(start, min(total, start + num_rows))
+    ]
+    return 200, 'json', _paged_body(items, total)
+
+
+def tour_detail(state, q):
+    return 200, 'json', _paged_body({
+        'contentid': q.get('contentId', [''])[0], 'restroom': '장애인 화장실 있음', 'elevator': '없음',
+        'parking': '장애인 주차구역 있음', 'publictransport': '지하철 1호선, 버스',
+    }, 1)
+
+
+OPERATIONS = {
+    'getBusRouteListv2': gbis_route_list,
+    'getBusRouteInfoItemv2': gbis_route_info,
+    'getBusRouteStationListv2': gbis_route_stations,
+    'stationFacilities': korail_facilities('stationFacilities'),
+    'weekPersonFacilities': korail_facilities('weekPersonFacilities'),
+    'getDisConvFaclList': kowsi_list,
+    'getFacInfoOpenApiJpEvalInfoList': kowsi_eval,
+    'areaBasedList2': tour_area_list,
+    'detailWithTour2': tour_detail,
+}
+
+
+def resolve_operation(path, q):
+    """(op 이름, 핸들러). KOSIS 는 method 파라미터, 그 외는 마지막 경로 조각으로 찾는다."""
+    method = q.get('method', [''])[0]
+    if method == 'getList':
+        return 'kosis.getList', kosis_data
+    if method == 'getMeta':
+        return 'kosis.getMeta.' + (q.get('type', ['ITM'])[0] or 'ITM').upper(), kosis_meta
+    op = path.rstrip('/').rsplit('/', 1)[-1]
+    return op, OPERATIONS.get(op)
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    server_version = 'KosisMock/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, fmt, *args):  # 요청마다 stderr 출력하지 않음(부하 측정 왜곡 방지)
+        pass
+
+    def _send(self, status, kind, body):
+        if kind == 'json':
+            payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            ctype = 'application/json;charset=UTF-8'
+        else:
+            payload = str(body).encode('utf-8')
+            ctype = 'text/xml;charset=UTF-8' if kind == 'xml' else 'text/plain;charset=UTF-8'
+        self.send_response(status)
+        self.send_header('Content-Type', ctype)
+        self.send_header('Content-Length', str(len(payload)))
+        if status == 429:
+            self.send_header('Retry-After', '1')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        state = self.server.state
+        parts = urlsplit(self.path)
+        if parts.path == '/__stats':
+            self._send(200, 'json', state.stats)
+            return
+        q = parse_qs(parts.query)
+        op, handler = resolve_operation(parts.path, q)
+        delay = state.latency_sec()
+        if delay:
+            time.sleep(delay)
+        if handler is None:
+            state.record(op, 404)
+            self._send(404, 'text', f'unknown operation: {op}')
+            return
+        fault = state.fault()
+        if fault:
+            state.record(op, fault)
+            self._send(fault, 'text', 'LIMITED NUMBER OF SERVICE REQUESTS EXCEEDS ERROR.'
+                       if fault == 429 else 'SERVICE UNAVAILABLE')
+            return
+        status, kind, body = handler(state, q)
+        state.record(op, status)
+        self._send(status, kind, body)
+
+
+def start_server(config=None, host='127.0.0.1', port=0):
+    """모의 서버를 백그라운드 스레드로 띄운다. 반환: (server, base_url). 종료는 server.shutdown()."""
+    server = ThreadingHTTPServer((host, port), MockHandler)
+    server.daemon_threads = True
+    server.state = MockState(config)
+    thread = threading.Thread(target=server.serve_forever, name='kosis-mock', daemon=True)
+    thread.start()
+    return server, f'http://{host}:{server.server_address[1]}'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='KOSIS / data.go.kr 로컬 모의 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', dest='latency_ms', type=float, default=DEFAULT_CONFIG['latency_ms'],
+                        help='평균 응답 지연(ms)')
+    parser.add_argument('--latency-dist', dest='latency_dist', choices=LATENCY_DISTS,
+                        default=DEFAULT_CONFIG['latency_dist'], help='지연 분포')
+    parser.add_argument('--rate-429', dest='rate_429', type=float, default=0.0, help='429 응답 비율(0~1)')
+    parser.add_argument('--rate-5xx', dest='rate_5xx', type=float, default=0.0, help='503 응답 비율(0~1)')
+    parser.add_argument('--payload-scale', dest='payload_scale', type=float, default=1.0,
+                        help='모든 응답 건수 배율')
+    parser.add_argument('--seed', type=int, default=0)
+    for key in ('kosis_max_years', 'kosis_cells_per_year', 'gbis_routes', 'gbis_stations_per_route',
+                'korail_stations', 'kowsi_facilities', 'tour_items'):
+        parser.add_argument('--' + key.replace('_', '-'), dest=key, type=int, default=DEFAULT_CONFIG[key])
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = vars(parse_args(argv))
+    host, port = args.pop('host'), args.pop('port')
+    server = ThreadingHTTPServer((host, port), MockHandler)
+    server.daemon_threads = True
+    server.state = MockState(args)
+    print(f'mock server: http://{host}:{server.server_address[1]} (Ctrl+C 종료)')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,290 @@
+"""KOSIS 적재 경로 벤치마크 — 합성 페이로드로 단계별 처리량/지연/최대 RSS 측정.
+
+사용:
+    python -m benchmarks.run_bench --cells 1000,10000,100000,1000000
+    python -m benchmarks.run_bench --cells 100000 --db [--intg-tbl-id <통합테이블>] [--commit]
+    python -m benchmarks.run_bench --cells 100000 --compare logs/bench/bench_<이전>.json
+
+단계 (셀 = data 행 1건):
+- generate : 합성 data/meta/latest 생성 (fetch 대체 — 네트워크 비용 제외)
+- save     : file_utils.save_meta/latest/data_file
+- parse    : latest SendDe 추출 + data JSON 로드 + meta XML 파싱
+- map      : _map_origin_data(프로파일 포함) + _map_metadata_rows
+- prepare  : prepare_statistic_files (프로세스 풀 경로: 파싱·매핑·COPY 버퍼)
+- db_insert / db_copy / db_transfer (--db): executemany / COPY / 통합 테이블 이관
+- e2e      : save -> parse/map -> (db 삽입 -> 이관) 연속 실행
+
+셀 수마다 새 프로세스(spawn)에서 측정해 최대 RSS(ru_maxrss)가 크기별로 분리된다.
+DB 단계는 기본적으로 트랜잭션을 롤백한다(--commit 시에만 남김). 로컬 PostgreSQL(DB_URL) 전용.
+결과는 JSON(--out, 기본 logs/bench/bench_<시각>.json)으로 남긴다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+DEFAULT_CELLS = (1000, 10000, 100000, 1000000)
+DEFAULT_OUT_DIR = os.path.join('logs', 'bench')
+BENCH_SRC_DATA_ID = 'BENCH'
+
+
+def _peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 는 byte, Linux 는 KB
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class StageTimer:
+    """단계별 소요 시간·행 수·최대 RSS 누적."""
+
+    def __init__(self):
+        self.stages = []
+
+    def run(self, name, rows, func, *args, **kwargs):
+        started = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - started
+        self.stages.append({
+            'stage': name,
+            'rows': rows,
+            'seconds': round(elapsed, 6),
+            'rows_per_sec': round(rows / elapsed, 1) if elapsed > 0 else None,
+            'peak_rss_kb': _peak_rss_kb(),
+        })
+        return result
+
+
+def _save_files(work_dir, data, meta_xml, latest):
+    from file_utils import save_data_file, save_latest_file, save_meta_file
+
+    dirs = {}
+    for kind in ('meta', 'latest', 'data'):
+        dirs[kind] = os.path.join(work_dir, kind)
+        os.makedirs(dirs[kind], exist_ok=True)
+    title = 'bench'
+    return {
+        'stat_tbl_id': 'DT_BENCH_001',
+        'src_data_id': BENCH_SRC_DATA_ID,
+        'meta_path': save_meta_file(meta_xml, None, dirs['meta'], BENCH_SRC_DATA_ID, title, '2006', '2025', 'xml'),
+        'latest_path': save_latest_file(latest, None, dirs['latest'], BENCH_SRC_DATA_ID, title, '2006', '2025', 'json'),
+        'data_path': save_data_file(data, None, dirs['data'], BENCH_SRC_DATA_ID, title, '2006', '2025', 'json'),
+    }
+
+
+def _parse_files(file_info):
+    import db_processing as dp
+
+    latest_date = dp._parse_latest_file_for_latest_date(file_info['latest_path'])
+    with open(file_info['data_path'], 'r', encoding='utf-8') as f:
+        data_json = json.load(f)
+    meta_root = dp.parse_xml_skip_leading_nonxml(file_info['meta_path'])
+    return latest_date, data_json, meta_root
+
+
+def _map_rows(file_info, latest_date, data_json, meta_root):
+    import db_processing as dp
+
+    stats_src = {'stat_tbl_id': file_info['stat_tbl_id']}
+    rows, profile = dp._map_origin_data(data_json, file_info, stats_src, latest_date)
+    meta_rows = dp._map_metadata_rows(meta_root, file_info['src_data_id'], file_info['stat_tbl_id'], latest_date)
+    return rows, profile, meta_rows
+
+
+def _db_session():
+    import db_processing as dp
+
+    if dp.get_engine() is None:
+        raise RuntimeError('DB_URL 이 설정되지 않아 DB 단계를 실행할 수 없습니다.')
+    return dp.Session()
+
+
+def _finish(session, commit):
+    if commit:
+        session.commit()
+    else:
+        session.rollback()
+    session.close()
+
+
+def _db_insert(rows, commit):
+    import db_processing as dp
+
+    session = _db_session()
+    try:
+        dp._insert_origin_rows(session, rows)
+    finally:
+        _finish(session, commit)
+
+
+def _db_copy_and_transfer(copy_path, file_info, latest_date, intg_tbl_id, commit, timer, cells):
+    import db_processing as dp
+
+    session = _db_session()
+    try:
+        timer.run('db_copy', cells, dp._copy_origin_rows, session, copy_path)
+        if intg_tbl_id:
+            timer.run(
+                'db_transfer', cells, dp._transfer_to_integration_table, session, file_info,
+                {'stat_tbl_id': file_info['stat_tbl_id']}, {'intg_tbl_id': intg_tbl_id}, latest_date,
+            )
+    finally:
+        _finish(session, commit)
+
+
+def _end_to_end(work_dir, data, meta_xml, latest, use_db, intg_tbl_id, commit):
+    import db_processing as dp
+
+    file_info = _save_files(work_dir, data, meta_xml, latest)
+    latest_date, data_json, meta_root = _parse_files(file_info)
+    rows, _, _ = _map_rows(file_info, latest_date, data_json, meta_root)
+    if use_db:
+        session = _db_session()
+        try:
+            dp._insert_origin_rows(session, rows)
+            if intg_tbl_id:
+                dp._transfer_to_integration_table(
+                    session, file_info, {'stat_tbl_id': file_info['stat_tbl_id']},
+                    {'intg_tbl_id': intg_tbl_id}, latest_date,
+                )
+        finally:
+            _finish(session, commit)
+
+
+def run_size(cells, use_db=False, intg_tbl_id=None, commit=False, seed=0):
+    """셀 수 1개에 대한 전 단계 측정 (spawn 자식 프로세스에서 실행)."""
+    from benchmarks import synthetic
+    import db_processing as dp
+
+    timer = StageTimer()
+    work_dir = tempfile.mkdtemp(prefix='kosis_bench_')
+    try:
+        data = timer.run('generate', cells, synthetic.make_data, cells, seed=seed)
+        meta_xml = synthetic.make_meta_xml(cells)
+        latest = synthetic.make_latest()
+
+        file_info = timer.run('save', cells, _save_files, work_dir, data, meta_xml, latest)
+        latest_date, data_json, meta_root = timer.run('parse', cells, _parse_files, file_info)
+        rows, _, _ = timer.run('map', cells, _map_rows, file_info, latest_date, data_json, meta_root)
+        del data_json
+        prepared = timer.run('prepare', cells, dp.prepare_statistic_files, file_info, file_info['stat_tbl_id'], work_dir)
+
+        if use_db:
+            timer.run('db_insert', cells, _db_insert, rows, commit)
+            _db_copy_and_transfer(prepared['copy_path'], file_info, latest_date, intg_tbl_id, commit, timer, cells)
+        del rows
+
+        e2e_dir = os.path.join(work_dir, 'e2e')
+        timer.run('e2e', cells, _end_to_end, e2e_dir, data, meta_xml, latest, use_db, intg_tbl_id, commit)
+        data_bytes = os.path.getsize(file_info['data_path'])
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return {'cells': cells, 'data_file_bytes': data_bytes, 'stages': timer.stages}
+
+
+def _git_rev():
+    try:
+        out = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, timeout=5,
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _environment():
+    from config import get_db_batch_size
+
+    return {
+        'git_rev': _git_rev(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'db_batch_size': get_db_batch_size(),
+    }
+
+
+def compare(current, previous):
+    """(cells, stage) 별 rows/sec 비율(현재/이전) 목록."""
+    prev = {
+        (r['cells'], s['stage']): s
+        for r in previous.get('results', []) for s in r['stages']
+    }
+    deltas = []
+    for r in current.get('results', []):
+        for s in r['stages']:
+            old = prev.get((r['cells'], s['stage']))
+            if not old or not old.get('rows_per_sec') or not s.get('rows_per_sec'):
+                continue
+            deltas.append({
+                'cells': r['cells'],
+                'stage': s['stage'],
+                'rows_per_sec_before': old['rows_per_sec'],
+                'rows_per_sec_after': s['rows_per_sec'],
+                'speedup': round(s['rows_per_sec'] / old['rows_per_sec'], 3),
+            })
+    return deltas
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='KOSIS 적재 경로 벤치마크 (합성 페이로드)')
+    parser.add_argument('--cells', default=','.join(str(c) for c in DEFAULT_CELLS),
+                        help='측정할 셀 수 목록 (콤마 구분, 기본 1000,10000,100000,1000000)')
+    parser.add_argument('--db', action='store_true', help='로컬 PostgreSQL(DB_URL) 적재 단계 포함')
+    parser.add_argument('--intg-tbl-id', dest='intg_tbl_id', default=None,
+                        help='db_transfer 단계에 사용할 통합 테이블 (미지정 시 이관 단계 생략)')
+    parser.add_argument('--commit', action='store_true', help='DB 단계 결과를 커밋 (기본: 롤백)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default=None, help='결과 JSON 경로 (기본 logs/bench/bench_<시각>.json)')
+    parser.add_argument('--compare', default=None, help='이전 결과 JSON 과 rows/sec 비교')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cells_list = [int(c) for c in args.cells.split(',') if c.strip()]
+    report = {
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': _environment(),
+        'options': {'db': args.db, 'intg_tbl_id': args.intg_tbl_id, 'commit': args.commit, 'seed': args.seed},
+        'results': [],
+    }
+    ctx = multiprocessing.get_context('spawn')
+    for cells in cells_list:
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+            result = pool.submit(run_size, cells, args.db, args.intg_tbl_id, args.commit, args.seed).result()
+        report['results'].append(result)
+        for s in result['stages']:
+            print(f"{cells:>9} {s['stage']:<12} {s['seconds']:>10.3f}s {s['rows_per_sec'] or 0:>14,.0f} rows/s "
+                  f"peak_rss={s['peak_rss_kb']:,}KB")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            report['compare'] = compare(report, json.load(f))
+        for d in report['compare']:
+            print(f"{d['cells']:>9} {d['stage']:<12} x{d['speedup']:.3f}")
+
+    out = args.out or os.path.join(DEFAULT_OUT_DIR, f"bench_{datetime.now().strftime('%Y%m%d%H%M%S')}.json")
+    os.makedirs(os.path.dirname(out) or '.', exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f'결과 저장: {out}')
+    return report
+
+
+if __name__ == '__main__':
+    main()
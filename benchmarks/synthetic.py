@@ -0,0 +1,96 @@
+"""합성 KOSIS 페이로드 생성기 — data(JSON 행 목록) / meta(XML MetaRow) / latest(JSON SendDe).
+
+실제 KOSIS 응답과 같은 키·형식을 만들어 db_processing 파서/매퍼가 그대로 소비할 수 있게 한다.
+셀(cell) = data 행 1건(DT 값 1개). 차원 구성은 기간(prd_de) x 항목(itm) x 분류1(c1) x 분류2(c2)
+이며 cells 에 도달하면 잘라낸다. seed 가 같으면 항상 같은 페이로드를 만든다.
+"""
+from __future__ import annotations
+
+import math
+import random
+from typing import Iterator, List
+from xml.sax.saxutils import escape
+
+DEFAULT_PERIODS = 20
+DEFAULT_ITEMS = 5
+DEFAULT_C2 = 4
+DEFAULT_TBL_ID = 'DT_BENCH_001'
+DEFAULT_SEND_DE = '2026-01-15'
+
+
+def dimension_plan(cells: int, periods: int = DEFAULT_PERIODS, items: int = DEFAULT_ITEMS,
+                   c2: int = DEFAULT_C2) -> dict:
+    """cells 를 덮는 차원 크기. c1 은 나머지를 채우도록 늘어난다."""
+    periods = max(1, min(periods, cells))
+    c1 = max(1, math.ceil(cells / (periods * items * c2)))
+    return {'periods': periods, 'items': items, 'c1': c1, 'c2': c2}
+
+
+def iter_data_rows(cells: int, tbl_id: str = DEFAULT_TBL_ID, seed: int = 0,
+                   null_ratio: float = 0.01, start_year: int = None, **dims) -> Iterator[dict]:
+    """KOSIS 통계자료 응답 행(dict)을 cells 건 생성. start_year 미지정 시 2025년에서 끝나도록 맞춘다."""
+    plan = dimension_plan(cells, **dims)
+    rnd = random.Random(seed)
+    if start_year is None:
+        start_year = 2026 - plan['periods']
+    produced = 0
+    for p in range(plan['periods']):
+        prd_de = str(start_year + p)
+        for i in range(plan['items']):
+            for c1 in range(plan['c1']):
+                for c2 in range(plan['c2']):
+                    if produced >= cells:
+                        return
+                    dt = '-' if rnd.random() < null_ratio else f'{rnd.uniform(0, 100000):.1f}'
+                    yield {
+                        'ORG_ID': '101',
+                        'TBL_ID': tbl_id,
+                        'TBL_NM': '벤치마크 합성 통계표',
+                        'C1': f'A{c1:05d}',
+                        'C1_OBJ_NM': '행정구역별',
+                        'C1_NM': f'지역{c1}',
+                        'C2': f'B{c2:02d}',
+                        'C2_OBJ_NM': '성별',
+                        'C2_NM': f'구분{c2}',
+                        'ITM_ID': f'T{i:02d}',
+                        'ITM_NM': f'항목{i}',
+                        'UNIT_NM': '명',
+                        'PRD_SE': 'Y',
+                        'PRD_DE': prd_de,
+                        'DT': dt,
+                        'LST_CHN_DE': DEFAULT_SEND_DE,
+                    }
+                    produced += 1
+
+
+def make_data(cells: int, **kwargs) -> List[dict]:
+    return list(iter_data_rows(cells, **kwargs))
+
+
+def make_meta_xml(cells: int, **dims) -> str:
+    """통계표 메타(분류·항목 코드) XML. data 와 같은 차원 구성으로 MetaRow 를 만든다."""
+    plan = dimension_plan(cells, **dims)
+    rows = []
+
+    def meta_row(obj_id, obj_nm, itm_id, itm_nm, sn, unit=''):
+        return (
+            '<MetaRow>'
+            f'<objId>{escape(obj_id)}</objId><objNm>{escape(obj_nm)}</objNm>'
+            f'<itmId>{escape(itm_id)}</itmId><itmNm>{escape(itm_nm)}</itmNm>'
+            f'<upItmId></upItmId><objIdSn>{sn}</objIdSn>'
+            f'<unitId></unitId><unitNm>{escape(unit)}</unitNm>'
+            '</MetaRow>'
+        )
+
+    for i in range(plan['items']):
+        rows.append(meta_row('ITEM', '항목', f'T{i:02d}', f'항목{i}', 0, '명'))
+    for c1 in range(plan['c1']):
+        rows.append(meta_row('A', '행정구역별', f'A{c1:05d}', f'지역{c1}', 1))
+    for c2 in range(plan['c2']):
+        rows.append(meta_row('B', '성별', f'B{c2:02d}', f'구분{c2}', 2))
+    return '<?xml version="1.0" encoding="UTF-8"?><root>' + ''.join(rows) + '</root>'
+
+
+def make_latest(send_de: str = DEFAULT_SEND_DE, tbl_id: str = DEFAULT_TBL_ID) -> list:
+    """최신 변경일 응답(JSON)."""
+    return [{'TBL_ID': tbl_id, 'SendDe': send_de}]
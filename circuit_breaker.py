@@ -0,0 +1,155 @@
+"""호스트별 서킷 브레이커 — 죽은 외부 API 에 남은 작업이 타임아웃을 반복하지 않도록.
+
+호스트가 내려가면 kosis_api 는 통계표마다, BaseCollector.http_get 은 요청마다 재시도까지
+다시 호출해 `타임아웃 x 재시도 x 통계표` 만큼 시간을 쓴 뒤에야 실행이 실패한다.
+호스트마다 연속 실패(연결 오류·타임아웃·5xx)가 CIRCUIT_BREAKER_FAILURES 번 쌓이면 열림(open)
+으로 바꿔 이후 호출을 즉시 CircuitOpenError 로 끝내고, CIRCUIT_BREAKER_RESET_SEC 가 지나면
+반열림(half-open)으로 1건만 시험 호출을 보내 성공하면 닫고 실패하면 다시 연다.
+
+    circuit_breaker.reset()                         # 실행 시작 (main.run_source)
+    breaker = circuit_breaker.for_url(url)          # 실행 전·비활성이면 None
+    breaker.before_call()                           # 열려 있으면 CircuitOpenError
+    ... breaker.record_success() / breaker.record_failure(reason)
+    trips = circuit_breaker.finish()                # {host: 열린 횟수} — 실행 요약에 기록
+
+429 는 호스트 장애가 아니라 속도 제한이므로 실패로 세지 않는다(concurrency 가 병렬도를 줄임).
+브레이커는 reset() 을 부른 실행 컨텍스트에만 있다 — 워커 스레드는 run_report.in_context 로 받는다.
+"""
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import metrics
+import run_report
+from config import get_circuit_breaker_failures, get_circuit_breaker_reset_sec
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+# 반열림 시험 호출의 결과가 이 시간 안에 기록되지 않으면 새 시험 호출을 허용 (HTTP 타임아웃보다 길게)
+PROBE_TIMEOUT_SEC = 120.0
+
+
+class CircuitOpenError(RuntimeError):
+    """호스트 서킷이 열려 있어 요청을 보내지 않고 실패."""
+
+
+def is_host_failure(status) -> bool:
+    """호스트 장애로 볼 HTTP 상태 (5xx). 4xx·429 는 요청 문제·속도 제한이라 제외."""
+    return isinstance(status, int) and status >= 500
+
+
+class CircuitBreaker:
+    """호스트 1개의 연속 실패 집계와 closed/open/half-open 전이 (thread-safe)."""
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_sec: float = 60.0, clock=time.monotonic):
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_sec = max(0.0, reset_sec)
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._opened_at = 0.0
+        self._probe_started = None
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """요청 전 확인. 열려 있으면 CircuitOpenError, 반열림이면 시험 호출 1건만 통과."""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            now = self.clock()
+            if self.state == OPEN:
+                if now - self._opened_at < self.reset_sec:
+                    raise CircuitOpenError(f'{self.host} 서킷 열림 (연속 실패 {self.failures}회)')
+                self.state = HALF_OPEN
+                self._probe_started = now
+                logger.info('서킷 반열림: %s 시험 호출', self.host)
+                return
+            # 반열림 — 시험 호출 1건이 끝날 때까지 나머지는 즉시 실패
+            if self._probe_started is not None and now - self._probe_started < PROBE_TIMEOUT_SEC:
+                raise CircuitOpenError(f'{self.host} 서킷 반열림 (시험 호출 진행 중)')
+            self._probe_started = now
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info('서킷 닫힘: %s 시험 호출 성공', self.host)
+            self.state = CLOSED
+            self.failures = 0
+            self._probe_started = None
+
+    def record_failure(self, reason: str = '') -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                self.state = OPEN
+                self._opened_at = self.clock()
+                self._probe_started = None
+                logger.warning('서킷 다시 열림: %s 시험 호출 실패 (%s)', self.host, reason)
+                return
+            if self.state == OPEN or self.failures < self.failure_threshold:
+                return
+            self.state = OPEN
+            self._opened_at = self.clock()
+            self.trips += 1
+        logger.error('서킷 열림: %s 연속 실패 %d회 (%s) — %.0f초 동안 즉시 실패 처리',
+                     self.host, self.failures, reason, self.reset_sec)
+        run_report.record('http.breaker_trip', trips=1)
+        metrics.inc('circuit_breaker_trips_total', host=self.host)
+
+
+class _Registry:
+    def __init__(self, failure_threshold: int, reset_sec: float):
+        self.failure_threshold = failure_threshold
+        self.reset_sec = reset_sec
+        self.lock = threading.Lock()
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, host: str) -> CircuitBreaker:
+        with self.lock:
+            breaker = self.breakers.get(host)
+            if breaker is None:
+                breaker = self.breakers[host] = CircuitBreaker(host, self.failure_threshold, self.reset_sec)
+            return breaker
+
+
+_context_registry = contextvars.ContextVar('circuit_breaker', default=None)
+
+
+def host_of(url: str) -> str:
+    return urlsplit(str(url)).netloc.lower()
+
+
+def reset(failure_threshold: Optional[int] = None, reset_sec: Optional[float] = None) -> None:
+    """새 실행 시작 — 모든 호스트를 닫힌 상태로 (CIRCUIT_BREAKER_FAILURES=0 이면 비활성)."""
+    failure_threshold = get_circuit_breaker_failures() if failure_threshold is None else failure_threshold
+    reset_sec = get_circuit_breaker_reset_sec() if reset_sec is None else reset_sec
+    registry = _Registry(failure_threshold, reset_sec) if failure_threshold > 0 else None
+    _context_registry.set(registry)
+
+
+def for_url(url: str) -> Optional[CircuitBreaker]:
+    """url 호스트의 브레이커. 실행이 시작되지 않았거나 비활성이면 None."""
+    registry = _context_registry.get()
+    if registry is None or not url:
+        return None
+    return registry.get(host_of(url))
+
+
+def finish() -> Dict[str, int]:
+    """현재 실행의 브레이커를 비활성화하고 호스트별 열린 횟수를 반환한다 (열린 적 없으면 {})."""
+    registry = _context_registry.get()
+    _context_registry.set(None)
+    if registry is None:
+        return {}
+    with registry.lock:
+        return {host: b.trips for host, b in sorted(registry.breakers.items()) if b.trips}
@@ -27,17 +27,35 @@ Adding a new source (5-line skeleton)::
         def is_retryable_error(self, response): ...
 
 See ``docs/design/26-multi-source-architecture.md`` §2 for the full contract.
+
+Adapter classes are exported lazily (PEP 562 ``__getattr__``): importing the
+package or one adapter module does not import every other adapter. ext_sys
+routing goes through ``collectors.registry.LazyRegistry``.
 """
 
-from .base import BaseCollector  # noqa: F401
-from .kosis import KosisCollector  # noqa: F401
-from .mobility_base import MobilityCollector  # noqa: F401
-from .gbis import GbisCollector  # noqa: F401
-from .korail_conv import KorailConvCollector  # noqa: F401
-from .kowsi_facl import KowsiFaclCollector  # noqa: F401
-from .tour_bf import TourBfCollector  # noqa: F401
-
-__all__ = [
-    "BaseCollector", "KosisCollector", "MobilityCollector",
-    "GbisCollector", "KorailConvCollector", "KowsiFaclCollector", "TourBfCollector",
-]
+import importlib
+
+_LAZY_EXPORTS = {
+    "BaseCollector": ".base",
+    "KosisCollector": ".kosis",
+    "MobilityCollector": ".mobility_base",
+    "GbisCollector": ".gbis",
+    "KorailConvCollector": ".korail_conv",
+    "KowsiFaclCollector": ".kowsi_facl",
+    "TourBfCollector": ".tour_bf",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -23,6 +23,12 @@ from typing import Any, Optional, Union
 
 import requests
 
+import circuit_breaker
+import concurrency
+import deadline
+import metrics
+from log_utils import preview
+
 
 def _mask_url(url):
     """로그 출력용 URL 인증키 마스킹"""
@@ -30,6 +36,12 @@ def _mask_url(url):
         return url
     return re.sub(r"(apiKey=)[^&]+", r"\1***", str(url), flags=re.IGNORECASE)
 
+
+def _endpoint_name(url):
+    """메트릭 라벨용 오퍼레이션명 — 쿼리 제외 URL 의 마지막 경로 조각."""
+    path = str(url).split("?", 1)[0].rstrip("/")
+    return path.rsplit("/", 1)[-1] or "root"
+
 logger = logging.getLogger(__name__)
 
 # Default HTTP behavior (overridable per-call). Conservative values that
@@ -97,8 +109,11 @@ class BaseCollector(ABC):
         KOSIS behavior for callers that opt out.
 
         On HTTP failure the method raises ``RuntimeError`` after exhausting
-        retries; on success it returns the ``Response`` untouched so that
-        adapter code can inspect ``status_code`` / ``json()`` / ``text``.
+        retries (``CircuitOpenError`` right away while the host's circuit
+        breaker is open, ``DeadlineExceeded`` once the run deadline has
+        passed — ``timeout`` is also capped to the time left); on success it
+        returns the ``Response`` untouched so that adapter code can inspect
+        ``status_code`` / ``json()`` / ``text``.
         """
         timeout = timeout if timeout is not None else DEFAULT_TIMEOUT_SEC
         retries = retries if retries is not None else DEFAULT_RETRY_COUNT
@@ -106,9 +121,37 @@ class BaseCollector(ABC):
 
         last_exc: Optional[Exception] = None
         attempts = retries + 1
+        ext_sys = self.EXT_SYS or "BASE"
+        endpoint = _endpoint_name(url)
+        breaker = circuit_breaker.for_url(url)
         for attempt in range(1, attempts + 1):
+            # Deadline first: before_call() may start a half-open probe that
+            # must end in record_success/record_failure.
+            call_timeout = deadline.call_timeout(timeout)
+            if breaker is not None:
+                # Open circuit: fail fast instead of spending timeout x retries.
+                breaker.before_call()
+            started = time.perf_counter()
             try:
-                resp = requests.get(url, timeout=timeout)
+                try:
+                    resp = requests.get(url, timeout=call_timeout)
+                except requests.RequestException as exc:
+                    metrics.observe_http(ext_sys, endpoint, "error", time.perf_counter() - started,
+                                         retry=attempt > 1)
+                    if breaker is not None:
+                        breaker.record_failure(f"{ext_sys} {endpoint} {type(exc).__name__}")
+                    if isinstance(exc, requests.Timeout):
+                        concurrency.report_congestion(f"{ext_sys} {endpoint} timeout")
+                    raise
+                metrics.observe_http(ext_sys, endpoint, resp.status_code, time.perf_counter() - started,
+                                     len(resp.content), retry=attempt > 1)
+                if breaker is not None:
+                    if circuit_breaker.is_host_failure(resp.status_code):
+                        breaker.record_failure(f"{ext_sys} {endpoint} status={resp.status_code}")
+                    else:
+                        breaker.record_success()
+                if resp.status_code in concurrency.CONGESTION_STATUS:
+                    concurrency.report_congestion(f"{ext_sys} {endpoint} status={resp.status_code}")
                 if resp.status_code == 200:
                     return resp
                 logger.warning(
@@ -116,7 +159,7 @@ class BaseCollector(ABC):
                     self.EXT_SYS or "BASE",
                     _mask_url(url),
                     resp.status_code,
-                    resp.text[:200],
+                    preview(resp.content),
                 )
                 if attempt >= attempts:
                     raise RuntimeError(
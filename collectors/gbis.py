@@ -69,19 +69,25 @@ class GbisCollector(MobilityCollector):
             self.pause()
         return routes
 
-    def collect(self) -> List[dict]:
-        routes = self.enumerate_routes()
+    def target_route_ids(self) -> List:
+        """열거한 노선 중 regionName 필터에 맞는 routeId 목록 (분산 수집 작업 단위 분할용)."""
         region = self.region_filter
-        targets = [r for r in routes.values() if region in str(r.get('regionName') or '')]
+        return [rid for rid, r in self.enumerate_routes().items() if region in str(r.get('regionName') or '')]
+
+    def collect_routes(self, route_ids: List) -> List[dict]:
+        """노선별 상세(busRouteInfoItem) 조회 → tran_bus_route_info 행."""
         rows = []
-        for r in targets:
-            body = self._msg_body(self.get_json(self._route_info_url(r['routeId'])))
+        for route_id in route_ids:
+            body = self._msg_body(self.get_json(self._route_info_url(route_id)))
             item = body.get('busRouteInfoItem') or {}
             if item:
                 rows.append(self.map_route(item))
             self.pause()
         return rows
 
+    def collect(self) -> List[dict]:
+        return self.collect_routes(self.target_route_ids())
+
     @staticmethod
     def map_route(item: dict) -> dict:
         """GBIS busRouteInfoItem → tran_bus_route_info 컬럼 매핑."""
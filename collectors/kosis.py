@@ -42,6 +42,9 @@ class KosisCollector(BaseCollector):
 
     EXT_SYS = "KOSIS"
 
+    # Last fetch_meta() response — reused by fetch_data() for cell estimation.
+    _meta = None
+
     # --- Required abstract overrides ---------------------------------------
 
     def fetch_meta(self, data_info: dict) -> Union[dict, str]:
@@ -50,7 +53,10 @@ class KosisCollector(BaseCollector):
         KOSIS-specific: URL template uses ``api_meta_url`` key with auth
         substitution. Response key/format negotiation handled inside helper.
         """
-        return kosis_api.fetch_kosis_meta(self.api_info, self.stats_src, data_info)
+        meta = kosis_api.fetch_kosis_meta(self.api_info, self.stats_src, data_info)
+        # reused by fetch_data for cell estimation (one collector per stat table)
+        self._meta = meta
+        return meta
 
     def fetch_latest(self, data_info: dict) -> Union[dict, str]:
         """KOSIS 최신 변경일 조회 (api_latest_chn_dt_url 템플릿)."""
@@ -62,8 +68,14 @@ class KosisCollector(BaseCollector):
         KOSIS-specific retry policy: Error 31 (period-too-wide) triggers a
         recursive year-range split until a 1-year window succeeds. Handled
         internally by ``kosis_api.fetch_kosis_data_with_retry``.
+
+        When ``fetch_meta`` ran first on this instance, its response is used
+        to estimate the cell count and split the period up front so that no
+        request exceeds ``KOSIS_CELL_LIMIT``.
         """
-        return kosis_api.fetch_kosis_data(self.api_info, self.stats_src, data_info)
+        if self._meta is None:
+            return kosis_api.fetch_kosis_data(self.api_info, self.stats_src, data_info)
+        return kosis_api.fetch_kosis_data(self.api_info, self.stats_src, data_info, meta=self._meta)
 
     def is_retryable_error(self, response: Any) -> bool:
         """Return True for KOSIS Error 31 ({err: '31'}); False otherwise.
@@ -23,6 +23,7 @@ import os
 from typing import List, Optional, Tuple
 import xml.etree.ElementTree as ET
 
+import deadline
 from collectors.mobility_base import MobilityCollector
 
 logger = logging.getLogger(__name__)
@@ -186,6 +187,25 @@ class KowsiFaclCollector(MobilityCollector):
 
         start_page = int(state.get('next_page', 1))
         end_page = start_page + self.max_pages - 1
+        matched, completed, page = self.scan_pages(start_page, end_page)
+
+        if completed:
+            state['next_page'] = 1
+            state['cycle_completed_at'] = datetime.datetime.now().isoformat(timespec='seconds')
+            logger.info('KOWSI_FACL: 전 페이지 스캔 완료(~p%d) — cycle 종료', page)
+        else:
+            last_page = min(page, end_page)     # 마감으로 중단했으면 end_page 전
+            state['next_page'] = last_page + 1
+            logger.info('KOWSI_FACL: p%d~p%d 스캔 — 다음 실행 p%d부터 이어받기', start_page, last_page, last_page + 1)
+        self.save_state(state)
+        return self.enrich_eval(matched)
+
+    def scan_pages(self, start_page: int, end_page: int) -> Tuple[List[dict], bool, int]:
+        """목록 p{start_page}~p{end_page} 스캔 (주소 필터 적용).
+
+        반환: ``(일치 행, 마지막 페이지 도달 여부, 마지막으로 읽은 페이지)``.
+        분산 수집은 상태 파일 없이 페이지 범위를 작업 단위로 나눠 이 메서드를 직접 부른다.
+        """
         matched: List[dict] = []
         completed = False
         page = start_page
@@ -199,18 +219,21 @@ class KowsiFaclCollector(MobilityCollector):
             if page >= total_pages or not rows:
                 completed = True
                 break
+            if deadline.expired():
+                # 실행 마감 — 읽은 페이지까지만 반환 (다음 실행이 state 로 이어받음)
+                logger.warning('KOWSI_FACL 마감으로 p%d 에서 스캔 중단', page)
+                break
             page += 1
             self.pause()
+        return matched, completed, page
 
-        if completed:
-            state['next_page'] = 1
-            state['cycle_completed_at'] = datetime.datetime.now().isoformat(timespec='seconds')
-            logger.info('KOWSI_FACL: 전 페이지 스캔 완료(~p%d) — cycle 종료', page)
-        else:
-            state['next_page'] = end_page + 1
-            logger.info('KOWSI_FACL: p%d~p%d 스캔 — 다음 실행 p%d부터 이어받기', start_page, end_page, end_page + 1)
-        self.save_state(state)
+    def total_pages(self) -> int:
+        """목록 전체 페이지 수 (1페이지 totalCount 기준)."""
+        total, _ = self.parse_list_page(self.get_xml(self._list_url(1)))
+        return max(1, math.ceil(total / self.page_size)) if total else 1
 
+    def enrich_eval(self, matched: List[dict]) -> List[dict]:
+        """KOWSI_FETCH_EVAL=ON 이면 시설별 평가정보 조회, 아니면 플래그를 None 으로 채운다."""
         if self.fetch_eval:
             for row in matched:
                 key = row.get('wfclt_id') or row.get('facl_inf_id')
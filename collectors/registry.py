@@ -0,0 +1,93 @@
+"""지연 로딩 collector 레지스트리 — ext_sys -> BaseCollector 서브클래스.
+
+값으로 클래스 대신 ``'패키지.모듈:클래스명'`` 문자열이나 ``importlib.metadata`` EntryPoint 를
+넣어 두면 해당 ext_sys 를 처음 조회할 때 import 한다. 단일 소스 실행(예: --ext-sys GBIS)은
+다른 어댑터 모듈(및 그 의존성)을 import 하지 않는다.
+
+    registry = LazyRegistry({'KOSIS': 'collectors.kosis:KosisCollector'})
+    registry['MY_SOURCE'] = MySourceCollector          # 클래스 직접 등록도 가능
+    registry.load_entry_points()                        # 외부 패키지 플러그인 (dabt.collectors 그룹)
+    cls = registry['KOSIS']                             # 여기서 import
+"""
+from __future__ import annotations
+
+import importlib
+import threading
+from collections.abc import MutableMapping
+from importlib import metadata
+
+ENTRY_POINT_GROUP = 'dabt.collectors'
+
+
+def _resolve(target):
+    if isinstance(target, str):
+        module_name, _, attr = target.partition(':')
+        obj = importlib.import_module(module_name)
+        for part in attr.split('.') if attr else ():
+            obj = getattr(obj, part)
+        return obj
+    if isinstance(target, metadata.EntryPoint):
+        return target.load()
+    return target
+
+
+def _entry_points(group: str):
+    """group 의 entry point 목록. Python 3.8/3.9 의 entry_points() 는 {group: [...]} dict 를 반환한다."""
+    eps = metadata.entry_points()
+    if hasattr(eps, 'select'):
+        return eps.select(group=group)
+    return eps.get(group, [])
+
+
+class LazyRegistry(MutableMapping):
+    """키는 대문자 ext_sys. 조회 시 import 경로/EntryPoint 를 해석해 캐시한다 (thread-safe)."""
+
+    def __init__(self, entries=None):
+        self._entries = {}
+        self._lock = threading.Lock()
+        if entries:
+            self.update(entries)
+
+    def __getitem__(self, key):
+        key = key.upper()
+        target = self._entries[key]
+        if isinstance(target, (str, metadata.EntryPoint)):
+            with self._lock:
+                target = self._entries[key]
+                if isinstance(target, (str, metadata.EntryPoint)):
+                    target = self._entries[key] = _resolve(target)
+        return target
+
+    def __setitem__(self, key, value):
+        self._entries[key.upper()] = value
+
+    def __delitem__(self, key):
+        del self._entries[key.upper()]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return isinstance(key, str) and key.upper() in self._entries
+
+    def targets(self) -> dict:
+        """등록값 원본 복사본 (해석 전 문자열/EntryPoint 포함 — 다른 레지스트리로 import 없이 복사)."""
+        return dict(self._entries)
+
+    def is_loaded(self, key) -> bool:
+        return not isinstance(self._entries.get(key.upper()), (str, metadata.EntryPoint))
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> int:
+        """설치된 패키지의 entry point 를 (import 없이) 등록. 기존 키는 덮어쓰지 않는다."""
+        added = 0
+        for ep in _entry_points(group):
+            if ep.name.upper() not in self._entries:
+                self._entries[ep.name.upper()] = ep
+                added += 1
+        return added
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self._entries)})'
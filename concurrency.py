@@ -0,0 +1,198 @@
+"""워커 병렬도 자동 조정 — AIMD(가산 증가 / 곱셈 감소) 동시 실행 제한.
+
+PARALLEL_WORKERS_FILE / PARALLEL_WORKERS_DB 는 시간대·소스마다 알맞은 값이 달라 .env 를
+손으로 고쳐 왔다. PARALLEL_AUTO_TUNE=ON 이면 설정값에서 시작해, 작업 완료 window 마다
+처리량이 유지·개선되고 오류·지연이 정상이면 1 올리고, 429/503·타임아웃·DB 락 대기가
+보이면 절반으로 내린다. 스레드 풀은 상한 크기로 만들고 작업마다 slot() 으로 현재 한도를 지킨다.
+
+    limiter = concurrency.limiter('file', initial=4, maximum=10)
+    with ThreadPoolExecutor(max_workers=limiter.workers) as executor: ...
+    def run(args):
+        with limiter.slot():
+            ...                                   # 안에서 429 를 받으면
+            concurrency.report_congestion('http 429')   # kosis_api / BaseCollector 가 호출
+    limiter.close()                               # 한도 변화 요약 로그
+
+slot() 안에서 report_congestion() 을 부르면 현재 작업의 limiter 로 전달된다(contextvar).
+자동 조정이 꺼져 있으면 slot() 은 아무것도 하지 않는다.
+"""
+from __future__ import annotations
+
+import contextvars
+import logging
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from config import get_parallel_auto_tune
+
+logger = logging.getLogger(__name__)
+
+DECREASE_FACTOR = 0.5          # 혼잡 신호 시 한도 배수
+DECREASE_COOLDOWN_SEC = 5.0    # 같은 혼잡(동시에 터진 429 여러 건)으로 여러 번 내리지 않도록
+ERROR_RATE_LIMIT = 0.2         # window 안 실패 비율이 이보다 크면 감소
+LATENCY_FACTOR = 3.0           # window 중앙 지연이 최저 기록의 이 배수를 넘으면 감소
+THROUGHPUT_TOLERANCE = 0.9     # 직전 최고 처리량의 이 비율 이상이면 "유지"로 보고 증가
+
+# HTTP 상태 중 혼잡(속도 제한·과부하) 신호
+CONGESTION_STATUS = (429, 503)
+# DB 예외 메시지 중 락 대기/교착 신호 (PostgreSQL)
+_LOCK_WAIT_MARKERS = ('lock timeout', 'deadlock detected', 'could not obtain lock', 'canceling statement due to lock')
+
+_current = contextvars.ContextVar('concurrency_limiter', default=None)
+
+
+def is_lock_wait(exc: BaseException) -> bool:
+    """DB 락 대기·교착으로 실패한 예외인지 (원인 예외 체인 포함)."""
+    while exc is not None:
+        message = str(exc).lower()
+        if any(marker in message for marker in _LOCK_WAIT_MARKERS):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def report_congestion(reason: str) -> None:
+    """현재 작업(slot) 의 limiter 에 혼잡 신호 전달. slot 밖이면 무시."""
+    limiter = _current.get()
+    if limiter is not None:
+        limiter.congestion(reason)
+
+
+class AimdLimiter:
+    """동적 한도를 가진 세마포어 + AIMD 조정 (thread-safe)."""
+
+    def __init__(self, name: str, initial: int, maximum: int, minimum: int = 1,
+                 window: Optional[int] = None, clock=time.monotonic):
+        self.name = name
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.limit = max(self.minimum, min(initial, self.maximum))
+        self.window = window or max(4, self.limit * 2)
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._active = 0
+        self._samples = []               # (latency_sec, ok)
+        self._window_started = clock()
+        self._best_throughput = None
+        self._best_latency = None
+        self._last_decrease = None
+        self.levels = [self.limit]       # 한도 변화 기록 (로그 요약용)
+        self.congestions = 0
+
+    @property
+    def workers(self) -> int:
+        """스레드 풀 크기 (한도가 오를 수 있는 상한)."""
+        return self.maximum
+
+    # --- 작업 슬롯 ------------------------------------------------------------
+    @contextmanager
+    def slot(self):
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+        token = _current.set(self)
+        started = self.clock()
+        ok = True
+        try:
+            yield self
+        except BaseException:
+            ok = False
+            raise
+        finally:
+            _current.reset(token)
+            with self._cond:
+                self._active -= 1
+                self._complete(self.clock() - started, ok)
+                self._cond.notify_all()
+
+    # --- 신호 ----------------------------------------------------------------
+    def congestion(self, reason: str) -> None:
+        with self._cond:
+            self.congestions += 1
+            now = self.clock()
+            if self._last_decrease is not None and now - self._last_decrease < DECREASE_COOLDOWN_SEC:
+                return
+            self._decrease(f'혼잡 신호: {reason}')
+
+    def _complete(self, latency: float, ok: bool) -> None:
+        self._samples.append((latency, ok))
+        if len(self._samples) >= self.window:
+            self._evaluate()
+
+    def _evaluate(self) -> None:
+        now = self.clock()
+        samples, self._samples = self._samples, []
+        elapsed = max(now - self._window_started, 1e-6)
+        self._window_started = now
+        throughput = len(samples) / elapsed
+        error_rate = sum(1 for _, ok in samples if not ok) / len(samples)
+        latency = statistics.median(latency for latency, _ in samples)
+
+        if error_rate > ERROR_RATE_LIMIT:
+            self._decrease(f'실패율 {error_rate:.0%}')
+        elif self._best_latency is not None and latency > self._best_latency * LATENCY_FACTOR:
+            self._decrease(f'중앙 지연 {latency:.2f}s (최저 {self._best_latency:.2f}s)')
+        elif self._best_throughput is None or throughput >= self._best_throughput * THROUGHPUT_TOLERANCE:
+            self._set(self.limit + 1, f'처리량 {throughput:.2f}/s')
+        else:
+            logger.debug('concurrency[%s]: 처리량 %.2f/s < 최고 %.2f/s — 한도 %d 유지',
+                         self.name, throughput, self._best_throughput, self.limit)
+        if self._best_throughput is None or throughput > self._best_throughput:
+            self._best_throughput = throughput
+        if self._best_latency is None or latency < self._best_latency:
+            self._best_latency = latency
+
+    def _decrease(self, reason: str) -> None:
+        self._last_decrease = self.clock()
+        self._samples = []
+        self._window_started = self._last_decrease
+        # 한도가 바뀌면 처리량 기준도 새로 잡는다
+        self._best_throughput = None
+        self._set(int(self.limit * DECREASE_FACTOR), reason)
+
+    def _set(self, limit: int, reason: str) -> None:
+        limit = max(self.minimum, min(limit, self.maximum))
+        if limit == self.limit:
+            return
+        logger.info('concurrency[%s]: 한도 %d -> %d (%s)', self.name, self.limit, limit, reason)
+        self.limit = limit
+        self.levels.append(limit)
+        self._cond.notify_all()
+
+    def close(self) -> None:
+        logger.info('concurrency[%s]: 최종 한도 %d (범위 %d~%d, 변화 %s, 혼잡 신호 %d건)', self.name, self.limit,
+                    min(self.levels), max(self.levels), '->'.join(map(str, self.levels[-10:])), self.congestions)
+
+
+class _StaticLimiter:
+    """자동 조정 OFF — 스레드 풀 크기가 곧 병렬도."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.workers = limit
+
+    @contextmanager
+    def slot(self):
+        yield self
+
+    def congestion(self, reason: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def limiter(name: str, initial: int, maximum: int):
+    """PARALLEL_AUTO_TUNE=ON 이면 initial 에서 시작해 maximum 까지 조정, 아니면 initial 고정.
+
+    스레드 풀은 반환값의 .workers 크기로 만든다.
+    """
+    if not get_parallel_auto_tune():
+        return _StaticLimiter(initial)
+    result = AimdLimiter(name, initial, maximum)
+    logger.info('concurrency[%s]: 자동 조정 시작 한도 %d (상한 %d)', name, result.limit, result.maximum)
+    return result
@@ -11,6 +11,12 @@ _DB_BATCH_SIZE = int(os.getenv('DB_BATCH_SIZE', '100'))
 
 # --- 로깅 설정 ---
 _LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+# 파일 로그 형식: TEXT(기존) 또는 JSON(1줄 1레코드, 로그 수집기용)
+_LOG_FORMAT = os.getenv('LOG_FORMAT', 'TEXT').upper()
+# 배치 단위 진행 로그(bulk insert 등) 최소 간격(초). 0 이면 완료 로그만
+_LOG_PROGRESS_INTERVAL_SEC = float(os.getenv('LOG_PROGRESS_INTERVAL_SEC', '5'))
+# Prometheus textfile 메트릭 출력 디렉터리 (빈 값 또는 OFF 면 비활성)
+_METRICS_TEXTFILE_DIR = os.getenv('METRICS_TEXTFILE_DIR', os.path.join('logs', 'metrics'))
 
 # --- KOSIS API 설정 ---
 _EXT_API_INFO_KOSIS_SYS = os.getenv('EXT_API_INFO_KOSIS_SYS', 'KOSIS')
@@ -18,6 +24,36 @@ _EXT_API_INFO_KOSIS_SYS = os.getenv('EXT_API_INFO_KOSIS_SYS', 'KOSIS')
 # --- 병렬처리 성능 설정 ---
 _PARALLEL_WORKERS_FILE = int(os.getenv('PARALLEL_WORKERS_FILE', '4'))
 _PARALLEL_WORKERS_DB = int(os.getenv('PARALLEL_WORKERS_DB', '2'))
+# ON 이면 위 값에서 시작해 처리량·혼잡 신호에 따라 상한(파일 10 / DB 5)까지 자동 조정 (concurrency.py)
+_PARALLEL_AUTO_TUNE = os.getenv('PARALLEL_AUTO_TUNE', 'OFF').upper()
+# --ext-sys 여러 개 / ALL 실행 시 동시에 도는 소스 수
+_PARALLEL_SOURCES = int(os.getenv('PARALLEL_SOURCES', '4'))
+# 분산 수집(distributed.py) 작업 단위 리스 시간 / 단위당 최대 시도 횟수
+_WORK_QUEUE_LEASE_SEC = int(os.getenv('WORK_QUEUE_LEASE_SEC', '600'))
+_WORK_QUEUE_MAX_ATTEMPTS = int(os.getenv('WORK_QUEUE_MAX_ATTEMPTS', '3'))
+# 0 이면 DB 스레드 안에서 파싱(기존 동작), 1 이상이면 파싱·행 매핑을 프로세스 풀에서 수행
+_DB_PARSE_PROCESSES = int(os.getenv('DB_PARSE_PROCESSES', '0'))
+# KOSIS 요청 1건당 셀 수 상한 (초과 시 Error 31) / 미리 나눈 기간 요청의 동시 호출 수
+_KOSIS_CELL_LIMIT = int(os.getenv('KOSIS_CELL_LIMIT', '40000'))
+_KOSIS_SPLIT_CONCURRENCY = int(os.getenv('KOSIS_SPLIT_CONCURRENCY', '4'))
+# 같은 실행에서 같은 meta/latest URL 응답을 재사용하는 최근 결과 수 (0 이면 동시 요청 합치기만)
+_KOSIS_RESPONSE_CACHE_SIZE = int(os.getenv('KOSIS_RESPONSE_CACHE_SIZE', '128'))
+# 호스트별 서킷 브레이커: 연속 실패 N회면 열고(0 이면 비활성), 열린 뒤 시험 호출까지 대기(초)
+_CIRCUIT_BREAKER_FAILURES = int(os.getenv('CIRCUIT_BREAKER_FAILURES', '5'))
+_CIRCUIT_BREAKER_RESET_SEC = float(os.getenv('CIRCUIT_BREAKER_RESET_SEC', '60'))
+# KOSIS 헤지 요청: 최근 응답 시간의 이 백분위를 넘기면 같은 요청 1건 더 (0 이면 비활성) / 전체 요청 대비 헤지 비율 상한
+_KOSIS_HEDGE_PERCENTILE = float(os.getenv('KOSIS_HEDGE_PERCENTILE', '0'))
+_KOSIS_HEDGE_BUDGET = float(os.getenv('KOSIS_HEDGE_BUDGET', '0.05'))
+# 실행 마감(초, 0 이면 없음 — CLI --deadline-sec 우선) / 통계표 1개 수집 예산(초, 0 이면 없음)
+_RUN_DEADLINE_SEC = float(os.getenv('RUN_DEADLINE_SEC', '0'))
+_TABLE_DEADLINE_SEC = float(os.getenv('TABLE_DEADLINE_SEC', '0'))
+# 이 행 수를 넘는 통계표는 prd_de 샤드로 나눠 여러 커넥션에서 병렬 적재 (0 이면 비활성)
+_DB_SHARD_ROW_THRESHOLD = int(os.getenv('DB_SHARD_ROW_THRESHOLD', '0'))
+_DB_SHARD_COUNT = int(os.getenv('DB_SHARD_COUNT', '4'))
+
+# --- 스케줄러 데몬 (scheduler.py) ---
+# "<EXT_SYS>[:<mode>]=<cron 5필드>" 를 ; 로 구분. 예: "KOSIS=0 3 3,18 * *; GBIS=0 4 * * 1"
+_SCHEDULES = os.getenv('SCHEDULES', '')
 
 # --- 데이터 수집 옵션 ---
 _DATA_COLLECTION_SCOPE = os.getenv('DATA_COLLECTION_SCOPE', 'ALL').upper()
@@ -30,6 +66,22 @@ def get_db_url():
 def get_log_level():
     return _LOG_LEVEL
 
+def get_log_format():
+    return 'JSON' if _LOG_FORMAT == 'JSON' else 'TEXT'
+
+def get_log_progress_interval_sec():
+    return max(0.0, _LOG_PROGRESS_INTERVAL_SEC)
+
+def get_schedules():
+    return _SCHEDULES
+
+def get_metrics_textfile_dir():
+    """node_exporter textfile collector 디렉터리. 비활성이면 None."""
+    value = (_METRICS_TEXTFILE_DIR or '').strip()
+    if not value or value.upper() == 'OFF':
+        return None
+    return value
+
 def get_db_batch_size():
     return _DB_BATCH_SIZE
 
@@ -53,11 +105,89 @@ def get_check_data_latest_date_mode():
     return _CHECK_DATA_LATEST_DATE_MODE
 
 
-def get_parallel_workers_file():
-    return min(_PARALLEL_WORKERS_FILE, 10)
+def _ext_sys_override(name, ext_sys, default):
+    """<name>_<EXT_SYS> 환경변수가 있으면 그 값 (소스별 병렬도 예산), 없으면 default."""
+    if ext_sys:
+        raw = os.getenv(f'{name}_{ext_sys.upper()}')
+        if raw:
+            return int(raw)
+    return default
+
+MAX_PARALLEL_WORKERS_FILE = 10
+MAX_PARALLEL_WORKERS_DB = 5
+
+def get_parallel_workers_file(ext_sys=None):
+    return min(_ext_sys_override('PARALLEL_WORKERS_FILE', ext_sys, _PARALLEL_WORKERS_FILE), MAX_PARALLEL_WORKERS_FILE)
+
+def get_parallel_workers_db(ext_sys=None):
+    return min(_ext_sys_override('PARALLEL_WORKERS_DB', ext_sys, _PARALLEL_WORKERS_DB), MAX_PARALLEL_WORKERS_DB)
+
+def get_parallel_auto_tune():
+    """파일/DB 워커 수 AIMD 자동 조정 여부 (PARALLEL_AUTO_TUNE=ON)."""
+    return _PARALLEL_AUTO_TUNE == 'ON'
+
+def get_parallel_sources():
+    """--ext-sys 가 여러 개(ALL 포함)일 때 동시에 실행할 소스 수 (1~8)."""
+    return max(1, min(_PARALLEL_SOURCES, 8))
+
+def get_kosis_cell_limit():
+    """KOSIS 요청 1건당 셀 수 상한. 0 이하면 메타 기반 사전 분할 비활성(Error 31 후 분할만)."""
+    return _KOSIS_CELL_LIMIT
+
+def get_kosis_split_concurrency():
+    """메타 기반으로 나눈 KOSIS 기간 요청을 동시에 보내는 수 (1~8)."""
+    return max(1, min(_KOSIS_SPLIT_CONCURRENCY, 8))
+
+def get_kosis_response_cache_size():
+    """실행 동안 재사용할 KOSIS meta/latest 응답 수 (LRU). 0 이면 동시에 들어온 같은 요청만 합친다."""
+    return max(0, _KOSIS_RESPONSE_CACHE_SIZE)
+
+def get_circuit_breaker_failures():
+    """호스트 서킷을 여는 연속 실패(연결 오류·타임아웃·5xx) 횟수. 0 이하면 서킷 브레이커 비활성."""
+    return max(0, _CIRCUIT_BREAKER_FAILURES)
+
+def get_circuit_breaker_reset_sec():
+    """서킷이 열린 뒤 반열림 시험 호출을 보내기까지 대기(초)."""
+    return max(1.0, _CIRCUIT_BREAKER_RESET_SEC)
+
+def get_kosis_hedge_percentile():
+    """KOSIS 헤지 요청 기준 백분위(엔드포인트별 최근 응답 시간, 50~99.9). 0 이하면 헤지 비활성."""
+    if _KOSIS_HEDGE_PERCENTILE <= 0:
+        return 0.0
+    return max(50.0, min(_KOSIS_HEDGE_PERCENTILE, 99.9))
+
+def get_kosis_hedge_budget():
+    """실행 전체 KOSIS 요청 대비 헤지 요청 비율 상한 (0~0.5)."""
+    return max(0.0, min(_KOSIS_HEDGE_BUDGET, 0.5))
+
+def get_run_deadline_sec():
+    """실행 마감(초). 넘기면 시작 전 통계표는 다음 실행으로 미룬다. 0 이하면 마감 없음."""
+    return max(0.0, _RUN_DEADLINE_SEC)
+
+def get_table_deadline_sec():
+    """통계표 1개 수집(meta/latest/data 호출) 예산(초). 0 이하면 없음."""
+    return max(0.0, _TABLE_DEADLINE_SEC)
+
+def get_work_queue_lease_sec():
+    """분산 수집 작업 단위 리스(초). 하트비트가 1/3 주기로 연장하며 최소 30초."""
+    return max(30, _WORK_QUEUE_LEASE_SEC)
+
+def get_work_queue_max_attempts():
+    """분산 수집 작업 단위 최대 시도 횟수 (이후 failed)."""
+    return max(1, _WORK_QUEUE_MAX_ATTEMPTS)
+
+def get_db_shard_row_threshold():
+    """prd_de 샤딩 적재 기준 행 수. 0 이하면 비활성(기존 단일 커넥션 적재)."""
+    return _DB_SHARD_ROW_THRESHOLD
+
+def get_db_shard_count():
+    """통계표 1건당 샤드(커넥션) 수 (최대 8). 샤딩이 켜지면 db.get_engine 이 DB 워커 상한 x 이 값만큼
+    커넥션 풀 초과 한도를 늘린다."""
+    return max(1, min(_DB_SHARD_COUNT, 8))
 
-def get_parallel_workers_db():
-    return min(_PARALLEL_WORKERS_DB, 5)
+def get_db_parse_processes():
+    """DB 단계 파싱/행 매핑용 프로세스 수. 0 이하면 비활성, 상한은 CPU 코어 수."""
+    return max(0, min(_DB_PARSE_PROCESSES, os.cpu_count() or 1))
 
 
 # 여러 줄 섹션 기반 테이블 ID 리스트 로드 함수
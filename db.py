@@ -1,36 +1,76 @@
 import logging
+import threading
 from sqlalchemy import create_engine, text, event
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
-from config import get_db_url, get_kosis_sys
+from config import (
+    get_db_url, get_kosis_sys, get_db_shard_row_threshold, get_db_shard_count, MAX_PARALLEL_WORKERS_DB,
+)
 
 load_dotenv()
 
 DB_URL = get_db_url()
-engine = create_engine(
-    DB_URL,
-    pool_pre_ping=True,      # 끊긴 커넥션 자동 감지(원격 DB 일시 단절 대비)
-    pool_recycle=1800,       # 30분마다 커넥션 재생성(stale 방지)
-    connect_args={'connect_timeout': 10},
-) if DB_URL else None
-Session = sessionmaker(bind=engine) if engine else None
 
 db_logger = logging.getLogger('db')
 
 EXT_SYS_KOSIS = get_kosis_sys()
 
+# 엔진/세션 팩토리는 첫 DB 접근 시 생성 (--mode file·단순 호출은 SQLAlchemy 엔진 비용 없음)
+_engine = None
+_sessionmaker = None
+_engine_lock = threading.Lock()
+
 def set_timezone(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("SET TIME ZONE 'Asia/Seoul';")
     cursor.close()
 
-# 엔진에 이벤트 리스너 등록
-if engine:
-    try:
-        event.listen(engine, 'connect', set_timezone)
-        db_logger.info("DB 세션 타임존을 Asia/Seoul로 설정했습니다.")
-    except Exception as e:
-        db_logger.error(f"DB 타임존 설정 실패: {e}")
+# 기본 QueuePool 크기(5 + 초과 10)에 샤딩 적재 커넥션을 더한다 — DB 워커(최대 MAX_PARALLEL_WORKERS_DB)
+# 마다 세션 1개를 잡은 채 샤드 커넥션 DB_SHARD_COUNT 개를 추가로 열기 때문 (db_processing._load_sharded)
+DB_POOL_SIZE = 5
+DB_MAX_OVERFLOW = 10
+
+def _pool_max_overflow():
+    if get_db_shard_row_threshold() <= 0:
+        return DB_MAX_OVERFLOW
+    return DB_MAX_OVERFLOW + MAX_PARALLEL_WORKERS_DB * get_db_shard_count()
+
+def get_engine():
+    """공용 SQLAlchemy 엔진 (최초 호출 시 생성 + 타임존 리스너 등록). DB_URL 미설정이면 None."""
+    global _engine, _sessionmaker
+    if _engine is not None or not DB_URL:
+        return _engine
+    with _engine_lock:
+        if _engine is None:
+            engine = create_engine(
+                DB_URL,
+                pool_pre_ping=True,      # 끊긴 커넥션 자동 감지(원격 DB 일시 단절 대비)
+                pool_recycle=1800,       # 30분마다 커넥션 재생성(stale 방지)
+                pool_size=DB_POOL_SIZE,
+                max_overflow=_pool_max_overflow(),
+                connect_args={'connect_timeout': 10},
+            )
+            # 엔진에 이벤트 리스너 등록
+            try:
+                event.listen(engine, 'connect', set_timezone)
+                db_logger.info("DB 세션 타임존을 Asia/Seoul로 설정했습니다.")
+            except Exception as e:
+                db_logger.error(f"DB 타임존 설정 실패: {e}")
+            _sessionmaker = sessionmaker(bind=engine)
+            _engine = engine
+    return _engine
+
+def Session():
+    """공용 엔진에 묶인 ORM 세션 (기존 sessionmaker 호출과 동일하게 사용)."""
+    if get_engine() is None:
+        raise RuntimeError('DB engine not configured (DB_URL)')
+    return _sessionmaker()
+
+def __getattr__(name):
+    # 후방호환: `db.engine` 참조 시점에 생성
+    if name == 'engine':
+        return get_engine()
+    raise AttributeError(f"module 'db' has no attribute {name!r}")
 
 def get_api_info(ext_sys: str = 'KOSIS'):
     """sys_ext_api_info 테이블에서 ext_sys 키로 외부 API 메타데이터를 단건 조회한다.
@@ -61,8 +101,8 @@ def get_api_info(ext_sys: str = 'KOSIS'):
         (이슈 #26 — 멀티 외부 API 소스 확장 아키텍처)
     """
     db_logger.info(f"외부 API 정보 조회 시작 (ext_sys={ext_sys})")
+    session = Session()   # try 밖: 엔진 미설정(RuntimeError)이 finally 의 close 에 가려지지 않도록
     try:
-        session = Session()
         query = text("""
             SELECT ext_api_id, if_name, ext_sys, ext_url, auth, data_format, 
                    latest_sync_time, status
@@ -98,8 +138,8 @@ def get_api_info(ext_sys: str = 'KOSIS'):
 
 def get_stats_src_api_info(ext_api_id):
     db_logger.info(f"통계 소스 API 정보 조회 시작 (ext_api_id={ext_api_id})")
+    session = Session()
     try:
-        session = Session()
         
         if not ext_api_id:
             db_logger.warning("ext_api_id가 없어 통계 소스 정보를 조회할 수 없습니다.")
@@ -145,8 +185,8 @@ def get_stats_src_api_info(ext_api_id):
 
 def get_stats_src_data_info(ext_api_id, stat_tbl_id_list):
     db_logger.info(f"stats_src_data_info 일괄 조회 시작 (ext_api_id={ext_api_id}, stat_tbl_id_list={stat_tbl_id_list})")
+    session = Session()
     try:
-        session = Session()
         if len(stat_tbl_id_list) == 1:
             query = text("""
                 SELECT src_data_id, ext_api_id, ext_sys, stat_api_id, intg_tbl_id, stat_title, stat_org_id, stat_survey_name, stat_pub_dt, periodicity, collect_start_dt, collect_end_dt, stat_tbl_id, stat_tbl_name, stat_latest_chn_dt, stat_data_ref_dt, avail_cat_cols, status, del_yn
@@ -18,21 +18,24 @@ from typing import List
 
 from sqlalchemy import text
 
-from db import engine
+from db import get_engine
+import run_report
 
 logger = logging.getLogger('db')
 
 CREATED_BY = 'SYS-BACH'  # sys_work_type 시드 정본 표기
 
 
-def _execute_batch(sql: str, rows: List[dict]) -> int:
+def _execute_batch(sql: str, rows: List[dict], table: str) -> int:
     if not rows:
         return 0
+    engine = get_engine()
     if engine is None:
         raise RuntimeError('DB engine not configured (DB_URL)')
-    with engine.begin() as conn:
-        for row in rows:
-            conn.execute(text(sql), dict(row, created_by=CREATED_BY))
+    with run_report.span('db.upsert', table=table, rows=len(rows)):
+        with engine.begin() as conn:
+            for row in rows:
+                conn.execute(text(sql), dict(row, created_by=CREATED_BY))
     return len(rows)
 
 
@@ -68,7 +71,7 @@ def upsert_bus_routes(rows: List[dict]) -> int:
         " down_first_time=EXCLUDED.down_first_time, down_last_time=EXCLUDED.down_last_time,"
         " base_dt=EXCLUDED.base_dt, updated_at=CURRENT_TIMESTAMP, updated_by=:created_by"
     )
-    return _execute_batch(sql, rows)
+    return _execute_batch(sql, rows, 'tran_bus_route_info')
 
 
 def upsert_bus_stations(rows: List[dict]) -> int:
@@ -91,7 +94,7 @@ def upsert_bus_stations(rows: List[dict]) -> int:
         " center_yn=EXCLUDED.center_yn, district_cd=EXCLUDED.district_cd,"
         " base_dt=EXCLUDED.base_dt, updated_at=CURRENT_TIMESTAMP, updated_by=:created_by"
     )
-    return _execute_batch(sql, rows)
+    return _execute_batch(sql, rows, 'tran_bus_station_info')
 
 
 def upsert_bus_route_stations(rows: List[dict]) -> int:
@@ -105,7 +108,7 @@ def upsert_bus_route_stations(rows: List[dict]) -> int:
         " turn_seq=EXCLUDED.turn_seq, turn_yn=EXCLUDED.turn_yn,"
         " base_dt=EXCLUDED.base_dt, updated_at=CURRENT_TIMESTAMP, updated_by=:created_by"
     )
-    return _execute_batch(sql, rows)
+    return _execute_batch(sql, rows, 'tran_bus_route_station')
 
 
 def upsert_station_access(rows: List[dict]) -> int:
@@ -133,11 +136,12 @@ def upsert_station_access(rows: List[dict]) -> int:
     for row in rows:
         row.setdefault('latitude', None)
         row.setdefault('longitude', None)
-    return _execute_batch(sql, rows)
+    return _execute_batch(sql, rows, 'poi_station_access_status')
 
 
 def fetch_station_names() -> List[dict]:
     """poi_station_access_status 의 (stn_cd, stn_name, latitude) — 좌표 갱신 매칭용."""
+    engine = get_engine()
     if engine is None:
         raise RuntimeError('DB engine not configured (DB_URL)')
     with engine.begin() as conn:
@@ -156,7 +160,7 @@ def update_station_coords(rows: List[dict]) -> int:
         " updated_at=CURRENT_TIMESTAMP, updated_by=:created_by"
         " WHERE stn_cd=:stn_cd"
     )
-    return _execute_batch(sql, rows)
+    return _execute_batch(sql, rows, 'poi_station_access_status')
 
 
 def upsert_wheelchair_lifts(rows: List[dict]) -> int:
@@ -172,7 +176,7 @@ def upsert_wheelchair_lifts(rows: List[dict]) -> int:
         " start_floor=EXCLUDED.start_floor, end_floor=EXCLUDED.end_floor,"
         " base_dt=EXCLUDED.base_dt, updated_at=CURRENT_TIMESTAMP, updated_by=:created_by"
     )
-    return _execute_batch(sql, rows)
+    return _execute_batch(sql, rows, 'poi_station_wheelchair_lift')
 
 
 def upsert_facilities(rows: List[dict]) -> int:
@@ -193,13 +197,14 @@ def upsert_facilities(rows: List[dict]) -> int:
         " approach_road_yn=EXCLUDED.approach_road_yn, eval_info_raw=EXCLUDED.eval_info_raw,"
         " base_dt=EXCLUDED.base_dt, updated_at=CURRENT_TIMESTAMP, updated_by=:created_by"
     )
-    return _execute_batch(sql, rows)
+    return _execute_batch(sql, rows, 'poi_facility_accessibility')
 
 
 def upsert_tour_bf(rows: List[dict]) -> int:
     """poi_tour_bf_facility — 자연키(UNIQUE) 부재로 (fclt_name, sido_code) 조회 후 분기."""
     if not rows:
         return 0
+    engine = get_engine()
     if engine is None:
         raise RuntimeError('DB engine not configured (DB_URL)')
     select_sql = text(
@@ -229,7 +234,7 @@ def upsert_tour_bf(rows: List[dict]) -> int:
         " WHERE fclt_id=:fclt_id"
     )
     count = 0
-    with engine.begin() as conn:
+    with run_report.span('db.upsert', table='poi_tour_bf_facility', rows=len(rows)), engine.begin() as conn:
         for row in rows:
             params = dict(row, created_by=CREATED_BY)
             found = conn.execute(select_sql, params).fetchone()
@@ -244,6 +249,7 @@ def upsert_tour_bf(rows: List[dict]) -> int:
 
 def touch_latest_sync(ext_sys: str) -> None:
     """sys_ext_api_info.latest_sync_time 갱신 (수집 성공 후 1회)."""
+    engine = get_engine()
     if engine is None:
         return
     with engine.begin() as conn:
@@ -1,64 +1,182 @@
 import logging
+import csv
+import io
 import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+import uuid
 import xml.etree.ElementTree as ET
-from sqlalchemy.orm import sessionmaker
-from db import engine
+from sqlalchemy.orm import sessionmaker, Session as OrmSession
+from db import Session, get_engine
+from log_utils import ProgressLog, preview
+import concurrency
+import deadline
+import profiling
+import run_report
+import table_history
 from datetime import datetime
-from sqlalchemy import text
-from config import get_db_batch_size, get_parallel_workers_db
+from sqlalchemy import event, text
+from config import (
+    get_db_batch_size, get_parallel_workers_db, get_db_parse_processes, MAX_PARALLEL_WORKERS_DB,
+    get_db_shard_row_threshold, get_db_shard_count, get_log_progress_interval_sec,
+)
 import json as pyjson
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
-# SQLAlchemy Session을 생성합니다.
-Session = sessionmaker(bind=engine)
-
-def process_db_insertion(saved_files_info, api_info, stats_src_list, stats_src_data_info_dict):
+def process_db_insertion(saved_files_info, api_info, stats_src_list, stats_src_data_info_dict, manifest=None,
+                         finalize=True):
     """
     저장된 파일들을 기반으로 DB에 데이터를 삽입/수정하는 전체 프로세스를 관리합니다.
     통계표 단위로 격리 커밋하며, 스레드에서는 종료시키지 않고 예외를 상위로 전달하여
     성공/실패를 집계합니다. 전체 성공일 때만 동기화 시각 갱신 + 과거데이터 cleanup 을 수행합니다.
 
-    :return: {"succeeded": [stat_tbl_id, ...], "failed": [(stat_tbl_id, error), ...]}
+    manifest(run_manifest.RunManifest)가 주어지면 통계표별 load 완료/실패를 기록하고,
+    이미 load 완료로 기록된 통계표(--resume)는 적재를 건너뛰고 성공으로 집계합니다.
+    finalize=False 면(예: --mode load 에서 파일이 없는 통계표가 있을 때) 전체 성공이어도
+    동기화 시각 갱신/cleanup 을 하지 않습니다.
+    실행 마감(deadline)까지 끝낼 수 없는 통계표는 적재를 시작하지 않고 미루며(deferred),
+    미룬 통계표가 있으면 동기화 시각 갱신/cleanup 도 보류합니다.
+
+    :return: {"succeeded": [stat_tbl_id, ...], "failed": [(stat_tbl_id, error), ...],
+              "skipped": [stat_tbl_id, ...], "deferred": [stat_tbl_id, ...]}
     """
     logging.info("DB 삽입/수정 프로세스를 시작합니다.")
 
-    parallel_workers = get_parallel_workers_db()
+    skipped = []
+    if manifest is not None:
+        pending = []
+        for fi in saved_files_info:
+            if manifest.is_loaded(fi['stat_tbl_id']):
+                logging.info(f"[{fi['stat_tbl_id']}] resume - 이전 실행에서 적재 완료, 건너뜀")
+                skipped.append(fi['stat_tbl_id'])
+            else:
+                pending.append(fi)
+        saved_files_info = pending
+
+    # 이전 실행 이력(table_history) 기준 예상 적재 시간이 긴 통계표부터 제출 (이력 없으면 데이터 파일 크기)
+    ext_sys = api_info.get('ext_sys')
+    saved_files_info, estimates = table_history.load(ext_sys).order_longest_first(
+        saved_files_info, 'db', table_of=lambda fi: fi['stat_tbl_id'],
+        fallback=lambda fi: table_history.file_size_cost(fi.get('data_path')),
+    )
+    # PARALLEL_AUTO_TUNE=ON 이면 처리량·락 대기에 따라 워커 수 조정 (concurrency)
+    limiter = concurrency.limiter(
+        f'db:{ext_sys}',
+        initial=table_history.pool_size(estimates, get_parallel_workers_db(ext_sys)),
+        maximum=table_history.pool_size(estimates, MAX_PARALLEL_WORKERS_DB),
+    )
+
+    # DB_PARSE_PROCESSES > 0 이면 파싱·행 매핑을 프로세스 풀에 미리 모두 제출하고,
+    # 스레드 풀은 결과(COPY 버퍼)를 받아 DB I/O 만 수행한다.
+    parse_processes = get_db_parse_processes()
+    parse_pool = None
+    buffer_dir = None
+    prepare_futures = {}
+    if parse_processes > 0 and saved_files_info:
+        buffer_dir = tempfile.mkdtemp(prefix='kosis_copy_')
+        parse_pool = ProcessPoolExecutor(
+            max_workers=parse_processes,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+        for fi in saved_files_info:
+            stats_src = next((s for s in stats_src_list if s['stat_tbl_id'] == fi['stat_tbl_id']), None) or {}
+            prepare_futures[id(fi)] = parse_pool.submit(
+                prepare_statistic_files, fi, stats_src.get('stat_tbl_id'), buffer_dir
+            )
+        logging.info(f"파싱/행 매핑 프로세스 풀 사용: processes={parse_processes}, buffer_dir={buffer_dir}")
 
     def worker(file_info):
+        stat_tbl_id = file_info['stat_tbl_id']
+        with limiter.slot():
+            if deadline.should_defer(estimates.get(str(stat_tbl_id))):
+                deadline.defer(stat_tbl_id, 'db', f'예상 {estimates.get(str(stat_tbl_id), 0):.0f}초')
+                return None
+            with run_report.table_scope(stat_tbl_id), profiling.table(stat_tbl_id), run_report.span('db.total'):
+                return _worker(file_info)
+
+    def _worker(file_info):
+        prepared = None
         session = Session()
         try:
             stat_tbl_id = file_info['stat_tbl_id']
             stats_src = next((s for s in stats_src_list if s['stat_tbl_id'] == stat_tbl_id), None)
             stats_data_info = stats_src_data_info_dict.get(stat_tbl_id, {})
-            process_single_statistic(session, file_info, api_info, stats_src, stats_data_info)
-            session.commit()
+            if id(file_info) in prepare_futures:
+                with run_report.span('db.prepare_wait'):
+                    prepared = prepare_futures[id(file_info)].result()
+                run_report.record('db.prepare', prepared.get('prepare_sec'), rows=prepared['record_count'])
+            profile = process_single_statistic(session, file_info, api_info, stats_src, stats_data_info, prepared=prepared)
+            with run_report.span('db.commit'):
+                session.commit()
+            if manifest is not None:
+                manifest.mark_loaded(stat_tbl_id)
+            _write_data_profile(file_info, profile)
             return stat_tbl_id
         except Exception as e:
             session.rollback()
+            if concurrency.is_lock_wait(e):
+                concurrency.report_congestion('db lock wait')
             logging.error(f"DB 처리 중 에러(통계: {file_info['stat_tbl_id']}): {e}", exc_info=True)
+            if manifest is not None:
+                manifest.mark_failed(file_info['stat_tbl_id'], 'load', e)
             raise
         finally:
             session.close()
+            if prepared and prepared.get('copy_path'):
+                try:
+                    os.remove(prepared['copy_path'])
+                except OSError:
+                    pass
 
-    succeeded = []
+    succeeded = list(skipped)
     failed = []
-    with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
-        future_map = {executor.submit(worker, fi): fi for fi in saved_files_info}
-        for future in as_completed(future_map):
-            fi = future_map[future]
-            try:
-                future.result()
-                succeeded.append(fi['stat_tbl_id'])
-            except Exception as e:
-                failed.append((fi['stat_tbl_id'], str(e)))
+    deferred = []
+    try:
+        worker = run_report.in_context(worker)
+        with ThreadPoolExecutor(max_workers=limiter.workers) as executor:
+            future_map = {executor.submit(worker, fi): fi for fi in saved_files_info}
+            for future in as_completed(future_map):
+                fi = future_map[future]
+                try:
+                    if future.result() is None:
+                        deferred.append(fi['stat_tbl_id'])
+                    else:
+                        succeeded.append(fi['stat_tbl_id'])
+                except Exception as e:
+                    failed.append((fi['stat_tbl_id'], str(e)))
+    finally:
+        limiter.close()
+        if parse_pool is not None:
+            # shutdown(cancel_futures=True) 는 3.9+ — 아직 시작하지 않은 파싱 작업은 직접 취소
+            for future in prepare_futures.values():
+                future.cancel()
+            parse_pool.shutdown(wait=True)
+            shutil.rmtree(buffer_dir, ignore_errors=True)
 
     if failed:
         logging.error(
             f"DB 처리 실패 {len(failed)}건 / 성공 {len(succeeded)}건. "
             f"실패 통계: {[f[0] for f in failed]} — 동기화 시각 갱신/cleanup 보류."
         )
-        return {"succeeded": succeeded, "failed": failed}
+        return {"succeeded": succeeded, "failed": failed, "skipped": skipped, "deferred": deferred}
+    if deferred:
+        logging.warning(f"실행 마감으로 적재를 미룬 통계 {len(deferred)}건 — 동기화 시각 갱신/cleanup 보류.")
+        return {"succeeded": succeeded, "failed": [], "skipped": skipped, "deferred": deferred}
+    if not finalize:
+        logging.warning("finalize=False (적재 대상 누락·마감으로 미룬 수집 또는 분산 수집 단위) — 동기화 시각 갱신/cleanup 보류.")
+        return {"succeeded": succeeded, "failed": [], "skipped": skipped, "deferred": deferred}
 
+    finalize_db_insertion(api_info, stats_src_list, stats_src_data_info_dict)
+    return {"succeeded": succeeded, "failed": [], "skipped": skipped, "deferred": deferred}
+
+def finalize_db_insertion(api_info, stats_src_list, stats_src_data_info_dict):
+    """전체 통계표 적재 성공 후 1회: 시스템 동기화 시각 갱신 + 과거데이터 cleanup.
+
+    process_db_insertion(finalize=True) 와 분산 수집(distributed.py)의 마지막 작업자가 호출한다.
+    """
     # 전체 성공 시에만 시스템 전체 동기화 시각 갱신(세션 누수 방지 위해 try/finally close)
     sync_session = Session()
     try:
@@ -67,47 +185,84 @@ def process_db_insertion(saved_files_info, api_info, stats_src_list, stats_src_d
         sync_session.close()
     logging.info("DB 처리가 성공적으로 완료되었습니다.")
     # 모든 데이터 커밋 후 cleanup 실행
-    cleanup_old_data(api_info, stats_src_list, stats_src_data_info_dict)
-    return {"succeeded": succeeded, "failed": []}
+    with run_report.span('db.cleanup'):
+        cleanup_old_data(api_info, stats_src_list, stats_src_data_info_dict)
 
-def process_single_statistic(session, file_info, api_info, stats_src, stats_data_info):
+def process_single_statistic(session, file_info, api_info, stats_src, stats_data_info, prepared=None):
     """
     하나의 통계 데이터에 대한 DB 처리 로직을 담당합니다.
     (1단계 ~ 5단계 로직이 여기에 구현됩니다)
+
+    prepared 가 주어지면(prepare_statistic_files 의 프로세스 풀 결과) 파일 파싱·행 매핑을
+    생략하고 COPY 버퍼와 미리 매핑된 메타 행으로 DB I/O 만 수행합니다.
+
+    :return: 원본 적재 중 1회 순회로 수집한 프로파일 dict (OriginDataProfile.to_dict())
     """
     logging.info(f"[{stats_src.get('stat_tbl_id')}] 단일 통계 처리 시작.")
-    # 1. latest 파일 파싱 (최신 날짜 추출)
-    latest_path = file_info['latest_path']
-    latest_date = _parse_latest_file_for_latest_date(latest_path)
-    logging.info(f"최신 SendDe 날짜 추출: {latest_date}")
-
-    # 2. data 파일 파싱
-    data_path = file_info['data_path']
-    with open(data_path, 'r', encoding='utf-8') as f:
-        data_json = json.load(f)
-    logging.info(f"data 파일 로드: {data_path}, 레코드 수: {len(data_json) if isinstance(data_json, list) else '1'}")
+    if prepared is None:
+        # 1. latest 파일 파싱 (최신 날짜 추출)
+        latest_path = file_info['latest_path']
+        latest_date = _parse_latest_file_for_latest_date(latest_path)
+        logging.info(f"최신 SendDe 날짜 추출: {latest_date}")
 
-    # 3. stats_kosis_origin_data 테이블에 bulk insert
-    _insert_origin_data(session, data_json, file_info, stats_src, stats_data_info, latest_date)
+        # 2. data 파일 파싱
+        data_path = file_info['data_path']
+        with run_report.span('db.parse_data', bytes=os.path.getsize(data_path)) as sp:
+            with open(data_path, 'r', encoding='utf-8') as f:
+                data_json = json.load(f)
+            record_count = len(data_json) if isinstance(data_json, list) else 1
+            sp.add(rows=record_count)
+        logging.info(f"data 파일 로드: {data_path}, 레코드 수: {len(data_json) if isinstance(data_json, list) else '1'}")
+
+        sharded = _should_shard(record_count)
+        if sharded:
+            # 3~4. 대용량: prd_de 샤드 병렬 스테이징 후 현재 트랜잭션에서 게시
+            rows, profile = _map_origin_data(data_json, file_info, stats_src, latest_date)
+            del data_json
+            with run_report.span('db.load_sharded', rows=record_count):
+                _load_sharded(session, file_info, stats_data_info, latest_date, rows=rows)
+        else:
+            # 3. stats_kosis_origin_data 테이블에 bulk insert (적재 루프에서 프로파일 동시 수집)
+            with run_report.span('db.insert_origin', rows=record_count):
+                profile = _insert_origin_data(session, data_json, file_info, stats_src, stats_data_info, latest_date)
+        meta_rows = None
+    else:
+        # 1~3. 프로세스 풀에서 파싱·매핑 완료 — COPY 버퍼 적재만 수행
+        latest_date = prepared['latest_date']
+        logging.info(f"최신 SendDe 날짜 추출: {latest_date} (프로세스 풀 파싱, 레코드 수: {prepared['record_count']})")
+        profile = prepared['profile']
+        sharded = _should_shard(prepared['record_count'])
+        if sharded:
+            with run_report.span('db.load_sharded', rows=prepared['record_count']):
+                _load_sharded(session, file_info, stats_data_info, latest_date, copy_path=prepared['copy_path'])
+        else:
+            with run_report.span('db.copy_origin', rows=prepared['record_count']):
+                _copy_origin_rows(session, prepared['copy_path'])
+        meta_rows = prepared['meta_rows']
     logging.info(f"stats_kosis_origin_data 테이블에 데이터 삽입 완료.")
 
-    # 4. 통계 통합 테이블(intg_tbl_id)로 데이터 이관
-    _transfer_to_integration_table(session, file_info, stats_src, stats_data_info, latest_date)
+    # 4. 통계 통합 테이블(intg_tbl_id)로 데이터 이관 (샤딩 적재는 게시 단계에서 이미 이관)
+    if not sharded:
+        with run_report.span('db.transfer'):
+            _transfer_to_integration_table(session, file_info, stats_src, stats_data_info, latest_date)
     logging.info(f"통계 통합 테이블({stats_data_info.get('intg_tbl_id')})로 데이터 이관 완료.")
 
     # 5. 메타데이터 테이블(stats_kosis_metadata_code) 적재
     meta_path = file_info['meta_path']
-    _insert_metadata(session, meta_path, file_info, stats_src, stats_data_info, latest_date)
+    with run_report.span('db.metadata'):
+        _insert_metadata(session, meta_path, file_info, stats_src, stats_data_info, latest_date, meta_rows=meta_rows)
     logging.info(f"stats_kosis_metadata_code 테이블에 메타데이터 적재 완료.")
 
-    # 6. stats_src_data_info 테이블 업데이트
-    _update_stats_src_data_info(session, file_info, data_json, latest_date)
+    with run_report.span('db.update_mgmt'):
+        # 6. stats_src_data_info 테이블 업데이트 (avail_cat_cols 는 프로파일에서 — data_json 재순회 없음)
+        _update_stats_src_data_info(session, file_info, profile, latest_date)
 
-    # 7. sys_data_summary_info 테이블 업데이트
-    _update_sys_data_summary_info(session, file_info, stats_data_info, latest_date)
+        # 7. sys_data_summary_info 테이블 업데이트
+        _update_sys_data_summary_info(session, file_info, stats_data_info, latest_date)
 
-    # 8. 관리 테이블(sys_stats_src_api_info, sys_ext_api_info) 최신화
-    _update_management_tables(session, file_info, api_info, stats_src, stats_data_info)
+        # 8. 관리 테이블(sys_stats_src_api_info, sys_ext_api_info) 최신화
+        _update_management_tables(session, file_info, api_info, stats_src, stats_data_info)
+    return profile.to_dict()
 
 def _parse_latest_file_for_latest_date(latest_path):
     """
@@ -139,58 +294,192 @@ def _parse_latest_file_for_latest_date(latest_path):
     # 가장 최신 날짜 반환
     return max(send_de_list)
 
-def _insert_origin_data(session, data_json, file_info, stats_src, stats_data_info, latest_date):
+CAT_COLS = ('c1', 'c2', 'c3', 'c4')
+DATA_PROFILE_LOG = 'data_profile.log'
+
+
+class OriginDataProfile:
+    """원본 데이터 적재 루프 안에서 1회 순회로 통계표 프로파일을 누적한다.
+
+    _insert_origin_data 가 행을 매핑하면서 observe() 를 호출하므로, avail_cat_cols
+    계산이나 모니터링용 통계를 위해 data_json 을 다시 순회하지 않는다.
+    수집 항목: 행 수, c1~c4 존재 여부, 기간(prd_de) 범위/개수, 단위명,
+    DT 수치 min/max 및 결측('-'/빈값)·비수치 건수.
     """
-    stats_kosis_origin_data 테이블에 데이터 bulk insert
+
+    __slots__ = ('row_count', 'cat_present', 'periods', 'units',
+                 'dt_min', 'dt_max', 'dt_null', 'dt_non_numeric')
+
+    def __init__(self):
+        self.row_count = 0
+        self.cat_present = dict.fromkeys(CAT_COLS, False)
+        self.periods = set()
+        self.units = set()
+        self.dt_min = None
+        self.dt_max = None
+        self.dt_null = 0
+        self.dt_non_numeric = 0
+
+    def observe(self, row):
+        """원본 응답 행(dict) 1건을 반영한다. dict 가 아닌 요소는 건너뛴다."""
+        if not isinstance(row, dict):
+            return
+        self.row_count += 1
+        for c in CAT_COLS:
+            if not self.cat_present[c] and (row.get(c.upper()) or row.get(c)):
+                self.cat_present[c] = True
+        prd_de = row.get('PRD_DE')
+        if prd_de:
+            self.periods.add(str(prd_de))
+        unit_nm = row.get('UNIT_NM')
+        if unit_nm:
+            self.units.add(unit_nm)
+        dt = row.get('DT')
+        if dt is None or dt == '' or dt == '-':
+            self.dt_null += 1
+            return
+        try:
+            value = float(dt)
+        except (TypeError, ValueError):
+            self.dt_non_numeric += 1
+            return
+        if self.dt_min is None or value < self.dt_min:
+            self.dt_min = value
+        if self.dt_max is None or value > self.dt_max:
+            self.dt_max = value
+
+    @property
+    def avail_cat_cols(self):
+        return [c for c in CAT_COLS if self.cat_present[c]]
+
+    def to_dict(self):
+        periods = sorted(self.periods)
+        return {
+            'row_count': self.row_count,
+            'avail_cat_cols': self.avail_cat_cols,
+            'prd_de_min': periods[0] if periods else None,
+            'prd_de_max': periods[-1] if periods else None,
+            'prd_de_count': len(periods),
+            'unit_nms': sorted(self.units),
+            'dt_min': self.dt_min,
+            'dt_max': self.dt_max,
+            'dt_null_count': self.dt_null,
+            'dt_non_numeric_count': self.dt_non_numeric,
+        }
+
+
+def _write_data_profile(file_info, profile):
+    """통계표 프로파일을 logs/data_profile.log 에 JSON 1줄로 누적(모니터링용).
+
+    stats_src_data_info 갱신과 같은 키(src_data_id, stat_tbl_id)로 기록하며,
+    커밋 이후 호출되므로 기록 실패가 적재 결과에 영향을 주지 않도록 경고만 남긴다.
     """
+    if not profile:
+        return
+    record = {
+        'logged_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'src_data_id': file_info.get('src_data_id'),
+        'stat_tbl_id': file_info.get('stat_tbl_id'),
+    }
+    record.update(profile)
+    try:
+        log_dir = 'logs'
+        os.makedirs(log_dir, exist_ok=True)
+        with open(os.path.join(log_dir, DATA_PROFILE_LOG), 'a', encoding='utf-8') as f:
+            f.write(pyjson.dumps(record, ensure_ascii=False) + '\n')
+    except OSError as e:
+        logging.warning(f"[{record['stat_tbl_id']}] data profile 기록 실패: {e}")
+
+ORIGIN_COLUMNS = (
+    'src_data_id', 'org_id', 'tbl_id', 'tbl_nm',
+    'c1', 'c2', 'c3', 'c4',
+    'c1_obj_nm', 'c2_obj_nm', 'c3_obj_nm', 'c4_obj_nm',
+    'c1_nm', 'c2_nm', 'c3_nm', 'c4_nm',
+    'itm_id', 'itm_nm', 'unit_nm',
+    'prd_se', 'prd_de', 'dt', 'lst_chn_de',
+    'stat_latest_chn_dt', 'data_ref_dt', 'created_by',
+)
+
+# COPY 버퍼(CSV)에서 NULL 표기. 빈 문자열('')과 구분하기 위해 \N 을 사용한다.
+COPY_NULL = '\\N'
+ORIGIN_COPY_SQL = (
+    "COPY stats_kosis_origin_data (" + ", ".join(ORIGIN_COLUMNS) + ") "
+    "FROM STDIN WITH (FORMAT csv, NULL '" + COPY_NULL + "')"
+)
+
+
+def _map_origin_row(row, src_data_id, default_tbl_id, stat_latest_chn_dt, data_ref_dt, created_by="SYS-BATCH"):
+    """KOSIS 응답 행 1건 -> stats_kosis_origin_data 컬럼 dict."""
+    return {
+        'src_data_id': src_data_id,
+        'org_id': row.get('ORG_ID') or row.get('ORG_NM') or 0,  # 실제 데이터에 맞게 조정 필요
+        'tbl_id': row.get('TBL_ID') or row.get('TBL_NM') or default_tbl_id,
+        'tbl_nm': row.get('TBL_NM') or '',
+        'c1': row.get('C1') or '',
+        'c2': row.get('C2') or '',
+        'c3': row.get('C3') or '',
+        'c4': row.get('C4') or '',
+        'c1_obj_nm': row.get('C1_OBJ_NM') or '',
+        'c2_obj_nm': row.get('C2_OBJ_NM') or '',
+        'c3_obj_nm': row.get('C3_OBJ_NM') or '',
+        'c4_obj_nm': row.get('C4_OBJ_NM') or '',
+        'c1_nm': row.get('C1_NM') or '',
+        'c2_nm': row.get('C2_NM') or '',
+        'c3_nm': row.get('C3_NM') or '',
+        'c4_nm': row.get('C4_NM') or '',
+        'itm_id': row.get('ITM_ID') or row.get('ITM_NM') or '',
+        'itm_nm': row.get('ITM_NM') or '',
+        'unit_nm': row.get('UNIT_NM') or '',
+        'prd_se': row.get('PRD_SE') or '',
+        'prd_de': row.get('PRD_DE') or '',
+        'dt': row.get('DT') or '',
+        'lst_chn_de': row.get('LST_CHN_DE') or '',
+        'stat_latest_chn_dt': stat_latest_chn_dt,
+        'data_ref_dt': data_ref_dt,
+        'created_by': created_by
+    }
+
+def _map_origin_data(data_json, file_info, stats_src, latest_date):
+    """data_json -> (원본 행 dict 목록, OriginDataProfile). 매핑과 프로파일을 1회 순회로 처리."""
     from datetime import date
     rows = []
+    profile = OriginDataProfile()
     src_data_id = file_info['src_data_id']
     stat_latest_chn_dt = latest_date
     data_ref_dt = date.today()
-    created_by = "SYS-BATCH"
+    default_tbl_id = stats_src.get('stat_tbl_id')
 
     # data_json이 리스트가 아닐 경우 리스트로 변환
     if not isinstance(data_json, list):
         data_json = [data_json]
 
     for row in data_json:
-        db_row = {
-            'src_data_id': src_data_id,
-            'org_id': row.get('ORG_ID') or row.get('ORG_NM') or 0,  # 실제 데이터에 맞게 조정 필요
-            'tbl_id': row.get('TBL_ID') or row.get('TBL_NM') or stats_src.get('stat_tbl_id'),
-            'tbl_nm': row.get('TBL_NM') or '',
-            'c1': row.get('C1') or '',
-            'c2': row.get('C2') or '',
-            'c3': row.get('C3') or '',
-            'c4': row.get('C4') or '',
-            'c1_obj_nm': row.get('C1_OBJ_NM') or '',
-            'c2_obj_nm': row.get('C2_OBJ_NM') or '',
-            'c3_obj_nm': row.get('C3_OBJ_NM') or '',
-            'c4_obj_nm': row.get('C4_OBJ_NM') or '',
-            'c1_nm': row.get('C1_NM') or '',
-            'c2_nm': row.get('C2_NM') or '',
-            'c3_nm': row.get('C3_NM') or '',
-            'c4_nm': row.get('C4_NM') or '',
-            'itm_id': row.get('ITM_ID') or row.get('ITM_NM') or '',
-            'itm_nm': row.get('ITM_NM') or '',
-            'unit_nm': row.get('UNIT_NM') or '',
-            'prd_se': row.get('PRD_SE') or '',
-            'prd_de': row.get('PRD_DE') or '',
-            'dt': row.get('DT') or '',
-            'lst_chn_de': row.get('LST_CHN_DE') or '',
-            'stat_latest_chn_dt': stat_latest_chn_dt,
-            'data_ref_dt': data_ref_dt,
-            'created_by': created_by
-        }
-        rows.append(db_row)
+        profile.observe(row)
+        rows.append(_map_origin_row(row, src_data_id, default_tbl_id, stat_latest_chn_dt, data_ref_dt))
+    return rows, profile
+
+def _insert_origin_data(session, data_json, file_info, stats_src, stats_data_info, latest_date):
+    """
+    stats_kosis_origin_data 테이블에 데이터 bulk insert
+
+    :return: 적재 루프에서 함께 누적한 OriginDataProfile
+    """
+    rows, profile = _map_origin_data(data_json, file_info, stats_src, latest_date)
 
     if not rows:
         logging.warning("삽입할 데이터가 없습니다.")
-        return
+        return profile
+
+    _insert_origin_rows(session, rows)
+    return profile
 
-    insert_sql = '''
-    INSERT INTO stats_kosis_origin_data (
+def _insert_origin_rows(session, rows, table='stats_kosis_origin_data'):
+    """매핑된 원본 행 dict 목록을 DB_BATCH_SIZE 단위 executemany 로 삽입.
+
+    session 은 ORM Session 또는 Connection, table 은 본 테이블 또는 같은 구조의 스테이징 테이블.
+    """
+    insert_sql = f'''
+    INSERT INTO {table} (
         src_data_id, org_id, tbl_id, tbl_nm,
         c1, c2, c3, c4,
         c1_obj_nm, c2_obj_nm, c3_obj_nm, c4_obj_nm,
@@ -209,13 +498,86 @@ def _insert_origin_data(session, data_json, file_info, stats_src, stats_data_inf
     )
     '''
     batch_size = get_db_batch_size()
+    progress = ProgressLog(f"{table} bulk insert", total=len(rows), interval_sec=get_log_progress_interval_sec())
     for i in range(0, len(rows), batch_size):
         batch = rows[i:i+batch_size]
         session.execute(
             text(insert_sql),
             batch
         )
-        logging.info(f"stats_kosis_origin_data에 {len(batch)}건 bulk insert 완료.")
+        progress.update(len(batch))
+    progress.done()
+
+def _copy_origin_rows(session, source, table='stats_kosis_origin_data'):
+    """CSV COPY 버퍼(파일 경로 또는 파일 객체)를 현재 트랜잭션으로 적재한다.
+
+    psycopg2 커서(copy_expert)면 COPY FROM STDIN 으로 스트리밍하고,
+    그 외 드라이버는 버퍼를 읽어 기존 executemany 경로로 폴백한다.
+    session 은 ORM Session 또는 Connection.
+    """
+    conn = session.connection() if isinstance(session, OrmSession) else session
+    cursor = conn.connection.cursor()
+    copy_sql = ORIGIN_COPY_SQL.replace('stats_kosis_origin_data', table, 1)
+    f = open(source, 'r', encoding='utf-8', newline='') if isinstance(source, str) else source
+    try:
+        if hasattr(cursor, 'copy_expert'):
+            cursor.copy_expert(copy_sql, f)
+            logging.info(f"{table}에 {cursor.rowcount}건 COPY 완료.")
+            return
+        rows = [
+            {col: (None if val == COPY_NULL else val) for col, val in zip(ORIGIN_COLUMNS, record)}
+            for record in csv.reader(f)
+        ]
+    finally:
+        cursor.close()
+        if isinstance(source, str):
+            f.close()
+    if rows:
+        _insert_origin_rows(session, rows, table=table)
+
+def prepare_statistic_files(file_info, default_tbl_id, buffer_dir):
+    """[프로세스 풀 작업] 통계표 1건의 latest/data/meta 파싱과 행 매핑 (DB 접근 없음).
+
+    GIL 에 묶이는 순수 파이썬 CPU 작업(JSON 로드, 행 dict 매핑, 프로파일 누적,
+    XML 순회)을 별도 프로세스에서 수행하고, 원본 행은 부모로 되돌려 보내는 대신
+    buffer_dir 아래 CSV COPY 버퍼 파일로 기록한다. DB 스레드는 결과를 받아
+    COPY/INSERT 만 수행한다.
+
+    :return: {'latest_date', 'record_count', 'profile', 'copy_path', 'meta_rows', 'prepare_sec'}
+    """
+    from datetime import date
+    started = time.perf_counter()
+    src_data_id = file_info['src_data_id']
+    stat_tbl_id = file_info['stat_tbl_id']
+    latest_date = _parse_latest_file_for_latest_date(file_info['latest_path'])
+
+    with open(file_info['data_path'], 'r', encoding='utf-8') as f:
+        data_json = json.load(f)
+    if not isinstance(data_json, list):
+        data_json = [data_json]
+
+    profile = OriginDataProfile()
+    data_ref_dt = date.today()
+    copy_path = os.path.join(buffer_dir, f"origin_{os.getpid()}_{src_data_id}_{stat_tbl_id}.csv")
+    with open(copy_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        for row in data_json:
+            profile.observe(row)
+            db_row = _map_origin_row(row, src_data_id, default_tbl_id, latest_date, data_ref_dt)
+            writer.writerow([COPY_NULL if db_row[col] is None else db_row[col] for col in ORIGIN_COLUMNS])
+    record_count = len(data_json)
+    del data_json
+
+    root = parse_xml_skip_leading_nonxml(file_info['meta_path'])
+    meta_rows = _map_metadata_rows(root, src_data_id, stat_tbl_id, latest_date)
+    return {
+        'latest_date': latest_date,
+        'record_count': record_count,
+        'profile': profile,
+        'copy_path': copy_path,
+        'meta_rows': meta_rows,
+        'prepare_sec': time.perf_counter() - started,
+    }
 
 def _transfer_to_integration_table(session, file_info, stats_src, stats_data_info, latest_date):
     """
@@ -232,6 +594,22 @@ def _transfer_to_integration_table(session, file_info, stats_src, stats_data_inf
         return
 
     # 1. 기존 데이터 삭제 (동일한 날짜의 데이터는 생성 시간을 고려하여 삭제)
+    _delete_integration_rows(session, intg_tbl_id, src_data_id, stat_latest_chn_dt)
+
+    # 2. 신규 데이터 insert (stats_kosis_origin_data에서 select하여 insert)
+    insert_sql = _integration_insert_sql(intg_tbl_id, intg_tbl_id, 'stats_kosis_origin_data')
+    session.execute(
+        text(insert_sql),
+        {
+            'src_data_id': src_data_id,
+            'stat_tbl_id': stat_tbl_id,
+            'stat_latest_chn_dt': stat_latest_chn_dt
+        }
+    )
+    logging.info(f"{intg_tbl_id}로 신규 데이터 insert 완료.")
+
+def _delete_integration_rows(session, intg_tbl_id, src_data_id, stat_latest_chn_dt):
+    """통합 테이블에서 동일 src_data_id/변경일의 오늘 이전 데이터를 삭제."""
     delete_sql = f"""
     DELETE FROM {intg_tbl_id}
     WHERE src_data_id = :src_data_id
@@ -248,34 +626,24 @@ def _transfer_to_integration_table(session, file_info, stats_src, stats_data_inf
     )
     logging.info(f"{intg_tbl_id}에서 기존 데이터 삭제 완료 (오늘 이전 데이터만 삭제).")
 
-    # 2. 신규 데이터 insert (stats_kosis_origin_data에서 select하여 insert)
+INTEGRATION_COLUMNS = "src_data_id, prd_de, c1, c2, c3, itm_id, unit_nm, dt, lst_chn_de, src_latest_chn_dt, created_by"
+
+def _integration_insert_sql(intg_tbl_id, target_table, source_table, prd_de_filter=False):
+    """원본(source_table) -> 통합 컬럼(target_table) 변환 INSERT ... SELECT 문.
+
+    target_table 은 통합 테이블 자체 또는 같은 구조의 스테이징 테이블이며,
+    prd_de_filter=True 면 :prd_de_list 에 포함된 기간만 이관한다(샤드 단위 이관).
+    """
     if intg_tbl_id == "stats_dis_hlth_disease_cost_sub":
         # dt는 문자열로 insert
-        insert_sql = f"""
-        INSERT INTO {intg_tbl_id} (
-            src_data_id, prd_de, c1, c2, c3, itm_id, unit_nm, dt, lst_chn_de, src_latest_chn_dt, created_by
-        )
-        SELECT 
-            src_data_id,
-            CAST(prd_de AS INTEGER),
-            c1, c2, c3,
-            itm_id,
-            unit_nm,
-            dt,  -- 문자열 그대로
-            NULLIF(lst_chn_de, '')::date,
-            :stat_latest_chn_dt,
-            'SYS-BATCH'
-        FROM stats_kosis_origin_data
-        WHERE src_data_id = :src_data_id
-          AND tbl_id = :stat_tbl_id
-          AND stat_latest_chn_dt = :stat_latest_chn_dt
-          AND prd_de ~ '^[0-9]+$'   -- 빈/비숫자 period 행 제외(CAST 실패 방지)
-        """
+        dt_expr = "dt,  -- 문자열 그대로"
     else:
         # dt는 숫자로 변환, '-' 또는 ''일 경우 0으로 변환
-        insert_sql = f"""
-        INSERT INTO {intg_tbl_id} (
-            src_data_id, prd_de, c1, c2, c3, itm_id, unit_nm, dt, lst_chn_de, src_latest_chn_dt, created_by
+        dt_expr = "CASE WHEN dt = '-' OR dt = '' THEN 0 ELSE CAST(dt AS NUMERIC(15,3)) END,"
+    prd_de_cond = "\n          AND prd_de = ANY(:prd_de_list)" if prd_de_filter else ""
+    return f"""
+        INSERT INTO {target_table} (
+            {INTEGRATION_COLUMNS}
         )
         SELECT 
             src_data_id,
@@ -283,25 +651,140 @@ def _transfer_to_integration_table(session, file_info, stats_src, stats_data_inf
             c1, c2, c3,
             itm_id,
             unit_nm,
-            CASE WHEN dt = '-' OR dt = '' THEN 0 ELSE CAST(dt AS NUMERIC(15,3)) END,
+            {dt_expr}
             NULLIF(lst_chn_de, '')::date,
             :stat_latest_chn_dt,
             'SYS-BATCH'
-        FROM stats_kosis_origin_data
+        FROM {source_table}
         WHERE src_data_id = :src_data_id
           AND tbl_id = :stat_tbl_id
           AND stat_latest_chn_dt = :stat_latest_chn_dt
-          AND prd_de ~ '^[0-9]+$'   -- 빈/비숫자 period 행 제외(CAST 실패 방지)
+          AND prd_de ~ '^[0-9]+$'   -- 빈/비숫자 period 행 제외(CAST 실패 방지){prd_de_cond}
         """
-    session.execute(
-        text(insert_sql),
-        {
-            'src_data_id': src_data_id,
-            'stat_tbl_id': stat_tbl_id,
-            'stat_latest_chn_dt': stat_latest_chn_dt
-        }
-    )
-    logging.info(f"{intg_tbl_id}로 신규 데이터 insert 완료.")
+
+def _plan_prd_de_shards(prd_de_counts, shard_count):
+    """prd_de 별 행 수 -> 행 수가 고르게 나뉘도록 연속된 prd_de 묶음 목록(최대 shard_count 개)."""
+    items = sorted(prd_de_counts.items())
+    total = sum(cnt for _, cnt in items)
+    if not items or shard_count <= 1:
+        return [[prd for prd, _ in items]] if items else []
+    target = total / shard_count
+    shards = []
+    current = []
+    acc = 0
+    for prd, cnt in items:
+        current.append(prd)
+        acc += cnt
+        if len(shards) < shard_count - 1 and acc >= target * (len(shards) + 1):
+            shards.append(current)
+            current = []
+    if current:
+        shards.append(current)
+    return shards
+
+def _should_shard(record_count):
+    threshold = get_db_shard_row_threshold()
+    return threshold > 0 and get_db_shard_count() > 1 and record_count > threshold
+
+def _load_sharded(session, file_info, stats_data_info, latest_date, rows=None, copy_path=None):
+    """대용량 통계표 원본 적재 + 통합 이관을 prd_de 샤드로 병렬 처리한다.
+
+    1단계(스테이징): 원본/통합 구조를 복제한 UNLOGGED 스테이징 테이블을 만들고,
+      prd_de 범위로 나눈 샤드마다 별도 커넥션에서 원본 행 적재 + 통합 변환을 병렬 수행·커밋.
+      스테이징 테이블은 조회 대상이 아니므로 부분 결과가 외부에 보이지 않는다.
+    2단계(게시): 호출자 세션(통계표 단위 트랜잭션)에서 스테이징 -> 본 테이블 INSERT ... SELECT.
+      이후 단계와 함께 한 번에 커밋되므로 논리적으로는 기존과 같은 단일 커밋이다.
+    스테이징 테이블은 게시와 같은 트랜잭션에서 삭제하고, 게시 전·게시 중 실패나 이후 롤백이면
+    별도 커넥션에서 삭제한다.
+
+    rows(매핑된 dict 목록) 또는 copy_path(프로세스 풀 CSV COPY 버퍼) 중 하나를 받는다.
+    """
+    src_data_id = file_info['src_data_id']
+    stat_tbl_id = file_info['stat_tbl_id']
+    intg_tbl_id = stats_data_info.get('intg_tbl_id')
+    shard_count = get_db_shard_count()
+
+    # 샤드 입력 분할: prd_de 별로 행(또는 CSV 레코드)을 묶는다.
+    groups = {}
+    if rows is not None:
+        for row in rows:
+            groups.setdefault(row['prd_de'], []).append(row)
+    else:
+        prd_idx = ORIGIN_COLUMNS.index('prd_de')
+        with open(copy_path, 'r', encoding='utf-8', newline='') as f:
+            for record in csv.reader(f):
+                groups.setdefault(record[prd_idx], []).append(record)
+    shards = _plan_prd_de_shards({prd: len(v) for prd, v in groups.items()}, shard_count)
+    logging.info(f"[{stat_tbl_id}] prd_de 샤딩 적재: {sum(len(v) for v in groups.values())}건 -> 샤드 {len(shards)}개")
+
+    engine = get_engine()
+    token = uuid.uuid4().hex[:12]
+    stg_origin = f"stg_origin_{token}"
+    stg_intg = f"stg_intg_{token}" if intg_tbl_id else None
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE UNLOGGED TABLE {stg_origin} (LIKE stats_kosis_origin_data INCLUDING DEFAULTS)"))
+        if stg_intg:
+            conn.execute(text(f"CREATE UNLOGGED TABLE {stg_intg} (LIKE {intg_tbl_id} INCLUDING DEFAULTS)"))
+
+    params = {'src_data_id': src_data_id, 'stat_tbl_id': stat_tbl_id, 'stat_latest_chn_dt': latest_date}
+
+    def stage_shard(shard_no, prd_de_list):
+        shard_rows = [r for prd in prd_de_list for r in groups[prd]]
+        with engine.begin() as conn:
+            if rows is not None:
+                _insert_origin_rows(conn, shard_rows, table=stg_origin)
+            else:
+                buf = io.StringIO()
+                csv.writer(buf).writerows(shard_rows)
+                buf.seek(0)
+                _copy_origin_rows(conn, buf, table=stg_origin)
+            if stg_intg:
+                conn.execute(
+                    text(_integration_insert_sql(intg_tbl_id, stg_intg, stg_origin, prd_de_filter=True)),
+                    dict(params, prd_de_list=list(prd_de_list)),
+                )
+        logging.info(f"[{stat_tbl_id}] 샤드 {shard_no} 스테이징 완료: prd_de {prd_de_list[0]}~{prd_de_list[-1]}, {len(shard_rows)}건")
+
+    staging = [t for t in (stg_origin, stg_intg) if t]
+    try:
+        with ThreadPoolExecutor(max_workers=len(shards) or 1) as executor:
+            stage_shard = run_report.in_context(stage_shard)
+            futures = [executor.submit(stage_shard, i, prds) for i, prds in enumerate(shards, 1)]
+            for future in as_completed(futures):
+                future.result()
+
+        # 게시: 호출자 세션 트랜잭션 안에서 스테이징 -> 본 테이블. 세션이 읽은 스테이징 테이블은
+        # 커밋 전까지 ACCESS SHARE 잠금이 남아 별도 커넥션의 DROP 이 끝없이 기다리므로 같은 세션에서
+        # 삭제한다. SAVEPOINT 로 감싸 게시가 실패하면 잠금까지 풀고 아래 except 에서 별도로 삭제한다.
+        with session.begin_nested():
+            cols = ", ".join(ORIGIN_COLUMNS)
+            session.execute(text(f"INSERT INTO stats_kosis_origin_data ({cols}) SELECT {cols} FROM {stg_origin}"))
+            logging.info(f"stats_kosis_origin_data 게시 완료 (스테이징 {stg_origin}).")
+            if stg_intg:
+                _delete_integration_rows(session, intg_tbl_id, src_data_id, latest_date)
+                session.execute(text(
+                    f"INSERT INTO {intg_tbl_id} ({INTEGRATION_COLUMNS}) SELECT {INTEGRATION_COLUMNS} FROM {stg_intg}"
+                ))
+                logging.info(f"{intg_tbl_id}로 신규 데이터 게시 완료 (스테이징 {stg_intg}).")
+            else:
+                logging.warning(f"intg_tbl_id가 없어 통합 테이블 이관을 건너뜁니다. stat_tbl_id={stat_tbl_id}")
+            for table in staging:
+                session.execute(text(f"DROP TABLE IF EXISTS {table}"))
+    except BaseException:
+        _drop_staging_tables(engine, staging, stat_tbl_id)
+        raise
+    # 이후 단계 실패로 세션 트랜잭션이 롤백되면 DROP 도 롤백되므로, 잠금이 풀린 롤백 뒤 다시 삭제
+    event.listen(session, 'after_rollback', lambda _session: _drop_staging_tables(engine, staging, stat_tbl_id),
+                 once=True)
+
+def _drop_staging_tables(engine, tables, stat_tbl_id):
+    """샤딩 스테이징 테이블을 별도 커넥션에서 삭제 (호출자 세션이 잠금을 잡고 있지 않을 때만)."""
+    try:
+        with engine.begin() as conn:
+            for table in tables:
+                conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+    except Exception as e:
+        logging.warning(f"[{stat_tbl_id}] 스테이징 테이블 삭제 실패({', '.join(tables)}): {e}")
 
 def parse_xml_skip_leading_nonxml(file_path):
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -315,15 +798,37 @@ def parse_xml_skip_leading_nonxml(file_path):
     xml_str = ''.join(lines[xml_start:])
     return ET.fromstring(xml_str)
 
-def _insert_metadata(session, meta_path, file_info, stats_src, stats_data_info, latest_date):
+def _map_metadata_rows(root, src_data_id, stat_tbl_id, stat_latest_chn_dt, created_by="SYS-BATCH"):
+    """meta XML 루트의 MetaRow -> stats_kosis_metadata_code 컬럼 dict 목록."""
+    rows = []
+    for row in root.findall('.//MetaRow'):
+        db_row = {
+            'src_data_id': src_data_id,
+            'tbl_id': stat_tbl_id,
+            'obj_id': row.findtext('objId') or '',
+            'obj_nm': row.findtext('objNm') or '',
+            'itm_id': row.findtext('itmId') or '',
+            'itm_nm': row.findtext('itmNm') or '',
+            'up_itm_id': row.findtext('upItmId') or '',
+            'obj_id_sn': row.findtext('objIdSn') or None,
+            'unit_id': row.findtext('unitId') or '',
+            'unit_nm': row.findtext('unitNm') or '',
+            'stat_latest_chn_dt': stat_latest_chn_dt,
+            'created_by': created_by
+        }
+        rows.append(db_row)
+    return rows
+
+def _insert_metadata(session, meta_path, file_info, stats_src, stats_data_info, latest_date, meta_rows=None):
     """
     meta XML 파일을 파싱하여 stats_kosis_metadata_code 테이블에 데이터 삭제 및 bulk insert
+
+    meta_rows 가 주어지면(프로세스 풀에서 미리 매핑) XML 파싱을 생략한다.
     """
     from config import get_db_batch_size
     src_data_id = file_info['src_data_id']
     stat_tbl_id = file_info['stat_tbl_id']
     stat_latest_chn_dt = latest_date
-    created_by = "SYS-BATCH"
 
     # 1. 기존 데이터 삭제
     delete_sql = """
@@ -343,24 +848,11 @@ def _insert_metadata(session, meta_path, file_info, stats_src, stats_data_info,
     logging.info(f"stats_kosis_metadata_code에서 기존 메타데이터 삭제 완료., {src_data_id}-{stat_tbl_id}-{stat_latest_chn_dt}")
 
     # 2. meta XML 파싱 및 row 매핑 (설명문 등 무시)
-    root = parse_xml_skip_leading_nonxml(meta_path)
-    rows = []
-    for row in root.findall('.//MetaRow'):
-        db_row = {
-            'src_data_id': src_data_id,
-            'tbl_id': stat_tbl_id,
-            'obj_id': row.findtext('objId') or '',
-            'obj_nm': row.findtext('objNm') or '',
-            'itm_id': row.findtext('itmId') or '',
-            'itm_nm': row.findtext('itmNm') or '',
-            'up_itm_id': row.findtext('upItmId') or '',
-            'obj_id_sn': row.findtext('objIdSn') or None,
-            'unit_id': row.findtext('unitId') or '',
-            'unit_nm': row.findtext('unitNm') or '',
-            'stat_latest_chn_dt': stat_latest_chn_dt,
-            'created_by': created_by
-        }
-        rows.append(db_row)
+    if meta_rows is None:
+        root = parse_xml_skip_leading_nonxml(meta_path)
+        rows = _map_metadata_rows(root, src_data_id, stat_tbl_id, stat_latest_chn_dt)
+    else:
+        rows = meta_rows
     if not rows:
         logging.warning("삽입할 메타데이터가 없습니다.")
         return
@@ -374,18 +866,23 @@ def _insert_metadata(session, meta_path, file_info, stats_src, stats_data_info,
     )
     """
     batch_size = get_db_batch_size()
+    progress = ProgressLog("stats_kosis_metadata_code bulk insert", total=len(rows),
+                           interval_sec=get_log_progress_interval_sec())
     for i in range(0, len(rows), batch_size):
         batch = rows[i:i+batch_size]
         session.execute(
             text(insert_sql),
             batch
         )
-        logging.info(f"stats_kosis_metadata_code에 {len(batch)}건 bulk insert 완료.")
+        progress.update(len(batch))
+    progress.done()
 
-def _update_stats_src_data_info(session, file_info, data_json, latest_date):
+def _update_stats_src_data_info(session, file_info, profile, latest_date):
     """
     stats_src_data_info 테이블의 stat_latest_chn_dt, stat_data_ref_dt, avail_cat_cols 컬럼 업데이트
     updated_at, updated_by도 같이 업데이트
+
+    avail_cat_cols 는 _insert_origin_data 가 적재 루프에서 누적한 OriginDataProfile 에서 가져온다.
     """
     from datetime import date
     src_data_id = file_info['src_data_id']
@@ -394,14 +891,8 @@ def _update_stats_src_data_info(session, file_info, data_json, latest_date):
     stat_data_ref_dt = date.today().strftime('%Y-%m-%d')
     updated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     updated_by = 'SYS-BATCH'
-    # avail_cat_cols: data_json에서 실제 값이 존재하는 c1~c4만 추출
-    # 단일 dict 응답(KOSIS 단건)도 리스트로 정규화하고, dict 아닌 요소는 건너뜀
-    rows_iter = data_json if isinstance(data_json, list) else [data_json]
-    cat_cols = []
-    for c in ['c1', 'c2', 'c3', 'c4']:
-        if any(isinstance(row, dict) and (row.get(c.upper()) or row.get(c)) for row in rows_iter):
-            cat_cols.append(c)
-    avail_cat_cols = pyjson.dumps(cat_cols, ensure_ascii=False)
+    # avail_cat_cols: 실제 값이 존재하는 c1~c4만 (단건 dict 응답·비 dict 요소 처리는 observe() 가 담당)
+    avail_cat_cols = pyjson.dumps(profile.avail_cat_cols, ensure_ascii=False)
     update_sql = """
     UPDATE stats_src_data_info
     SET stat_latest_chn_dt = :stat_latest_chn_dt,
@@ -424,7 +915,11 @@ def _update_stats_src_data_info(session, file_info, data_json, latest_date):
             'stat_tbl_id': stat_tbl_id
         }
     )
-    logging.info(f"stats_src_data_info({src_data_id}, {stat_tbl_id}) 업데이트 완료: stat_latest_chn_dt={stat_latest_chn_dt}, stat_data_ref_dt={stat_data_ref_dt}, avail_cat_cols={avail_cat_cols}, updated_at={updated_at}, updated_by={updated_by}")
+    logging.info(
+        "stats_src_data_info(%s, %s) 업데이트 완료: stat_latest_chn_dt=%s, stat_data_ref_dt=%s, avail_cat_cols=%s, updated_at=%s, updated_by=%s",
+        src_data_id, stat_tbl_id, stat_latest_chn_dt, stat_data_ref_dt, preview(avail_cat_cols, items=10),
+        updated_at, updated_by,
+    )
 
 def _update_sys_data_summary_info(session, file_info, stats_data_info, latest_date):
     """
@@ -0,0 +1,167 @@
+"""실행·통계표 마감 시간 — 크론 슬롯 안에 끝나도록 남은 작업을 다음 실행으로 미룬다.
+
+마감 개념이 없으면 실행이 크론 슬롯을 넘겨 다음 트리거와 겹치고, run_collect.sh 는 flock 으로
+그 트리거를 조용히 건너뛴다. run_source 가 RUN_DEADLINE_SEC(--deadline-sec) 로 마감을 잡으면
+
+- save_all_files / process_db_insertion 은 통계표를 시작하기 전에 남은 시간과 이력상 예상 시간을
+  비교해, 끝낼 수 없는 통계표는 실행하지 않고 미룬다(defer). 미룬 통계표는 실행 요약에 남고,
+  table_history 에 기록돼 다음 실행에서 먼저 처리된다.
+- 통계표마다 TABLE_DEADLINE_SEC 예산(scope)을 더 좁게 걸 수 있다.
+- kosis_api / BaseCollector.http_get 은 호출 타임아웃을 남은 시간으로 줄이고(call_timeout),
+  마감이 지났으면 요청 없이 DeadlineExceeded 로 끝낸다 (Error 31 분할 재시도도 요청마다 확인).
+
+    deadline.start(3600)                                  # 실행 시작 (main.run_source)
+    if deadline.should_defer(estimate_sec): deadline.defer(table, 'fetch')
+    with deadline.scope(get_table_deadline_sec()): ...    # 통계표 예산
+    timeout = deadline.call_timeout(HTTP_TIMEOUT)
+    deadline.deferred()                                   # 지금까지 미룬 [stat_tbl_id, ...]
+    deferred = deadline.finish()                          # 실행 종료
+
+마감은 start() 를 부른 실행 컨텍스트에만 걸리고 워커 스레드는 run_report.in_context 로
+물려받는다. start() 전에는 모든 함수가 마감 없음으로 동작한다.
+"""
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+import run_report
+
+logger = logging.getLogger(__name__)
+
+# 마감이 가까워도 호출 타임아웃을 이보다 줄이지 않는다 (연결만 하고 끊기는 요청 방지)
+MIN_CALL_TIMEOUT_SEC = 1.0
+
+
+class DeadlineExceeded(RuntimeError):
+    """실행/통계표 마감이 지나 작업을 시작하지 않음."""
+
+
+def is_deadline_exceeded(exc: BaseException) -> bool:
+    """마감으로 중단된 예외인지 (원인 예외 체인 포함 — save_single_file 등이 감싸 다시 던짐)."""
+    while exc is not None:
+        if isinstance(exc, DeadlineExceeded):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+class _Budget:
+    """마감 시각(monotonic, None 이면 마감 없음) + 실행 전체가 공유하는 미룬 통계표 목록."""
+
+    __slots__ = ('expires_at', 'deferred', 'lock', 'clock')
+
+    def __init__(self, expires_at: Optional[float], deferred: list, lock, clock):
+        self.expires_at = expires_at
+        self.deferred = deferred
+        self.lock = lock
+        self.clock = clock
+
+    def remaining(self) -> Optional[float]:
+        return None if self.expires_at is None else self.expires_at - self.clock()
+
+
+_context_budget = contextvars.ContextVar('deadline', default=None)
+
+
+def start(seconds: Optional[float], clock=time.monotonic) -> None:
+    """실행 마감을 지금부터 seconds 초 뒤로 잡는다. None·0 이하면 마감 없음(통계표 예산·미룬 목록만)."""
+    expires_at = None
+    if seconds and seconds > 0:
+        expires_at = clock() + seconds
+        logger.info('실행 마감: %.0f초 뒤', seconds)
+    _context_budget.set(_Budget(expires_at, [], threading.Lock(), clock))
+
+
+def remaining() -> Optional[float]:
+    """남은 시간(초). 마감이 없으면 None."""
+    budget = _context_budget.get()
+    return None if budget is None else budget.remaining()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def check(what: str = '') -> None:
+    """마감이 지났으면 DeadlineExceeded."""
+    if expired():
+        raise DeadlineExceeded(f'마감 시간 초과{": " + what if what else ""}')
+
+
+def call_timeout(timeout):
+    """호출 타임아웃을 남은 시간으로 줄인다. timeout 은 초 또는 (connect, read) 튜플."""
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded('마감 시간 초과: 요청 생략')
+    cap = max(MIN_CALL_TIMEOUT_SEC, left)
+    if isinstance(timeout, tuple):
+        return tuple(min(t, cap) for t in timeout)
+    return min(timeout, cap)
+
+
+def should_defer(estimate_sec: Optional[float] = None) -> bool:
+    """지금 시작할 작업을 미뤄야 하는지 — 마감이 지났거나 예상 시간(이력)이 남은 시간보다 길면."""
+    left = remaining()
+    if left is None:
+        return False
+    return left <= 0 or bool(estimate_sec and estimate_sec > left)
+
+
+def defer(table, stage: str, reason: str = '') -> None:
+    """통계표를 이번 실행에서 미룬다 (실행 요약·run_report·다음 실행 우선순위에 기록)."""
+    budget = _context_budget.get()
+    if budget is not None:
+        with budget.lock:
+            if str(table) not in budget.deferred:
+                budget.deferred.append(str(table))
+    run_report.record('deadline.deferred', table=table, deferred=1)
+    logger.warning('[%s] 마감으로 %s 단계를 다음 실행으로 미룸%s', table, stage, f' ({reason})' if reason else '')
+
+
+@contextmanager
+def scope(seconds: Optional[float]):
+    """with 블록 동안 마감을 min(현재 마감, 지금 + seconds) 로 좁힌다 (통계표 예산). None·0 이하면 그대로."""
+    if not seconds or seconds <= 0:
+        yield
+        return
+    outer = _context_budget.get()
+    clock = outer.clock if outer is not None else time.monotonic
+    expires_at = clock() + seconds
+    if outer is not None:
+        if outer.expires_at is not None:
+            expires_at = min(outer.expires_at, expires_at)
+        budget = _Budget(expires_at, outer.deferred, outer.lock, clock)
+    else:
+        budget = _Budget(expires_at, [], threading.Lock(), clock)
+    token = _context_budget.set(budget)
+    try:
+        yield
+    finally:
+        _context_budget.reset(token)
+
+
+def deferred() -> List[str]:
+    """지금까지 미룬 통계표 목록."""
+    budget = _context_budget.get()
+    if budget is None:
+        return []
+    with budget.lock:
+        return list(budget.deferred)
+
+
+def finish() -> List[str]:
+    """실행 마감을 해제하고 미룬 통계표 목록을 반환한다."""
+    budget = _context_budget.get()
+    _context_budget.set(None)
+    if budget is None:
+        return []
+    with budget.lock:
+        return list(budget.deferred)
@@ -0,0 +1,294 @@
+"""분산 수집 — 여러 호스트(프로세스)가 DB 작업 큐(work_queue)를 나눠 수집·적재.
+
+run_collect.sh 는 로컬 flock 으로 한 호스트에서만 돈다. 분산 모드는 작업 단위를 같은 PostgreSQL 의
+sys_batch_work_queue 에 등록하고, 호스트마다 띄운 작업자가 SKIP LOCKED 로 한 건씩 가져간다.
+
+    python distributed.py enqueue --ext-sys KOSIS --mode db     # 1회: 작업 단위 등록 (멱등)
+    python distributed.py work --ext-sys KOSIS --workers 2      # 호스트마다 실행 (여러 개 가능)
+    python distributed.py status --ext-sys KOSIS                # 상태별 단위 수 / 실패 목록
+    python distributed.py retry --ext-sys KOSIS                 # failed 단위를 다시 pending 으로
+
+- 작업 단위: 통계 소스(KOSIS 등)는 통계표 1건(수집 -> 적재), GBIS 는 노선 묶음, KOWSI_FACL 은
+  목록 페이지 범위, 그 밖의 이동편의 소스는 소스 전체 1건. 우선순위는 table_history 예상 시간
+- run_key 기본값은 ``<EXT_SYS>:<YYYYMMDD>`` (--run-key 로 지정). mode 는 enqueue 때 정해 큐에 저장
+- 모든 단위가 done 이 되면 작업자 한 명만 마무리(통계: _update_sys_ext_api_info + cleanup_old_data,
+  이동편의: latest_sync_time 갱신)를 실행한다. failed 단위가 남으면 마무리하지 않는다
+- 원본 파일·실행 리포트·run_summary 는 각 호스트 로컬에 남는다
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from config import get_data_collection_scope, get_work_queue_lease_sec, get_work_queue_max_attempts
+import circuit_breaker
+import hedging
+import metrics
+import run_report
+import single_flight
+import table_history
+import work_queue
+
+logger = logging.getLogger(__name__)
+
+STAT_UNIT = 'stat'
+QUEUE_MODES = ('file', 'db')
+
+
+def default_run_key(ext_sys: str) -> str:
+    return f'{ext_sys.upper()}:{datetime.now().strftime("%Y%m%d")}'
+
+
+class StatRun:
+    """통계 소스 실행 1회의 공통 입력 (api_info·대상 통계표·data_info·저장 경로). 프로세스당 1번 조회."""
+
+    def __init__(self, ext_sys: str):
+        import main as batch
+        from db import get_stats_src_data_info
+
+        scope = get_data_collection_scope()
+        if scope not in batch.ALLOWED_DATA_COLLECTION_SCOPES:
+            raise ValueError('DATA_COLLECTION_SCOPE 는 ALL 또는 PARTIAL 만 가능합니다. (현재: %s)' % scope)
+        self.ext_sys = ext_sys
+        self.api_info, self.stats_src_list, _ = batch.get_filtered_stats_src_list(scope, ext_sys=ext_sys)
+        stat_tbl_ids = [s['stat_tbl_id'] for s in self.stats_src_list]
+        ext_api_id = self.stats_src_list[0]['ext_api_id'] if self.stats_src_list else None
+        self.data_info_dict = get_stats_src_data_info(ext_api_id, stat_tbl_ids)
+        self.by_id = {str(s['stat_tbl_id']): s for s in self.stats_src_list}
+        self._dirs = None
+        self._lock = threading.Lock()
+
+    def data_info(self, stat_tbl_id) -> dict:
+        return self.data_info_dict.get(str(stat_tbl_id), {})
+
+    def dirs(self) -> dict:
+        with self._lock:
+            if self._dirs is None:
+                import main as batch
+                self._dirs = batch.prepare_data_directories(ext_sys=self.ext_sys)
+            return self._dirs
+
+
+def plan_stat_units(stat_run: StatRun) -> list:
+    """통계표 1건 = 작업 단위 1건. 우선순위 = 이력상 수집 + 적재 예상 시간 (긴 것 먼저)."""
+    history = table_history.load(stat_run.ext_sys)
+    table_of = lambda s: s['stat_tbl_id']
+    file_est = history.estimate(stat_run.stats_src_list, 'file', table_of,
+                                fallback=lambda s: table_history.period_cost(stat_run.data_info(s['stat_tbl_id'])))
+    db_est = history.estimate(stat_run.stats_src_list, 'db', table_of, fallback=None)
+    units = []
+    for stats_src in stat_run.stats_src_list:
+        table = str(stats_src['stat_tbl_id'])
+        units.append({
+            'unit_key': f'{STAT_UNIT}:{table}', 'kind': STAT_UNIT, 'payload': {'stat_tbl_id': table},
+            'priority': round(file_est.get(table, 0.0) + db_est.get(table, 0.0), 4),
+        })
+    return units
+
+
+def run_stat_unit(stat_run: StatRun, mode: str, stat_tbl_id) -> None:
+    """통계표 1건 수집 -> (db) 적재. 실패하면 예외 (큐가 재시도/실패 처리)."""
+    import main as batch
+
+    stats_src = stat_run.by_id.get(str(stat_tbl_id))
+    if stats_src is None:
+        raise ValueError(f'[{stat_tbl_id}] 대상 통계표 목록에 없습니다 (DATA_COLLECTION_SCOPE/대상 설정 확인)')
+    data_info = stat_run.data_info(stat_tbl_id)
+    file_info = batch.save_single_file((stat_run.api_info, stats_src, stat_run.dirs(), data_info))
+    if mode != 'db':
+        return
+    from db_processing import process_db_insertion
+    result = process_db_insertion([file_info], stat_run.api_info, [stats_src],
+                                  {str(stat_tbl_id): data_info}, finalize=False)
+    if result['failed']:
+        raise RuntimeError(f'[{stat_tbl_id}] DB 적재 실패: {result["failed"][0][1]}')
+
+
+class UnitRunner:
+    """run_key 1개의 작업 단위 처리기 + 마무리 작업 (작업자 스레드끼리 공유)."""
+
+    def __init__(self, ext_sys: str, mode: str):
+        from mobility_pipeline import MOBILITY_EXT_SYS
+
+        self.ext_sys = ext_sys
+        self.mode = mode
+        self.mobility = ext_sys in MOBILITY_EXT_SYS
+        self._stat_run = None
+        self._lock = threading.Lock()
+
+    def stat_run(self) -> StatRun:
+        with self._lock:
+            if self._stat_run is None:
+                self._stat_run = StatRun(self.ext_sys)
+            return self._stat_run
+
+    def plan(self) -> list:
+        if self.mobility:
+            from mobility_pipeline import plan_mobility_units
+            return plan_mobility_units(self.ext_sys)
+        return plan_stat_units(self.stat_run())
+
+    def __call__(self, unit) -> None:
+        if unit.kind == STAT_UNIT:
+            run_stat_unit(self.stat_run(), self.mode, unit.payload['stat_tbl_id'])
+        else:
+            from mobility_pipeline import run_mobility_unit
+            run_mobility_unit(self.ext_sys, self.mode, unit.unit_key, unit.kind, unit.payload)
+
+    def finalize(self) -> None:
+        if self.mode != 'db':
+            return
+        if self.mobility:
+            import db_mobility
+            db_mobility.touch_latest_sync(self.ext_sys)
+            return
+        from db_processing import finalize_db_insertion
+        stat_run = self.stat_run()
+        finalize_db_insertion(stat_run.api_info, stat_run.stats_src_list, stat_run.data_info_dict)
+
+
+def open_queue(run_key: str) -> 'work_queue.WorkQueue':
+    from db import get_engine
+
+    queue = work_queue.WorkQueue(get_engine(), run_key, lease_sec=get_work_queue_lease_sec(),
+                                 max_attempts=get_work_queue_max_attempts())
+    queue.ensure_schema()
+    return queue
+
+
+def cmd_enqueue(args) -> int:
+    ext_sys = args.ext_sys.upper()
+    queue = open_queue(args.run_key or default_run_key(ext_sys))
+    units = UnitRunner(ext_sys, args.mode).plan()
+    inserted = queue.create_run(ext_sys, args.mode, units)
+    info = queue.run_info()
+    if info['mode'] != args.mode or info['ext_sys'] != ext_sys:
+        print(f"[WARN] {queue.run_key} 는 이미 ext_sys={info['ext_sys']} mode={info['mode']} 로 등록되어 있습니다.")
+    print(f'{queue.run_key}: 작업 단위 {len(units)}건 중 신규 {inserted}건 등록')
+    return 0
+
+
+def cmd_work(args) -> int:
+    import main as batch
+
+    run_key = args.run_key or default_run_key(args.ext_sys)
+    queue = open_queue(run_key)
+    info = queue.run_info()
+    if info is None:
+        print(f'[ERROR] 등록된 실행이 없습니다: {run_key} (먼저 enqueue 실행)')
+        return 1
+    ext_sys, mode = info['ext_sys'], info['mode']
+    runner = UnitRunner(ext_sys, mode)
+
+    started = datetime.now()
+    summary = {
+        'start': started.strftime('%Y-%m-%d %H:%M:%S'), 'ext_sys': ext_sys, 'mode': f'{mode}:distributed',
+        'targets': 0, 'files_ok': 0, 'db_ok': 0, 'db_fail': 0, 'status': 'ERROR', 'error': None,
+    }
+    exit_code = 1
+    run_report.start_run(ext_sys=ext_sys, mode=mode, run_key=run_key)
+    metrics.reset(ext_sys)
+    single_flight.reset()
+    circuit_breaker.reset()
+    hedging.reset()
+    run_report.add_listener(metrics.on_span)
+    try:
+        def work(index):
+            worker_queue = queue.with_owner(f'{queue.owner}:{index}')
+            return work_queue.run_worker(worker_queue, runner, finalize=runner.finalize)
+
+        work = run_report.in_context(work)
+        with ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix='work') as executor:
+            results = list(executor.map(work, range(args.workers)))
+        done = sum(r['done'] for r in results)
+        failed = sum(r['failed'] for r in results)
+        summary.update(targets=done + failed, files_ok=done, db_ok=done if mode == 'db' else 0, db_fail=failed)
+        counts = queue.counts()
+        logger.info('distributed %s: 이 프로세스 완료 %d / 실패 %d, 큐 상태 %s, 마무리 %s', run_key, done, failed,
+                    counts, any(r['finalized'] for r in results))
+        if counts.get(work_queue.STATUS_FAILED):
+            summary['status'], exit_code = 'PARTIAL', 2
+            summary['error'] = f'failed_units:{counts[work_queue.STATUS_FAILED]}'
+        else:
+            summary['status'], exit_code = 'SUCCESS', 0
+    except Exception as e:
+        logger.error('distributed 작업자 예외: %s', e, exc_info=True)
+        summary['error'] = str(e)[:300]
+    finally:
+        ended = datetime.now()
+        summary['end'] = ended.strftime('%Y-%m-%d %H:%M:%S')
+        summary['duration_sec'] = int((ended - started).total_seconds())
+        single_flight.finish()
+        summary['breaker_trips'] = circuit_breaker.finish()
+        hedging.finish()
+        run_report.update_meta(status=summary['status'], duration_sec=summary['duration_sec'])
+        summary['report'] = run_report.finish_run()
+        try:
+            table_history.record_run(ext_sys, summary.get('report'))
+        except Exception as _e:
+            logger.error(f'table history 기록 실패: {_e}')
+        batch.write_run_summary(summary)
+    return exit_code
+
+
+def cmd_status(args) -> int:
+    queue = open_queue(args.run_key or default_run_key(args.ext_sys))
+    info = queue.run_info()
+    if info is None:
+        print(f'{queue.run_key}: 등록된 실행 없음')
+        return 1
+    by = ''
+    if info['finalized_by']:
+        by = f" (by {info['finalized_by']}" + (f" at {info['finalized_at']})" if info['finalized_at'] else ')')
+    print(f"{queue.run_key}: ext_sys={info['ext_sys']} mode={info['mode']} status={info['status']}{by}")
+    for status, n in sorted(queue.counts().items()):
+        print(f'  {status:<8} {n}')
+    for unit in queue.failed_units():
+        print(f"  failed: {unit['unit_key']} (시도 {unit['attempts']}) {unit['last_error']}")
+    return 0
+
+
+def cmd_retry(args) -> int:
+    queue = open_queue(args.run_key or default_run_key(args.ext_sys))
+    print(f'{queue.run_key}: failed 단위 {queue.retry_failed()}건을 pending 으로 되돌렸습니다')
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='DB 작업 큐 기반 분산 수집')
+    sub = parser.add_subparsers(dest='command', required=True)
+    for name, help_text in (('enqueue', '작업 단위 등록'), ('work', '작업자 실행'),
+                            ('status', '진행 상태'), ('retry', 'failed 단위 재시도')):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument('--ext-sys', dest='ext_sys', default='KOSIS', help='외부 시스템 식별자 (기본 KOSIS)')
+        p.add_argument('--run-key', dest='run_key', default=None, help='실행 키 (기본 <EXT_SYS>:<YYYYMMDD>)')
+        if name == 'enqueue':
+            p.add_argument('--mode', choices=QUEUE_MODES, default='db', help='file: 수집만, db: 수집 후 적재')
+        if name == 'work':
+            p.add_argument('--workers', type=int, default=1, help='이 프로세스의 작업자 스레드 수 (기본 1)')
+    args = parser.parse_args(argv)
+    args.ext_sys = args.ext_sys.upper()
+    return args
+
+
+_COMMANDS = {'enqueue': cmd_enqueue, 'work': cmd_work, 'status': cmd_status, 'retry': cmd_retry}
+
+
+def main(argv=None):
+    import main as batch
+
+    args = parse_args(argv)
+    batch.setup_logging()
+    try:
+        exit_code = _COMMANDS[args.command](args)
+    finally:
+        batch.shutdown_queue_logging()
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,8 @@ from datetime import datetime
 import logging
 import re
 
+import run_report
+
 def safe_filename(filename, max_length=100):
     # 파일명에 사용할 수 없는 문자 제거/치환
     filename = re.sub(r'[\\/:*?"<>|]', '_', filename)
@@ -19,11 +21,13 @@ def save_meta_file(meta, stats_src, meta_dir, src_data_id, stat_title, from_year
     src_data_id_safe = safe_filename(str(src_data_id))
     filename = f"meta_{src_data_id_safe}-{stat_title_safe}-{from_year}-{to_year}_{time_str}.{file_format}"
     meta_path = os.path.join(meta_dir, filename)
-    with open(meta_path, 'w', encoding='utf-8') as f:
-        if file_format == 'json':
-            json.dump(meta, f, ensure_ascii=False, indent=2)
-        else:
-            f.write(str(meta))
+    with run_report.span('file.save_meta') as sp:
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            if file_format == 'json':
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+            else:
+                f.write(str(meta))
+        sp.add(bytes=os.path.getsize(meta_path))
     return meta_path
 
 def save_latest_file(latest, stats_src, latest_dir, src_data_id, stat_title, from_year, to_year, file_format):
@@ -33,11 +37,13 @@ def save_latest_file(latest, stats_src, latest_dir, src_data_id, stat_title, fro
     src_data_id_safe = safe_filename(str(src_data_id))
     filename = f"latest_{src_data_id_safe}-{stat_title_safe}-{from_year}-{to_year}_{time_str}.{file_format}"
     latest_path = os.path.join(latest_dir, filename)
-    with open(latest_path, 'w', encoding='utf-8') as f:
-        if file_format == 'json':
-            json.dump(latest, f, ensure_ascii=False, indent=2)
-        else:
-            f.write(str(latest))
+    with run_report.span('file.save_latest') as sp:
+        with open(latest_path, 'w', encoding='utf-8') as f:
+            if file_format == 'json':
+                json.dump(latest, f, ensure_ascii=False, indent=2)
+            else:
+                f.write(str(latest))
+        sp.add(bytes=os.path.getsize(latest_path))
     return latest_path 
 
 def save_data_file(data, stats_src, data_dir, src_data_id, stat_title, from_str, to_str, file_format):
@@ -47,10 +53,12 @@ def save_data_file(data, stats_src, data_dir, src_data_id, stat_title, from_str,
     src_data_id_safe = safe_filename(str(src_data_id))
     filename = f"data_{src_data_id_safe}-{stat_title_safe}-{from_str}-{to_str}_{time_str}.{file_format}"
     data_path = os.path.join(data_dir, filename)
-    with open(data_path, 'w', encoding='utf-8') as f:
-        if file_format == 'json':
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        else:
-            f.write(str(data))
+    with run_report.span('file.save_data') as sp:
+        with open(data_path, 'w', encoding='utf-8') as f:
+            if file_format == 'json':
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            else:
+                f.write(str(data))
+        sp.add(bytes=os.path.getsize(data_path))
     logging.debug(f"save_data_file: 파일 저장 완료 {data_path}")
     return data_path 
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""헤지 요청 — 느린 꼬리 지연을 같은 요청 1건 더 보내 줄인다.
+
+KOSIS 데이터 호출 일부는 HTTP_TIMEOUT 의 60초 read 타임아웃 근처까지 걸리는데, 같은 요청을
+다시 보내면 몇 초 만에 돌아오는 경우가 많다. 통계표 1개의 꼬리 지연이 전체 실행 시간을 정하므로,
+엔드포인트별 최근 응답 시간의 백분위(KOSIS_HEDGE_PERCENTILE)를 넘기도록 응답이 없으면 같은
+요청을 1건 더 보내 먼저 끝난 쪽을 쓴다. 헤지 요청 수는 실행 전체 요청의 KOSIS_HEDGE_BUDGET
+비율로 묶어 장애 상황에서 부하를 두 배로 만들지 않는다. 진 쪽 요청은 취소할 수 없어 백그라운드에서
+끝나고 결과는 버린다.
+
+    hedging.reset()                                        # 실행 시작 (main.run_source)
+    result, outcome = hedging.call('data', fn, ok=lambda r: r.status_code == 200)
+    hedging.finish()                                       # 실행 종료 — 헤지 건수 로그
+
+outcome: None(헤지 안 함) / 'primary'(헤지했지만 원 요청이 먼저) / 'hedge'(헤지 요청이 먼저).
+지연 기록·예산은 실행마다 따로 배운다 (reset() 한 실행 컨텍스트 안에서만 헤지).
+"""
+from __future__ import annotations
+
+import contextvars
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional
+
+from config import get_kosis_hedge_budget, get_kosis_hedge_percentile
+
+logger = logging.getLogger(__name__)
+
+LATENCY_WINDOW = 100        # 엔드포인트별로 기억할 최근 성공 응답 시간 수
+MIN_SAMPLES = 20            # 이보다 적게 모이면 백분위를 믿지 않고 헤지하지 않음
+MIN_DELAY_SEC = 1.0         # 헤지 대기 하한 (빠른 엔드포인트에서 헤지가 남발되지 않도록)
+
+
+class Hedger:
+    """엔드포인트별 지연 백분위 학습 + 예산 안에서 헤지 요청 (thread-safe)."""
+
+    def __init__(self, percentile: float, budget: float, clock=time.perf_counter):
+        self.percentile = percentile
+        self.budget = budget
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._samples = {}
+        self.requests = 0
+        self.hedged = 0
+        self.won = 0
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(endpoint, deque(maxlen=LATENCY_WINDOW)).append(seconds)
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """헤지 요청을 보내기까지 기다릴 시간 (학습 전이면 None)."""
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if len(samples) < MIN_SAMPLES:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(self.percentile / 100 * len(samples)) - 1))
+        return max(MIN_DELAY_SEC, samples[index])
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self.hedged + 1 > self.budget * self.requests:
+                return False
+            self.hedged += 1
+            return True
+
+    def call(self, endpoint: str, fn, ok=lambda result: True):
+        """fn() 을 보내고 delay 안에 끝나지 않으면 (예산 안에서) 한 번 더 보낸다. 반환: (결과, outcome)."""
+        with self._lock:
+            self.requests += 1
+
+        def attempt():
+            started = self.clock()
+            result = fn()
+            if ok(result):
+                self.observe(endpoint, self.clock() - started)
+            return result
+
+        delay = self.delay(endpoint)
+        if delay is None:
+            return attempt(), None
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='hedge')
+        try:
+            primary = executor.submit(attempt)
+            done, _ = wait([primary], timeout=delay)
+            if done or not self._take_budget():
+                return primary.result(), None
+            hedge = executor.submit(attempt)
+            pending = {primary, hedge}
+            error = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in (primary, hedge):
+                    if future not in done:
+                        continue
+                    if future.exception() is not None:
+                        error = future.exception()
+                        continue
+                    outcome = 'hedge' if future is hedge else 'primary'
+                    if outcome == 'hedge':
+                        with self._lock:
+                            self.won += 1
+                    return future.result(), outcome
+            raise error
+        finally:
+            executor.shutdown(wait=False)
+
+
+_context_hedger = contextvars.ContextVar('hedger', default=None)
+
+
+def reset(percentile: Optional[float] = None, budget: Optional[float] = None) -> None:
+    """새 실행 시작 — 지연 기록·예산을 비운다 (KOSIS_HEDGE_PERCENTILE=0 이면 비활성)."""
+    percentile = get_kosis_hedge_percentile() if percentile is None else percentile
+    budget = get_kosis_hedge_budget() if budget is None else budget
+    hedger = Hedger(percentile, budget) if percentile > 0 and budget > 0 else None
+    _context_hedger.set(hedger)
+
+
+def call(endpoint: str, fn, ok=lambda result: True):
+    """현재 실행의 Hedger 로 fn 호출. 실행 전이거나 비활성이면 fn() 그대로 (outcome=None)."""
+    hedger = _context_hedger.get()
+    if hedger is None:
+        return fn(), None
+    return hedger.call(endpoint, fn, ok)
+
+
+def finish() -> Optional[Hedger]:
+    """현재 실행의 Hedger 를 비활성화하고 헤지 건수를 로그로 남긴다."""
+    hedger = _context_hedger.get()
+    _context_hedger.set(None)
+    if hedger is not None and hedger.hedged:
+        logger.info('헤지 요청: 전체 %d건 중 %d건 헤지, 헤지 쪽이 먼저 끝난 %d건',
+                    hedger.requests, hedger.hedged, hedger.won)
+    return hedger
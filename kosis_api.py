@@ -1,7 +1,22 @@
 import json
+import math
 import re
 import requests
 import logging
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+import circuit_breaker
+import concurrency
+import deadline
+import hedging
+import metrics
+from config import get_kosis_cell_limit, get_kosis_split_concurrency
+from log_utils import preview
+import run_report
+import single_flight
+from table_history import periods_per_year
 
 # (connect, read) 타임아웃 — 서버 무응답 시 무한 대기 방지
 HTTP_TIMEOUT = (5, 60)
@@ -12,9 +27,17 @@ def mask_auth_in_url(url):
         return url
     return re.sub(r'(apiKey=)[^&]+', r'\1***', url, flags=re.IGNORECASE)
 
-def build_kosis_url(api_info, stats_src, stats_src_data_info, url_key, from_year=None, to_year=None):
+def _set_url_param(url, name, value):
+    """쿼리 파라미터 name 의 값을 value 로 교체 (없으면 추가)."""
+    pattern = re.compile(r'([?&]' + re.escape(name) + r'=)[^&]*')
+    if pattern.search(url):
+        return pattern.sub(lambda m: m.group(1) + value, url, count=1)
+    return url + ('&' if '?' in url else '?') + f'{name}={value}'
+
+def build_kosis_url(api_info, stats_src, stats_src_data_info, url_key, from_year=None, to_year=None, params=None):
     """
     url_key: 'api_meta_url', 'api_latest_chn_dt_url', 'api_data_url'
+    params: {'itmId': [코드, ...], 'objL1': [...]} — 분류 분할 요청의 코드 목록 (KOSIS 형식 'A+B+')
     """
     use_base = stats_src.get('use_base_url_yn', 'N') == 'Y'
     base_url = api_info.get('ext_url', '')
@@ -34,10 +57,82 @@ def build_kosis_url(api_info, stats_src, stats_src_data_info, url_key, from_year
             to_year = int(str(stats_src_data_info.get('collect_end_dt', '0'))[:4])
         url = url.replace('{from}', str(from_year))
         url = url.replace('{to}', str(to_year))
+        for name, codes in (params or {}).items():
+            url = _set_url_param(url, name, ''.join(f'{code}+' for code in codes))
     if use_base:
         url = base_url + url
     return url, file_format
 
+def _http_get(url, kind, file_format):
+    """KOSIS GET 공통 — 상태 확인·에러 로깅·응답 디코딩 (kind: data/meta/latest).
+
+    실패 시 로그/콘솔 출력 후 RuntimeError("KOSIS API 처리 중단"). 호출 1건을
+    run_report span(http.kosis.<kind>) 과 metrics(http_requests_total 등)로 계측한다.
+    호스트 서킷이 열려 있으면 요청 없이 CircuitOpenError(RuntimeError) 로 바로 실패한다.
+    실행·통계표 마감(deadline)이 가까우면 타임아웃을 남은 시간으로 줄이고, 지났으면 DeadlineExceeded.
+    """
+    timeout = deadline.call_timeout(HTTP_TIMEOUT)
+    breaker = circuit_breaker.for_url(url)
+    if breaker is not None:
+        try:
+            breaker.before_call()
+        except circuit_breaker.CircuitOpenError as e:
+            logging.error(f'KOSIS {kind} API 요청 생략: {e}')
+            raise
+    with run_report.span(f'http.kosis.{kind}') as sp:
+        started = time.perf_counter()
+        try:
+            try:
+                # 최근 응답 시간 백분위를 넘기면 같은 요청을 1건 더 보내 먼저 끝난 쪽 사용 (hedging)
+                response, hedge = hedging.call(kind, lambda: requests.get(url, timeout=timeout),
+                                               ok=lambda r: r.status_code == 200)
+                if hedge:
+                    run_report.record('kosis.hedge', hedged=1, won=int(hedge == 'hedge'))
+                    metrics.inc('http_hedged_requests_total', ext_sys='KOSIS', endpoint=kind, winner=hedge)
+            except Exception as e:
+                metrics.observe_http('KOSIS', kind, 'error', time.perf_counter() - started)
+                if breaker is not None:
+                    breaker.record_failure(f'KOSIS {kind} {type(e).__name__}')
+                if isinstance(e, requests.Timeout):
+                    concurrency.report_congestion(f'KOSIS {kind} timeout')
+                raise
+            metrics.observe_http('KOSIS', kind, response.status_code, time.perf_counter() - started,
+                                 len(response.content))
+            if breaker is not None:
+                if circuit_breaker.is_host_failure(response.status_code):
+                    breaker.record_failure(f'KOSIS {kind} status={response.status_code}')
+                else:
+                    breaker.record_success()
+            if response.status_code in concurrency.CONGESTION_STATUS:
+                concurrency.report_congestion(f'KOSIS {kind} status={response.status_code}')
+            if response.status_code != 200:
+                logging.error('KOSIS %s API 요청 실패: status=%s, url=%s, response=%s',
+                              kind, response.status_code, mask_auth_in_url(url), preview(response.content))
+                print(f"[ERROR] KOSIS {kind} API 요청 실패: status={response.status_code}, url={mask_auth_in_url(url)}")
+                raise RuntimeError("KOSIS API 요청 실패")
+        except Exception as e:
+            logging.error(f'KOSIS {kind} API 요청 중 예외 발생: {e}', exc_info=True)
+            print(f"[ERROR] KOSIS {kind} API 요청 중 예외 발생: {e}")
+            raise RuntimeError("KOSIS API 처리 중단")
+        sp.add(bytes=len(response.content))
+
+    if file_format == 'json':
+        return response.json()
+    else:
+        return response.text
+
+def _shared_get(url, kind, file_format):
+    """같은 실행 안의 같은 URL(마스킹 기준) 요청은 1번만 보내고 결과를 나눠 쓴다 (single_flight).
+
+    sys_stats_src_api_info 의 여러 행이 같은 통계표의 meta/latest URL 로 풀리는 경우용.
+    """
+    key = (kind, file_format, mask_auth_in_url(url))
+    value, shared = single_flight.do(key, lambda: _http_get(url, kind, file_format))
+    if shared:
+        run_report.record('kosis.coalesced', requests=1)
+        metrics.inc('http_requests_coalesced_total', ext_sys='KOSIS', endpoint=kind)
+    return value
+
 def is_error_31(response):
     """
     응답이 Error 31인지 확인
@@ -46,35 +141,25 @@ def is_error_31(response):
         return response.get('err') == '31'
     return False
 
-def fetch_kosis_data_single(api_info, stats_src, stats_src_data_info, from_year, to_year):
+def fetch_kosis_data_single(api_info, stats_src, stats_src_data_info, from_year, to_year, params=None):
     """
-    특정 기간의 데이터만 수집
+    특정 기간(+ params 의 분류 코드)의 데이터만 수집
     """
-    url, file_format = build_kosis_url(api_info, stats_src, stats_src_data_info, 'api_data_url', from_year, to_year)
+    url, file_format = build_kosis_url(api_info, stats_src, stats_src_data_info, 'api_data_url', from_year, to_year,
+                                       params=params)
     if not url:
         logging.error('KOSIS data url 생성 실패')
         return None
     
-    try:
-        response = requests.get(url, timeout=HTTP_TIMEOUT)
-        if response.status_code != 200:
-            logging.error(f'KOSIS data API 요청 실패: status={response.status_code}, url={mask_auth_in_url(url)}, response={response.text[:200]}')
-            print(f"[ERROR] KOSIS data API 요청 실패: status={response.status_code}, url={mask_auth_in_url(url)}")
-            raise RuntimeError("KOSIS API 요청 실패")
-    except Exception as e:
-        logging.error(f'KOSIS data API 요청 중 예외 발생: {e}', exc_info=True)
-        print(f"[ERROR] KOSIS data API 요청 중 예외 발생: {e}")
-        raise RuntimeError("KOSIS API 처리 중단")
-    
-    if file_format == 'json':
-        return response.json()
-    else:
-        return response.text
+    return _http_get(url, 'data', file_format)
 
-def fetch_kosis_data_split(api_info, stats_src, stats_src_data_info, from_year, to_year):
+def fetch_kosis_data_split(api_info, stats_src, stats_src_data_info, from_year, to_year, meta=None, params=None):
     """
     기간을 1/2씩 분할하여 데이터 수집
-    갭이 1년이 될 때까지 반복
+    갭이 1년이 될 때까지 반복. 1년에서도 Error 31 이면 월/분기/반기 통계표는 시점 단위로,
+    그래도 안 되면(또는 연간 통계표) meta 가 있을 때 분류(itmId/objL) 코드를 나눠 수집하고
+    (fetch_kosis_data_period_split), 둘 다 불가능하면 중단한다.
+    params 는 상위 분할에서 이미 좁힌 분류 코드 (구간 안 모든 요청에 그대로 적용).
     """
     all_data = []
     year_gap = to_year - from_year + 1
@@ -84,21 +169,25 @@ def fetch_kosis_data_split(api_info, stats_src, stats_src_data_info, from_year,
         
         # 전반부 수집
         logging.warning(f"분할 수집 시도: {from_year}~{mid_year-1} ({year_gap//2}년)")
-        response1 = fetch_kosis_data_single(api_info, stats_src, stats_src_data_info, from_year, mid_year-1)
+        response1 = fetch_kosis_data_single(api_info, stats_src, stats_src_data_info, from_year, mid_year-1, params)
         
         if is_error_31(response1):
             # 전반부도 분할 필요
-            all_data.extend(fetch_kosis_data_split(api_info, stats_src, stats_src_data_info, from_year, mid_year-1))
+            run_report.record('kosis.error31_split', retries=1)
+            all_data.extend(fetch_kosis_data_split(api_info, stats_src, stats_src_data_info, from_year, mid_year-1,
+                                                   meta, params))
         else:
             all_data.extend(response1 if isinstance(response1, list) else [response1])
         
         # 후반부 수집
         logging.warning(f"분할 수집 시도: {mid_year}~{to_year} ({year_gap//2}년)")
-        response2 = fetch_kosis_data_single(api_info, stats_src, stats_src_data_info, mid_year, to_year)
+        response2 = fetch_kosis_data_single(api_info, stats_src, stats_src_data_info, mid_year, to_year, params)
         
         if is_error_31(response2):
             # 후반부도 분할 필요
-            all_data.extend(fetch_kosis_data_split(api_info, stats_src, stats_src_data_info, mid_year, to_year))
+            run_report.record('kosis.error31_split', retries=1)
+            all_data.extend(fetch_kosis_data_split(api_info, stats_src, stats_src_data_info, mid_year, to_year,
+                                                   meta, params))
         else:
             all_data.extend(response2 if isinstance(response2, list) else [response2])
         
@@ -106,21 +195,108 @@ def fetch_kosis_data_split(api_info, stats_src, stats_src_data_info, from_year,
     
     # 1년 단위 도달
     logging.warning(f"1년 단위 수집 시도: {from_year}~{to_year}")
-    response = fetch_kosis_data_single(api_info, stats_src, stats_src_data_info, from_year, to_year)
+    response = fetch_kosis_data_single(api_info, stats_src, stats_src_data_info, from_year, to_year, params)
     
     if is_error_31(response):
+        if meta is not None or periods_per_year(stats_src_data_info.get('periodicity')) > 1:
+            run_report.record('kosis.error31_split', retries=1)
+            return fetch_kosis_data_period_split(api_info, stats_src, stats_src_data_info, from_year, to_year,
+                                                 meta, params)
         logging.error(f"Error 31: 1년 단위({from_year}~{to_year})에서도 데이터 수집 실패")
         print(f"[ERROR] KOSIS API Error 31: 1년 단위({from_year}~{to_year})에서도 데이터 수집 실패")
         raise RuntimeError("KOSIS API 처리 중단")
     
     return response if isinstance(response, list) else [response]
 
-def fetch_kosis_data_with_retry(api_info, stats_src, stats_src_data_info):
+def _to_ordinal(value, per_year, end=False):
+    """수집 범위 값 -> 시점 순번 (연 x 연간 시점 수 + 시점 - 1).
+
+    6자리 KOSIS 시점 코드(월 YYYYMM, 분기/반기 YYYY0Q)는 그 시점, 그 밖(연도 YYYY, 날짜 YYYYMMDD)은
+    연도의 첫 시점(end=True 면 마지막 시점).
     """
-    Error 31 발생 시 1년 단위까지 자동 분할 수집
+    digits = re.sub(r'\D', '', str(value))
+    year = int(digits[:4] or 0)
+    if per_year > 1 and len(digits) == 6:
+        index = max(1, min(int(digits[4:6]), per_year))
+    else:
+        index = per_year if end else 1
+    return year * per_year + index - 1
+
+
+def _period_code(ordinal, per_year):
+    year, index = divmod(ordinal, per_year)
+    return f'{year}{index + 1:02d}' if per_year > 1 else str(year)
+
+
+def _window(first, last, per_year):
+    """시점 순번 구간 -> 요청 from/to. 연 단위로 맞으면 연도(int, 기존 형식), 아니면 시점 코드(str)."""
+    if first % per_year == 0 and last % per_year == per_year - 1:
+        return first // per_year, last // per_year
+    return _period_code(first, per_year), _period_code(last, per_year)
+
+
+def collect_period_range(stats_src_data_info):
+    """수집 범위 (연간 시점 수, 첫 시점 순번, 마지막 시점 순번)."""
+    per_year = periods_per_year(stats_src_data_info.get('periodicity'))
+    first = _to_ordinal(stats_src_data_info.get('collect_start_dt', '0'), per_year)
+    last = _to_ordinal(stats_src_data_info.get('collect_end_dt', '0'), per_year, end=True)
+    return per_year, first, last
+
+
+def fetch_kosis_data_period_split(api_info, stats_src, stats_src_data_info, from_period, to_period, meta=None,
+                                  params=None):
+    """
+    Error 31 이 난 연 이하 구간을 시점(월/분기/반기) 단위로 반씩 나눠 동시에 수집
+    시점 1개에서도 Error 31 이면 분류 코드 분할(meta 필요), 그것도 불가능하면 중단한다.
+    """
+    per_year = periods_per_year(stats_src_data_info.get('periodicity'))
+    first, last = _to_ordinal(from_period, per_year), _to_ordinal(to_period, per_year, end=True)
+    if first < last:
+        mid = (first + last + 1) // 2
+        halves = [(_period_code(first, per_year), _period_code(mid - 1, per_year), params),
+                  (_period_code(mid, per_year), _period_code(last, per_year), params)]
+        logging.warning(f"시점 분할 수집 시도: {halves[0][0]}~{halves[0][1]} / {halves[1][0]}~{halves[1][1]}")
+        return _fetch_requests(api_info, stats_src, stats_src_data_info, halves, meta, concurrency_limit=2)
+    if meta is not None:
+        return fetch_kosis_data_category_split(api_info, stats_src, stats_src_data_info, from_period, to_period,
+                                               meta, params)
+    logging.error(f"Error 31: 시점 1개({from_period}~{to_period})에서도 데이터 수집 실패")
+    print(f"[ERROR] KOSIS API Error 31: 시점 1개({from_period}~{to_period})에서도 데이터 수집 실패")
+    raise RuntimeError("KOSIS API 처리 중단")
+
+def _resplit(api_info, stats_src, stats_src_data_info, from_period, to_period, meta, params):
+    """Error 31 이 난 요청 범위를 다시 나눠 수집 (여러 해면 연 단위 이분, 그 밖은 시점/분류 분할)."""
+    if isinstance(from_period, int) and from_period < to_period:
+        return fetch_kosis_data_split(api_info, stats_src, stats_src_data_info, from_period, to_period, meta, params)
+    return fetch_kosis_data_period_split(api_info, stats_src, stats_src_data_info, from_period, to_period,
+                                         meta, params)
+
+def fetch_kosis_data_category_split(api_info, stats_src, stats_src_data_info, from_year, to_year, meta, params=None):
+    """
+    Error 31 이 난 1년 구간을 코드가 가장 많은 분류(itmId/objL1..8)의 코드를 반으로 나눠 동시에 수집
+    나눈 요청도 Error 31 이면 다시 분할하고, 나눌 분류가 없으면(모두 코드 1개) 중단한다.
+    """
+    dims, splittable = request_dimensions(stats_src, meta, params)
+    candidates = [name for name in splittable if len(dims.get(name, ())) > 1]
+    if not candidates:
+        logging.error(f"Error 31: {from_year}~{to_year} 분류 코드 1개 단위({params})에서도 데이터 수집 실패")
+        print(f"[ERROR] KOSIS API Error 31: {from_year}~{to_year} 분류 코드 1개 단위에서도 데이터 수집 실패")
+        raise RuntimeError("KOSIS API 처리 중단")
+    name = max(candidates, key=lambda n: len(dims[n]))
+    codes = dims[name]
+    halves = [dict(params or {}, **{name: part}) for part in (codes[:len(codes) // 2], codes[len(codes) // 2:])]
+    logging.warning(f"분류 분할 수집 시도: {from_year}~{to_year} {name} {len(codes)}개 -> "
+                    f"{len(halves[0][name])}+{len(halves[1][name])}")
+    return _fetch_requests(api_info, stats_src, stats_src_data_info,
+                           [(from_year, to_year, half) for half in halves], meta, concurrency_limit=2)
+
+def fetch_kosis_data_with_retry(api_info, stats_src, stats_src_data_info, meta=None):
     """
-    from_year = int(str(stats_src_data_info.get('collect_start_dt', '0'))[:4])
-    to_year = int(str(stats_src_data_info.get('collect_end_dt', '0'))[:4])
+    Error 31 발생 시 1년 -> 시점(월/분기/반기) 단위까지 자동 분할 수집 (meta 가 있으면 이후 분류 코드 단위까지)
+    collect_start_dt/collect_end_dt 가 6자리 시점 코드(YYYYMM)면 그 시점 범위만 수집한다.
+    """
+    per_year, first, last = collect_period_range(stats_src_data_info)
+    from_year, to_year = _window(first, last, per_year)
     
     # 1차 시도: 전체 기간
     response = fetch_kosis_data_single(api_info, stats_src, stats_src_data_info, from_year, to_year)
@@ -129,51 +305,204 @@ def fetch_kosis_data_with_retry(api_info, stats_src, stats_src_data_info):
         return response
     
     # Error 31 발생 시 분할 수집 시작
+    run_report.record('kosis.error31_split', retries=1)
     logging.warning(f"Error 31 발생: {from_year}~{to_year} 전체 기간 데이터 수집 실패, 분할 수집 시작")
-    return fetch_kosis_data_split(api_info, stats_src, stats_src_data_info, from_year, to_year)
+    return _resplit(api_info, stats_src, stats_src_data_info, from_year, to_year, meta, None)
+
+# KOSIS 통계자료 요청의 분류 파라미터: 항목(itmId) + 분류 1~8 단계(objL1..objL8)
+ITEM_PARAM = 'itmId'
+OBJ_PARAMS = tuple(f'objL{i}' for i in range(1, 9))
+
+def _meta_records(meta):
+    """meta 응답(XML MetaRow 문자열 또는 JSON 목록) -> (obj_id, itm_id, obj_id_sn) 목록. 해석 불가면 None."""
+    if isinstance(meta, str):
+        start = meta.find('<')
+        if start < 0:
+            return None
+        try:
+            root = ET.fromstring(meta[start:])
+        except ET.ParseError:
+            return None
+        return [(row.findtext('objId') or '', row.findtext('itmId') or '', row.findtext('objIdSn') or '')
+                for row in root.iter('MetaRow')]
+    if isinstance(meta, list):
+        return [
+            (str(row.get('OBJ_ID') or row.get('objId') or ''), str(row.get('ITM_ID') or row.get('itmId') or ''),
+             str(row.get('OBJ_ID_SN') or row.get('objIdSn') or ''))
+            for row in meta if isinstance(row, dict)
+        ]
+    return None
+
+
+def meta_dimensions(meta):
+    """meta 의 분류별 코드 목록을 요청 파라미터 이름으로 {'itmId': [...], 'objL1': [...], ...}.
+
+    항목(objId 'ITEM' 또는 objIdSn 0)은 itmId, 나머지 분류는 objIdSn 순서(없으면 meta 등장 순서)로
+    objL1, objL2, ... 에 대응한다. 해석 불가/빈 meta 면 None.
+    """
+    records = _meta_records(meta)
+    if not records:
+        return None
+    codes_by_obj, order = {}, {}
+    for obj_id, itm_id, sn in records:
+        codes = codes_by_obj.setdefault(obj_id, [])
+        if itm_id not in codes:
+            codes.append(itm_id)
+        order.setdefault(obj_id, int(sn) if sn.isdigit() else len(order) + 100)
+    dims = {}
+    objects = sorted(codes_by_obj, key=lambda obj_id: order[obj_id])
+    for obj_id in objects:
+        if obj_id == 'ITEM' or order[obj_id] == 0:
+            dims[ITEM_PARAM] = codes_by_obj[obj_id]
+    for param, obj_id in zip(OBJ_PARAMS, [o for o in objects if o != 'ITEM' and order[o] != 0]):
+        dims[param] = codes_by_obj[obj_id]
+    return dims
+
+
+def _template_params(stats_src):
+    """stats_src.api_data_url 템플릿의 분류 파라미터 {이름: 값} (itmId/objL* 만)."""
+    try:
+        url = json.loads(stats_src.get('api_data_url') or '{}').get('url', '')
+    except (TypeError, ValueError):
+        return {}
+    found = {}
+    for name in (ITEM_PARAM,) + OBJ_PARAMS:
+        match = re.search(r'[?&]' + re.escape(name) + r'=([^&]*)', url)
+        if match:
+            found[name] = match.group(1)
+    return found
+
+
+def request_dimensions(stats_src, meta, params=None):
+    """요청 1건이 실제로 받는 분류 코드 ({파라미터: 코드 목록}, 분할 가능한 파라미터 목록).
+
+    템플릿이 코드를 지정했으면('T10+T20+') 그 코드, ALL/빈 값이면 meta 의 전체 코드, params 가 있으면
+    params 코드. 분할은 템플릿에 있는 파라미터만 (없는 파라미터를 붙이면 요청 의미가 바뀔 수 있음).
+    """
+    dims = dict(meta_dimensions(meta) or {})
+    template = _template_params(stats_src or {})
+    for name, value in template.items():
+        codes = [code for code in value.replace('%2B', '+').split('+') if code]
+        if codes and value.upper() != 'ALL':
+            dims[name] = codes
+    dims.update(params or {})
+    return dims, [name for name in template if name in dims]
+
+
+def estimate_cells_per_period(dims):
+    """시점 1개당 셀 수 = 항목 수 x 분류별 코드 수의 곱."""
+    return math.prod(len(codes) for codes in dims.values()) if dims else 0
+
+
+def partition_dimensions(dims, splittable, max_cells):
+    """셀 수가 max_cells 이하가 되도록 코드가 많은 분류부터 코드를 나눈 요청 파라미터 목록.
+
+    반환: [{'objL1': [...], ...}, ...] (나눌 필요 없으면 [{}]). 모든 분류를 코드 1개까지 나눠도
+    넘으면 가능한 만큼만 나눈다 (실제 Error 31 은 분할 재시도가 처리).
+    """
+    parts = [{}]
+    cells = estimate_cells_per_period(dims)
+    for name in sorted(splittable, key=lambda n: -len(dims[n])):
+        if cells <= max_cells:
+            break
+        codes = dims[name]
+        others = cells // len(codes)
+        per_part = max(1, max_cells // others)
+        chunks = [codes[i:i + per_part] for i in range(0, len(codes), per_part)]
+        parts = [dict(part, **{name: chunk}) for part in parts for chunk in chunks]
+        cells = others * per_part
+    return parts
+
+
+def plan_data_requests(stats_src_data_info, meta, stats_src=None, cell_limit=None):
+    """meta 로 셀 수를 추정해 요청마다 cell_limit 이하가 되도록 수집 범위를 나눈다.
+
+    반환: [(from, to, params), ...] — 추정할 수 없으면(meta 없음·해석 불가·상한 비활성) None.
+    from/to 는 연 단위로 맞는 구간이면 연도(int), 아니면 KOSIS 시점 코드(str, YYYYMM·YYYY0Q).
+    1) 시점 1개 셀 수가 상한 이하면 기간만 나눈다 — 1년 이상 들어가면 연 단위로 맞추고,
+       월/분기/반기 통계표가 1년도 못 들어가면 분기·월 단위 구간으로 (params 는 {})
+    2) 시점 1개만으로도 넘으면 시점마다 분류 코드(itmId/objL)를 나눈 요청으로 쪼갠다.
+    실제 요청에서 Error 31 이 나면 그 요청만 기존 분할 재시도로 넘긴다.
+    """
+    cell_limit = get_kosis_cell_limit() if cell_limit is None else cell_limit
+    if cell_limit <= 0 or meta is None:
+        return None
+    dims, splittable = request_dimensions(stats_src, meta)
+    cells_per_period = estimate_cells_per_period(dims)
+    if not cells_per_period:
+        return None
+    per_year, first, last = collect_period_range(stats_src_data_info)
+    size = cell_limit // cells_per_period
+    if size < 1:
+        parts = partition_dimensions(dims, splittable, cell_limit)
+        return [_window(n, n, per_year) + (part,) for n in range(first, last + 1) for part in parts]
+    if size >= per_year:
+        size -= size % per_year
+    planned = []
+    n = first
+    while n <= last:
+        # 연 단위 구간은 연초에 맞춘다 (시점 코드로 시작한 증분 범위의 첫 구간만 짧아짐)
+        end = min(n + size - 1 - (n % per_year if size >= per_year else 0), last)
+        planned.append(_window(n, end, per_year) + ({},))
+        n = end + 1
+    return planned
+
+
+def _fetch_request(api_info, stats_src, stats_src_data_info, from_year, to_year, params, meta):
+    response = fetch_kosis_data_single(api_info, stats_src, stats_src_data_info, from_year, to_year, params or None)
+    if is_error_31(response):
+        # 추정보다 셀이 많은 요청 (분류 코드가 시점별로 다른 통계표 등)
+        run_report.record('kosis.error31_split', retries=1)
+        logging.warning(f"Error 31 발생: 사전 분할 요청 {from_year}~{to_year} {params or ''}, 분할 수집 시작")
+        return _resplit(api_info, stats_src, stats_src_data_info, from_year, to_year, meta, params or None)
+    return response if isinstance(response, list) else [response]
+
+
+def _fetch_requests(api_info, stats_src, stats_src_data_info, requests_, meta, concurrency_limit=None):
+    """요청 목록을 동시에 보내고 요청 순서대로 합친다."""
+    limit = concurrency_limit or get_kosis_split_concurrency()
+    fetch = run_report.in_context(_fetch_request)
+    with ThreadPoolExecutor(max_workers=max(1, min(limit, len(requests_))),
+                            thread_name_prefix='kosis-part') as executor:
+        futures = [executor.submit(fetch, api_info, stats_src, stats_src_data_info, start, end, params, meta)
+                   for start, end, params in requests_]
+        all_data = []
+        for future in futures:
+            all_data.extend(future.result())
+    return all_data
+
+
+def fetch_kosis_data_planned(api_info, stats_src, stats_src_data_info, planned, meta=None):
+    """plan_data_requests() 요청을 동시에 보내 기간·분류 순서대로 합친다."""
+    categories = sum(1 for _, _, params in planned if params)
+    logging.info(f"KOSIS 사전 분할 수집: {len(planned)}개 요청 {planned[0][0]}~{planned[-1][1]} "
+                 f"(분류 분할 {categories}건, 동시 {get_kosis_split_concurrency()})")
+    run_report.record('kosis.planned_split', retries=len(planned) - 1)
+    return _fetch_requests(api_info, stats_src, stats_src_data_info, planned, meta)
+
 
 def fetch_kosis_meta(api_info, stats_src, stats_src_data_info):
     url, file_format = build_kosis_url(api_info, stats_src, stats_src_data_info, 'api_meta_url')
     if not url:
         logging.error('KOSIS meta url 생성 실패')
         return None
-    try:
-        response = requests.get(url, timeout=HTTP_TIMEOUT)
-        if response.status_code != 200:
-            logging.error(f'KOSIS meta API 요청 실패: status={response.status_code}, url={mask_auth_in_url(url)}, response={response.text[:200]}')
-            print(f"[ERROR] KOSIS meta API 요청 실패: status={response.status_code}, url={mask_auth_in_url(url)}")
-            raise RuntimeError("KOSIS API 요청 실패")
-    except Exception as e:
-        logging.error(f'KOSIS meta API 요청 중 예외 발생: {e}', exc_info=True)
-        print(f"[ERROR] KOSIS meta API 요청 중 예외 발생: {e}")
-        raise RuntimeError("KOSIS API 처리 중단")
-    if file_format == 'json':
-        return response.json()
-    else:
-        return response.text
+    return _shared_get(url, 'meta', file_format)
 
 def fetch_kosis_latest(api_info, stats_src, stats_src_data_info):
     url, file_format = build_kosis_url(api_info, stats_src, stats_src_data_info, 'api_latest_chn_dt_url')
     if not url:
         logging.error('KOSIS latest url 생성 실패')
         return None
-    try:
-        response = requests.get(url, timeout=HTTP_TIMEOUT)
-        if response.status_code != 200:
-            logging.error(f'KOSIS latest API 요청 실패: status={response.status_code}, url={mask_auth_in_url(url)}, response={response.text[:200]}')
-            print(f"[ERROR] KOSIS latest API 요청 실패: status={response.status_code}, url={mask_auth_in_url(url)}")
-            raise RuntimeError("KOSIS API 요청 실패")
-    except Exception as e:
-        logging.error(f'KOSIS latest API 요청 중 예외 발생: {e}', exc_info=True)
-        print(f"[ERROR] KOSIS latest API 요청 중 예외 발생: {e}")
-        raise RuntimeError("KOSIS API 처리 중단")
-    if file_format == 'json':
-        return response.json()
-    else:
-        return response.text
+    return _shared_get(url, 'latest', file_format)
 
-def fetch_kosis_data(api_info, stats_src, stats_src_data_info):
+def fetch_kosis_data(api_info, stats_src, stats_src_data_info, meta=None):
     """
     KOSIS 데이터 API 호출 (Error 31 자동 분할 처리 포함)
+
+    meta(같은 통계표의 fetch_kosis_meta 결과)가 있으면 셀 수를 추정해 KOSIS_CELL_LIMIT 를
+    넘지 않도록 기간·분류 코드를 미리 나눠 동시에 요청한다 (Error 31 로 실패하는 전체 기간 요청 생략).
     """
-    return fetch_kosis_data_with_retry(api_info, stats_src, stats_src_data_info)
\ No newline at end of file
+    planned = plan_data_requests(stats_src_data_info, meta, stats_src)
+    if planned and len(planned) > 1:
+        return fetch_kosis_data_planned(api_info, stats_src, stats_src_data_info, planned, meta)
+    return fetch_kosis_data_with_retry(api_info, stats_src, stats_src_data_info, meta)
@@ -0,0 +1,192 @@
+"""로깅 유틸 — 응답/목록 미리보기, 큐 기반 비동기 로깅, JSON lines, 진행 로그 rate limit.
+
+미리보기 (지연 평가 + 크기 제한):
+
+``logging.debug(f"... {str(data)[:200]}")`` 는 DEBUG 가 꺼져 있어도 응답 전체(수백 MB 가능)를
+문자열로 만든 뒤 잘라낸다. preview 객체를 %-스타일 인자로 넘기면 로거가 실제로 레코드를
+출력할 때만 __str__ 이 호출되고, 그때도 앞쪽 원소 몇 개만 직렬화한다.
+
+    logging.debug("[%s] fetch_data 결과: %s", stat_tbl_id, preview(data))
+    logging.debug("stats_src_list: %s", preview(stats_src_list, items=5))
+
+큐 로깅: setup_queue_logging() 은 root 에 QueueHandler 만 달고, 실제 파일/콘솔 쓰기는
+QueueListener 백그라운드 스레드 1개가 담당한다. 워커 스레드는 핸들러 lock·디스크 I/O 를
+기다리지 않는다(PARALLEL_WORKERS_FILE 을 크게 줄 때 경합 제거).
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import time
+from datetime import datetime
+
+PREVIEW_CHARS = 200
+PREVIEW_ITEMS = 3
+_MAX_DEPTH = 3
+
+
+def _render(obj, items: int, budget: int, depth: int) -> str:
+    """obj 를 앞쪽 items 개 원소까지만, 대략 budget 자 안에서 문자열로."""
+    if isinstance(obj, (bytes, bytearray)):
+        return bytes(obj[:budget]).decode('utf-8', errors='replace')
+    if isinstance(obj, str):
+        return obj[:budget]
+    if depth >= _MAX_DEPTH:
+        return f'<{type(obj).__name__}>'
+    if isinstance(obj, dict):
+        parts, used = [], 0
+        for i, (key, value) in enumerate(obj.items()):
+            if i >= items or used >= budget:
+                parts.append(f'... (+{len(obj) - i})')
+                break
+            part = f'{key!r}: {_render_item(value, items, budget - used, depth + 1)}'
+            parts.append(part)
+            used += len(part) + 2
+        return '{' + ', '.join(parts) + '}'
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        seq = obj if isinstance(obj, (list, tuple)) else list(obj)
+        parts, used = [], 0
+        for i, value in enumerate(seq):
+            if i >= items or used >= budget:
+                parts.append(f'... (+{len(seq) - i}, total {len(seq)})')
+                break
+            part = _render_item(value, items, budget - used, depth + 1)
+            parts.append(part)
+            used += len(part) + 2
+        open_, close = ('(', ')') if isinstance(obj, tuple) else ('[', ']')
+        return open_ + ', '.join(parts) + close
+    return repr(obj)[:budget]
+
+
+def _render_item(value, items: int, budget: int, depth: int) -> str:
+    if isinstance(value, str):
+        return repr(value[:budget])
+    return _render(value, items, budget, depth)
+
+
+class preview:
+    """logging 인자용 지연 미리보기 (출력될 때만 앞 items 개 원소·최대 chars 자로 직렬화)."""
+
+    __slots__ = ('obj', 'items', 'chars')
+
+    def __init__(self, obj, items: int = PREVIEW_ITEMS, chars: int = PREVIEW_CHARS):
+        self.obj = obj
+        self.items = items
+        self.chars = chars
+
+    def __str__(self) -> str:
+        text = _render(self.obj, self.items, self.chars, 0)
+        if len(text) > self.chars:
+            text = text[:self.chars] + '...'
+        return text
+
+    __repr__ = __str__
+
+
+class JsonLineFormatter(logging.Formatter):
+    """1레코드 = JSON 1줄 (ts/level/logger/pid/thread/file/line/func/msg[/exc])."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        item = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'pid': record.process,
+            'thread': record.threadName,
+            'file': record.filename,
+            'line': record.lineno,
+            'func': record.funcName,
+            'msg': record.getMessage(),
+        }
+        if record.exc_info:
+            item['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            item['exc'] = record.exc_text
+        return json.dumps(item, ensure_ascii=False)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """예외 traceback 을 message 에 합치지 않고 exc_text 로 넘겨 JSON 포맷에서 따로 남긴다."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_listener = None
+
+
+def setup_queue_logging(handlers, level=logging.INFO) -> logging.handlers.QueueListener:
+    """root 로거를 QueueHandler -> QueueListener(handlers) 파이프라인으로 구성.
+
+    이미 구성돼 있으면 이전 리스너를 멈추고 교체한다. 프로세스 종료 시(atexit) 큐를 비우고 멈춘다.
+    """
+    global _listener
+    shutdown_queue_logging()
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_QueueHandler(log_queue))
+    root.setLevel(level)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_queue_logging() -> None:
+    """남은 레코드를 모두 쓰고 리스너·핸들러를 닫는다 (여러 번 호출해도 안전)."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_queue_logging)
+
+
+class ProgressLog:
+    """반복 배치 진행 로그 rate limit — interval_sec 마다 1줄 + 완료 시 1줄.
+
+        progress = ProgressLog('stats_kosis_origin_data bulk insert', total=len(rows), interval_sec=5)
+        for batch in ...:
+            ...
+            progress.update(len(batch))
+        progress.done()
+    """
+
+    def __init__(self, label: str, total=None, interval_sec: float = 5.0, logger=None):
+        self.label = label
+        self.total = total
+        self.interval_sec = interval_sec
+        self.logger = logger or logging.getLogger()
+        self.count = 0
+        self.batches = 0
+        self.started = time.monotonic()
+        self._last = self.started
+
+    def update(self, n: int) -> None:
+        self.count += n
+        self.batches += 1
+        now = time.monotonic()
+        if self.interval_sec > 0 and now - self._last >= self.interval_sec:
+            self._last = now
+            total = f'/{self.total}' if self.total is not None else ''
+            self.logger.info('%s 진행: %s%s건 (%d배치, %.1fs)', self.label, self.count, total,
+                             self.batches, now - self.started, stacklevel=2)
+
+    def done(self) -> None:
+        self.logger.info('%s 완료: %s건 (%d배치, %.1fs)', self.label, self.count, self.batches,
+                         time.monotonic() - self.started, stacklevel=2)
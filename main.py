@@ -1,19 +1,28 @@
 import argparse
+import contextvars
 import os
 import logging
 import sys
 import json
+import threading
 from datetime import datetime
-from file_utils import save_meta_file, save_latest_file, save_data_file
+from file_utils import save_meta_file, save_latest_file, save_data_file, safe_filename
 from db import get_db_url, get_api_info, get_stats_src_api_info, get_stats_src_data_info
-from config import load_target_src_tbl_id_list, get_log_level, get_data_collection_scope, get_parallel_workers_file
-from db_processing import process_db_insertion
-from collectors import KosisCollector
-from collectors.gbis import GbisCollector
-from collectors.korail_conv import KorailConvCollector
-from collectors.kowsi_facl import KowsiFaclCollector
-from collectors.tour_bf import TourBfCollector
-from mobility_pipeline import MOBILITY_EXT_SYS, run_mobility
+from config import load_target_src_tbl_id_list, get_log_level, get_data_collection_scope, get_parallel_workers_file, get_metrics_textfile_dir, get_log_format, get_parallel_sources, get_run_deadline_sec, get_table_deadline_sec, MAX_PARALLEL_WORKERS_FILE
+from collectors.registry import LazyRegistry
+from mobility_pipeline import MOBILITY_COLLECTORS, MOBILITY_EXT_SYS, run_mobility
+from log_utils import JsonLineFormatter, preview, setup_queue_logging, shutdown_queue_logging
+import circuit_breaker
+import concurrency
+import deadline
+import hedging
+import metrics
+import profiling
+import run_report
+import single_flight
+import table_history
+from run_manifest import (RunManifest, STAGE_FETCH, STAGE_LOAD, find_latest_manifest, index_saved_files,
+                          saved_stem_head)
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
@@ -36,25 +45,28 @@ __version__ = "1.7.1"
 # 않고, KOSIS 를 default 로 묶어 두는 방식으로 후방호환을 보장합니다.
 #
 # - resolve_ext_sys() : 우선순위 CLI --ext-sys > env EXT_SYS > 'KOSIS'
+# - resolve_ext_sys_list() : 'KOSIS,GBIS' / 'ALL' -> 동시 실행할 ext_sys 목록
 # - get_collector_class() : ext_sys -> BaseCollector subclass 매핑
-# - _COLLECTOR_REGISTRY : 신규 소스는 이 매핑 한 줄로 등록 가능
+# - _COLLECTOR_REGISTRY : 신규 소스는 이 매핑 한 줄로 등록 가능 (import 경로 문자열 — 첫 사용 시 import)
 #
 # 설계 근거: docs/design/26-multi-source-architecture.md §5 마이그레이션 플랜
 # 후방호환 전략: §2.4 — KOSIS 호출 경로는 어댑터를 거쳐도 동일한 응답 형태 유지.
 DEFAULT_EXT_SYS = 'KOSIS'
+# --ext-sys ALL: 등록된 모든 소스
+ALL_EXT_SYS = 'ALL'
 
 # DATA_COLLECTION_SCOPE 허용값. 그 외 값은 실행 중단(조용한 ALL 폴백 제거).
 ALLOWED_DATA_COLLECTION_SCOPES = ('ALL', 'PARTIAL')
 
 # ext_sys 식별자 -> BaseCollector 서브클래스. 신규 소스 추가 시 한 줄만 더하면 됨.
-_COLLECTOR_REGISTRY = {
-    'KOSIS': KosisCollector,
-    # 이슈 #76: 이동편의 소스 4종 — 실행 흐름은 mobility_pipeline.run_mobility() 로 위임
-    'GBIS': GbisCollector,
-    'KORAIL_CONV': KorailConvCollector,
-    'KOWSI_FACL': KowsiFaclCollector,
-    'TOUR_BF_API': TourBfCollector,
-}
+# 값은 'module:Class' 문자열로 두어 실제로 쓰는 어댑터만 import 한다 (설치 패키지의
+# dabt.collectors entry point 도 같은 방식으로 지연 등록).
+_COLLECTOR_REGISTRY = LazyRegistry({
+    'KOSIS': 'collectors.kosis:KosisCollector',
+})
+# 이슈 #76: 이동편의 소스 4종 — 실행 흐름은 mobility_pipeline.run_mobility() 로 위임
+_COLLECTOR_REGISTRY.update(MOBILITY_COLLECTORS.targets())
+_COLLECTOR_REGISTRY.load_entry_points()
 
 
 def resolve_ext_sys(cli_value):
@@ -70,6 +82,21 @@ def resolve_ext_sys(cli_value):
     return DEFAULT_EXT_SYS
 
 
+def resolve_ext_sys_list(cli_value):
+    """resolve_ext_sys() 값을 쉼표로 나눈 ext_sys 목록 (중복 제거, 순서 유지).
+
+    'ALL' 은 등록된 모든 ext_sys(_COLLECTOR_REGISTRY) 로 펼친다.
+    """
+    ext_sys_list = []
+    for item in resolve_ext_sys(cli_value).split(','):
+        item = item.strip()
+        names = list(_COLLECTOR_REGISTRY) if item == ALL_EXT_SYS else [item]
+        for name in names:
+            if name and name not in ext_sys_list:
+                ext_sys_list.append(name)
+    return ext_sys_list or [DEFAULT_EXT_SYS]
+
+
 def get_collector_class(ext_sys):
     """ext_sys 키에 등록된 BaseCollector subclass 를 반환.
 
@@ -89,23 +116,26 @@ def setup_logging():
     db_log_file = os.path.join(log_dir, f'db_{today}.log')
     log_level = getattr(logging, get_log_level().upper(), logging.INFO)
     log_format = '%(asctime)s [%(levelname)s] [PID:%(process)d][%(threadName)s] %(filename)s:%(lineno)d %(funcName)s() - %(message)s'
-
-    # 전체 로그
-    logging.basicConfig(
-        level=log_level,
-        format=log_format,
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
-
-    # DB 전용 로그 핸들러
-    db_logger = logging.getLogger('db')
+    text_formatter = logging.Formatter(log_format)
+    file_formatter = JsonLineFormatter() if get_log_format() == 'JSON' else text_formatter
+    if get_log_format() == 'JSON':
+        log_file = log_file[:-len('.log')] + '.jsonl'
+        db_log_file = db_log_file[:-len('.log')] + '.jsonl'
+
+    # 전체 로그 (파일 + 콘솔)
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(file_formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(text_formatter)
+
+    # DB 전용 로그 (db 로거 레코드만)
     db_handler = logging.FileHandler(db_log_file, encoding='utf-8')
-    db_handler.setFormatter(logging.Formatter(log_format))
-    db_logger.addHandler(db_handler)
-    db_logger.setLevel(log_level)
+    db_handler.setFormatter(file_formatter)
+    db_handler.addFilter(logging.Filter('db'))
+
+    # 워커 스레드는 큐에 넣기만 하고, 파일/콘솔 쓰기는 QueueListener 스레드 1개가 처리
+    setup_queue_logging([file_handler, stream_handler, db_handler], level=log_level)
+    logging.getLogger('db').setLevel(log_level)
 
 
 # 이슈 #29: 멀티소스 저장 경로 일반화 + KOSIS 후방호환
@@ -170,22 +200,75 @@ def create_data_save_directory(ext_sys=DEFAULT_EXT_SYS):
         "ext_sys": ext_sys_norm,
     }
 
+def resolve_resume_directories(ext_sys=DEFAULT_EXT_SYS):
+    """--resume: 매니페스트가 남아 있는 가장 최근 실행 디렉터리를 저장 경로로 재사용한다.
+
+    날짜가 바뀐 뒤 재실행해도 이전 실행의 파일/기록을 이어받도록 오늘 디렉터리에 한정하지 않는다.
+    매니페스트가 없으면 None (호출자는 오늘 디렉터리로 새로 시작).
+    """
+    ext_sys_norm = (ext_sys or DEFAULT_EXT_SYS).upper()
+    _, today_root, _ = _resolve_data_roots(ext_sys_norm)
+    manifest_path = find_latest_manifest(os.path.dirname(today_root))
+    if not manifest_path:
+        return None
+    root_dir = os.path.dirname(manifest_path)
+    return {
+        "root": root_dir,
+        "data": os.path.join(root_dir, "data"),
+        "meta": os.path.join(root_dir, "meta"),
+        "latest": os.path.join(root_dir, "latest"),
+        "ext_sys": ext_sys_norm,
+    }
+
 def parse_args():
     parser = argparse.ArgumentParser(description='외부 통계 API 연동 툴 (KOSIS 등 멀티소스 지원)')
-    parser.add_argument('--mode', choices=['file', 'db'], required=True, help='file: 파일 저장만, db: 파일 저장 후 DB 삽입')
+    parser.add_argument(
+        '--mode', choices=['file', 'db', 'load'], required=True,
+        help='file: 파일 저장만, db: 파일 저장 후 DB 삽입, load: 저장된 파일(--from-dir)만 DB 삽입(API 호출 없음)'
+    )
     parser.add_argument(
         '--ext-sys',
         dest='ext_sys',
         default=None,
-        help='외부 시스템 식별자 (예: KOSIS). 미지정 시 환경변수 EXT_SYS, 그래도 없으면 KOSIS 사용.'
+        help='외부 시스템 식별자 (예: KOSIS). 쉼표로 여러 개(KOSIS,GBIS) 또는 ALL 이면 소스별로 동시 실행. '
+             '미지정 시 환경변수 EXT_SYS, 그래도 없으면 KOSIS 사용.'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='최근 실행 매니페스트(manifest.json)를 이어받아 완료된 수집/적재는 건너뛰고 실패분만 재시도'
+    )
+    parser.add_argument(
+        '--from-dir',
+        dest='from_dir',
+        default=None,
+        help='--mode load 에서 적재할 실행 디렉터리 (예: kosis_data/20260101)'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='단계별 cProfile/tracemalloc 결과와 통계표별 최대 메모리를 logs/profile/<시각>_<ext_sys>/ 에 기록'
+    )
+    parser.add_argument(
+        '--deadline-sec',
+        dest='deadline_sec',
+        type=float,
+        default=None,
+        help='실행 마감(초). 넘기면 아직 시작하지 않은 통계표는 다음 실행으로 미룸 (미지정 시 RUN_DEADLINE_SEC)'
     )
     return parser.parse_args()
 
 def check_required_env_and_args(args):
-    if args.mode not in ['file', 'db']:
+    if args.mode not in ['file', 'db', 'load']:
         logging.error(f"잘못된 실행 옵션: {args.mode}")
-        print("[ERROR] 실행 옵션은 --mode file 또는 --mode db 만 가능합니다.")
+        print("[ERROR] 실행 옵션은 --mode file / db / load 만 가능합니다.")
         sys.exit(1)
+    if args.mode == 'load':
+        from_dir = getattr(args, 'from_dir', None)
+        if not from_dir or not os.path.isdir(from_dir):
+            logging.error(f"--mode load 에는 존재하는 --from-dir 이 필요합니다: {from_dir}")
+            print("[ERROR] --mode load 에는 존재하는 --from-dir <실행 디렉터리> 가 필요합니다.")
+            sys.exit(1)
     if not get_db_url():
         logging.error("DB_URL 환경변수가 설정되어 있지 않습니다.")
         print("[ERROR] DB_URL 환경변수가 설정되어 있지 않습니다. .env 파일을 확인하세요.")
@@ -202,19 +285,19 @@ def get_filtered_stats_src_list(data_collection_scope, ext_sys=DEFAULT_EXT_SYS):
         target_id_set = set(item['stat_tbl_id'] for item in env_target_list)
         existing_stat_tbl_ids = {s.get('stat_tbl_id') for s in stats_src_list}
         missing_stat_tbl_ids = target_id_set - existing_stat_tbl_ids
-        logging.info(f"[DEBUG] env target_id_set!: {target_id_set}")
-        logging.info(f"[DEBUG] DB existing_stat_tbl_ids: {existing_stat_tbl_ids}")
-        logging.info(f"[DEBUG] missing_stat_tbl_ids: {missing_stat_tbl_ids}")
-        logging.info(f"[DEBUG] stats_src_list(before filter): {stats_src_list}")
+        logging.debug("env target_id_set: %s", preview(target_id_set, items=20))
+        logging.debug("DB existing_stat_tbl_ids: %s", preview(existing_stat_tbl_ids, items=20))
+        logging.info(f"PARTIAL 모드: 대상 {len(target_id_set)}건, DB 등록 {len(existing_stat_tbl_ids)}건, 누락 {len(missing_stat_tbl_ids)}건")
+        logging.debug("stats_src_list(before filter): %s", preview(stats_src_list))
         if missing_stat_tbl_ids:
             error_msg = f"설정된 stat_tbl_id 중 DB에 존재하지 않는 것들: {list(missing_stat_tbl_ids)}"
             logging.error(error_msg)
             print(f"[ERROR] {error_msg}")
             sys.exit(1)
         stats_src_list = [s for s in stats_src_list if s.get('stat_tbl_id') in target_id_set]
-        logging.info(f"[DEBUG] stats_src_list(after filter): {stats_src_list}")
+        logging.debug("stats_src_list(after filter): %s", preview(stats_src_list))
         if not stats_src_list:
-            logging.warning("[DEBUG] PARTIAL 모드에서 stats_src_list가 비어 있습니다!")
+            logging.warning("PARTIAL 모드에서 stats_src_list가 비어 있습니다!")
         logging.info(f"PARTIAL 모드: {len(target_id_set)} -> {len(stats_src_list)}개 통계 소스 필터링 완료")
     return api_info, stats_src_list, env_target_list
 
@@ -231,8 +314,6 @@ def save_single_file(args):
     _end = data_info.get('collect_end_dt', 'unknown')
     from_str = str(_start)[:4] if str(_start) not in ('unknown', '', 'None') else 'unknown'
     to_str = str(_end)[:4] if str(_end) not in ('unknown', '', 'None') else 'unknown'
-    meta_format = 'xml'
-    func_name = 'save_single_file'
 
     # 이슈 #29: BaseCollector 어댑터를 통해 ext_sys 별로 수집 호출 분기.
     # KOSIS 의 경우 KosisCollector 가 기존 fetch_kosis_* 함수들을 동일 시그니처로 위임 호출하므로
@@ -241,6 +322,14 @@ def save_single_file(args):
     collector_cls = get_collector_class(ext_sys)
     collector = collector_cls(api_info=api_info, stats_src=stats_src)
 
+    with run_report.table_scope(stat_tbl_id), profiling.table(stat_tbl_id), run_report.span('file.total'):
+        return _save_single_file(collector, api_info, stats_src, dirs, data_info, stat_tbl_id, src_data_id,
+                                 stat_title, from_str, to_str, ext_sys)
+
+def _save_single_file(collector, api_info, stats_src, dirs, data_info, stat_tbl_id, src_data_id,
+                      stat_title, from_str, to_str, ext_sys):
+    meta_format = 'xml'
+    func_name = 'save_single_file'
     try:
         logging.info(f"[{stat_tbl_id}] {func_name} - 메타 파일 저장 시작 (ext_sys={ext_sys})")
         if stats_src.get('api_meta_url'):
@@ -249,8 +338,9 @@ def save_single_file(args):
                 meta_format = meta_url_info.get('format', 'xml')
             except Exception as e:
                 logging.debug(f"[{stat_tbl_id}] {func_name} - api_meta_url 파싱 실패: {e}")
-        meta = collector.fetch_meta(data_info)
-        logging.debug(f"[{stat_tbl_id}] {func_name} - fetch_meta 결과: {str(meta)[:200]}")
+        with run_report.span('fetch.meta'):
+            meta = collector.fetch_meta(data_info)
+        logging.debug("[%s] %s - fetch_meta 결과: %s", stat_tbl_id, func_name, preview(meta))
         meta_path = save_meta_file(meta, stats_src, dirs['meta'], src_data_id, stat_title, from_str, to_str, meta_format)
         logging.info(f"[{stat_tbl_id}] {func_name} - 메타 파일 저장 완료: {meta_path}")
 
@@ -262,8 +352,9 @@ def save_single_file(args):
                 latest_format = latest_url_info.get('format', 'json')
             except Exception as e:
                 logging.debug(f"[{stat_tbl_id}] {func_name} - api_latest_chn_dt_url 파싱 실패: {e}")
-        latest = collector.fetch_latest(data_info)
-        logging.debug(f"[{stat_tbl_id}] {func_name} - fetch_latest 결과: {str(latest)[:200]}")
+        with run_report.span('fetch.latest'):
+            latest = collector.fetch_latest(data_info)
+        logging.debug("[%s] %s - fetch_latest 결과: %s", stat_tbl_id, func_name, preview(latest))
         latest_path = save_latest_file(latest, stats_src, dirs['latest'], src_data_id, stat_title, from_str, to_str, latest_format)
         logging.info(f"[{stat_tbl_id}] {func_name} - latest 파일 저장 완료: {latest_path}")
 
@@ -275,8 +366,11 @@ def save_single_file(args):
                 data_format = data_url_info.get('format', 'json')
             except Exception as e:
                 logging.debug(f"[{stat_tbl_id}] {func_name} - api_data_url 파싱 실패: {e}")
-        data = collector.fetch_data(data_info)
-        logging.debug(f"[{stat_tbl_id}] {func_name} - fetch_data 결과: {str(data)[:200]}")
+        with run_report.span('fetch.data') as sp:
+            data = collector.fetch_data(data_info)
+            if isinstance(data, list):
+                sp.add(rows=len(data))
+        logging.debug("[%s] %s - fetch_data 결과: %s", stat_tbl_id, func_name, preview(data))
         data_path = save_data_file(data, stats_src, dirs['data'], src_data_id, stat_title, from_str, to_str, data_format)
         logging.info(f"[{stat_tbl_id}] {func_name} - 데이터 파일 저장 완료: {data_path}")
         return {
@@ -293,23 +387,129 @@ def save_single_file(args):
         logging.error(f"[{stat_tbl_id}] {func_name} - 파일 저장 중 에러: {e}", exc_info=True)
         raise RuntimeError(f"[{stat_tbl_id}] {func_name} - 파일 저장 실패") from e
 
-def save_all_files(api_info, stats_src_list, dirs, stats_src_data_info_dict):
+def save_all_files(api_info, stats_src_list, dirs, stats_src_data_info_dict, manifest=None, resume=False):
+    """통계표별 meta/latest/data 파일을 병렬 저장한다.
+
+    manifest 가 주어지면 통계표마다 fetch 완료(파일 해시)/실패를 기록하고,
+    resume=True 면 매니페스트상 fetch 완료 + 파일 해시가 일치하는 통계표는 재수집하지 않는다.
+    제출 순서·워커 수는 이전 실행 이력(table_history)의 예상 시간이 긴 통계표부터.
+    PARALLEL_AUTO_TUNE=ON 이면 워커 수를 처리량·429/타임아웃에 따라 조정한다(concurrency).
+    실행 마감(deadline)까지 끝낼 수 없는 통계표는 시작하지 않고 미룬다 (결과 목록에서 빠짐).
+    """
     saved_files_info = []
-    parallel_workers = get_parallel_workers_file()
+    ext_sys = dirs.get('ext_sys')
     args_list = []
     for stats_src in stats_src_list:
         stat_tbl_id = str(stats_src['stat_tbl_id'])
+        if resume and manifest is not None:
+            reused = manifest.fetched_file_info(stat_tbl_id)
+            if reused:
+                logging.info(f"[{stat_tbl_id}] resume - 이전 실행 파일 재사용 (API 호출 생략)")
+                saved_files_info.append(reused)
+                continue
         data_info = stats_src_data_info_dict.get(stat_tbl_id, {})
         if not data_info:
             logging.warning(f"[{stat_tbl_id}] DB 매핑 정보 없음. 파일명에 unknown이 들어갈 수 있습니다.")
         args_list.append((api_info, stats_src, dirs, data_info))
-    with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
-        futures = [executor.submit(save_single_file, args) for args in args_list]
-        for future in as_completed(futures):
-            result = future.result()
-            saved_files_info.append(result)
+
+    args_list, estimates = table_history.load(ext_sys).order_longest_first(
+        args_list, 'file', table_of=lambda a: a[1]['stat_tbl_id'], fallback=lambda a: table_history.period_cost(a[3])
+    )
+    limiter = concurrency.limiter(
+        f'file:{ext_sys}',
+        initial=table_history.pool_size(estimates, get_parallel_workers_file(ext_sys)),
+        maximum=table_history.pool_size(estimates, MAX_PARALLEL_WORKERS_FILE),
+    )
+    logging.info(f"파일 저장 워커 수: {limiter.limit} (대상 {len(args_list)}건)")
+
+    def run(args):
+        stat_tbl_id = args[1]['stat_tbl_id']
+        with limiter.slot():
+            if deadline.should_defer(estimates.get(str(stat_tbl_id))):
+                deadline.defer(stat_tbl_id, 'fetch', f'예상 {estimates.get(str(stat_tbl_id), 0):.0f}초')
+                return None
+            try:
+                with deadline.scope(get_table_deadline_sec()):
+                    result = save_single_file(args)
+            except Exception as e:
+                if deadline.is_deadline_exceeded(e) and deadline.expired():
+                    # 실행 마감으로 중단 — 실패가 아니라 다음 실행으로 (통계표 예산 초과는 실패)
+                    deadline.defer(stat_tbl_id, 'fetch', '수집 중 마감')
+                    return None
+                if manifest is not None:
+                    manifest.mark_failed(stat_tbl_id, STAGE_FETCH, e)
+                raise
+        if manifest is not None:
+            manifest.mark_fetched(result)
+        return result
+
+    run = run_report.in_context(run)
+    try:
+        with ThreadPoolExecutor(max_workers=limiter.workers) as executor:
+            futures = [executor.submit(run, args) for args in args_list]
+            for future in as_completed(futures):
+                result = future.result()
+                if result is not None:
+                    saved_files_info.append(result)
+    finally:
+        limiter.close()
     return saved_files_info
 
+def discover_saved_files_info(from_dir, ext_sys, api_info, stats_src_list, stats_src_data_info_dict, resume=False):
+    """--mode load: 이미 저장된 실행 디렉터리에서 통계표별 data/meta/latest triplet 을 찾는다.
+
+    1순위는 from_dir/manifest.json 의 fetch 기록(해시 일치 시)이고, 기록이 없는 통계표만
+    파일명 규칙 색인(index_saved_files, 디렉터리당 1회 스캔)에서 찾는다. 파일명의 src_data_id 와
+    title 사이 '-' 는 구분되지 않으므로(DT_1B / DT_1B-1) save_single_file 과 같은 규칙으로 만든
+    ``<src_data_id>-<title>`` 이 stem 에서 기간을 뗀 부분과 정확히 같은 것만 쓴다.
+    색인으로 찾은 결과는 매니페스트에 기록해 다음 실행부터는 색인도 필요 없게 한다.
+    resume=False 면 이전 load 완료 기록을 지워 전체를 다시 적재한다.
+
+    :return: (saved_files_info, missing_stat_tbl_ids, manifest)
+    """
+    manifest = RunManifest.open(from_dir, ext_sys, resume=True)
+    if not resume:
+        manifest.clear_stage(STAGE_LOAD)
+    saved_files_info = []
+    missing = []
+    index = None
+    for stats_src in stats_src_list:
+        stat_tbl_id = str(stats_src['stat_tbl_id'])
+        file_info = manifest.fetched_file_info(stat_tbl_id)
+        if file_info is None:
+            if index is None:
+                index = index_saved_files(from_dir)
+                logging.info(f"load: 파일명 색인 생성 {from_dir} (triplet {len(index)}건)")
+            data_info = stats_src_data_info_dict.get(stat_tbl_id, {})
+            src_data_id = data_info.get('src_data_id')
+            head = None
+            if src_data_id:
+                stat_title = data_info.get('stat_title', 'unknown')
+                head = f"{safe_filename(str(src_data_id))}-{safe_filename(str(stat_title))}"
+            candidates = [v for k, v in index.items() if head and saved_stem_head(k) == head]
+            if not candidates:
+                logging.warning(f"[{stat_tbl_id}] load: {from_dir} 에 저장된 파일이 없습니다 (src_data_id={src_data_id})")
+                missing.append(stat_tbl_id)
+                continue
+            paths = max(candidates, key=lambda v: v['ts'])
+            file_info = {
+                'stat_tbl_id': stats_src['stat_tbl_id'],
+                'meta_path': paths['meta_path'],
+                'latest_path': paths['latest_path'],
+                'data_path': paths['data_path'],
+                'ext_api_id': api_info.get('ext_api_id'),
+                'stat_api_id': stats_src.get('stat_api_id'),
+                'src_data_id': src_data_id,
+                'ext_sys': ext_sys,
+            }
+            manifest.mark_fetched(file_info)
+        saved_files_info.append(file_info)
+    return saved_files_info, missing, manifest
+
+# 스케줄러 데몬에서 실행이 겹칠 때 run_summary.log 줄이 섞이지 않도록
+_summary_lock = threading.Lock()
+
+
 def write_run_summary(summary):
     """실행 1회를 한 줄로 logs/run_summary.log 에 누적 기록(스케줄러 추적용). 기존 로그는 그대로 유지."""
     log_dir = 'logs'
@@ -321,15 +521,121 @@ def write_run_summary(summary):
         f"| files_ok={summary.get('files_ok')} | db_ok={summary.get('db_ok')} db_fail={summary.get('db_fail')} "
         f"| dur={summary.get('duration_sec')}s | status={summary.get('status')}"
     )
+    if summary.get('sources'):
+        line += " | sources=" + ",".join(f"{k}:{v}" for k, v in summary['sources'].items())
+    if summary.get('resumed'):
+        line += f" | resumed={summary.get('resumed')}"
+    if summary.get('deferred'):
+        line += f" | deferred={len(summary['deferred'])}:" + ",".join(str(t) for t in summary['deferred'])
+    if summary.get('breaker_trips'):
+        line += " | breaker_trips=" + ",".join(f"{k}:{v}" for k, v in summary['breaker_trips'].items())
+    if summary.get('report'):
+        line += f" | report={summary.get('report')}"
+    if summary.get('profile'):
+        line += f" | profile={summary.get('profile')}"
     if summary.get('error'):
         line += f" | error={summary.get('error')}"
-    with open(path, 'a', encoding='utf-8') as f:
+    with _summary_lock, open(path, 'a', encoding='utf-8') as f:
         f.write(line + '\n')
     logging.info(f"run-summary: {line}")
 
 
 def main():
     setup_logging()
+    exit_code, _ = run_batch()
+    shutdown_queue_logging()
+    sys.exit(exit_code)
+
+
+def run_batch(args=None):
+    """배치 1회 실행 (수집 -> 적재 -> 실행 요약/리포트/메트릭). 반환: (종료 코드, summary).
+
+    args 가 None 이면 CLI 인자를 파싱한다. 스케줄러 데몬(scheduler.py)은 argparse.Namespace 를
+    직접 넘겨 같은 프로세스 안에서 반복 호출한다 — 로깅 설정·sys.exit 는 호출자 몫.
+    --ext-sys 에 소스가 여러 개(또는 ALL)면 run_sources() 로 동시 실행한다.
+    """
+    if args is None:
+        args = parse_args()
+    ext_sys_list = resolve_ext_sys_list(getattr(args, 'ext_sys', None))
+    if len(ext_sys_list) > 1:
+        return run_sources(args, ext_sys_list)
+    return run_source(args, ext_sys_list[0])
+
+
+# 통합 요약에서 소스별로 합산하는 건수
+_SUMMARY_COUNT_KEYS = ('targets', 'files_ok', 'db_ok', 'db_fail')
+
+
+def run_sources(args, ext_sys_list):
+    """여러 ext_sys 를 한 프로세스에서 동시에 실행하고 통합 실행 요약 1줄을 더 남긴다.
+
+    소스마다 run_source() 를 빈 contextvars 컨텍스트에서 돌려 실행 리포트·메트릭·run_summary
+    는 소스별로 따로 남고, DB 엔진(커넥션 풀)과 import 는 공유한다. 동시 실행 소스 수는
+    PARALLEL_SOURCES, 소스 안 병렬도는 PARALLEL_WORKERS_FILE_<EXT_SYS> / PARALLEL_WORKERS_DB_<EXT_SYS>.
+
+    통합 종료 코드: 모두 성공 0, 모두 ERROR 1, 그 밖(일부 실패·부분 완료) 2.
+    """
+    started = datetime.now()
+    summary = {
+        'start': started.strftime('%Y-%m-%d %H:%M:%S'),
+        'ext_sys': ','.join(ext_sys_list), 'mode': args.mode,
+        'targets': 0, 'files_ok': 0, 'db_ok': 0, 'db_fail': 0,
+        'status': 'ERROR', 'error': None, 'sources': {},
+    }
+    exit_code = 1
+    if args.mode == 'load' or getattr(args, 'profile', False):
+        # --from-dir 은 소스 1개의 실행 디렉터리이고, profiling 은 프로세스 전역 상태다
+        summary['error'] = '--mode load / --profile 은 ext_sys 1개로만 실행할 수 있습니다'
+        logging.error(summary['error'])
+        print(f"[ERROR] {summary['error']}")
+    else:
+        logging.info("ext_sys %d개 동시 실행: %s (PARALLEL_SOURCES=%d)",
+                     len(ext_sys_list), summary['ext_sys'], get_parallel_sources())
+
+        def run_one(ext_sys):
+            source_args = argparse.Namespace(**dict(vars(args), ext_sys=ext_sys))
+            return contextvars.Context().run(run_source, source_args, ext_sys)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=get_parallel_sources(), thread_name_prefix='source') as executor:
+            futures = {executor.submit(run_one, ext_sys): ext_sys for ext_sys in ext_sys_list}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        errors = []
+        breaker_trips = {}
+        for ext_sys in ext_sys_list:
+            source_code, source_summary = results[ext_sys]
+            summary['sources'][ext_sys] = source_summary['status']
+            for key in _SUMMARY_COUNT_KEYS:
+                summary[key] += source_summary.get(key) or 0
+            for host, trips in (source_summary.get('breaker_trips') or {}).items():
+                breaker_trips[host] = breaker_trips.get(host, 0) + trips
+            if source_code != 0:
+                errors.append(f"{ext_sys}:{source_summary['status']}")
+        if breaker_trips:
+            summary['breaker_trips'] = breaker_trips
+        statuses = set(summary['sources'].values())
+        if statuses == {'SUCCESS'}:
+            summary['status'], exit_code = 'SUCCESS', 0
+        elif statuses == {'ERROR'}:
+            summary['status'], exit_code = 'ERROR', 1
+        else:
+            summary['status'], exit_code = 'PARTIAL', 2
+        summary['error'] = ','.join(errors) or None
+
+    ended = datetime.now()
+    summary['end'] = ended.strftime('%Y-%m-%d %H:%M:%S')
+    summary['duration_sec'] = int((ended - started).total_seconds())
+    try:
+        write_run_summary(summary)
+    except Exception as _e:
+        logging.error(f"run-summary 기록 실패: {_e}")
+    return exit_code, summary
+
+
+def run_source(args, ext_sys):
+    """ext_sys 1개 실행 (run_batch 본체). 반환: (종료 코드, summary)."""
     started = datetime.now()
     summary = {
         'start': started.strftime('%Y-%m-%d %H:%M:%S'),
@@ -339,16 +645,27 @@ def main():
     }
     exit_code = 1
     try:
-        args = parse_args()
         summary['mode'] = args.mode
         check_required_env_and_args(args)
-        ext_sys = resolve_ext_sys(getattr(args, 'ext_sys', None))
         summary['ext_sys'] = ext_sys
+        run_report.start_run(ext_sys=ext_sys, mode=args.mode)
+        metrics.reset(ext_sys)
+        single_flight.reset()
+        circuit_breaker.reset()
+        hedging.reset()
+        deadline_sec = getattr(args, 'deadline_sec', None)
+        deadline.start(get_run_deadline_sec() if deadline_sec is None else deadline_sec)
+        run_report.add_listener(metrics.on_span)
+        if getattr(args, 'profile', False):
+            summary['profile'] = profiling.start(ext_sys)
         logging.info(f"수집 외부 시스템: ext_sys={ext_sys}")
 
         # 이슈 #76: 이동편의 소스는 통계(stats_*) 흐름과 별개 파이프라인으로 위임
+        if ext_sys in MOBILITY_EXT_SYS and args.mode == 'load':
+            raise ValueError(f"--mode load 는 통계(stats_*) 소스만 지원합니다 (ext_sys={ext_sys})")
         if ext_sys in MOBILITY_EXT_SYS:
-            mob = run_mobility(ext_sys, args.mode)
+            with profiling.stage('mobility'):
+                mob = run_mobility(ext_sys, args.mode)
             summary['targets'] = mob['targets']
             summary['files_ok'] = mob['files_ok']
             summary['db_ok'] = mob['db_ok']
@@ -363,21 +680,47 @@ def main():
                     "DATA_COLLECTION_SCOPE 는 ALL 또는 PARTIAL 만 가능합니다. (현재: %s)" % data_collection_scope
                 )
             api_info, stats_src_list, env_target_list = get_filtered_stats_src_list(data_collection_scope, ext_sys=ext_sys)
-            dirs = prepare_data_directories(ext_sys=ext_sys)
-            # dirs['ext_sys'] 는 create_data_save_directory 에서 이미 정규화되어 채워짐.
+            resume = bool(getattr(args, 'resume', False))
             stat_tbl_id_list = [s['stat_tbl_id'] for s in stats_src_list]
             summary['targets'] = len(stat_tbl_id_list)
             ext_api_id = stats_src_list[0]['ext_api_id'] if stats_src_list else None
             stats_src_data_info_dict = get_stats_src_data_info(ext_api_id, stat_tbl_id_list)
-
-            saved_files_info = save_all_files(api_info, stats_src_list, dirs, stats_src_data_info_dict)
+            missing = []
+
+            if args.mode == 'load':
+                # 이미 받아 둔 파일만 적재 — API 호출 없음 (재적재 / DB 처리량 측정용)
+                with profiling.stage('discover'):
+                    saved_files_info, missing, manifest = discover_saved_files_info(
+                        args.from_dir, ext_sys, api_info, stats_src_list, stats_src_data_info_dict, resume=resume
+                    )
+                logging.info(f"load 모드: {args.from_dir} 에서 {len(saved_files_info)}건 발견, 누락 {len(missing)}건")
+            else:
+                dirs = resolve_resume_directories(ext_sys) if resume else None
+                if resume and dirs is None:
+                    logging.warning("resume: 이어받을 매니페스트가 없어 새 실행으로 시작합니다.")
+                if dirs is None:
+                    dirs = prepare_data_directories(ext_sys=ext_sys)
+                # dirs['ext_sys'] 는 create_data_save_directory 에서 이미 정규화되어 채워짐.
+                manifest = RunManifest.open(dirs['root'], ext_sys, resume=resume)
+                logging.info(f"run manifest: {manifest.path} (resume={resume})")
+                with profiling.stage('fetch'):
+                    saved_files_info = save_all_files(
+                        api_info, stats_src_list, dirs, stats_src_data_info_dict, manifest=manifest, resume=resume
+                    )
             summary['files_ok'] = len(saved_files_info)
 
-            if args.mode == 'db':
+            if args.mode in ('db', 'load'):
                 logging.info("DB 삽입 모드를 시작합니다.")
-                db_result = process_db_insertion(saved_files_info, api_info, stats_src_list, stats_src_data_info_dict)
+                # DB 적재 모듈은 db/load 모드에서만 import (--mode file 기동 비용 절감)
+                from db_processing import process_db_insertion
+                with profiling.stage('db'):
+                    db_result = process_db_insertion(
+                        saved_files_info, api_info, stats_src_list, stats_src_data_info_dict, manifest=manifest,
+                        finalize=not missing and not deadline.deferred(),
+                    )
+                summary['resumed'] = len(db_result.get('skipped', []))
                 summary['db_ok'] = len(db_result.get('succeeded', []))
-                failed = db_result.get('failed', [])
+                failed = db_result.get('failed', []) + [(m, 'missing files') for m in missing]
                 summary['db_fail'] = len(failed)
                 if failed:
                     summary['status'] = 'PARTIAL'
@@ -391,6 +734,12 @@ def main():
             else:
                 summary['status'] = 'SUCCESS'
                 exit_code = 0
+            deferred = deadline.deferred()
+            if deferred and exit_code == 0:
+                summary['status'] = 'PARTIAL'
+                summary['error'] = f"deferred:{len(deferred)}"
+                exit_code = 2
+                logging.warning(f"실행 마감으로 통계표 {len(deferred)}건을 다음 실행으로 미룸 — 부분 완료(종료코드 2).")
 
         logging.info("모든 작업이 완료되었습니다.")
 
@@ -410,12 +759,35 @@ def main():
         ended = datetime.now()
         summary['end'] = ended.strftime('%Y-%m-%d %H:%M:%S')
         summary['duration_sec'] = int((ended - started).total_seconds())
+        single_flight.finish()
+        summary['breaker_trips'] = circuit_breaker.finish()
+        hedging.finish()
+        summary['deferred'] = deadline.finish()
+        try:
+            run_report.update_meta(status=summary['status'], duration_sec=summary['duration_sec'])
+            summary['report'] = run_report.finish_run()
+        except Exception as _e:
+            logging.error(f"run-report 기록 실패: {_e}")
+        try:
+            table_history.record_run(summary['ext_sys'], summary.get('report'))
+        except Exception as _e:
+            logging.error(f"table history 기록 실패: {_e}")
+        try:
+            profiling.finish()
+        except Exception as _e:
+            logging.error(f"profiling 결과 기록 실패: {_e}")
+        metrics_dir = get_metrics_textfile_dir()
+        if metrics_dir and summary['ext_sys']:
+            try:
+                summary['metrics'] = metrics.write_textfile(metrics_dir, summary['ext_sys'], summary)
+            except Exception as _e:
+                logging.error(f"metrics textfile 기록 실패: {_e}")
         try:
             write_run_summary(summary)
         except Exception as _e:
             logging.error(f"run-summary 기록 실패: {_e}")
 
-    sys.exit(exit_code)
+    return exit_code, summary
 
 
 if __name__ == '__main__':
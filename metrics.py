@@ -0,0 +1,206 @@
+"""배치 실행 Prometheus textfile 메트릭 — node_exporter textfile collector 형식.
+
+일회성 배치라 scrape 엔드포인트 대신 실행 종료 시 ``<METRICS_TEXTFILE_DIR>/dabt_batch_<ext_sys>.prom``
+파일을 원자적으로(임시 파일 -> rename) 교체한다. 카운터는 실행마다 0 에서 시작하므로
+파일 내용은 "마지막 실행" 값이다 (알림은 last_run_* 게이지와 함께 본다).
+
+수집 지점:
+- HTTP: kosis_api._http_get / BaseCollector.http_get 이 observe_http() 직접 호출
+  (ext_sys / endpoint(KOSIS 는 data·meta·latest, 그 외는 오퍼레이션명) / status)
+  KOSIS meta/latest 를 같은 실행의 같은 요청 결과로 대신한 건은 http_requests_coalesced_total
+- DB 단계 지연·적재 행 수·Error 31 분할: run_report span 리스너(on_span)로 변환
+  (db.* 단계 -> 히스토그램, 적재 단계 rows -> rows_inserted, kosis.error31_split -> 카운터)
+
+prometheus_client 의존성 없이 텍스트 형식을 직접 쓴다. 누적 저장소는 run_report 와 같이
+contextvar 로 잡아 스케줄러 데몬에서 겹쳐 도는 실행끼리 섞이지 않는다. reset() 한 실행 컨텍스트를
+물려받지 않은 스레드의 값은 기록하지 않는다(처음 1번만 debug 로그).
+"""
+from __future__ import annotations
+
+import contextvars
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+PREFIX = 'dabt_batch_'
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# 적재 행 수로 집계하는 run_report 단계
+ROW_STAGES = ('db.insert_origin', 'db.copy_origin', 'db.load_sharded', 'db.upsert')
+
+
+class _Store:
+    def __init__(self, ext_sys=None):
+        self.lock = threading.Lock()
+        self.counters = {}     # (name, labels) -> value
+        self.histograms = {}   # (name, labels) -> [bucket_counts..., sum, count]
+        self.gauges = {}       # (name, labels) -> value
+        self.ext_sys = ext_sys
+
+
+_context_store = contextvars.ContextVar('metrics_store', default=None)
+_logged_outside_run = False
+
+
+def _store() -> Optional[_Store]:
+    global _logged_outside_run
+    store = _context_store.get()
+    if store is None and not _logged_outside_run:
+        _logged_outside_run = True
+        logger.debug('실행 컨텍스트 밖에서 기록한 메트릭은 버립니다 (run_report.in_context 로 감싸지 않은 스레드)')
+    return store
+
+
+HELP = {
+    'http_requests_total': ('counter', 'HTTP requests by ext_sys, endpoint and status'),
+    'http_request_duration_seconds': ('histogram', 'HTTP request latency'),
+    'http_response_bytes_total': ('counter', 'HTTP response bytes downloaded'),
+    'http_retries_total': ('counter', 'HTTP retry attempts'),
+    'http_hedged_requests_total': ('counter', 'Hedged duplicate requests by endpoint and which request finished first'),
+    'http_requests_coalesced_total': ('counter', 'HTTP requests served by an identical in-flight or cached request'),
+    'circuit_breaker_trips_total': ('counter', 'Times a host circuit breaker opened after consecutive failures'),
+    'kosis_error31_splits_total': ('counter', 'KOSIS Error 31 period splits'),
+    'kosis_planned_splits_total': ('counter', 'KOSIS requests added by cell-count based period planning'),
+    'rows_inserted_total': ('counter', 'Rows inserted per table'),
+    'db_stage_duration_seconds': ('histogram', 'DB stage latency'),
+    'last_run_timestamp_seconds': ('gauge', 'Unix time the last run finished'),
+    'last_run_duration_seconds': ('gauge', 'Duration of the last run'),
+    'last_run_success': ('gauge', '1 if the last run finished with status SUCCESS'),
+    'last_run_tables_failed': ('gauge', 'Tables that failed to load in the last run'),
+}
+
+
+def _key(name, labels):
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def reset(ext_sys: Optional[str] = None) -> None:
+    """새 실행 시작 — 빈 저장소를 현재 컨텍스트에 두고 기본 ext_sys 라벨을 정한다."""
+    _context_store.set(_Store(ext_sys))
+
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    if not value:
+        return
+    store = _store()
+    if store is None:
+        return
+    key = _key(name, labels)
+    with store.lock:
+        store.counters[key] = store.counters.get(key, 0) + value
+
+
+def observe(name: str, value: float, **labels) -> None:
+    store = _store()
+    if store is None:
+        return
+    key = _key(name, labels)
+    with store.lock:
+        hist = store.histograms.get(key)
+        if hist is None:
+            hist = store.histograms[key] = [0] * (len(DURATION_BUCKETS) + 2)
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if value <= bound:
+                hist[i] += 1
+        hist[-2] += value
+        hist[-1] += 1
+
+
+def set_gauge(name: str, value: float, **labels) -> None:
+    store = _store()
+    if store is None:
+        return
+    with store.lock:
+        store.gauges[_key(name, labels)] = value
+
+
+def observe_http(ext_sys: str, endpoint: str, status, seconds: float, nbytes: int = 0, retry: bool = False) -> None:
+    """HTTP 요청 1건 (status 는 HTTP 코드 또는 예외 시 'error')."""
+    inc('http_requests_total', ext_sys=ext_sys, endpoint=endpoint, status=status)
+    observe('http_request_duration_seconds', seconds, ext_sys=ext_sys, endpoint=endpoint)
+    inc('http_response_bytes_total', nbytes, ext_sys=ext_sys, endpoint=endpoint)
+    if retry:
+        inc('http_retries_total', ext_sys=ext_sys, endpoint=endpoint)
+
+
+def on_span(stage: str, seconds: Optional[float], table, counters: dict) -> None:
+    """run_report 리스너 — 단계 기록을 메트릭으로 변환."""
+    if stage == 'kosis.error31_split':
+        inc('kosis_error31_splits_total', counters.get('retries', 1))
+        return
+    if stage == 'kosis.planned_split':
+        inc('kosis_planned_splits_total', counters.get('retries', 0))
+        return
+    if stage.startswith('db.') and seconds is not None:
+        observe('db_stage_duration_seconds', seconds, stage=stage)
+    if stage in ROW_STAGES and counters.get('rows') and not counters.get('errors'):
+        store = _store()
+        if store is not None:
+            inc('rows_inserted_total', counters['rows'], ext_sys=store.ext_sys or '', table=table or '')
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', ' ')
+
+
+def _fmt_labels(labels, extra=()):
+    items = list(labels) + list(extra)
+    if not items:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in items) + '}'
+
+
+def _fmt_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render() -> str:
+    """현재 값을 Prometheus 텍스트 형식으로."""
+    store = _store() or _Store()
+    with store.lock:
+        counters = dict(store.counters)
+        histograms = {k: list(v) for k, v in store.histograms.items()}
+        gauges = dict(store.gauges)
+
+    by_name = {}
+    for values in (counters, histograms, gauges):
+        for (name, labels), value in values.items():
+            by_name.setdefault(name, []).append((labels, value))
+
+    lines = []
+    for name in sorted(by_name):
+        mtype, help_text = HELP.get(name, ('untyped', name))
+        full = PREFIX + name
+        lines.append(f'# HELP {full} {help_text}')
+        lines.append(f'# TYPE {full} {mtype}')
+        for labels, value in sorted(by_name[name]):
+            if mtype == 'histogram':
+                for i, bound in enumerate(DURATION_BUCKETS):
+                    lines.append(f'{full}_bucket{_fmt_labels(labels, [("le", bound)])} {value[i]}')
+                lines.append(f'{full}_bucket{_fmt_labels(labels, [("le", "+Inf")])} {value[-1]}')
+                lines.append(f'{full}_sum{_fmt_labels(labels)} {_fmt_value(float(value[-2]))}')
+                lines.append(f'{full}_count{_fmt_labels(labels)} {value[-1]}')
+            else:
+                lines.append(f'{full}{_fmt_labels(labels)} {_fmt_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_textfile(directory: str, ext_sys: str, summary: Optional[dict] = None) -> str:
+    """실행 요약 게이지를 채운 뒤 <directory>/dabt_batch_<ext_sys>.prom 을 원자적으로 교체."""
+    ext_sys = ext_sys or 'UNKNOWN'
+    if summary:
+        set_gauge('last_run_timestamp_seconds', int(time.time()), ext_sys=ext_sys)
+        set_gauge('last_run_duration_seconds', summary.get('duration_sec') or 0, ext_sys=ext_sys)
+        set_gauge('last_run_success', 1 if summary.get('status') == 'SUCCESS' else 0, ext_sys=ext_sys)
+        set_gauge('last_run_tables_failed', summary.get('db_fail') or 0, ext_sys=ext_sys)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'{PREFIX}{ext_sys.lower()}.prom')
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(render())
+    os.replace(tmp_path, path)
+    return path
@@ -14,22 +14,21 @@ import logging
 import os
 
 import db_mobility
-from db import get_api_info
-from collectors.gbis import GbisCollector
-from collectors.korail_conv import KorailConvCollector
-from collectors.kowsi_facl import KowsiFaclCollector
-from collectors.tour_bf import TourBfCollector
+import run_report
+from collectors.registry import LazyRegistry
+from db import get_api_info, get_engine
 
 logger = logging.getLogger(__name__)
 
 GENERIC_EXT_DATA_ROOT = 'ext_data'
 
-MOBILITY_COLLECTORS = {
-    'GBIS': GbisCollector,
-    'KORAIL_CONV': KorailConvCollector,
-    'KOWSI_FACL': KowsiFaclCollector,
-    'TOUR_BF_API': TourBfCollector,
-}
+# 어댑터는 해당 ext_sys 실행 시에만 import (collectors.registry.LazyRegistry)
+MOBILITY_COLLECTORS = LazyRegistry({
+    'GBIS': 'collectors.gbis:GbisCollector',
+    'KORAIL_CONV': 'collectors.korail_conv:KorailConvCollector',
+    'KOWSI_FACL': 'collectors.kowsi_facl:KowsiFaclCollector',
+    'TOUR_BF_API': 'collectors.tour_bf:TourBfCollector',
+})
 
 MOBILITY_EXT_SYS = tuple(MOBILITY_COLLECTORS)
 
@@ -62,7 +61,9 @@ def _collect_gbis_stations(collector, route_rows, save_dir, mode: str, summary:
         logger.warning('GBIS 대상 노선이 없어 경유정류소 수집을 생략합니다')
         return
 
-    stations, links = collector.collect_stations(route_ids)
+    with run_report.span('mobility.collect_stations') as sp:
+        stations, links = collector.collect_stations(route_ids)
+        sp.add(rows=len(stations) + len(links))
     logger.info('GBIS 경유정류소 수집 완료: 정류장 %d개 / 노선-정류장 %d행',
                 len(stations), len(links))
     collector.save_response(stations, save_dir, 'stations.json')
@@ -81,30 +82,107 @@ def run_mobility(ext_sys: str, mode: str) -> dict:
     """이동편의 소스 1건 수집·적재. 반환: 요약 dict (targets/files_ok/db_ok/db_fail)."""
     ext_sys = ext_sys.upper()
     collector_cls = MOBILITY_COLLECTORS[ext_sys]
-    api_info = get_api_info(ext_sys) or {}
+    # --mode file 은 DB 없이도 돈다 (DB_URL 미설정이면 조회하지 않고 .env 설정 사용)
+    api_info = (get_api_info(ext_sys) if get_engine() is not None else None) or {}
     if not api_info:
-        logger.warning('sys_ext_api_info 에 %s 행이 없습니다 — .env 설정으로 진행', ext_sys)
+        logger.warning('sys_ext_api_info 에 %s 행이 없거나 DB_URL 미설정 — .env 설정으로 진행', ext_sys)
     collector = collector_cls(api_info=api_info, stats_src={})
 
-    rows = collector.collect()
-    logger.info('%s 수집 완료: %d행', ext_sys, len(rows))
+    # 계측 기본 단위(table)는 ext_sys — db_mobility 는 적재 테이블명으로 따로 집계된다.
+    with run_report.table_scope(ext_sys):
+        with run_report.span('mobility.collect') as sp:
+            rows = collector.collect()
+            sp.add(rows=len(rows))
+        logger.info('%s 수집 완료: %d행', ext_sys, len(rows))
+
+        today = datetime.datetime.now().strftime('%Y%m%d')
+        save_dir = os.path.join(GENERIC_EXT_DATA_ROOT, ext_sys, today)
+        with run_report.span('mobility.save', rows=len(rows)):
+            collector.save_response(rows, save_dir, 'rows.json')
+            raw_details = getattr(collector, '_raw_details', None)
+            if raw_details:
+                collector.save_response(raw_details, save_dir, 'raw_details.json')
+
+        summary = {'targets': len(rows), 'files_ok': len(rows), 'db_ok': 0, 'db_fail': 0}
+        if mode == 'db':
+            upsert = _UPSERT_DISPATCH[ext_sys]
+            with run_report.span('mobility.load', rows=len(rows)):
+                summary['db_ok'] = upsert(rows)
+            logger.info('%s DB 적재 완료: %d행', ext_sys, summary['db_ok'])
+
+        if ext_sys == 'GBIS':
+            _collect_gbis_stations(collector, rows, save_dir, mode, summary)
+
+        if mode == 'db':
+            db_mobility.touch_latest_sync(ext_sys)
+    return summary
 
-    today = datetime.datetime.now().strftime('%Y%m%d')
-    save_dir = os.path.join(GENERIC_EXT_DATA_ROOT, ext_sys, today)
-    collector.save_response(rows, save_dir, 'rows.json')
-    raw_details = getattr(collector, '_raw_details', None)
-    if raw_details:
-        collector.save_response(raw_details, save_dir, 'raw_details.json')
 
-    summary = {'targets': len(rows), 'files_ok': len(rows), 'db_ok': 0, 'db_fail': 0}
-    if mode == 'db':
-        upsert = _UPSERT_DISPATCH[ext_sys]
-        summary['db_ok'] = upsert(rows)
-        logger.info('%s DB 적재 완료: %d행', ext_sys, summary['db_ok'])
+# --- 분산 수집(distributed.py) 작업 단위 -------------------------------------
+# GBIS 는 노선 묶음, KOWSI_FACL 은 목록 페이지 범위로 나누고 나머지는 소스 전체가 단위 1개.
+GBIS_ROUTE_BATCH = 50
 
-    if ext_sys == 'GBIS':
-        _collect_gbis_stations(collector, rows, save_dir, mode, summary)
 
-    if mode == 'db':
-        db_mobility.touch_latest_sync(ext_sys)
+def _mobility_collector(ext_sys: str):
+    api_info = get_api_info(ext_sys) or {}
+    return MOBILITY_COLLECTORS[ext_sys](api_info=api_info, stats_src={})
+
+
+def plan_mobility_units(ext_sys: str) -> list:
+    """분산 수집 작업 단위 목록 [{unit_key, kind, payload, priority}, ...]."""
+    ext_sys = ext_sys.upper()
+    if ext_sys == 'GBIS':
+        route_ids = _mobility_collector(ext_sys).target_route_ids()
+        return [
+            {'unit_key': f'gbis:{i // GBIS_ROUTE_BATCH:04d}', 'kind': 'gbis_routes',
+             'payload': {'route_ids': route_ids[i:i + GBIS_ROUTE_BATCH]},
+             'priority': len(route_ids[i:i + GBIS_ROUTE_BATCH])}
+            for i in range(0, len(route_ids), GBIS_ROUTE_BATCH)
+        ]
+    if ext_sys == 'KOWSI_FACL':
+        # 분산 수집은 상태 파일(next_page) 이어받기 대신 매 실행 전 페이지를 범위로 나눠 스캔한다
+        collector = _mobility_collector(ext_sys)
+        total, step = collector.total_pages(), collector.max_pages
+        return [
+            {'unit_key': f'kowsi:p{start:05d}', 'kind': 'kowsi_pages',
+             'payload': {'start': start, 'end': min(start + step - 1, total)},
+             'priority': min(start + step - 1, total) - start + 1}
+            for start in range(1, total + 1, step)
+        ]
+    return [{'unit_key': ext_sys.lower(), 'kind': 'mobility', 'payload': {}, 'priority': 0}]
+
+
+def run_mobility_unit(ext_sys: str, mode: str, unit_key: str, kind: str, payload: dict) -> dict:
+    """작업 단위 1건 수집·보존·적재. 반환: 요약 dict (targets/files_ok/db_ok/db_fail).
+
+    원본은 ``ext_data/<EXT_SYS>/<YYYYMMDD>/units/<unit_key>/`` 에 단위별로 남긴다 (호스트 로컬).
+    sys_ext_api_info.latest_sync_time 갱신은 모든 단위가 끝난 뒤 마무리 작업자 1명이 한다.
+    """
+    ext_sys = ext_sys.upper()
+    if kind == 'mobility':
+        return run_mobility(ext_sys, mode)
+    collector = _mobility_collector(ext_sys)
+    with run_report.table_scope(ext_sys):
+        with run_report.span('mobility.collect') as sp:
+            if kind == 'gbis_routes':
+                rows = collector.collect_routes(payload['route_ids'])
+            elif kind == 'kowsi_pages':
+                matched, _, _ = collector.scan_pages(int(payload['start']), int(payload['end']))
+                rows = collector.enrich_eval(matched)
+            else:
+                raise ValueError(f'알 수 없는 작업 단위 종류: {kind!r} ({unit_key})')
+            sp.add(rows=len(rows))
+        logger.info('%s %s 수집 완료: %d행', ext_sys, unit_key, len(rows))
+
+        today = datetime.datetime.now().strftime('%Y%m%d')
+        save_dir = os.path.join(GENERIC_EXT_DATA_ROOT, ext_sys, today, 'units', unit_key.replace(':', '_'))
+        with run_report.span('mobility.save', rows=len(rows)):
+            collector.save_response(rows, save_dir, 'rows.json')
+
+        summary = {'targets': len(rows), 'files_ok': len(rows), 'db_ok': 0, 'db_fail': 0}
+        if mode == 'db':
+            with run_report.span('mobility.load', rows=len(rows)):
+                summary['db_ok'] = _UPSERT_DISPATCH[ext_sys](rows)
+        if kind == 'gbis_routes':
+            _collect_gbis_stations(collector, rows, save_dir, mode, summary)
     return summary
@@ -0,0 +1,196 @@
+"""배치 내장 프로파일링 (--profile) — 단계별 cProfile + tracemalloc, 통계표별 최대 메모리.
+
+실행이 갑자기 두 배로 느려지거나 메모리가 튈 때 코드를 고치지 않고 원인을 보기 위한 모드다.
+
+    profiling.start('KOSIS')                      # logs/profile/<시각>_KOSIS/
+    with profiling.stage('fetch'):                # fetch.pstats / fetch_alloc.txt
+        ... ThreadPoolExecutor 워커 안에서:
+        with profiling.table(stat_tbl_id):        # 워커 스레드 cProfile + 통계표 메모리 추적
+            ...
+    profiling.finish()                            # summary.json
+
+- cProfile 은 스레드별로만 동작하므로 단계 스레드의 프로파일에 table() 로 감싼 워커 작업의
+  프로파일을 합쳐 단계 .pstats 1개로 남긴다 (``python -m pstats <파일>`` / snakeviz 로 확인).
+- tracemalloc 은 단계 시작 시 peak 를 초기화하고 종료 시 peak 와 상위 할당 위치를 기록한다.
+- 통계표별 peak_mb 는 해당 통계표 작업 동안의 프로세스 전체 tracemalloc peak 다. 진행 중인
+  통계표가 하나도 없을 때만 peak 를 초기화하므로, 동시에 도는 다른 통계표 몫이 섞인 상한값이
+  된다(PARALLEL_WORKERS_* =1 이면 정확).
+- DB_PARSE_PROCESSES 프로세스 풀(spawn) 안의 파싱은 추적 대상이 아니다.
+- tracemalloc.reset_peak 가 없는 Python 3.8 에서는 peak 를 초기화하지 못해 단계·통계표 peak 가
+  프로파일 시작 이후 최댓값이 된다.
+
+비활성(start 전)이면 stage()/table() 은 아무 일도 하지 않는다.
+"""
+from __future__ import annotations
+
+import cProfile
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = os.path.join('logs', 'profile')
+TOP_ALLOCATIONS = 30
+TRACE_FRAMES = 5
+
+_MB = 1024 * 1024
+
+
+def _reset_peak() -> None:
+    """tracemalloc peak 초기화 (3.9+). 3.8 은 초기화 없이 시작 이후 peak 를 쓴다."""
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+
+
+class _Profiler:
+    def __init__(self, run_dir: str):
+        self.run_dir = run_dir
+        self.lock = threading.Lock()
+        self.stages = {}
+        self.tables = {}
+        self.open_tables = {}        # table -> 열린 횟수
+        self.stage_thread = None
+        self.stage_peak = 0          # 통계표 단위 reset_peak 이전까지의 단계 peak
+        self.task_profiles = []
+
+    # --- 통계표 메모리 ---------------------------------------------------------
+    def enter_table(self, table) -> None:
+        with self.lock:
+            if not self.open_tables:
+                self.stage_peak = max(self.stage_peak, tracemalloc.get_traced_memory()[1])
+                _reset_peak()
+            self.open_tables[table] = self.open_tables.get(table, 0) + 1
+
+    def exit_table(self, table) -> None:
+        peak = tracemalloc.get_traced_memory()[1]
+        with self.lock:
+            if peak > self.tables.get(table, 0):
+                self.tables[table] = peak
+            left = self.open_tables.get(table, 1) - 1
+            if left > 0:
+                self.open_tables[table] = left
+            else:
+                self.open_tables.pop(table, None)
+
+    # --- 단계 ----------------------------------------------------------------
+    def write_stage(self, name: str, profile: cProfile.Profile, seconds: float, snapshot) -> None:
+        with self.lock:
+            task_profiles, self.task_profiles = self.task_profiles, []
+        previous = self.stages.get(name)
+        calls = previous['calls'] + 1 if previous else 1
+        # 같은 단계가 여러 번 돌면 파일을 덮어쓰지 않고 <name>_2 ... 로 남긴다
+        file_stem = name if calls == 1 else f'{name}_{calls}'
+        stats = pstats.Stats(profile)
+        for task_profile in task_profiles:
+            stats.add(task_profile)
+        stats.dump_stats(os.path.join(self.run_dir, f'{file_stem}.pstats'))
+
+        peak = max(self.stage_peak, tracemalloc.get_traced_memory()[1])
+        alloc_path = os.path.join(self.run_dir, f'{file_stem}_alloc.txt')
+        with open(alloc_path, 'w', encoding='utf-8') as f:
+            f.write(f'# stage={name} seconds={seconds:.3f} peak_mb={peak / _MB:.1f}\n')
+            for stat in snapshot.statistics('traceback')[:TOP_ALLOCATIONS]:
+                f.write(f'{stat.size / _MB:10.2f} MB  {stat.count:>9} blocks\n')
+                for line in stat.traceback.format():
+                    f.write(f'    {line}\n')
+        self.stages[name] = {
+            'calls': calls,
+            'seconds': round(seconds + (previous['seconds'] if previous else 0), 3),
+            'peak_mb': round(max(peak / _MB, previous['peak_mb'] if previous else 0), 1),
+            'task_profiles': len(task_profiles) + (previous['task_profiles'] if previous else 0),
+        }
+
+    def summary(self) -> dict:
+        with self.lock:
+            tables = {str(t): round(v / _MB, 1) for t, v in sorted(self.tables.items(), key=lambda kv: -kv[1])}
+        return {'stages': self.stages, 'tables_peak_mb': tables}
+
+
+_active: Optional[_Profiler] = None
+
+
+def enabled() -> bool:
+    return _active is not None
+
+
+def start(label: str = 'run', profile_dir: str = PROFILE_DIR) -> str:
+    """프로파일링 시작. 반환: 결과 디렉터리 (logs/profile/<시각>_<label>)."""
+    global _active
+    run_dir = os.path.join(profile_dir, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{label}")
+    os.makedirs(run_dir, exist_ok=True)
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACE_FRAMES)
+    _active = _Profiler(run_dir)
+    logger.info(f"profiling 활성: {run_dir}")
+    return run_dir
+
+
+def finish() -> Optional[str]:
+    """summary.json 기록 후 비활성화. 반환: summary 경로 (비활성이었으면 None)."""
+    global _active
+    profiler, _active = _active, None
+    if profiler is None:
+        return None
+    tracemalloc.stop()
+    path = os.path.join(profiler.run_dir, 'summary.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(profiler.summary(), f, ensure_ascii=False, indent=2)
+    logger.info(f"profiling 결과: {profiler.run_dir}")
+    return path
+
+
+@contextmanager
+def stage(name: str):
+    """단계 1개를 cProfile(현재 스레드 + table() 워커) 과 tracemalloc 으로 측정."""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    _reset_peak()
+    profiler.stage_peak = 0
+    profile = cProfile.Profile()
+    profiler.stage_thread = threading.get_ident()
+    started = time.perf_counter()
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        seconds = time.perf_counter() - started
+        profiler.stage_thread = None
+        try:
+            profiler.write_stage(name, profile, seconds, tracemalloc.take_snapshot())
+        except Exception as e:  # 프로파일 기록 실패가 배치를 막지 않도록
+            logger.warning(f"profiling 단계 기록 실패({name}): {e}")
+
+
+@contextmanager
+def table(table_id):
+    """워커 작업 1건 — 통계표 메모리 추적 + (워커 스레드면) 작업 cProfile 을 단계에 합산."""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    profiler.enter_table(table_id)
+    # 단계 스레드에서는 이미 단계 프로파일러가 돌고 있으므로 중복 활성화하지 않는다
+    profile = None
+    if profiler.stage_thread is not None and profiler.stage_thread != threading.get_ident():
+        profile = cProfile.Profile()
+        profile.enable()
+    try:
+        yield
+    finally:
+        if profile is not None:
+            profile.disable()
+            profile.create_stats()
+            with profiler.lock:
+                profiler.task_profiles.append(profile)
+        profiler.exit_table(table_id)
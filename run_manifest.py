@@ -0,0 +1,241 @@
+"""실행 체크포인트 매니페스트 — 통계표 단위 단계 완료 기록과 --resume 이어받기.
+
+수집 결과 디렉터리(``kosis_data/<YYYYMMDD>`` / ``ext_data/<EXT_SYS>/<YYYYMMDD>``) 루트에
+``manifest.json`` 1개를 두고, 통계표(stat_tbl_id)마다 단계별 완료 상태를 기록한다.
+
+- fetch : meta/latest/data 파일 저장 완료. 파일 경로 + sha256 + 크기를 함께 기록
+- load  : DB 적재(통계표 단위 커밋) 완료 / 실패(에러 메시지)
+
+``--resume`` 실행 시 가장 최근 매니페스트를 읽어, 파일이 그대로(해시 일치) 남아 있는
+fetch 완료 통계표는 API 재호출 없이 재사용하고, load 완료 통계표는 DB 적재를 건너뛴다.
+결과적으로 실패했던 통계표만 다시 수집·적재된다.
+
+기록은 여러 워커 스레드에서 동시에 일어나므로 잠금 후 임시 파일 -> os.replace 로
+원자적으로 교체한다(중간에 프로세스가 죽어도 매니페스트가 깨지지 않도록).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+STAGE_FETCH = 'fetch'
+STAGE_LOAD = 'load'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+FILE_KEYS = ('meta_path', 'latest_path', 'data_path')
+
+# file_utils.save_*_file 파일명 규칙: <kind>_<src_data_id>-<title>-<from>-<to>_<YYYYMMDDHHMMSS>.<ext>
+SAVED_FILE_RE = re.compile(r'^(meta|latest|data)_(.+)_(\d{14})\.[^.]+$')
+# stem 끝의 수집 기간 -<from>-<to> (연도 4자리, 값이 없으면 unknown)
+SAVED_STEM_PERIOD_RE = re.compile(r'^(.+)-(?:\d{4}|unknown)-(?:\d{4}|unknown)$')
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 sha256 (대용량 data 파일도 고정 메모리로 계산)."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _now() -> str:
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def find_latest_manifest(base_dir: str) -> Optional[str]:
+    """base_dir 아래 날짜 디렉터리(YYYYMMDD) 중 매니페스트가 있는 가장 최근 경로."""
+    try:
+        names = sorted(
+            (e.name for e in os.scandir(base_dir) if e.is_dir() and e.name.isdigit()),
+            reverse=True,
+        )
+    except FileNotFoundError:
+        return None
+    for name in names:
+        path = os.path.join(base_dir, name, MANIFEST_FILENAME)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def index_saved_files(root_dir: str) -> dict:
+    """root_dir/{meta,latest,data} 를 한 번씩만 스캔해 파일명 규칙으로 triplet 색인을 만든다.
+
+    반환: {stem: {'meta_path', 'latest_path', 'data_path', 'ts'}} — stem 은
+    ``<src_data_id>-<title>-<from>-<to>`` 이고 세 종류가 모두 있는 것만 포함한다.
+    같은 stem 이 여러 번 저장되었으면 종류별로 가장 최근(파일명 시각) 파일을 쓴다.
+    """
+    found = {}
+    for kind in ('meta', 'latest', 'data'):
+        kind_dir = os.path.join(root_dir, kind)
+        try:
+            entries = list(os.scandir(kind_dir))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            m = SAVED_FILE_RE.match(entry.name)
+            if not entry.is_file() or not m or m.group(1) != kind:
+                continue
+            stem, ts = m.group(2), m.group(3)
+            slot = found.setdefault(stem, {})
+            key = f'{kind}_path'
+            if key not in slot or ts > slot[key][0]:
+                slot[key] = (ts, entry.path)
+    index = {}
+    for stem, slot in found.items():
+        if all(key in slot for key in FILE_KEYS):
+            index[stem] = {key: slot[key][1] for key in FILE_KEYS}
+            index[stem]['ts'] = slot['data_path'][0]
+    return index
+
+
+def saved_stem_head(stem: str) -> Optional[str]:
+    """색인 stem 에서 수집 기간을 뗀 ``<src_data_id>-<title>`` (규칙에 안 맞으면 None)."""
+    m = SAVED_STEM_PERIOD_RE.match(stem)
+    return m.group(1) if m else None
+
+
+class RunManifest:
+    """통계표 단위 단계 완료 기록 (thread-safe, 기록마다 원자적 저장)."""
+
+    def __init__(self, path: str, ext_sys: str, data: Optional[dict] = None):
+        self.path = path
+        self.ext_sys = ext_sys
+        self._lock = threading.Lock()
+        self._data = data or {
+            'version': MANIFEST_VERSION,
+            'ext_sys': ext_sys,
+            'created_at': _now(),
+            'updated_at': None,
+            'tables': {},
+        }
+
+    # --- 생성 / 로드 ---------------------------------------------------------
+    @classmethod
+    def open(cls, root_dir: str, ext_sys: str, resume: bool = False) -> 'RunManifest':
+        """root_dir 의 매니페스트를 연다.
+
+        resume=False 면 기존 기록을 무시하고 새 매니페스트로 시작한다(같은 날 재실행 시
+        이전 load 완료 기록 때문에 적재를 건너뛰는 일이 없도록).
+        """
+        path = os.path.join(root_dir, MANIFEST_FILENAME)
+        if resume and os.path.isfile(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+                if not isinstance(data, dict) or not isinstance(data.get('tables'), dict):
+                    raise ValueError('manifest must be dict with tables')
+                logger.info('run manifest 로드: %s (통계표 %d건 기록)', path, len(data['tables']))
+                return cls(path, ext_sys, data)
+            except (OSError, ValueError) as e:
+                logger.warning('run manifest 로드 실패 — 새로 시작합니다: %s (%s)', path, e)
+        manifest = cls(path, ext_sys)
+        manifest.save()
+        return manifest
+
+    def save(self) -> None:
+        with self._lock:
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        self._data['updated_at'] = _now()
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    # --- 기록 ---------------------------------------------------------------
+    def _table(self, stat_tbl_id) -> dict:
+        return self._data['tables'].setdefault(str(stat_tbl_id), {'stages': {}})
+
+    def mark_fetched(self, file_info: dict) -> None:
+        """파일 저장 완료 기록. 파일이 새로 저장되었으므로 이전 load 기록은 무효화한다."""
+        files = {}
+        for key in FILE_KEYS:
+            path = file_info.get(key)
+            if path and os.path.isfile(path):
+                files[key] = {'path': path, 'sha256': file_sha256(path), 'bytes': os.path.getsize(path)}
+        with self._lock:
+            table = self._table(file_info['stat_tbl_id'])
+            table['file_info'] = {k: v for k, v in file_info.items() if k not in FILE_KEYS}
+            table['stages'][STAGE_FETCH] = {'status': STATUS_DONE, 'at': _now(), 'files': files}
+            table['stages'].pop(STAGE_LOAD, None)
+            self._save_locked()
+
+    def clear_stage(self, stage: str) -> None:
+        """모든 통계표의 stage 기록을 지운다(load 전용 재적재 시 이전 load 완료 무시)."""
+        with self._lock:
+            for table in self._data['tables'].values():
+                table.get('stages', {}).pop(stage, None)
+            self._save_locked()
+
+    def mark_loaded(self, stat_tbl_id) -> None:
+        self._mark(stat_tbl_id, STAGE_LOAD, STATUS_DONE)
+
+    def mark_failed(self, stat_tbl_id, stage: str, error) -> None:
+        self._mark(stat_tbl_id, stage, STATUS_FAILED, error=str(error)[:300])
+
+    def _mark(self, stat_tbl_id, stage: str, status: str, **extra) -> None:
+        with self._lock:
+            entry = {'status': status, 'at': _now()}
+            entry.update(extra)
+            stages = self._table(stat_tbl_id)['stages']
+            if stage == STAGE_FETCH and stages.get(STAGE_FETCH, {}).get('status') == STATUS_DONE:
+                # 이전 실행에서 받은 파일은 그대로 두고 실패만 덧붙인다.
+                stages[STAGE_FETCH]['last_error'] = entry
+            else:
+                stages[stage] = entry
+            self._save_locked()
+
+    # --- 조회 ---------------------------------------------------------------
+    def stage_status(self, stat_tbl_id, stage: str) -> Optional[str]:
+        with self._lock:
+            table = self._data['tables'].get(str(stat_tbl_id)) or {}
+            return (table.get('stages', {}).get(stage) or {}).get('status')
+
+    def is_loaded(self, stat_tbl_id) -> bool:
+        return self.stage_status(stat_tbl_id, STAGE_LOAD) == STATUS_DONE
+
+    def fetched_file_info(self, stat_tbl_id) -> Optional[dict]:
+        """fetch 완료 + 파일이 기록된 해시 그대로 남아 있으면 재사용할 file_info, 아니면 None."""
+        with self._lock:
+            table = self._data['tables'].get(str(stat_tbl_id)) or {}
+            fetch = table.get('stages', {}).get(STAGE_FETCH) or {}
+            if fetch.get('status') != STATUS_DONE:
+                return None
+            files = dict(fetch.get('files') or {})
+            base_info = dict(table.get('file_info') or {})
+        if any(key not in files for key in FILE_KEYS):
+            return None
+        for key in FILE_KEYS:
+            entry = files[key]
+            path = entry.get('path')
+            if not path or not os.path.isfile(path) or file_sha256(path) != entry.get('sha256'):
+                logger.warning('[%s] manifest 파일 불일치(%s) — 재수집합니다', stat_tbl_id, path)
+                return None
+            base_info[key] = path
+        return base_info
+
+    def summary(self) -> dict:
+        """단계별 done/failed 건수 (run summary 용)."""
+        counts = {}
+        with self._lock:
+            for table in self._data['tables'].values():
+                for stage, entry in table.get('stages', {}).items():
+                    key = f"{stage}_{entry.get('status')}"
+                    counts[key] = counts.get(key, 0) + 1
+        return counts
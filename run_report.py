@@ -0,0 +1,216 @@
+"""실행 단계별 계측 — span/timer API 와 통계표·단계별 JSON 실행 리포트.
+
+run_summary.log 한 줄(시작/종료/건수/총 소요)만으로는 느린 실행의 원인이 네트워크인지,
+파일 I/O·파싱·삽입·이관·cleanup 인지 알 수 없어, 각 단계를 span 으로 감싸
+소요 시간과 bytes/rows/retries 카운터를 통계표(table)·단계(stage)별로 집계한다.
+
+    run_report.start_run(ext_sys='KOSIS', mode='db')
+    with run_report.table_scope(stat_tbl_id):          # 현재 컨텍스트의 통계표
+        with run_report.span('http.kosis.data') as sp:
+            ...
+            sp.add(bytes=len(body))
+    path = run_report.finish_run()                     # logs/run_report/<시작시각>_<ext_sys>.json
+
+실행이 시작되지 않았으면(start_run 전, 테스트·스크립트 단독 호출) span 은 아무것도
+기록하지 않는 no-op 이다. 통계표는 table 인자가 없으면 table_scope 로 지정한 컨텍스트별
+값을 쓴다(ThreadPoolExecutor 워커마다 독립, in_context 로 감싼 하위 스레드는 물려받음).
+중첩 span 은 각각 따로 집계되므로 통계표 합계는 상위 span(예: file / db.total)을 기준으로 본다.
+
+활성 리포트는 contextvar 로 잡는다(스케줄러 데몬에서 ext_sys 실행이 겹쳐도 분리). 워커
+스레드에 넘길 함수는 in_context(fn) 로 감싸 현재 실행 컨텍스트를 물려준다. 물려받지 않은
+스레드에서는 실행 전과 같이 span 이 no-op 이다(다른 실행의 리포트에 섞여 들어가지 않도록).
+"""
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+REPORT_DIR = os.path.join('logs', 'run_report')
+RUN_LEVEL_TABLE = '_run'
+
+_context_run = contextvars.ContextVar('run_report_active', default=None)
+_context_table = contextvars.ContextVar('run_report_table', default=None)
+_listeners = []
+
+
+def _new_bucket() -> dict:
+    return {'count': 0, 'total_sec': 0.0, 'max_sec': 0.0}
+
+
+def _accumulate(bucket: dict, seconds: Optional[float], counters: dict) -> None:
+    bucket['count'] += 1
+    if seconds is not None:
+        bucket['total_sec'] += seconds
+        if seconds > bucket['max_sec']:
+            bucket['max_sec'] = seconds
+    for key, value in counters.items():
+        if value:
+            bucket[key] = bucket.get(key, 0) + value
+
+
+class RunReport:
+    """단계별 / 통계표x단계별 누적 (thread-safe)."""
+
+    def __init__(self, **meta):
+        self.meta = dict(meta)
+        self.started_at = datetime.now()
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._tables = {}
+
+    def record(self, stage: str, seconds: Optional[float] = None, table=None, **counters) -> None:
+        table = str(table) if table is not None else RUN_LEVEL_TABLE
+        with self._lock:
+            _accumulate(self._stages.setdefault(stage, _new_bucket()), seconds, counters)
+            per_table = self._tables.setdefault(table, {})
+            _accumulate(per_table.setdefault(stage, _new_bucket()), seconds, counters)
+        for listener in _listeners:
+            try:
+                listener(stage, seconds, table, counters)
+            except Exception as e:  # 계측 실패가 적재를 막지 않도록
+                logger.warning('run_report listener 실패(%s): %s', stage, e)
+
+    @staticmethod
+    def _rounded(buckets: dict) -> dict:
+        out = {}
+        for stage, bucket in sorted(buckets.items()):
+            item = dict(bucket)
+            item['total_sec'] = round(item['total_sec'], 4)
+            item['max_sec'] = round(item['max_sec'], 4)
+            out[stage] = item
+        return out
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                'run': dict(self.meta, started_at=self.started_at.isoformat(timespec='seconds'),
+                            finished_at=datetime.now().isoformat(timespec='seconds')),
+                'stages': self._rounded(self._stages),
+                'tables': {table: self._rounded(stages) for table, stages in sorted(self._tables.items())},
+            }
+
+    def write(self, report_dir: str = REPORT_DIR) -> str:
+        os.makedirs(report_dir, exist_ok=True)
+        suffix = self.meta.get('ext_sys') or 'run'
+        path = os.path.join(report_dir, f"{self.started_at.strftime('%Y%m%d_%H%M%S')}_{suffix}.json")
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+        return path
+
+
+class _Span:
+    __slots__ = ('stage', 'table', 'counters')
+
+    def __init__(self, stage, table, counters):
+        self.stage = stage
+        self.table = table
+        self.counters = counters
+
+    def add(self, **counters) -> None:
+        for key, value in counters.items():
+            self.counters[key] = self.counters.get(key, 0) + (value or 0)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def add(self, **counters) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+# --- 실행 수명주기 --------------------------------------------------------------
+def add_listener(listener) -> None:
+    """기록마다 listener(stage, seconds, table, counters) 호출 (예: metrics.on_span)."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def start_run(**meta) -> RunReport:
+    """새 실행 리포트를 현재 컨텍스트에 활성화한다."""
+    report = RunReport(**meta)
+    _context_run.set(report)
+    return report
+
+
+def current() -> Optional[RunReport]:
+    return _context_run.get()
+
+
+def update_meta(**meta) -> None:
+    report = current()
+    if report is not None:
+        report.meta.update(meta)
+
+
+def finish_run(report_dir: str = REPORT_DIR) -> Optional[str]:
+    """활성 리포트를 JSON 으로 기록하고 비활성화한다. 반환: 파일 경로 (없으면 None)."""
+    report = current()
+    if report is None:
+        return None
+    _context_run.set(None)
+    return report.write(report_dir)
+
+
+def in_context(fn):
+    """현재 contextvars(실행 리포트·메트릭)를 물려받아 fn 을 실행하는 래퍼 (executor.submit 용)."""
+    ctx = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        # 같은 Context 는 동시에 두 스레드에서 enter 할 수 없으므로 호출마다 복사본 사용
+        return ctx.copy().run(fn, *args, **kwargs)
+    return run
+
+
+# --- 계측 API -----------------------------------------------------------------
+def current_table():
+    return _context_table.get()
+
+
+@contextmanager
+def table_scope(table):
+    """with 블록 동안 현재 컨텍스트의 span 기본 통계표를 table 로 둔다."""
+    token = _context_table.set(table)
+    try:
+        yield
+    finally:
+        _context_table.reset(token)
+
+
+@contextmanager
+def span(stage: str, table=None, **counters):
+    """stage 소요 시간 + 카운터(bytes/rows/retries 등)를 기록. 예외 시 errors=1 도 함께 기록."""
+    report = current()
+    if report is None:
+        yield _NULL_SPAN
+        return
+    sp = _Span(stage, table if table is not None else current_table(), dict(counters))
+    started = time.perf_counter()
+    try:
+        yield sp
+    except BaseException:
+        sp.add(errors=1)
+        raise
+    finally:
+        report.record(sp.stage, time.perf_counter() - started, sp.table, **sp.counters)
+
+
+def record(stage: str, seconds: Optional[float] = None, table=None, **counters) -> None:
+    """span 없이 값만 기록 (예: 다른 프로세스에서 잰 시간, 재시도 횟수)."""
+    report = current()
+    if report is None:
+        return
+    report.record(stage, seconds, table if table is not None else current_table(), **counters)
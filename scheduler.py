@@ -0,0 +1,279 @@
+"""스케줄러 데몬 — ext_sys 별 cron 일정으로 배치를 같은 프로세스 안에서 반복 실행.
+
+cron + scripts/run_collect.sh 는 트리거마다 인터프리터 기동·import·DB 접속을 새로 하고,
+flock 때문에 한 번에 ext_sys 하나만 돈다. 데몬은 프로세스를 유지해 import 와 DB 커넥션
+풀(db.get_engine)을 재사용하고, main.run_batch() 를 그대로 호출하므로 실행 요약·리포트·
+메트릭·매니페스트 동작은 단발 실행과 같다.
+
+    python scheduler.py                        # SCHEDULES 환경변수 일정으로 상주
+    python scheduler.py --list                 # 일정별 다음 실행 시각만 출력
+    SCHEDULES="KOSIS=0 3 3,18 * *; GBIS=0 4 * * 1; TOUR_BF_API:file=30 4 * * *"
+
+- 일정 형식: ``<EXT_SYS>[:<mode>]=<cron 5필드>`` 를 ``;`` 로 구분 (mode 기본 db, file/db 만 허용)
+- cron: 분 시 일 월 요일(0/7=일). ``*`` ``*/n`` ``a-b`` ``a-b/n`` ``a,b`` 지원. 일·요일이 모두
+  지정되면 둘 중 하나만 맞아도 실행(표준 cron 과 동일)
+- 같은 ext_sys 는 겹쳐 돌지 않는다(이전 실행이 끝나지 않았으면 이번 트리거는 건너뜀).
+  서로 다른 ext_sys(KOSIS 와 이동편의 등)는 별도 스레드에서 동시에 돈다 — 실행 리포트·메트릭은
+  contextvar 로 실행마다 분리된다
+- run_collect.sh 와 같은 잠금 파일(.run_collect.lock)을 잡으므로 데몬이 떠 있는 동안 cron
+  트리거는 자동으로 건너뛴다
+- SIGTERM/SIGINT: 새 실행을 멈추고 진행 중인 실행이 끝나기를 기다린 뒤 종료
+"""
+from __future__ import annotations
+
+import argparse
+import fcntl
+import logging
+import os
+import signal
+import sys
+import threading
+from datetime import datetime, timedelta
+
+from config import get_schedules
+
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+LOCK_FILE = os.path.join(ROOT, '.run_collect.lock')
+SCHEDULE_MODES = ('file', 'db')
+
+_FIELD_RANGES = (
+    ('minute', 0, 59),
+    ('hour', 0, 23),
+    ('day', 1, 31),
+    ('month', 1, 12),
+    ('weekday', 0, 7),
+)
+
+
+def _parse_field(expr: str, low: int, high: int) -> frozenset:
+    values = set()
+    for part in expr.split(','):
+        step = 1
+        if '/' in part:
+            part, step_str = part.split('/', 1)
+            step = int(step_str)
+            if step < 1:
+                raise ValueError(f'cron step 은 1 이상이어야 합니다: {expr!r}')
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start, end = (int(v) for v in part.split('-', 1))
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if not (low <= start <= end <= high):
+            raise ValueError(f'cron 값 범위({low}-{high}) 밖: {expr!r}')
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """5필드 cron 식 (분 시 일 월 요일)."""
+
+    def __init__(self, expr: str):
+        fields = expr.split()
+        if len(fields) != 5:
+            raise ValueError(f'cron 식은 5필드여야 합니다: {expr!r}')
+        self.expr = expr
+        parsed = [_parse_field(f, low, high) for f, (_, low, high) in zip(fields, _FIELD_RANGES)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # cron 요일(0/7=일) -> datetime.weekday()(0=월)
+        self.weekdays = frozenset((d - 1) % 7 for d in weekdays)
+        self.day_any = fields[2] == '*'
+        self.weekday_any = fields[4] == '*'
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day_ok = dt.day in self.days
+        weekday_ok = dt.weekday() in self.weekdays
+        if self.day_any or self.weekday_any:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def matches(self, dt: datetime) -> bool:
+        return (dt.minute in self.minutes and dt.hour in self.hours
+                and dt.month in self.months and self._day_matches(dt))
+
+    def next_after(self, dt: datetime) -> datetime:
+        """dt 이후(초과) 첫 실행 시각 (분 단위)."""
+        t = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + timedelta(days=366 * 5)   # 2월 29일 같은 드문 일정 포함
+        while t < limit:
+            if t.month not in self.months:
+                t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        raise ValueError(f'cron 식이 실행 시각을 만들지 않습니다: {self.expr!r}')
+
+
+class ScheduledJob:
+    def __init__(self, ext_sys: str, mode: str, cron: CronSchedule):
+        self.ext_sys = ext_sys
+        self.mode = mode
+        self.cron = cron
+        self.next_run = None
+
+    def __repr__(self):
+        return f'ScheduledJob({self.ext_sys}:{self.mode}={self.cron.expr!r})'
+
+
+def parse_schedules(raw: str) -> list:
+    """'KOSIS=0 3 3,18 * *; GBIS:file=0 4 * * 1' -> [ScheduledJob, ...]."""
+    jobs = []
+    for item in (raw or '').replace('\n', ';').split(';'):
+        item = item.strip()
+        if not item or item.startswith('#'):
+            continue
+        target, sep, expr = item.partition('=')
+        if not sep:
+            raise ValueError(f'일정 형식은 <EXT_SYS>[:<mode>]=<cron> 입니다: {item!r}')
+        ext_sys, _, mode = target.strip().partition(':')
+        mode = (mode or 'db').strip().lower()
+        if mode not in SCHEDULE_MODES:
+            raise ValueError(f'일정 mode 는 {SCHEDULE_MODES} 중 하나여야 합니다: {item!r}')
+        jobs.append(ScheduledJob(ext_sys.strip().upper(), mode, CronSchedule(expr.strip())))
+    return jobs
+
+
+class Scheduler:
+    """일정별 다음 실행 시각까지 대기 -> 도래한 일정을 ext_sys 별 스레드에서 run_fn(args) 로 실행."""
+
+    def __init__(self, jobs, run_fn, clock=datetime.now, on_wake=None):
+        self.jobs = list(jobs)
+        self.run_fn = run_fn
+        self.clock = clock
+        self.on_wake = on_wake
+        self.stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._running = {}     # ext_sys -> Thread
+        self.skipped = 0
+
+    def plan(self, now: datetime) -> None:
+        for job in self.jobs:
+            job.next_run = job.cron.next_after(now)
+
+    def launch(self, job: ScheduledJob) -> bool:
+        """job 을 새 스레드로 시작. 같은 ext_sys 가 실행 중이면 False (이번 트리거 건너뜀)."""
+        with self._lock:
+            running = self._running.get(job.ext_sys)
+            if running is not None and running.is_alive():
+                self.skipped += 1
+                logger.warning('scheduler: %s 이전 실행이 진행 중 — 이번 트리거 건너뜀', job.ext_sys)
+                return False
+            thread = threading.Thread(target=self._run_job, args=(job,), name=f'job-{job.ext_sys}')
+            self._running[job.ext_sys] = thread
+            thread.start()
+            return True
+
+    def _run_job(self, job: ScheduledJob) -> None:
+        args = argparse.Namespace(mode=job.mode, ext_sys=job.ext_sys, resume=False, from_dir=None, profile=False)
+        logger.info('scheduler: %s 실행 시작 (mode=%s)', job.ext_sys, job.mode)
+        try:
+            exit_code, summary = self.run_fn(args)
+            logger.info('scheduler: %s 실행 종료 exit=%s status=%s', job.ext_sys, exit_code, summary.get('status'))
+        except BaseException as e:  # 한 실행의 실패가 데몬을 죽이지 않도록
+            logger.error('scheduler: %s 실행 중 예외: %s', job.ext_sys, e, exc_info=True)
+
+    def run_pending(self, now: datetime) -> int:
+        """now 까지 도래한 일정을 실행하고 다음 실행 시각을 갱신. 반환: 시작한 실행 수."""
+        started = 0
+        for job in self.jobs:
+            if job.next_run is not None and job.next_run <= now:
+                if self.on_wake is not None:
+                    self.on_wake()
+                started += self.launch(job)
+                job.next_run = job.cron.next_after(now)
+        return started
+
+    def run_forever(self) -> None:
+        self.plan(self.clock())
+        for job in self.jobs:
+            logger.info('scheduler: %s:%s "%s" 다음 실행 %s', job.ext_sys, job.mode, job.cron.expr, job.next_run)
+        while not self.stop_event.is_set():
+            now = self.clock()
+            self.run_pending(now)
+            next_run = min(job.next_run for job in self.jobs)
+            # 시계 조정·절전 복귀에 대비해 최대 60초마다 다시 확인
+            wait_sec = max(0.0, min((next_run - self.clock()).total_seconds(), 60.0))
+            self.stop_event.wait(wait_sec)
+        self.join()
+
+    def stop(self, *_):
+        logger.info('scheduler: 종료 요청 — 진행 중인 실행이 끝나면 종료합니다')
+        self.stop_event.set()
+
+    def join(self) -> None:
+        with self._lock:
+            threads = list(self._running.values())
+        for thread in threads:
+            thread.join()
+
+
+def _acquire_lock():
+    handle = open(LOCK_FILE, 'w')
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='ext_sys 별 cron 일정 배치 스케줄러 데몬')
+    parser.add_argument('--schedules', default=None,
+                        help='일정 목록 (미지정 시 SCHEDULES 환경변수). 예: "KOSIS=0 3 3,18 * *; GBIS=0 4 * * 1"')
+    parser.add_argument('--list', action='store_true', help='일정별 다음 실행 시각만 출력하고 종료')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    jobs = parse_schedules(args.schedules if args.schedules is not None else get_schedules())
+    if not jobs:
+        print('[ERROR] 실행할 일정이 없습니다. SCHEDULES 환경변수 또는 --schedules 를 설정하세요.')
+        sys.exit(1)
+    if args.list:
+        now = datetime.now()
+        for job in jobs:
+            print(f'{job.ext_sys:<12} {job.mode:<4} {job.cron.expr:<20} next={job.cron.next_after(now)}')
+        return
+
+    import main as batch
+
+    lock = _acquire_lock()
+    if lock is None:
+        print('[ERROR] 다른 배치/스케줄러가 실행 중입니다 (.run_collect.lock).')
+        sys.exit(1)
+
+    batch.setup_logging()
+    log_day = [datetime.now().date()]
+
+    def reopen_daily_logs():
+        # 날짜별 로그 파일(logs/<YYYYMMDD>.log)을 실행 시점 날짜로 맞춘다
+        today = datetime.now().date()
+        if today != log_day[0]:
+            log_day[0] = today
+            batch.setup_logging()
+
+    scheduler = Scheduler(jobs, batch.run_batch, on_wake=reopen_daily_logs)
+    signal.signal(signal.SIGTERM, scheduler.stop)
+    signal.signal(signal.SIGINT, scheduler.stop)
+    logger.info('scheduler 시작: pid=%s, 일정 %d건', os.getpid(), len(jobs))
+    try:
+        scheduler.run_forever()
+    finally:
+        logger.info('scheduler 종료 (건너뛴 트리거 %d건)', scheduler.skipped)
+        batch.shutdown_queue_logging()
+        lock.close()
+
+
+if __name__ == '__main__':
+    main()
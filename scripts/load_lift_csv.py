@@ -20,6 +20,7 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 import db_mobility  # noqa: E402
+import profiling  # noqa: E402
 
 HEADER_MAP = {
     '철도운영기관명': 'oper_org',
@@ -58,16 +59,25 @@ def main():
     parser = argparse.ArgumentParser(description='국가철도공단 휠체어리프트 CSV 적재')
     parser.add_argument('--csv', action='append', required=True, help='CSV 파일 경로(복수 지정 가능)')
     parser.add_argument('--base-dt', default=datetime.date.today().isoformat(), help='데이터 기준일')
+    parser.add_argument('--profile', action='store_true',
+                        help='cProfile/tracemalloc 결과를 logs/profile/<시각>_load_lift_csv/ 에 기록')
     args = parser.parse_args()
 
-    total = 0
-    for path in args.csv:
-        rows = read_rows(path, args.base_dt)
-        count = db_mobility.upsert_wheelchair_lifts(rows)
-        print(f'{path}: {count}행 적재')
-        total += count
-    db_mobility.touch_latest_sync('KRNA_LIFT')
-    print(f'완료 — 총 {total}행')
+    if args.profile:
+        profiling.start('load_lift_csv')
+    try:
+        total = 0
+        with profiling.stage('load'):
+            for path in args.csv:
+                with profiling.table(os.path.basename(path)):
+                    rows = read_rows(path, args.base_dt)
+                    count = db_mobility.upsert_wheelchair_lifts(rows)
+                print(f'{path}: {count}행 적재')
+                total += count
+        db_mobility.touch_latest_sync('KRNA_LIFT')
+        print(f'완료 — 총 {total}행')
+    finally:
+        profiling.finish()
 
 
 if __name__ == '__main__':
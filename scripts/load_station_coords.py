@@ -26,6 +26,7 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 import db_mobility  # noqa: E402
+import profiling  # noqa: E402
 from collectors.korail_conv import load_station_coords, norm_station_name  # noqa: E402
 
 
@@ -35,8 +36,20 @@ def main():
                         help='역위치 CSV 경로(복수 지정 가능)')
     parser.add_argument('--dry-run', action='store_true',
                         help='DB 갱신 없이 매칭 결과만 출력')
+    parser.add_argument('--profile', action='store_true',
+                        help='cProfile/tracemalloc 결과를 logs/profile/<시각>_load_station_coords/ 에 기록')
     args = parser.parse_args()
 
+    if args.profile:
+        profiling.start('load_station_coords')
+    try:
+        with profiling.stage('update'):
+            run(args)
+    finally:
+        profiling.finish()
+
+
+def run(args):
     coords = load_station_coords(args.csv)
     if not coords:
         print('CSV 에서 좌표를 읽지 못했습니다 — 경로·헤더(역명/위도/경도) 확인')
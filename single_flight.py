@@ -0,0 +1,109 @@
+"""같은 요청 합치기(single-flight) + 실행 동안의 최근 결과 LRU.
+
+sys_stats_src_api_info 의 여러 행이 같은 통계표(stat_tbl_id·기관)의 meta/latest URL 로
+풀리면 save_single_file 스레드마다 같은 요청을 따로 보낸다. 키가 같은 호출이 동시에
+들어오면 먼저 온 호출 1건만 실제로 실행하고 나머지는 그 결과(예외 포함)를 함께 받는다.
+성공한 결과는 실행 동안 작은 LRU 에 남겨 뒤이어 오는 같은 요청도 다시 보내지 않는다.
+
+    single_flight.reset()                                   # 실행 시작 (main.run_source)
+    value, shared = single_flight.do(key, lambda: get(url))
+    single_flight.finish()                                  # 실행 종료 — 결과 버림, 건수 로그
+
+저장소는 reset() 을 부른 실행 컨텍스트에만 있고(run_report 참고) 워커 스레드는 in_context 로
+물려받는다. 그 밖(reset() 전·테스트·스크립트 단독 호출)에서는 합치지 않고 fn 을 그대로 호출한다.
+공유된 결과는 호출자끼리 같은 객체이므로 읽기 전용으로 다룬다.
+"""
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from config import get_kosis_response_cache_size
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """키별 진행 중 호출 공유 + 성공 결과 LRU (thread-safe)."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = max(0, maxsize)
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._cache = OrderedDict()
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key, fn):
+        """fn() 결과를 반환한다. 반환: (값, shared) — shared 는 다른 호출·LRU 결과를 받았는지."""
+        with self._lock:
+            self.calls += 1
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.shared += 1
+                return self._cache[key], True
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e          # 실패는 캐시하지 않는다 (다음 호출이 다시 시도)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if call.error is None and self.maxsize:
+                    self._cache[key] = call.value
+                    while len(self._cache) > self.maxsize:
+                        self._cache.popitem(last=False)
+            call.done.set()
+        return call.value, False
+
+
+_context_flight = contextvars.ContextVar('single_flight', default=None)
+
+
+def reset(maxsize: Optional[int] = None) -> SingleFlight:
+    """새 실행 시작 — 빈 저장소를 현재 컨텍스트에 둔다."""
+    flight = SingleFlight(get_kosis_response_cache_size() if maxsize is None else maxsize)
+    _context_flight.set(flight)
+    return flight
+
+
+def do(key, fn):
+    """현재 실행의 SingleFlight 로 fn 호출. 실행이 시작되지 않았으면 fn() 그대로 (shared=False)."""
+    flight = _context_flight.get()
+    if flight is None:
+        return fn(), False
+    return flight.do(key, fn)
+
+
+def finish() -> Optional[SingleFlight]:
+    """현재 실행의 저장소를 비활성화(결과 버림)하고 재사용 건수를 로그로 남긴다."""
+    flight = _context_flight.get()
+    _context_flight.set(None)
+    if flight is not None and flight.shared:
+        logger.info('같은 요청 합치기: %d건 중 %d건 재사용', flight.calls, flight.shared)
+    return flight
@@ -0,0 +1,220 @@
+"""통계표별 실행 이력 — 이전 실행의 소요 시간·크기로 긴 작업 먼저(LPT) 순서와 워커 수를 정한다.
+
+save_all_files / process_db_insertion 이 stat_api_id 순서로 제출하면 마지막에 잡힌 대형
+통계표 하나가 혼자 도는 동안 나머지 워커는 논다. 실행이 끝나면 run_report JSON 의 통계표별
+file.total / db.total 시간을 ``logs/table_history/<EXT_SYS>.json`` 에 지수평활(EWMA)로 누적하고,
+다음 실행은 이 값으로 예상 시간이 긴 순서대로 제출한다.
+
+    history = table_history.load(ext_sys)
+    ordered, estimates = history.order_longest_first(items, 'file', table_of, fallback=period_cost)
+    workers = table_history.pool_size(estimates, get_parallel_workers_file(ext_sys))
+    ...
+    table_history.record_run(ext_sys, report_path)          # run_source 종료 시
+
+실행 마감(deadline)으로 미룬 통계표는 ``deferred`` 횟수로 남아, 다음 실행에서 예상 시간과
+관계없이 먼저 제출된다(미룬 횟수가 많은 순). 한 번 끝까지 처리되면 지운다.
+
+이력이 없는 통계표는 fallback 값(수집 단계: 수집 기간 x 연간 주기 수, 적재 단계: 데이터 파일
+크기)을 이력이 있는 통계표들의 "초/fallback 단위" 비율 중앙값으로 환산해 쓴다. 환산할 이력이
+하나도 없으면 fallback 값 그대로(단위만 다를 뿐 같은 실행 안에서는 비교 가능) 정렬한다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import statistics
+import threading
+from datetime import datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+HISTORY_DIR = os.path.join('logs', 'table_history')
+EWMA_ALPHA = 0.5          # 최근 실행 가중치
+
+# 이력 키 -> run_report 통계표 합계 단계
+STAGES = {
+    'file': 'file.total',
+    'db': 'db.total',
+}
+# 실행 마감으로 미룬 통계표 기록 단계 (deadline.defer)
+DEFERRED_STAGE = 'deadline.deferred'
+# 크기 이력 (참고용): run_report 단계 -> (카운터, 이력 키)
+SIZE_COUNTERS = (
+    ('file.save_data', 'bytes', 'bytes'),
+    ('fetch.data', 'rows', 'rows'),
+)
+
+# stats_src_data_info.periodicity -> 연간 시점 수 (수집 단계 fallback)
+_PERIODS_PER_YEAR = (
+    (('월', 'M'), 12),
+    (('분기', 'Q'), 4),
+    (('반기', 'H'), 2),
+)
+
+_save_lock = threading.Lock()
+
+
+def periods_per_year(periodicity) -> int:
+    """수록 주기(월/분기/반기/년, M/Q/H/Y) -> 연간 시점 수. 모르면 1(년)."""
+    periodicity = str(periodicity or '').upper()
+    return next((n for keys, n in _PERIODS_PER_YEAR if any(k in periodicity for k in keys)), 1)
+
+
+def period_cost(data_info: dict) -> float:
+    """수집 기간 길이 기반 크기 추정 (연수 x 연간 시점 수). 기간을 모르면 1."""
+    try:
+        years = int(str(data_info.get('collect_end_dt'))[:4]) - int(str(data_info.get('collect_start_dt'))[:4]) + 1
+    except (TypeError, ValueError):
+        return 1.0
+    return float(max(years, 1) * periods_per_year(data_info.get('periodicity')))
+
+
+def file_size_cost(path) -> float:
+    """파일 크기(bytes) 기반 크기 추정. 파일이 없으면 0."""
+    try:
+        return float(os.path.getsize(path))
+    except (OSError, TypeError):
+        return 0.0
+
+
+class TableHistory:
+    """ext_sys 1개의 통계표별 {file_sec, db_sec, bytes, rows, runs, updated} 이력."""
+
+    def __init__(self, ext_sys: str, path: str, tables: Optional[dict] = None):
+        self.ext_sys = ext_sys
+        self.path = path
+        self.tables = tables or {}
+
+    def seconds(self, table, stage: str) -> Optional[float]:
+        entry = self.tables.get(str(table))
+        return entry.get(f'{stage}_sec') if entry else None
+
+    def deferred(self, table) -> int:
+        """직전 실행들에서 마감으로 연속해 미룬 횟수."""
+        entry = self.tables.get(str(table))
+        return entry.get('deferred', 0) if entry else 0
+
+    def update_from_report(self, report: dict) -> int:
+        """run_report to_dict() 결과를 누적. 반환: 갱신한 통계표 수 (오류 난 단계는 제외)."""
+        updated = 0
+        now = datetime.now().isoformat(timespec='seconds')
+        for table, stages in (report.get('tables') or {}).items():
+            changed = False
+            entry = self.tables.get(table, {})
+            deferred = bool(stages.get(DEFERRED_STAGE))
+            if deferred:
+                entry['deferred'] = entry.get('deferred', 0) + 1
+                changed = True
+            for key, stage in STAGES.items():
+                bucket = stages.get(stage)
+                if not bucket or not bucket.get('count') or bucket.get('errors'):
+                    continue
+                value = bucket['total_sec']
+                previous = entry.get(f'{key}_sec')
+                entry[f'{key}_sec'] = round(value if previous is None
+                                            else EWMA_ALPHA * value + (1 - EWMA_ALPHA) * previous, 4)
+                changed = True
+            if not changed:
+                continue
+            if not deferred:
+                entry.pop('deferred', None)
+            for stage, counter, key in SIZE_COUNTERS:
+                value = (stages.get(stage) or {}).get(counter)
+                if value:
+                    entry[key] = value
+            entry['runs'] = entry.get('runs', 0) + 1
+            entry['updated'] = now
+            self.tables[table] = entry
+            updated += 1
+        return updated
+
+    def save(self) -> str:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with _save_lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.tables, f, ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        return self.path
+
+    def estimate(self, items, stage: str, table_of, fallback) -> dict:
+        """{table: 예상 초} — 이력 우선, 없으면 fallback(item) 을 이력 비율로 환산."""
+        known, unknown, ratios = {}, {}, []
+        for item in items:
+            table = str(table_of(item))
+            seconds = self.seconds(table, stage)
+            cost = fallback(item) if fallback is not None else 0.0
+            if seconds is not None:
+                known[table] = seconds
+                if cost > 0:
+                    ratios.append(seconds / cost)
+            else:
+                unknown[table] = cost
+        ratio = statistics.median(ratios) if ratios else None
+        if unknown and known and ratio is None:
+            # 환산 기준이 없으면 신규 통계표는 이력 평균으로 (순서상 중간)
+            mean = sum(known.values()) / len(known)
+            unknown = {table: mean for table in unknown}
+        elif ratio is not None:
+            unknown = {table: cost * ratio for table, cost in unknown.items()}
+        return {**unknown, **known}
+
+    def order_longest_first(self, items, stage: str, table_of, fallback=None):
+        """items 를 예상 소요 시간 내림차순으로 (동률은 원래 순서). 반환: (정렬된 items, estimates).
+
+        직전 실행에서 마감으로 미룬 통계표는 예상 시간과 관계없이 앞으로 (미룬 횟수 내림차순).
+        """
+        items = list(items)
+        estimates = self.estimate(items, stage, table_of, fallback)
+        ordered = sorted(items, key=lambda item: (-self.deferred(table_of(item)),
+                                                  -estimates.get(str(table_of(item)), 0.0)))
+        if ordered and estimates:
+            head = ', '.join(f'{table_of(i)}={estimates.get(str(table_of(i)), 0):.1f}' for i in ordered[:3])
+            logger.info('%s %s 단계 LPT 순서: %d건, 상위 %s (이력 %d건)', self.ext_sys, stage, len(ordered), head,
+                        sum(1 for i in items if self.seconds(table_of(i), stage) is not None))
+        return ordered, estimates
+
+
+def pool_size(estimates: dict, max_workers: int) -> int:
+    """워커 수 = min(max_workers, 작업 수, ceil(총 예상 / 최장 예상) + 1).
+
+    가장 긴 작업 하나가 makespan 의 하한이므로 그 시간 안에 나머지를 소화할 만큼(+1 여유)만
+    워커를 두고, 그 이상은 API·DB 커넥션만 점유하므로 쓰지 않는다.
+    """
+    values = [v for v in estimates.values() if v > 0]
+    if not values:
+        return max(1, min(max_workers, len(estimates) or 1))
+    needed = math.ceil(sum(values) / max(values)) + 1
+    return max(1, min(max_workers, len(estimates), needed))
+
+
+def history_path(ext_sys: str, history_dir: str = HISTORY_DIR) -> str:
+    return os.path.join(history_dir, f'{(ext_sys or "run").upper()}.json')
+
+
+def load(ext_sys: str, history_dir: str = HISTORY_DIR) -> TableHistory:
+    """이력 파일을 읽는다 (없거나 깨졌으면 빈 이력)."""
+    path = history_path(ext_sys, history_dir)
+    tables = {}
+    if os.path.exists(path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                tables = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning('table history 읽기 실패(%s): %s — 빈 이력으로 시작', path, e)
+    return TableHistory(ext_sys, path, tables)
+
+
+def record_run(ext_sys: str, report_path: Optional[str], history_dir: str = HISTORY_DIR) -> Optional[str]:
+    """실행 리포트(JSON) 의 통계표별 시간을 이력에 누적. 반환: 이력 파일 경로 (갱신 없으면 None)."""
+    if not report_path:
+        return None
+    with open(report_path, encoding='utf-8') as f:
+        report = json.load(f)
+    history = load(ext_sys, history_dir)
+    if not history.update_from_report(report):
+        return None
+    return history.save()
@@ -0,0 +1,123 @@
+"""
+Unit tests for benchmarks (합성 KOSIS 페이로드 + 단계별 측정)
+
+- 합성 페이로드가 db_processing 파서/매퍼와 호환되는지
+- DB 없이 비DB 단계 측정 결과 형태
+- 모의 서버: KOSIS Error 31 분할, data.go.kr 페이징, 장애 주입
+"""
+import json
+import os
+import sys
+import unittest
+from unittest.mock import patch
+import xml.etree.ElementTree as ET
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks import mock_server, run_bench, synthetic  # noqa: E402
+import db_processing as dp  # noqa: E402
+import kosis_api  # noqa: E402
+from collectors.korail_conv import KorailConvCollector  # noqa: E402
+
+
+class SyntheticPayloadTests(unittest.TestCase):
+    def test_exact_cell_count_and_deterministic(self):
+        rows = synthetic.make_data(1234, seed=7)
+        self.assertEqual(len(rows), 1234)
+        self.assertEqual(rows, synthetic.make_data(1234, seed=7))
+
+    def test_payload_maps_through_loader(self):
+        rows = synthetic.make_data(500)
+        mapped, profile = dp._map_origin_data(rows, {'src_data_id': 'S'}, {'stat_tbl_id': 'T'}, '2026-01-15')
+        self.assertEqual(len(mapped), 500)
+        self.assertEqual(profile.avail_cat_cols, ['c1', 'c2'])
+
+        meta_rows = dp._map_metadata_rows(ET.fromstring(synthetic.make_meta_xml(500)), 'S', 'T', '2026-01-15')
+        plan = synthetic.dimension_plan(500)
+        self.assertEqual(len(meta_rows), plan['items'] + plan['c1'] + plan['c2'])
+
+
+class RunBenchTests(unittest.TestCase):
+    def test_run_size_without_db(self):
+        result = run_bench.run_size(1000)
+        stages = [s['stage'] for s in result['stages']]
+        self.assertEqual(stages, ['generate', 'save', 'parse', 'map', 'prepare', 'e2e'])
+        for s in result['stages']:
+            self.assertEqual(s['rows'], 1000)
+            self.assertGreater(s['peak_rss_kb'], 0)
+
+    def test_compare_reports_speedup(self):
+        before = {'results': [{'cells': 10, 'stages': [{'stage': 'map', 'rows_per_sec': 100.0}]}]}
+        after = {'results': [{'cells': 10, 'stages': [{'stage': 'map', 'rows_per_sec': 150.0}]}]}
+        self.assertEqual(run_bench.compare(after, before)[0]['speedup'], 1.5)
+
+
+class MockServerTests(unittest.TestCase):
+    def _start(self, **config):
+        server, base_url = mock_server.start_server(config)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server, base_url
+
+    def test_kosis_error31_split_through_real_http(self):
+        server, base_url = self._start(kosis_max_years=3, kosis_cells_per_year=10)
+        api_info = {'ext_url': base_url, 'auth': 'mock'}
+        stats_src = {
+            'use_base_url_yn': 'Y',
+            'api_data_url': json.dumps({
+                'url': '/openapi/Param/statisticsParameterData.do?method=getList&apiKey={API_AUTH_KEY}'
+                       '&tblId=DT_X&startPrdDe={from}&endPrdDe={to}',
+                'format': 'json',
+            }),
+        }
+        data_info = {'collect_start_dt': '2016', 'collect_end_dt': '2025'}
+        rows = kosis_api.fetch_kosis_data(api_info, stats_src, data_info)
+        self.assertEqual(len(rows), 100)
+        self.assertEqual(sorted({r['PRD_DE'] for r in rows}), [str(y) for y in range(2016, 2026)])
+        self.assertGreater(server.state.stats['kosis.getList:200'], 1)
+
+    def test_kosis_meta_planned_split_avoids_error31_probe(self):
+        server, base_url = self._start(kosis_max_years=3, kosis_cells_per_year=10)
+        api_info = {'ext_url': base_url, 'auth': 'mock'}
+        stats_src = {
+            'use_base_url_yn': 'Y',
+            'api_data_url': json.dumps({
+                'url': '/openapi/Param/statisticsParameterData.do?method=getList&apiKey={API_AUTH_KEY}'
+                       '&tblId=DT_X&startPrdDe={from}&endPrdDe={to}',
+                'format': 'json',
+            }),
+            'api_meta_url': json.dumps({
+                'url': '/openapi/statisticsData.do?method=getMeta&type=ITM&apiKey={API_AUTH_KEY}&tblId=DT_X',
+                'format': 'xml',
+            }),
+        }
+        data_info = {'collect_start_dt': '2016', 'collect_end_dt': '2025'}
+        meta = kosis_api.fetch_kosis_meta(api_info, stats_src, data_info)
+        with patch.object(kosis_api, 'get_kosis_cell_limit', return_value=60):
+            rows = kosis_api.fetch_kosis_data(api_info, stats_src, data_info, meta=meta)
+        self.assertEqual(len(rows), 100)
+        # meta 5 items x 4 codes = 20 cells/year, 60-cell limit -> 3-year windows, no failed full-range request
+        self.assertEqual(server.state.stats['kosis.getList:200'], 4)
+
+    def test_korail_paging_and_fault_injection(self):
+        _, base_url = self._start(korail_stations=25)
+        env = {'KORAIL_CONV_BASE_URL': base_url + '/B551457/convenience',
+               'KORAIL_PAGE_SIZE': '10', 'DATA_GO_KR_API_KEY': 'mock', 'KORAIL_LOC_CSV': ''}
+        with patch.dict(os.environ, env), patch.object(KorailConvCollector, 'pause'):
+            rows = KorailConvCollector().collect()
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(sum(1 for r in rows if r['anyang_yn'] == 'Y'), 1)
+
+        _, faulty_url = self._start(rate_429=1.0)
+        env['KORAIL_CONV_BASE_URL'] = faulty_url
+        with patch.dict(os.environ, env), patch.object(KorailConvCollector, 'pause'), \
+                patch('collectors.mobility_base.MobilityCollector.http_get',
+                      lambda self, url, **kw: KorailConvCollector.http_get(self, url, retries=0)):
+            with self.assertRaises(RuntimeError):
+                KorailConvCollector().collect()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Unit tests for circuit_breaker (호스트별 연속 실패 -> 열림/반열림/닫힘, 수집기 즉시 실패)
+"""
+import os
+import contextvars
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import circuit_breaker  # noqa: E402
+from circuit_breaker import CircuitBreaker, CircuitOpenError  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def test_opens_after_consecutive_failures_and_success_resets_count(self):
+        breaker = CircuitBreaker('kosis.kr', failure_threshold=3, reset_sec=60, clock=_Clock())
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()                    # 연속이 끊김
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+        self.assertEqual((breaker.state, breaker.trips), (circuit_breaker.OPEN, 1))
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_half_open_allows_single_probe(self):
+        clock = _Clock()
+        breaker = CircuitBreaker('kosis.kr', failure_threshold=1, reset_sec=60, clock=clock)
+        breaker.record_failure()
+        clock.now = 61
+        breaker.before_call()                       # 시험 호출
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()                   # 시험 중 다른 호출은 즉시 실패
+        breaker.record_failure()                    # 시험 실패 -> 다시 열림
+        self.assertEqual(breaker.state, circuit_breaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        clock.now = 122
+        breaker.before_call()
+        breaker.record_success()
+        self.assertEqual(breaker.state, circuit_breaker.CLOSED)
+        breaker.before_call()
+        self.assertEqual(breaker.trips, 1)
+
+    def test_server_errors_count_but_rate_limits_do_not(self):
+        self.assertTrue(circuit_breaker.is_host_failure(503))
+        self.assertFalse(circuit_breaker.is_host_failure(429))
+        self.assertFalse(circuit_breaker.is_host_failure(404))
+
+
+class RunBreakerTests(unittest.TestCase):
+    def tearDown(self):
+        circuit_breaker.finish()
+
+    def test_disabled_or_outside_a_run_returns_none(self):
+        circuit_breaker.finish()
+        self.assertIsNone(circuit_breaker.for_url('https://kosis.kr/openapi'))
+        circuit_breaker.reset(failure_threshold=0)
+        self.assertIsNone(circuit_breaker.for_url('https://kosis.kr/openapi'))
+
+    def test_breakers_are_not_shared_between_run_contexts(self):
+        circuit_breaker.reset(failure_threshold=1, reset_sec=60)
+        circuit_breaker.for_url('https://kosis.kr/openapi').record_failure('down')
+        other_run = contextvars.Context().run(circuit_breaker.for_url, 'https://kosis.kr/openapi')
+        self.assertIsNone(other_run)
+        self.assertEqual(circuit_breaker.finish(), {'kosis.kr': 1})
+
+    def test_collector_fails_fast_once_host_is_open(self):
+        from collectors.base import BaseCollector
+
+        class _Dummy(BaseCollector):
+            EXT_SYS = 'GBIS'
+
+            def fetch_meta(self, data_info): return {}
+            def fetch_latest(self, data_info): return {}
+            def fetch_data(self, data_info): return {}
+            def is_retryable_error(self, response): return False
+
+        circuit_breaker.reset(failure_threshold=3, reset_sec=60)
+        collector = _Dummy(api_info={}, stats_src={})
+        with patch('collectors.base.requests.get', side_effect=requests.ConnectionError('down')) as get, \
+                patch('collectors.base.time.sleep'):
+            with self.assertRaises(RuntimeError):
+                collector.http_get('https://apis.data.go.kr/a?page=1', retries=2)
+            with self.assertRaises(CircuitOpenError):
+                collector.http_get('https://apis.data.go.kr/a?page=2', retries=2)
+            with self.assertRaises(CircuitOpenError):
+                collector.http_get('https://apis.data.go.kr/b', retries=2)
+        self.assertEqual(get.call_count, 3)
+        self.assertEqual(circuit_breaker.finish(), {'apis.data.go.kr': 1})
+
+    def test_kosis_request_fails_fast_once_host_is_open(self):
+        import kosis_api
+
+        circuit_breaker.reset(failure_threshold=2, reset_sec=60)
+        response = MagicMock(status_code=502, content=b'bad gateway')
+        with patch.object(kosis_api.requests, 'get', return_value=response) as get:
+            for _ in range(4):
+                with self.assertRaises(RuntimeError):
+                    kosis_api._http_get('https://kosis.kr/openapi/meta?apiKey=K', 'meta', 'json')
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(circuit_breaker.finish(), {'kosis.kr': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -91,7 +91,7 @@ if __name__ == "__main__":
 # KosisCollector parity tests
 # -----------------------------------------------------------------------------
 
-from unittest.mock import patch  # noqa: E402
+from unittest.mock import MagicMock, patch  # noqa: E402
 
 from collectors.kosis import KosisCollector  # noqa: E402
 
@@ -158,3 +158,203 @@ class KosisCollectorParityTests(unittest.TestCase):
             legacy_out = legacy.fetch_kosis_data({}, {}, {})
             adapter_out = KosisCollector({}, {}).fetch_data({})
         self.assertEqual(legacy_out, adapter_out)
+
+
+class KosisRequestPlanTests(unittest.TestCase):
+    """Cell-count based period / category planning from the table meta."""
+
+    META_XML = (
+        '<?xml version="1.0" encoding="UTF-8"?><root>'
+        + ''.join(f'<MetaRow><objId>ITEM</objId><itmId>T{i}</itmId></MetaRow>' for i in range(2))
+        + ''.join(f'<MetaRow><objId>A</objId><itmId>A{i}</itmId></MetaRow>' for i in range(50))
+        + ''.join(f'<MetaRow><objId>B</objId><itmId>B{i}</itmId></MetaRow>' for i in range(3))
+        + '</root>'
+    )
+
+    def test_meta_dimensions_xml_and_json(self):
+        import kosis_api
+        dims = kosis_api.meta_dimensions(self.META_XML)
+        self.assertEqual({k: len(v) for k, v in dims.items()}, {'itmId': 2, 'objL1': 50, 'objL2': 3})
+        self.assertEqual(kosis_api.estimate_cells_per_period(dims), 300)
+        json_meta = [{'OBJ_ID': 'ITEM', 'ITM_ID': 'T1'}, {'OBJ_ID': 'A', 'ITM_ID': 'A1'},
+                     {'OBJ_ID': 'A', 'ITM_ID': 'A2'}, {'OBJ_ID': 'A', 'ITM_ID': 'A2'}]
+        self.assertEqual(kosis_api.estimate_cells_per_period(kosis_api.meta_dimensions(json_meta)), 2)
+        self.assertIsNone(kosis_api.meta_dimensions('not xml'))
+
+    def test_monthly_table_is_split_under_limit(self):
+        import kosis_api
+        data_info = {'collect_start_dt': '2000', 'collect_end_dt': '2025', 'periodicity': '월'}
+        # 300 cells x 12 months = 3,600 cells/year -> 11 years per request
+        windows = kosis_api.plan_data_requests(data_info, self.META_XML, cell_limit=40000)
+        self.assertEqual(windows, [(2000, 2010, {}), (2011, 2021, {}), (2022, 2025, {})])
+        self.assertIsNone(kosis_api.plan_data_requests(data_info, None, cell_limit=40000))
+        self.assertIsNone(kosis_api.plan_data_requests(data_info, self.META_XML, cell_limit=0))
+
+    def test_planned_windows_fetched_and_error31_window_resplit(self):
+        import kosis_api
+        data_info = {'collect_start_dt': '2016', 'collect_end_dt': '2021'}
+        calls = []
+
+        def single(api_info, stats_src, info, start, end, params=None):
+            calls.append((start, end))
+            if (start, end) == (2018, 2019):
+                return {'err': '31'}
+            return [{'PRD_DE': str(y)} for y in range(start, end + 1)]
+
+        with patch.object(kosis_api, 'fetch_kosis_data_single', side_effect=single), \
+                patch.object(kosis_api, 'get_kosis_cell_limit', return_value=600):
+            rows = kosis_api.fetch_kosis_data({}, {}, data_info, meta=self.META_XML)
+        self.assertEqual([r['PRD_DE'] for r in rows], [str(y) for y in range(2016, 2022)])
+        self.assertNotIn((2016, 2021), calls)
+        self.assertIn((2018, 2018), calls)
+
+    STATS_SRC = {'api_data_url': json.dumps({
+        'url': '/data.do?method=getList&itmId=ALL&objL1=ALL&objL2=ALL&prdSe=M&startPrdDe={from}&endPrdDe={to}',
+        'format': 'json',
+    })}
+
+    def test_monthly_year_over_limit_is_split_into_quarters(self):
+        import kosis_api
+        data_info = {'collect_start_dt': '2024', 'collect_end_dt': '2025', 'periodicity': '월'}
+        # 300 cells x 12 = 3,600/year > 1,000 -> 3 months per request
+        planned = kosis_api.plan_data_requests(data_info, self.META_XML, self.STATS_SRC, cell_limit=1000)
+        self.assertEqual([(start, end) for start, end, _ in planned[:2]], [('202401', '202403'), ('202404', '202406')])
+        self.assertEqual(len(planned), 8)
+        self.assertTrue(all(params == {} for _, _, params in planned))
+
+    def test_incremental_start_fetches_only_newest_periods(self):
+        import kosis_api
+        data_info = {'collect_start_dt': '202503', 'collect_end_dt': '2026', 'periodicity': 'M'}
+        # one year (3,600 cells) per request; only the first window stops at the year end
+        planned = kosis_api.plan_data_requests(data_info, self.META_XML, self.STATS_SRC, cell_limit=3600)
+        self.assertEqual(planned, [('202503', '202512', {}), (2026, 2026, {})])
+        quarterly = {'collect_start_dt': '2024', 'collect_end_dt': '2024', 'periodicity': '분기'}
+        self.assertEqual(kosis_api.collect_period_range(quarterly), (4, 2024 * 4, 2024 * 4 + 3))
+
+    def test_period_over_limit_is_split_by_largest_category(self):
+        import kosis_api
+        data_info = {'collect_start_dt': '2024', 'collect_end_dt': '2025', 'periodicity': '월'}
+        # 300 cells/month > 100 -> monthly requests, objL1 (50 codes) in chunks of 16 (6 x 16 = 96)
+        planned = kosis_api.plan_data_requests(data_info, self.META_XML, self.STATS_SRC, cell_limit=100)
+        self.assertEqual(len(planned), 24 * 4)
+        self.assertEqual(planned[0][:2], ('202401', '202401'))
+        chunks = [params['objL1'] for start, _, params in planned if start == '202401']
+        self.assertEqual(sum(chunks, []), [f'A{i}' for i in range(50)])
+        self.assertTrue(all(set(params) == {'objL1'} for _, _, params in planned))
+
+    def test_single_year_error31_splits_monthly_periods(self):
+        import kosis_api
+        data_info = {'collect_start_dt': '2025', 'collect_end_dt': '2025', 'periodicity': '월'}
+        calls = []
+
+        def single(api_info, stats_src, info, start, end, params=None):
+            calls.append((start, end))
+            first, last = (kosis_api._to_ordinal(v, 12) for v in (start, end))
+            if isinstance(end, int):
+                last += 11
+            if last - first + 1 > 3:
+                return {'err': '31'}
+            return [{'PRD_DE': kosis_api._period_code(n, 12)} for n in range(first, last + 1)]
+
+        with patch.object(kosis_api, 'fetch_kosis_data_single', side_effect=single):
+            rows = kosis_api.fetch_kosis_data({}, self.STATS_SRC, data_info)
+        self.assertEqual([r['PRD_DE'] for r in rows], [f'2025{m:02d}' for m in range(1, 13)])
+        self.assertEqual(calls[0], (2025, 2025))
+        self.assertIn(('202501', '202503'), calls)
+
+    def test_template_codes_restrict_dimensions(self):
+        import kosis_api
+        stats_src = {'api_data_url': json.dumps({'url': '/d?itmId=T0+&objL1=ALL&startPrdDe={from}'})}
+        dims, splittable = kosis_api.request_dimensions(stats_src, self.META_XML)
+        self.assertEqual(dims['itmId'], ['T0'])
+        self.assertEqual(splittable, ['itmId', 'objL1'])
+
+    def test_build_url_substitutes_category_codes(self):
+        import kosis_api
+        url, _ = kosis_api.build_kosis_url({}, self.STATS_SRC, {}, 'api_data_url', 2024, 2024,
+                                           params={'objL1': ['A1', 'A2']})
+        self.assertIn('&objL1=A1+A2+&', url)
+        self.assertIn('itmId=ALL', url)
+
+    def test_single_year_error31_splits_categories_instead_of_failing(self):
+        import kosis_api
+        data_info = {'collect_start_dt': '2025', 'collect_end_dt': '2025'}
+        calls = []
+
+        def single(api_info, stats_src, info, start, end, params=None):
+            calls.append(params)
+            codes = (params or {}).get('objL1')
+            if codes is None or len(codes) > 13:
+                return {'err': '31'}
+            return [{'C1': code} for code in codes]
+
+        with patch.object(kosis_api, 'fetch_kosis_data_single', side_effect=single):
+            rows = kosis_api.fetch_kosis_data({}, self.STATS_SRC, data_info, meta=self.META_XML)
+        self.assertEqual([r['C1'] for r in rows], [f'A{i}' for i in range(50)])
+        self.assertIsNone(calls[0])
+
+        with patch.object(kosis_api, 'fetch_kosis_data_single', return_value={'err': '31'}), \
+                self.assertRaises(RuntimeError):
+            kosis_api.fetch_kosis_data({}, self.STATS_SRC, data_info)
+
+    def test_collector_passes_fetched_meta_to_data(self):
+        with patch("collectors.kosis.kosis_api.fetch_kosis_meta", return_value=self.META_XML), \
+                patch("collectors.kosis.kosis_api.fetch_kosis_data", return_value=[]) as m:
+            c = KosisCollector({}, {})
+            c.fetch_meta({})
+            c.fetch_data({})
+        m.assert_called_once_with({}, {}, {}, meta=self.META_XML)
+
+
+from collectors.registry import LazyRegistry  # noqa: E402
+
+
+class LazyRegistryTests(unittest.TestCase):
+    """ext_sys -> collector 지연 레지스트리"""
+
+    def test_import_path_resolved_on_first_lookup(self):
+        registry = LazyRegistry({'kosis': 'collectors.kosis:KosisCollector'})
+        self.assertIn('KOSIS', registry)
+        self.assertIn('kosis', registry)
+        self.assertFalse(registry.is_loaded('KOSIS'))
+        self.assertIs(registry['KOSIS'], KosisCollector)
+        self.assertTrue(registry.is_loaded('kosis'))
+
+    def test_unknown_module_fails_only_on_lookup(self):
+        registry = LazyRegistry({'BROKEN': 'collectors.does_not_exist:Nope', 'KOSIS': KosisCollector})
+        self.assertIs(registry.get('KOSIS'), KosisCollector)
+        with self.assertRaises(ImportError):
+            registry['BROKEN']
+        self.assertIsNone(registry.get('MISSING'))
+
+    def test_targets_copy_does_not_import(self):
+        source = LazyRegistry({'X': 'collectors.does_not_exist:Nope'})
+        target = LazyRegistry()
+        target.update(source.targets())
+        self.assertEqual(['X'], list(target))
+        self.assertFalse(target.is_loaded('X'))
+
+    def test_entry_points_registered_without_loading(self):
+        from importlib import metadata
+
+        ep = metadata.EntryPoint(name='my_source', value='collectors.kosis:KosisCollector', group='dabt.collectors')
+        registry = LazyRegistry({'KOSIS': KosisCollector})
+        eps = MagicMock()
+        eps.select.return_value = [ep]
+        with patch('collectors.registry.metadata.entry_points', return_value=eps):
+            self.assertEqual(1, registry.load_entry_points())
+        eps.select.assert_called_once_with(group='dabt.collectors')
+        self.assertFalse(registry.is_loaded('MY_SOURCE'))
+        self.assertIs(registry['MY_SOURCE'], KosisCollector)
+
+    def test_entry_points_legacy_dict_api(self):
+        """Python 3.8/3.9: entry_points() returns {group: [EntryPoint, ...]}."""
+        from importlib import metadata
+
+        ep = metadata.EntryPoint(name='my_source', value='collectors.kosis:KosisCollector', group='dabt.collectors')
+        registry = LazyRegistry()
+        with patch('collectors.registry.metadata.entry_points', return_value={'dabt.collectors': [ep]}):
+            self.assertEqual(1, registry.load_entry_points())
+        with patch('collectors.registry.metadata.entry_points', return_value={}):
+            self.assertEqual(0, LazyRegistry().load_entry_points())
+        self.assertIn('MY_SOURCE', registry)
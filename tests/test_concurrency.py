@@ -0,0 +1,122 @@
+"""
+Unit tests for concurrency (AIMD 워커 한도 조정, 혼잡 신호 전달, 락 대기 판별)
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import concurrency  # noqa: E402
+from concurrency import AimdLimiter  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _run_tasks(limiter, clock, n, seconds=1.0, fail=False):
+    for _ in range(n):
+        try:
+            with limiter.slot():
+                clock.now += seconds
+                if fail:
+                    raise RuntimeError('boom')
+        except RuntimeError:
+            pass
+
+
+class AimdLimiterTests(unittest.TestCase):
+    def test_additive_increase_while_throughput_holds(self):
+        clock = _Clock()
+        limiter = AimdLimiter('t', initial=2, maximum=4, window=4, clock=clock)
+        _run_tasks(limiter, clock, 4)
+        self.assertEqual(3, limiter.limit)
+        _run_tasks(limiter, clock, 4)
+        _run_tasks(limiter, clock, 4)
+        self.assertEqual(4, limiter.limit)          # 상한
+        self.assertEqual([2, 3, 4], limiter.levels)
+
+    def test_congestion_halves_once_per_cooldown(self):
+        clock = _Clock()
+        limiter = AimdLimiter('t', initial=8, maximum=10, clock=clock)
+        limiter.congestion('http 429')
+        limiter.congestion('http 429')              # 같은 혼잡 — 쿨다운 안
+        self.assertEqual(4, limiter.limit)
+        clock.now += concurrency.DECREASE_COOLDOWN_SEC
+        limiter.congestion('timeout')
+        self.assertEqual(2, limiter.limit)
+        self.assertEqual(3, limiter.congestions)
+
+    def test_failures_and_latency_decrease(self):
+        clock = _Clock()
+        limiter = AimdLimiter('t', initial=4, maximum=8, window=4, clock=clock)
+        _run_tasks(limiter, clock, 4, fail=True)
+        self.assertEqual(2, limiter.limit)
+        limiter = AimdLimiter('t', initial=4, maximum=8, window=4, clock=clock)
+        _run_tasks(limiter, clock, 4, seconds=1.0)   # 최저 지연 1s, 한도 5
+        _run_tasks(limiter, clock, 4, seconds=5.0)   # 중앙 지연 5s > 3배
+        self.assertEqual([4, 5, 2], limiter.levels)
+
+    def test_report_congestion_routes_to_current_slot(self):
+        limiter = AimdLimiter('t', initial=4, maximum=4)
+        concurrency.report_congestion('outside')    # slot 밖 — 무시
+        self.assertEqual(0, limiter.congestions)
+        with limiter.slot():
+            concurrency.report_congestion('http 429')
+        self.assertEqual((1, 2), (limiter.congestions, limiter.limit))
+
+    def test_slot_enforces_limit(self):
+        limiter = AimdLimiter('t', initial=2, maximum=2, window=1000)
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def task():
+            with limiter.slot():
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.01)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=task) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(2, peak[0])
+
+    def test_is_lock_wait_follows_cause(self):
+        try:
+            try:
+                raise Exception('ERROR: canceling statement due to lock timeout')
+            except Exception as e:
+                raise RuntimeError('wrapped') from e
+        except RuntimeError as e:
+            self.assertTrue(concurrency.is_lock_wait(e))
+        self.assertFalse(concurrency.is_lock_wait(RuntimeError('syntax error')))
+
+    def test_static_limiter_when_auto_tune_off(self):
+        with patch.object(concurrency, 'get_parallel_auto_tune', return_value=False):
+            limiter = concurrency.limiter('t', initial=3, maximum=10)
+        self.assertEqual((3, 3), (limiter.limit, limiter.workers))
+        with limiter.slot():
+            concurrency.report_congestion('ignored')
+        self.assertEqual(3, limiter.limit)
+        with patch.object(concurrency, 'get_parallel_auto_tune', return_value=True):
+            limiter = concurrency.limiter('t', initial=3, maximum=10)
+        self.assertEqual((3, 10), (limiter.limit, limiter.workers))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -36,6 +36,7 @@ class GetApiInfoKosisPathTests(unittest.TestCase):
         fake_result = MagicMock()
         fake_result.fetchone.return_value = fake_row
         fake_session.execute.return_value = fake_result
+        self.addCleanup(setattr, _db, 'Session', _db.Session)
         _db.Session = MagicMock(return_value=fake_session)
         return _db, fake_session
 
@@ -80,6 +81,7 @@ class GetApiInfoNonKosisPathTests(unittest.TestCase):
         fake_result = MagicMock()
         fake_result.fetchone.return_value = fake_row
         fake_session.execute.return_value = fake_result
+        self.addCleanup(setattr, _db, 'Session', _db.Session)
         _db.Session = MagicMock(return_value=fake_session)
         return _db, fake_session
 
@@ -116,5 +118,46 @@ class GetApiInfoNonKosisPathTests(unittest.TestCase):
         self.assertEqual(out, {})
 
 
+
+class LazyEngineTests(unittest.TestCase):
+    """엔진은 첫 DB 접근 시 1회 생성"""
+
+    def test_engine_created_on_first_access_only(self):
+        import db as _db
+        fake_engine = MagicMock()
+        with patch.object(_db, 'DB_URL', 'postgresql://u:p@localhost/x'), \
+                patch.object(_db, '_engine', None), patch.object(_db, '_sessionmaker', None), \
+                patch.object(_db, 'create_engine', return_value=fake_engine) as create, \
+                patch.object(_db.event, 'listen') as listen:
+            create.assert_not_called()
+            self.assertIs(_db.get_engine(), fake_engine)
+            self.assertIs(_db.get_engine(), fake_engine)
+            self.assertIs(_db.engine, fake_engine)
+            create.assert_called_once()
+            listen.assert_called_once_with(fake_engine, 'connect', _db.set_timezone)
+
+    def test_pool_overflow_covers_shard_connections(self):
+        import db as _db
+        with patch.object(_db, 'get_db_shard_row_threshold', return_value=0):
+            self.assertEqual(_db._pool_max_overflow(), _db.DB_MAX_OVERFLOW)
+        with patch.object(_db, 'get_db_shard_row_threshold', return_value=100000), \
+                patch.object(_db, 'get_db_shard_count', return_value=8):
+            peak = _db.MAX_PARALLEL_WORKERS_DB * (1 + 8)
+            self.assertGreaterEqual(_db.DB_POOL_SIZE + _db._pool_max_overflow(), peak)
+
+    def test_no_db_url(self):
+        import db as _db
+        with patch.object(_db, 'DB_URL', None), patch.object(_db, '_engine', None):
+            self.assertIsNone(_db.get_engine())
+
+    def test_lookup_without_db_url_raises_configuration_error(self):
+        import db as _db
+        with patch.object(_db, 'DB_URL', None), patch.object(_db, '_engine', None):
+            with self.assertRaisesRegex(RuntimeError, 'DB engine not configured'):
+                _db.get_api_info('GBIS')
+            with self.assertRaisesRegex(RuntimeError, 'DB engine not configured'):
+                _db.get_stats_src_data_info('X', ['T1'])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,223 @@
+"""db_processing 단위 테스트 — DB 접속 없이 순수 로직만 검증한다.
+
+- OriginDataProfile: 원본 적재 루프 1회 순회 프로파일 누적
+- prepare_statistic_files: 프로세스 풀용 파싱/행 매핑 + CSV COPY 버퍼
+- prd_de 샤딩 계획 / 통합 이관 SQL 생성
+- 샤딩 적재 게시·스테이징 삭제 (DB_URL 이 있을 때만 실제 PostgreSQL 에서)
+"""
+from __future__ import annotations
+
+import csv
+import json
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from unittest.mock import patch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import db_processing  # noqa: E402
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from db_processing import OriginDataProfile  # noqa: E402
+
+
+class OriginDataProfileTests(unittest.TestCase):
+    ROWS = [
+        {'C1': '11', 'C2': 'A', 'PRD_DE': '2021', 'UNIT_NM': '명', 'DT': '10'},
+        {'C1': '12', 'C2': '', 'PRD_DE': '2023', 'UNIT_NM': '명', 'DT': '-'},
+        {'C1': '13', 'c3': 'x', 'PRD_DE': '2022', 'UNIT_NM': '%', 'DT': '2.5'},
+        {'C1': '14', 'PRD_DE': '2022', 'DT': 'n/a'},
+        'not-a-dict',
+    ]
+
+    def _profile(self, rows):
+        profile = OriginDataProfile()
+        for row in rows:
+            profile.observe(row)
+        return profile
+
+    def test_avail_cat_cols_matches_upper_and_lower_keys(self):
+        profile = self._profile(self.ROWS)
+        self.assertEqual(profile.avail_cat_cols, ['c1', 'c2', 'c3'])
+
+    def test_summary_statistics(self):
+        out = self._profile(self.ROWS).to_dict()
+        self.assertEqual(out['row_count'], 4)
+        self.assertEqual(out['prd_de_min'], '2021')
+        self.assertEqual(out['prd_de_max'], '2023')
+        self.assertEqual(out['prd_de_count'], 3)
+        self.assertEqual(out['unit_nms'], ['%', '명'])
+        self.assertEqual(out['dt_min'], 2.5)
+        self.assertEqual(out['dt_max'], 10.0)
+        self.assertEqual(out['dt_null_count'], 1)
+        self.assertEqual(out['dt_non_numeric_count'], 1)
+
+    def test_empty_profile(self):
+        out = OriginDataProfile().to_dict()
+        self.assertEqual(out['row_count'], 0)
+        self.assertEqual(out['avail_cat_cols'], [])
+        self.assertIsNone(out['prd_de_min'])
+        self.assertIsNone(out['dt_max'])
+
+
+class PrepareStatisticFilesTests(unittest.TestCase):
+    META_XML = (
+        'KOSIS 메타 설명문\n'
+        '<MetaList><MetaRow><objId>A</objId><itmId>T1</itmId><unitNm>명</unitNm></MetaRow>'
+        '<MetaRow><objId>B</objId><itmId>T2</itmId></MetaRow></MetaList>'
+    )
+
+    def _write(self, tmp, name, content):
+        path = os.path.join(tmp, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def _file_info(self, tmp, latest):
+        data = [
+            {'C1': '11', 'PRD_DE': '2022', 'DT': '5', 'ITM_NM': '인구'},
+            {'C1': '', 'C2': 'x', 'PRD_DE': '2023', 'DT': '-'},
+        ]
+        return {
+            'src_data_id': 7,
+            'stat_tbl_id': 'DT_1',
+            'data_path': self._write(tmp, 'data.json', json.dumps(data, ensure_ascii=False)),
+            'meta_path': self._write(tmp, 'meta.xml', self.META_XML),
+            'latest_path': self._write(tmp, 'latest.json', json.dumps(latest)),
+        }
+
+    def test_copy_buffer_rows_and_meta(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            fi = self._file_info(tmp, [{'SendDe': '2024-01-02'}, {'SendDe': '2024-03-04'}])
+            out = db_processing.prepare_statistic_files(fi, 'DT_1', tmp)
+            with open(out['copy_path'], encoding='utf-8', newline='') as f:
+                records = list(csv.reader(f))
+        self.assertEqual(out['latest_date'], '2024-03-04')
+        self.assertEqual(out['record_count'], 2)
+        self.assertEqual(out['profile'].avail_cat_cols, ['c1', 'c2'])
+        self.assertEqual(len(records), 2)
+        first = dict(zip(db_processing.ORIGIN_COLUMNS, records[0]))
+        self.assertEqual(first['tbl_id'], 'DT_1')
+        self.assertEqual(first['itm_id'], '인구')
+        self.assertEqual(first['stat_latest_chn_dt'], '2024-03-04')
+        self.assertEqual([r['obj_id'] for r in out['meta_rows']], ['A', 'B'])
+
+    def test_missing_latest_date_written_as_copy_null(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            fi = self._file_info(tmp, [])
+            out = db_processing.prepare_statistic_files(fi, 'DT_1', tmp)
+            with open(out['copy_path'], encoding='utf-8', newline='') as f:
+                first = dict(zip(db_processing.ORIGIN_COLUMNS, next(csv.reader(f))))
+        self.assertIsNone(out['latest_date'])
+        self.assertEqual(first['stat_latest_chn_dt'], db_processing.COPY_NULL)
+        # 빈 문자열 컬럼은 NULL 이 아닌 '' 로 유지
+        self.assertEqual(first['c4'], '')
+
+
+class PrdDeShardPlanTests(unittest.TestCase):
+    def test_shards_are_contiguous_and_cover_all_periods(self):
+        counts = {'2019': 10, '2020': 10, '2021': 10, '2022': 10, '2023': 10, '2024': 10}
+        shards = db_processing._plan_prd_de_shards(counts, 3)
+        self.assertEqual(shards, [['2019', '2020'], ['2021', '2022'], ['2023', '2024']])
+
+    def test_never_exceeds_shard_count(self):
+        counts = {str(y): 1 for y in range(2000, 2020)}
+        shards = db_processing._plan_prd_de_shards(counts, 4)
+        self.assertLessEqual(len(shards), 4)
+        self.assertEqual([p for shard in shards for p in shard], sorted(counts))
+
+    def test_single_period_or_empty(self):
+        self.assertEqual(db_processing._plan_prd_de_shards({'2020': 5}, 4), [['2020']])
+        self.assertEqual(db_processing._plan_prd_de_shards({}, 4), [])
+
+    def test_integration_sql_shard_filter(self):
+        sql = db_processing._integration_insert_sql('stats_x', 'stg_intg_1', 'stg_origin_1', prd_de_filter=True)
+        self.assertIn('INSERT INTO stg_intg_1', sql)
+        self.assertIn('FROM stg_origin_1', sql)
+        self.assertIn('prd_de = ANY(:prd_de_list)', sql)
+        self.assertIn('CAST(dt AS NUMERIC(15,3))', sql)
+        plain = db_processing._integration_insert_sql('stats_dis_hlth_disease_cost_sub', 'stats_dis_hlth_disease_cost_sub', 'stats_kosis_origin_data')
+        self.assertNotIn('prd_de_list', plain)
+        self.assertNotIn('NUMERIC', plain)
+
+
+@unittest.skipUnless(os.getenv('DB_URL'), 'DB_URL 미설정 — PostgreSQL 샤딩 적재 테스트 생략')
+class ShardedLoadPostgresTests(unittest.TestCase):
+    """임시 스키마의 stats_kosis_origin_data 로 _load_sharded 게시·스테이징 삭제를 검증한다.
+
+    lock_timeout 을 걸어 두어 스테이징 DROP 이 호출자 세션 잠금을 기다리면 멈추지 않고 실패로 드러난다.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = f'test_shard_{uuid.uuid4().hex[:8]}'
+        admin = create_engine(os.getenv('DB_URL'))
+        with admin.begin() as conn:
+            conn.execute(text(f'CREATE SCHEMA {cls.schema}'))
+        admin.dispose()
+        cls.engine = create_engine(os.getenv('DB_URL'), connect_args={
+            'options': f'-c search_path={cls.schema} -c lock_timeout=5000'})
+        cols = ', '.join(f'{c} text' for c in db_processing.ORIGIN_COLUMNS)
+        with cls.engine.begin() as conn:
+            conn.execute(text(f"CREATE TABLE stats_kosis_origin_data ({cols}, CHECK (prd_de <> 'bad'))"))
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.engine.begin() as conn:
+            conn.execute(text(f'DROP SCHEMA {cls.schema} CASCADE'))
+        cls.engine.dispose()
+
+    def setUp(self):
+        self.session = sessionmaker(bind=self.engine)()
+        patches = [patch.object(db_processing, 'get_engine', return_value=self.engine),
+                   patch.object(db_processing, 'get_db_shard_count', return_value=2)]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self):
+        self.session.close()
+        with self.engine.begin() as conn:
+            conn.execute(text('TRUNCATE stats_kosis_origin_data'))
+
+    def _load(self, prd_des):
+        rows = [dict({c: None for c in db_processing.ORIGIN_COLUMNS}, src_data_id='S1', prd_de=prd, dt='1')
+                for prd in prd_des]
+        file_info = {'src_data_id': 'S1', 'stat_tbl_id': 'T1'}
+        db_processing._load_sharded(self.session, file_info, {}, '20260101', rows=rows)
+
+    def _count(self, sql):
+        with self.engine.connect() as conn:
+            return conn.execute(text(sql), {'schema': self.schema}).scalar()
+
+    def _staging_tables(self):
+        return self._count("SELECT count(*) FROM information_schema.tables "
+                           "WHERE table_schema = :schema AND table_name LIKE 'stg\\_%'")
+
+    def test_publish_commits_rows_and_drops_staging(self):
+        self._load(['2021', '2022', '2023', '2024'])
+        self.session.commit()
+        self.assertEqual(self._count('SELECT count(*) FROM stats_kosis_origin_data'), 4)
+        self.assertEqual(self._staging_tables(), 0)
+
+    def test_later_rollback_still_drops_staging(self):
+        self._load(['2021', '2022'])
+        self.session.rollback()
+        self.assertEqual(self._count('SELECT count(*) FROM stats_kosis_origin_data'), 0)
+        self.assertEqual(self._staging_tables(), 0)
+
+    def test_failed_publish_drops_staging(self):
+        with self.assertRaises(Exception):
+            self._load(['2021', 'bad'])
+        self.assertEqual(self._staging_tables(), 0)
+        self.session.rollback()
+        self.assertEqual(self._count('SELECT count(*) FROM stats_kosis_origin_data'), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Unit tests for deadline (실행·통계표 마감, 호출 타임아웃 축소, 통계표 미루기·다음 실행 우선)
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import deadline  # noqa: E402
+import table_history  # noqa: E402
+from deadline import DeadlineExceeded  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DeadlineTests(unittest.TestCase):
+    def tearDown(self):
+        deadline.finish()
+
+    def test_no_deadline_is_passthrough(self):
+        deadline.finish()
+        self.assertEqual(deadline.call_timeout((5, 60)), (5, 60))
+        self.assertFalse(deadline.should_defer(10 ** 6))
+
+    def test_call_timeout_shrinks_then_fails(self):
+        clock = _Clock()
+        deadline.start(100, clock=clock)
+        self.assertEqual(deadline.call_timeout((5, 60)), (5, 60))
+        clock.now = 90
+        self.assertEqual(deadline.call_timeout((5, 60)), (5, 10))
+        self.assertEqual(deadline.call_timeout(30), 10)
+        clock.now = 100
+        with self.assertRaises(DeadlineExceeded):
+            deadline.call_timeout((5, 60))
+
+    def test_should_defer_compares_estimate_with_time_left(self):
+        clock = _Clock()
+        deadline.start(100, clock=clock)
+        clock.now = 40
+        self.assertTrue(deadline.should_defer(61))
+        self.assertFalse(deadline.should_defer(59))
+        self.assertFalse(deadline.should_defer(None))
+
+    def test_table_scope_narrows_and_shares_deferred_list(self):
+        clock = _Clock()
+        deadline.start(100, clock=clock)
+        with deadline.scope(10):
+            self.assertEqual(deadline.remaining(), 10)
+            deadline.defer('T1', 'fetch')
+        self.assertEqual(deadline.remaining(), 100)
+        deadline.defer('T2', 'db')
+        self.assertEqual(deadline.finish(), ['T1', 'T2'])
+
+    def test_expired_deadline_does_not_start_a_breaker_probe(self):
+        import circuit_breaker
+        from collectors.base import BaseCollector
+
+        class _Dummy(BaseCollector):
+            EXT_SYS = 'GBIS'
+
+            def fetch_meta(self, data_info): return {}
+            def fetch_latest(self, data_info): return {}
+            def fetch_data(self, data_info): return {}
+            def is_retryable_error(self, response): return False
+
+        circuit_breaker.reset(failure_threshold=1, reset_sec=0)
+        self.addCleanup(circuit_breaker.finish)
+        breaker = circuit_breaker.for_url('https://apis.data.go.kr/a')
+        breaker.record_failure('down')
+        clock = _Clock()
+        deadline.start(10, clock=clock)
+        clock.now = 10
+        with patch('collectors.base.requests.get') as get, self.assertRaises(DeadlineExceeded):
+            _Dummy(api_info={}, stats_src={}).http_get('https://apis.data.go.kr/a', retries=0)
+        get.assert_not_called()
+        self.assertEqual(breaker.state, circuit_breaker.OPEN)
+
+    def test_wrapped_exception_is_detected(self):
+        try:
+            try:
+                raise DeadlineExceeded('x')
+            except DeadlineExceeded as e:
+                raise RuntimeError('파일 저장 실패') from e
+        except RuntimeError as e:
+            self.assertTrue(deadline.is_deadline_exceeded(e))
+        self.assertFalse(deadline.is_deadline_exceeded(RuntimeError('timeout')))
+
+
+class SaveAllFilesDeadlineTests(unittest.TestCase):
+    def tearDown(self):
+        deadline.finish()
+
+    def _run(self, history, save_single_file):
+        import main as main_module
+
+        stats = [{'stat_tbl_id': t} for t in ('BIG', 'SMALL')]
+        infos = {t: {} for t in ('BIG', 'SMALL')}
+        with patch.object(main_module.table_history, 'load', return_value=history), \
+                patch.object(main_module, 'save_single_file', side_effect=save_single_file):
+            return main_module.save_all_files({}, stats, {'ext_sys': 'KOSIS'}, infos)
+
+    def test_table_that_cannot_finish_is_deferred(self):
+        history = table_history.TableHistory('KOSIS', '', {'BIG': {'file_sec': 500.0}, 'SMALL': {'file_sec': 5.0}})
+        deadline.start(60)
+        saved = self._run(history, lambda args: {'stat_tbl_id': args[1]['stat_tbl_id']})
+        self.assertEqual([s['stat_tbl_id'] for s in saved], ['SMALL'])
+        self.assertEqual(deadline.deferred(), ['BIG'])
+
+    def test_table_budget_overrun_is_a_failure_not_a_deferral(self):
+        history = table_history.TableHistory('KOSIS', '', {})
+        deadline.start(3600)
+
+        def save(args):
+            raise RuntimeError('파일 저장 실패') from DeadlineExceeded('통계표 예산 초과')
+
+        with self.assertRaises(RuntimeError):
+            self._run(history, save)
+        self.assertEqual(deadline.deferred(), [])
+
+
+class DeferredHistoryTests(unittest.TestCase):
+    def test_deferred_tables_go_first_until_completed(self):
+        history = table_history.TableHistory('KOSIS', '', {'A': {'file_sec': 100.0}, 'B': {'file_sec': 1.0}})
+        history.update_from_report({'tables': {'B': {table_history.DEFERRED_STAGE: {'count': 1, 'deferred': 1}}}})
+        ordered, _ = history.order_longest_first(['A', 'B'], 'file', table_of=lambda t: t)
+        self.assertEqual(ordered, ['B', 'A'])
+
+        history.update_from_report({'tables': {'B': {'file.total': {'count': 1, 'total_sec': 2.0}}}})
+        self.assertEqual(history.deferred('B'), 0)
+        ordered, _ = history.order_longest_first(['A', 'B'], 'file', table_of=lambda t: t)
+        self.assertEqual(ordered, ['A', 'B'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Unit tests for hedging (엔드포인트별 지연 백분위 학습, 헤지 요청·예산)
+"""
+import contextvars
+import os
+import sys
+import threading
+import unittest
+from unittest.mock import patch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import hedging  # noqa: E402
+from hedging import Hedger  # noqa: E402
+
+
+def _learned(percentile=90, budget=0.5, latency=0.01):
+    hedger = Hedger(percentile, budget)
+    for _ in range(hedging.MIN_SAMPLES):
+        hedger.observe('data', latency)
+    return hedger
+
+
+@patch.object(hedging, 'MIN_DELAY_SEC', 0.01)
+class HedgerTests(unittest.TestCase):
+    def test_delay_is_learned_percentile(self):
+        hedger = Hedger(90, 0.1)
+        for i in range(1, hedging.MIN_SAMPLES):
+            hedger.observe('data', i / 10)
+        self.assertIsNone(hedger.delay('data'))          # 표본 부족
+        hedger.observe('data', 2.0)
+        self.assertAlmostEqual(hedger.delay('data'), 1.8)
+        self.assertIsNone(hedger.delay('meta'))          # 엔드포인트별
+
+    def test_slow_primary_is_hedged_and_hedge_wins(self):
+        hedger = _learned()
+        hedger.requests = 10
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(5)                           # 멈춘 원 요청
+                return 'slow'
+            return 'fast'
+
+        result = hedger.call('data', fetch)
+        release.set()
+        self.assertEqual(result, ('fast', 'hedge'))
+        self.assertEqual((hedger.hedged, hedger.won), (1, 1))
+
+    def test_fast_call_and_exhausted_budget_do_not_hedge(self):
+        hedger = _learned(budget=0.05)
+        self.assertEqual(hedger.call('data', lambda: 'ok'), ('ok', None))
+        calls = []
+
+        def slow():
+            calls.append(1)
+            threading.Event().wait(0.05)
+            return 'slow'
+
+        self.assertEqual(hedger.call('data', slow), ('slow', None))   # 2건 x 5% < 1건
+        self.assertEqual((len(calls), hedger.hedged), (1, 0))
+
+    def test_failed_primary_falls_back_to_hedge(self):
+        hedger = _learned()
+        hedger.requests = 10
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            if len(calls) == 1:
+                threading.Event().wait(0.05)
+                raise ConnectionError('reset')
+            threading.Event().wait(0.1)
+            return 'ok'
+
+        self.assertEqual(hedger.call('data', fetch), ('ok', 'hedge'))
+
+    def test_module_api_disabled_by_default(self):
+        hedging.reset(percentile=0)
+        try:
+            self.assertEqual(hedging.call('data', lambda: 'ok'), ('ok', None))
+        finally:
+            hedging.finish()
+
+    def test_hedger_is_scoped_to_the_run_context(self):
+        hedging.reset(percentile=90, budget=0.5)
+        try:
+            self.assertIsNone(contextvars.Context().run(hedging.finish))
+        finally:
+            self.assertIsNotNone(hedging.finish())
+
+
+if __name__ == '__main__':
+    unittest.main()
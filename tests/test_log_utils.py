@@ -0,0 +1,135 @@
+"""
+Unit tests for log_utils.preview (지연·크기 제한 로그 미리보기)
+"""
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import log_utils  # noqa: E402
+from log_utils import JsonLineFormatter, ProgressLog, preview  # noqa: E402
+
+
+class _Exploding:
+    def __repr__(self):
+        raise AssertionError('DEBUG 비활성인데 직렬화됨')
+
+
+class PreviewTests(unittest.TestCase):
+    def test_not_rendered_when_level_disabled(self):
+        logger = logging.getLogger('test_log_utils.disabled')
+        logger.setLevel(logging.INFO)
+        logger.debug('payload: %s', preview([_Exploding()]))
+
+    def test_only_first_items_are_serialized(self):
+        data = [{'C1': i, 'DT': str(i)} for i in range(100000)]
+        data.append(_Exploding())
+        text = str(preview(data, items=2))
+        self.assertTrue(text.startswith("[{'C1': 0, 'DT': '0'}, {'C1': 1, 'DT': '1'}"))
+        self.assertIn('(+99999, total 100001)', text)
+
+    def test_output_is_bounded(self):
+        self.assertLessEqual(len(str(preview(['x' * 10 ** 6], chars=200))), 203)
+        self.assertLessEqual(len(str(preview('y' * 10 ** 6, chars=50))), 53)
+        self.assertEqual('에러', str(preview('에러 응답'.encode('utf-8'), chars=6)))
+
+    def test_dict_and_nested(self):
+        text = str(preview({'a': [1, 2, 3, 4], 'b': 2, 'c': 3, 'd': 4}, items=2))
+        self.assertEqual("{'a': [1, 2, ... (+2, total 4)], 'b': 2, ... (+2)}", text)
+
+
+class QueueLoggingTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        root = logging.getLogger()
+        self._saved = (list(root.handlers), root.level)
+
+    def tearDown(self):
+        log_utils.shutdown_queue_logging()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        for handler in self._saved[0]:
+            root.addHandler(handler)
+        root.setLevel(self._saved[1])
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _read_jsonl(self, path):
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def test_records_from_threads_written_by_listener_as_json_lines(self):
+        path = os.path.join(self.tmp, 'app.jsonl')
+        db_path = os.path.join(self.tmp, 'db.jsonl')
+        handler = logging.FileHandler(path, encoding='utf-8')
+        handler.setFormatter(JsonLineFormatter())
+        db_handler = logging.FileHandler(db_path, encoding='utf-8')
+        db_handler.setFormatter(JsonLineFormatter())
+        db_handler.addFilter(logging.Filter('db'))
+        log_utils.setup_queue_logging([handler, db_handler], level=logging.INFO)
+
+        threads = [threading.Thread(target=logging.info, args=('worker %s', i)) for i in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        logging.getLogger('db').warning('db 전용 %s', 'msg')
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            logging.error('실패', exc_info=True)
+        log_utils.shutdown_queue_logging()
+
+        records = self._read_jsonl(path)
+        self.assertEqual(12, len(records))
+        self.assertEqual({f'worker {i}' for i in range(10)},
+                         {r['msg'] for r in records if r['msg'].startswith('worker')})
+        error = records[-1]
+        self.assertEqual('ERROR', error['level'])
+        self.assertEqual('실패', error['msg'])
+        self.assertIn('ValueError: boom', error['exc'])
+        db_records = self._read_jsonl(db_path)
+        self.assertEqual(['db 전용 msg'], [r['msg'] for r in db_records])
+
+    def test_text_handler_keeps_traceback(self):
+        path = os.path.join(self.tmp, 'app.log')
+        handler = logging.FileHandler(path, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        log_utils.setup_queue_logging([handler])
+        try:
+            raise KeyError('k')
+        except KeyError:
+            logging.exception('에러')
+        log_utils.shutdown_queue_logging()
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+        self.assertTrue(text.startswith('ERROR 에러\n'))
+        self.assertIn("KeyError: 'k'", text)
+
+
+class ProgressLogTests(unittest.TestCase):
+    def test_rate_limited_progress(self):
+        logger = logging.getLogger('test_log_utils.progress')
+        clock = iter([0.0, 1.0, 2.0, 6.0, 7.0, 8.0])
+        with patch('log_utils.time.monotonic', side_effect=lambda: next(clock)):
+            progress = ProgressLog('insert', total=500, interval_sec=5, logger=logger)
+            with self.assertLogs(logger, level='INFO') as logs:
+                for _ in range(4):
+                    progress.update(100)
+                progress.done()
+        self.assertEqual(2, len(logs.records))
+        self.assertIn('insert 진행: 300/500건 (3배치', logs.output[0])
+        self.assertIn('insert 완료: 400건 (4배치, 8.0s)', logs.output[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
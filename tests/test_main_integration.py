@@ -207,5 +207,70 @@ class MultiSourceRoutingTests(unittest.TestCase):
         self.assertFalse(instance.is_retryable_error({'err': '31'}))
 
 
+# ---------------------------------------------------------------------------
+# Suite 4 — --ext-sys 여러 개 / ALL 동시 실행
+# ---------------------------------------------------------------------------
+class MultiExtSysRunTests(unittest.TestCase):
+    """resolve_ext_sys_list 해석과 run_sources 통합 요약/종료 코드."""
+
+    def test_resolve_list_and_all(self):
+        self.assertEqual(main_module.resolve_ext_sys_list('kosis, gbis,KOSIS'), ['KOSIS', 'GBIS'])
+        all_list = main_module.resolve_ext_sys_list('ALL')
+        self.assertEqual(all_list, list(main_module._COLLECTOR_REGISTRY))
+        self.assertEqual(all_list[0], 'KOSIS')
+        self.assertIn('GBIS', all_list)
+
+    def _run_sources(self, statuses, mode='file'):
+        import argparse
+        import threading
+        import run_report
+
+        self.addCleanup(setattr, run_report, '_active', None)
+        seen = {}
+        barrier = threading.Barrier(len(statuses), timeout=5)
+
+        def fake_run_source(args, ext_sys):
+            run_report.start_run(ext_sys=ext_sys)
+            barrier.wait()   # 모든 소스가 동시에 진행 중
+            # 소스마다 컨텍스트가 분리돼 다른 소스의 start_run 이 현재 리포트를 바꾸지 않는다
+            seen[ext_sys] = (args.ext_sys, run_report.current().meta['ext_sys'])
+            code = {'SUCCESS': 0, 'PARTIAL': 2, 'ERROR': 1}[statuses[ext_sys]]
+            return code, {'status': statuses[ext_sys], 'targets': 3, 'files_ok': 3, 'db_ok': 0, 'db_fail': 0}
+
+        args = argparse.Namespace(mode=mode, ext_sys='unused', resume=False, from_dir=None, profile=False)
+        with patch.object(main_module, 'run_source', fake_run_source), \
+                patch.object(main_module, 'write_run_summary') as write_summary:
+            result = main_module.run_sources(args, list(statuses))
+        write_summary.assert_called_once()
+        return result, seen
+
+    def test_all_success(self):
+        (code, summary), seen = self._run_sources({'KOSIS': 'SUCCESS', 'GBIS': 'SUCCESS'})
+        self.assertEqual(code, 0)
+        self.assertEqual(summary['status'], 'SUCCESS')
+        self.assertEqual(summary['ext_sys'], 'KOSIS,GBIS')
+        self.assertEqual(summary['targets'], 6)
+        self.assertEqual(seen, {'KOSIS': ('KOSIS', 'KOSIS'), 'GBIS': ('GBIS', 'GBIS')})
+
+    def test_mixed_is_partial(self):
+        (code, summary), _ = self._run_sources({'KOSIS': 'SUCCESS', 'GBIS': 'ERROR'})
+        self.assertEqual((code, summary['status']), (2, 'PARTIAL'))
+        self.assertEqual(summary['error'], 'GBIS:ERROR')
+        self.assertEqual(summary['sources'], {'KOSIS': 'SUCCESS', 'GBIS': 'ERROR'})
+
+    def test_all_error(self):
+        (code, summary), _ = self._run_sources({'KOSIS': 'ERROR', 'GBIS': 'ERROR'})
+        self.assertEqual((code, summary['status']), (1, 'ERROR'))
+
+    def test_load_mode_rejected(self):
+        import argparse
+        args = argparse.Namespace(mode='load', ext_sys='KOSIS,GBIS', resume=False, from_dir='x', profile=False)
+        with patch.object(main_module, 'run_source') as run_source, \
+                patch.object(main_module, 'write_run_summary'):
+            code, summary = main_module.run_sources(args, ['KOSIS', 'GBIS'])
+        run_source.assert_not_called()
+        self.assertEqual((code, summary['status']), (1, 'ERROR'))
+
+
 if __name__ == '__main__':
     unittest.main()
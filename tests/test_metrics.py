@@ -0,0 +1,108 @@
+"""
+Unit tests for metrics (Prometheus textfile 메트릭)
+"""
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import metrics  # noqa: E402
+import run_report  # noqa: E402
+
+
+class MetricsTests(unittest.TestCase):
+    def setUp(self):
+        metrics.reset('KOSIS')
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        metrics.reset()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_render_counter_and_histogram(self):
+        metrics.observe_http('KOSIS', 'data', 200, 0.3, nbytes=1024)
+        metrics.observe_http('KOSIS', 'data', 'error', 2.0, retry=True)
+        text = metrics.render()
+        self.assertIn('# TYPE dabt_batch_http_requests_total counter', text)
+        self.assertIn('dabt_batch_http_requests_total{endpoint="data",ext_sys="KOSIS",status="200"} 1', text)
+        self.assertIn('dabt_batch_http_requests_total{endpoint="data",ext_sys="KOSIS",status="error"} 1', text)
+        self.assertIn('dabt_batch_http_response_bytes_total{endpoint="data",ext_sys="KOSIS"} 1024', text)
+        self.assertIn('dabt_batch_http_retries_total{endpoint="data",ext_sys="KOSIS"} 1', text)
+        # 누적 버킷: 0.5 에는 0.3 만, 2.5 부터 둘 다
+        self.assertIn('dabt_batch_http_request_duration_seconds_bucket{endpoint="data",ext_sys="KOSIS",le="0.5"} 1', text)
+        self.assertIn('dabt_batch_http_request_duration_seconds_bucket{endpoint="data",ext_sys="KOSIS",le="2.5"} 2', text)
+        self.assertIn('dabt_batch_http_request_duration_seconds_bucket{endpoint="data",ext_sys="KOSIS",le="+Inf"} 2', text)
+        self.assertIn('dabt_batch_http_request_duration_seconds_count{endpoint="data",ext_sys="KOSIS"} 2', text)
+
+    def test_threads_outside_the_run_context_are_not_recorded(self):
+        other = threading.Thread(target=lambda: metrics.inc('http_retries_total', ext_sys='GBIS'))
+        other.start()
+        other.join()
+        inherited = threading.Thread(target=run_report.in_context(lambda: metrics.inc('http_retries_total',
+                                                                                      ext_sys='KOSIS')))
+        inherited.start()
+        inherited.join()
+        text = metrics.render()
+        self.assertNotIn('ext_sys="GBIS"', text)
+        self.assertIn('dabt_batch_http_retries_total{ext_sys="KOSIS"} 1', text)
+
+    def test_label_values_are_escaped(self):
+        metrics.inc('rows_inserted_total', 1, table='a"b\\c')
+        self.assertIn('table="a\\"b\\\\c"', metrics.render())
+
+    def test_on_span_maps_run_report_stages(self):
+        metrics.on_span('db.insert_origin', 0.2, 'DT_1', {'rows': 100})
+        metrics.on_span('db.copy_origin', 0.1, 'DT_2', {'rows': 50, 'errors': 1})
+        metrics.on_span('kosis.error31_split', None, 'DT_1', {'retries': 1})
+        metrics.on_span('http.kosis.data', 0.1, 'DT_1', {'bytes': 10})
+        text = metrics.render()
+        self.assertIn('dabt_batch_rows_inserted_total{ext_sys="KOSIS",table="DT_1"} 100', text)
+        self.assertNotIn('table="DT_2"', text)
+        self.assertIn('dabt_batch_kosis_error31_splits_total 1', text)
+        self.assertIn('dabt_batch_db_stage_duration_seconds_count{stage="db.insert_origin"} 1', text)
+        self.assertNotIn('stage="http.kosis.data"', text)
+
+    def test_run_report_listener_feeds_metrics(self):
+        run_report.add_listener(metrics.on_span)
+        run_report.start_run(ext_sys='KOSIS')
+        try:
+            with run_report.span('db.upsert', table='tb_x', rows=7):
+                pass
+        finally:
+            run_report.finish_run(self.tmp)
+        self.assertIn('dabt_batch_rows_inserted_total{ext_sys="KOSIS",table="tb_x"} 7', metrics.render())
+
+    def test_write_textfile_sets_last_run_gauges(self):
+        metrics.observe_http('KOSIS', 'meta', 200, 0.01)
+        path = metrics.write_textfile(self.tmp, 'KOSIS', {'status': 'SUCCESS', 'duration_sec': 12, 'db_fail': 0})
+        self.assertEqual(os.path.join(self.tmp, 'dabt_batch_kosis.prom'), path)
+        self.assertEqual(['dabt_batch_kosis.prom'], os.listdir(self.tmp))
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+        self.assertIn('dabt_batch_last_run_success{ext_sys="KOSIS"} 1', text)
+        self.assertIn('dabt_batch_last_run_duration_seconds{ext_sys="KOSIS"} 12', text)
+        self.assertIn('dabt_batch_last_run_tables_failed{ext_sys="KOSIS"} 0', text)
+
+    def test_collector_http_get_records_each_attempt(self):
+        from collectors.gbis import GbisCollector
+
+        fail = MagicMock(status_code=500, content=b'', text='err')
+        ok = MagicMock(status_code=200, content=b'12345', text='ok')
+        with patch('collectors.base.requests.get', side_effect=[fail, ok]), \
+                patch('collectors.base.time.sleep'):
+            GbisCollector().http_get('http://x/api/getBusStationList?serviceKey=k', retries=1)
+        text = metrics.render()
+        self.assertIn('endpoint="getBusStationList",ext_sys="GBIS",status="500"} 1', text)
+        self.assertIn('endpoint="getBusStationList",ext_sys="GBIS",status="200"} 1', text)
+        self.assertIn('dabt_batch_http_retries_total{endpoint="getBusStationList",ext_sys="GBIS"} 1', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Unit tests for profiling (--profile: 단계별 cProfile/tracemalloc, 통계표별 최대 메모리)
+"""
+import json
+import os
+import pstats
+import shutil
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import profiling  # noqa: E402
+
+
+def _build_buffer(size):
+    return bytearray(size)
+
+
+def _allocate_in_worker(table_id, size):
+    with profiling.table(table_id):
+        return len(_build_buffer(size))
+
+
+class ProfilingTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        profiling.finish()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_noop_when_disabled(self):
+        self.assertFalse(profiling.enabled())
+        with profiling.stage('fetch'), profiling.table('DT_1'):
+            pass
+        self.assertIsNone(profiling.finish())
+
+    def test_stage_writes_merged_pstats_and_table_peaks(self):
+        run_dir = profiling.start('TEST', profile_dir=self.tmp)
+        with profiling.stage('db'):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(_allocate_in_worker, ['DT_SMALL', 'DT_BIG'], [1024, 8 * 1024 * 1024]))
+        summary_path = profiling.finish()
+
+        self.assertTrue(os.path.exists(os.path.join(run_dir, 'db.pstats')))
+        self.assertTrue(os.path.exists(os.path.join(run_dir, 'db_alloc.txt')))
+        # 워커 스레드 작업 프로파일이 단계 pstats 에 합쳐졌는지
+        stats = pstats.Stats(os.path.join(run_dir, 'db.pstats'))
+        funcs = {func[2] for func in stats.stats}
+        self.assertIn('_build_buffer', funcs)
+
+        with open(summary_path, encoding='utf-8') as f:
+            summary = json.load(f)
+        self.assertEqual(1, summary['stages']['db']['calls'])
+        self.assertEqual(2, summary['stages']['db']['task_profiles'])
+        self.assertGreaterEqual(summary['stages']['db']['peak_mb'], 8)
+        self.assertGreaterEqual(summary['tables_peak_mb']['DT_BIG'], 8)
+        self.assertIn('DT_SMALL', summary['tables_peak_mb'])
+
+    def test_repeated_stage_keeps_each_pstats(self):
+        run_dir = profiling.start('TEST', profile_dir=self.tmp)
+        for _ in range(2):
+            with profiling.stage('load'):
+                pass
+        profiling.finish()
+        self.assertTrue(os.path.exists(os.path.join(run_dir, 'load.pstats')))
+        self.assertTrue(os.path.exists(os.path.join(run_dir, 'load_2.pstats')))
+
+    def test_works_without_reset_peak(self):
+        # Python 3.8 의 tracemalloc 에는 reset_peak 가 없다
+        with patch.object(profiling, 'tracemalloc', wraps=profiling.tracemalloc) as tm:
+            del tm.reset_peak
+            run_dir = profiling.start('TEST', profile_dir=self.tmp)
+            with profiling.stage('db'), profiling.table('DT_1'):
+                _build_buffer(1024)
+            profiling.finish()
+        self.assertTrue(os.path.exists(os.path.join(run_dir, 'db.pstats')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+"""
+Unit tests for run_manifest.RunManifest
+
+- fetch/load 단계 기록과 원자적 저장
+- --resume: 해시 일치 파일만 재사용, load 완료 통계표 skip
+- --mode load: 저장 디렉터리 triplet 탐색
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import unittest.mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from run_manifest import (  # noqa: E402
+    MANIFEST_FILENAME,
+    STAGE_FETCH,
+    STAGE_LOAD,
+    STATUS_FAILED,
+    RunManifest,
+    find_latest_manifest,
+    index_saved_files,
+)
+import main as main_module  # noqa: E402
+
+
+class RunManifestTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.root = os.path.join(self.tmp, '20260101')
+        os.makedirs(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _file_info(self, stat_tbl_id='T1'):
+        info = {'stat_tbl_id': stat_tbl_id, 'ext_api_id': 'KOSIS_001', 'src_data_id': 'S1'}
+        for key in ('meta_path', 'latest_path', 'data_path'):
+            path = os.path.join(self.root, f'{stat_tbl_id}_{key}.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(f'{{"{key}": 1}}')
+            info[key] = path
+        return info
+
+    def test_fetch_then_resume_reuses_files(self):
+        manifest = RunManifest.open(self.root, 'KOSIS')
+        info = self._file_info()
+        manifest.mark_fetched(info)
+
+        resumed = RunManifest.open(self.root, 'KOSIS', resume=True)
+        self.assertEqual(resumed.fetched_file_info('T1'), info)
+        self.assertFalse(resumed.is_loaded('T1'))
+
+    def test_changed_file_is_not_reused(self):
+        manifest = RunManifest.open(self.root, 'KOSIS')
+        info = self._file_info()
+        manifest.mark_fetched(info)
+        with open(info['data_path'], 'a', encoding='utf-8') as f:
+            f.write('tampered')
+        self.assertIsNone(manifest.fetched_file_info('T1'))
+
+    def test_load_done_survives_resume_but_not_fresh_run(self):
+        manifest = RunManifest.open(self.root, 'KOSIS')
+        manifest.mark_fetched(self._file_info())
+        manifest.mark_loaded('T1')
+        manifest.mark_failed('T2', STAGE_LOAD, RuntimeError('boom'))
+
+        self.assertTrue(RunManifest.open(self.root, 'KOSIS', resume=True).is_loaded('T1'))
+        self.assertFalse(RunManifest.open(self.root, 'KOSIS').is_loaded('T1'))
+
+    def test_refetch_invalidates_load(self):
+        manifest = RunManifest.open(self.root, 'KOSIS')
+        manifest.mark_fetched(self._file_info())
+        manifest.mark_loaded('T1')
+        manifest.mark_fetched(self._file_info())
+        self.assertFalse(manifest.is_loaded('T1'))
+
+    def test_fetch_failure_keeps_previous_files(self):
+        manifest = RunManifest.open(self.root, 'KOSIS')
+        info = self._file_info()
+        manifest.mark_fetched(info)
+        manifest.mark_failed('T1', STAGE_FETCH, RuntimeError('timeout'))
+        self.assertEqual(manifest.fetched_file_info('T1'), info)
+        manifest.mark_failed('T9', STAGE_FETCH, RuntimeError('timeout'))
+        self.assertEqual(manifest.stage_status('T9', STAGE_FETCH), STATUS_FAILED)
+
+    def test_saved_file_is_valid_json(self):
+        manifest = RunManifest.open(self.root, 'KOSIS')
+        manifest.mark_loaded('T1')
+        with open(os.path.join(self.root, MANIFEST_FILENAME), encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['tables']['T1']['stages'][STAGE_LOAD]['status'], 'done')
+        self.assertEqual(manifest.summary(), {'load_done': 1})
+
+    def test_find_latest_manifest_picks_newest_dated_dir(self):
+        RunManifest.open(self.root, 'KOSIS')
+        newer = os.path.join(self.tmp, '20260201')
+        os.makedirs(newer)  # 매니페스트 없는 디렉터리는 무시
+        RunManifest.open(os.path.join(self.tmp, '20260115'), 'KOSIS')
+        self.assertEqual(
+            find_latest_manifest(self.tmp),
+            os.path.join(self.tmp, '20260115', MANIFEST_FILENAME),
+        )
+        self.assertIsNone(find_latest_manifest(os.path.join(self.tmp, 'missing')))
+
+
+class LoadOnlyDiscoveryTests(unittest.TestCase):
+    """--mode load: 파일명 규칙 색인 + 매니페스트 기반 triplet 탐색"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        for kind in ('meta', 'latest', 'data'):
+            os.makedirs(os.path.join(self.tmp, kind))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _touch(self, kind, stem, ts, ext='json'):
+        path = os.path.join(self.tmp, kind, f'{kind}_{stem}_{ts}.{ext}')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{}')
+        return path
+
+    def _triplet(self, stem, ts):
+        return {
+            'meta_path': self._touch('meta', stem, ts, 'xml'),
+            'latest_path': self._touch('latest', stem, ts),
+            'data_path': self._touch('data', stem, ts),
+        }
+
+    def test_index_keeps_complete_newest_triplets(self):
+        self._triplet('S1-인구-2000-2024', '20260101000000')
+        newest = self._triplet('S1-인구-2000-2024', '20260102000000')
+        self._touch('data', 'S2-고용-2000-2024', '20260101000000')  # meta/latest 없음
+        index = index_saved_files(self.tmp)
+        self.assertEqual(list(index), ['S1-인구-2000-2024'])
+        self.assertEqual(index['S1-인구-2000-2024']['data_path'], newest['data_path'])
+
+    def test_discover_uses_index_then_manifest(self):
+        paths = self._triplet('S-1-인구-2000-2024', '20260101000000')
+        stats_src_list = [
+            {'stat_tbl_id': 'T1', 'stat_api_id': 'A1'},
+            {'stat_tbl_id': 'T2', 'stat_api_id': 'A2'},
+        ]
+        data_info = {'T1': {'src_data_id': 'S-1', 'stat_title': '인구'}, 'T2': {'src_data_id': 'S2'}}
+        api_info = {'ext_api_id': 'KOSIS_001'}
+
+        saved, missing, manifest = main_module.discover_saved_files_info(
+            self.tmp, 'KOSIS', api_info, stats_src_list, data_info)
+        self.assertEqual(missing, ['T2'])
+        self.assertEqual(saved[0]['data_path'], paths['data_path'])
+        self.assertEqual(saved[0]['ext_api_id'], 'KOSIS_001')
+
+        manifest.mark_loaded('T1')
+        with unittest.mock.patch.object(main_module, 'index_saved_files') as index_mock:
+            saved, _, manifest = main_module.discover_saved_files_info(
+                self.tmp, 'KOSIS', api_info, stats_src_list[:1], data_info, resume=True)
+            index_mock.assert_not_called()
+        self.assertEqual(saved[0]['meta_path'], paths['meta_path'])
+        self.assertTrue(manifest.is_loaded('T1'))
+
+        _, _, manifest = main_module.discover_saved_files_info(
+            self.tmp, 'KOSIS', api_info, stats_src_list[:1], data_info)
+        self.assertFalse(manifest.is_loaded('T1'))
+
+    def test_discover_matches_src_data_id_exactly(self):
+        short = self._triplet('DT_1B-인구-2000-2024', '20260101000000')
+        longer = self._triplet('DT_1B-1-인구-2000-2024', '20260102000000')
+        stats_src_list = [{'stat_tbl_id': 'T1'}, {'stat_tbl_id': 'T2'}]
+        data_info = {
+            'T1': {'src_data_id': 'DT_1B', 'stat_title': '인구'},
+            'T2': {'src_data_id': 'DT_1B-1', 'stat_title': '인구'},
+        }
+        saved, missing, _ = main_module.discover_saved_files_info(
+            self.tmp, 'KOSIS', {}, stats_src_list, data_info)
+        by_table = {fi['stat_tbl_id']: fi['data_path'] for fi in saved}
+        self.assertEqual(by_table['T1'], short['data_path'])
+        self.assertEqual(by_table['T2'], longer['data_path'])
+        self.assertEqual(missing, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
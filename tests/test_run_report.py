@@ -0,0 +1,89 @@
+"""
+Unit tests for run_report (span/timer API + 실행 리포트 JSON)
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import run_report  # noqa: E402
+
+
+class RunReportTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        run_report.finish_run(self.tmp)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_span_is_noop_without_active_run(self):
+        self.assertIsNone(run_report.current())
+        with run_report.span('x') as sp:
+            sp.add(rows=3)
+        self.assertIsNone(run_report.finish_run(self.tmp))
+
+    def test_spans_aggregate_per_table_and_stage(self):
+        run_report.start_run(ext_sys='KOSIS', mode='db')
+
+        def work(table):
+            with run_report.table_scope(table):
+                for _ in range(2):
+                    with run_report.span('db.insert_origin', rows=10) as sp:
+                        sp.add(bytes=5)
+                run_report.record('kosis.error31_split', retries=1)
+
+        threads = [threading.Thread(target=run_report.in_context(work), args=(t,)) for t in ('T1', 'T2')]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        with self.assertRaises(ValueError), run_report.span('db.cleanup'):
+            raise ValueError('boom')
+
+        path = run_report.finish_run(self.tmp)
+        with open(path, encoding='utf-8') as f:
+            report = json.load(f)
+        self.assertEqual(report['run']['ext_sys'], 'KOSIS')
+        stage = report['stages']['db.insert_origin']
+        self.assertEqual((stage['count'], stage['rows'], stage['bytes']), (4, 40, 20))
+        self.assertEqual(report['tables']['T1']['db.insert_origin']['rows'], 20)
+        self.assertEqual(report['tables']['T2']['kosis.error31_split']['retries'], 1)
+        self.assertEqual(report['tables'][run_report.RUN_LEVEL_TABLE]['db.cleanup']['errors'], 1)
+        self.assertIsNone(run_report.current())
+
+    def test_threads_outside_the_run_context_record_nothing(self):
+        report = run_report.start_run(ext_sys='KOSIS', mode='db')
+        other = threading.Thread(target=lambda: run_report.record('db.insert_origin', table='T9', rows=1))
+        other.start()
+        other.join()
+        self.assertNotIn('T9', report._tables)
+        run_report.finish_run(self.tmp)
+
+    def test_in_context_carries_table_to_child_threads(self):
+        run_report.start_run(ext_sys='KOSIS', mode='db')
+
+        def shard():
+            with run_report.span('db.stage_shard', rows=5):
+                pass
+
+        with run_report.table_scope('T1'):
+            child = threading.Thread(target=run_report.in_context(shard))
+            child.start()
+            child.join()
+        self.assertIsNone(run_report.current_table())
+        report = run_report.finish_run(self.tmp)
+        with open(report, encoding='utf-8') as f:
+            tables = json.load(f)['tables']
+        self.assertEqual(tables['T1']['db.stage_shard']['rows'], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Unit tests for scheduler (cron 일정 파싱, 다음 실행 시각, 겹침 방지, 실행별 계측 분리)
+"""
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import metrics  # noqa: E402
+import run_report  # noqa: E402
+from scheduler import CronSchedule, Scheduler, parse_schedules  # noqa: E402
+
+
+class CronScheduleTests(unittest.TestCase):
+    def test_next_after_month_days(self):
+        cron = CronSchedule('0 3 3,18 * *')
+        self.assertEqual(datetime(2026, 1, 3, 3, 0), cron.next_after(datetime(2026, 1, 1, 12, 0)))
+        self.assertEqual(datetime(2026, 1, 18, 3, 0), cron.next_after(datetime(2026, 1, 3, 3, 0)))
+        self.assertEqual(datetime(2026, 2, 3, 3, 0), cron.next_after(datetime(2026, 1, 18, 3, 0, 30)))
+
+    def test_steps_ranges_and_weekday(self):
+        cron = CronSchedule('*/15 9-10 * * 1-5')   # 평일 09~10시 15분 간격
+        # 2026-10-17 은 토요일 -> 월요일 09:00
+        self.assertEqual(datetime(2026, 10, 19, 9, 0), cron.next_after(datetime(2026, 10, 17, 8, 0)))
+        self.assertEqual(datetime(2026, 10, 19, 10, 45), cron.next_after(datetime(2026, 10, 19, 10, 30)))
+        self.assertEqual(datetime(2026, 10, 20, 9, 0), cron.next_after(datetime(2026, 10, 19, 10, 45)))
+        self.assertTrue(CronSchedule('0 0 * * 7').matches(datetime(2026, 10, 18)))   # 7 = 일요일
+
+    def test_day_and_weekday_are_or_when_both_set(self):
+        cron = CronSchedule('0 0 1 * 1')          # 매월 1일 또는 월요일
+        self.assertEqual(datetime(2026, 10, 19), cron.next_after(datetime(2026, 10, 17)))
+        self.assertEqual(datetime(2026, 11, 1), cron.next_after(datetime(2026, 10, 26)))
+
+    def test_leap_day(self):
+        self.assertEqual(datetime(2028, 2, 29), CronSchedule('0 0 29 2 *').next_after(datetime(2026, 3, 1)))
+
+    def test_invalid(self):
+        for expr in ('0 3 * *', '60 * * * *', '* * 0 * *', '*/0 * * * *'):
+            with self.assertRaises(ValueError):
+                CronSchedule(expr)
+
+
+class ParseSchedulesTests(unittest.TestCase):
+    def test_parse(self):
+        jobs = parse_schedules('kosis=0 3 3,18 * *; GBIS:file=0 4 * * 1;\n# 주석\n')
+        self.assertEqual([('KOSIS', 'db'), ('GBIS', 'file')], [(j.ext_sys, j.mode) for j in jobs])
+        self.assertEqual('0 4 * * 1', jobs[1].cron.expr)
+
+    def test_rejects_bad_mode_or_format(self):
+        with self.assertRaises(ValueError):
+            parse_schedules('KOSIS:load=0 3 * * *')
+        with self.assertRaises(ValueError):
+            parse_schedules('KOSIS 0 3 * * *')
+
+
+class SchedulerTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_same_ext_sys_does_not_overlap_and_runs_are_isolated(self):
+        release = threading.Event()
+        both_started = threading.Barrier(2, timeout=5)
+        paths = {}
+
+        def fake_run_batch(args):
+            # main.run_batch 처럼 실행 리포트·메트릭을 시작하고, 두 실행이 동시에 진행되게 한다
+            run_report.start_run(ext_sys=args.ext_sys, mode=args.mode)
+            metrics.reset(args.ext_sys)
+            both_started.wait()
+            worker = run_report.in_context(lambda: run_report.record('fetch.data', 0.1, table=args.ext_sys, rows=1))
+            t = threading.Thread(target=worker)
+            t.start()
+            t.join()
+            metrics.observe_http(args.ext_sys, 'data', 200, 0.1)
+            release.wait(5)
+            paths[args.ext_sys] = (run_report.finish_run(self.tmp), metrics.render())
+            return 0, {'status': 'SUCCESS'}
+
+        jobs = parse_schedules('KOSIS=* * * * *; GBIS=* * * * *')
+        scheduler = Scheduler(jobs, fake_run_batch)
+        now = datetime(2026, 10, 19, 3, 0)
+        scheduler.plan(datetime(2026, 10, 19, 2, 59))
+        self.assertEqual(2, scheduler.run_pending(now))
+        # 이전 실행이 진행 중인 ext_sys 는 다음 트리거를 건너뛴다
+        self.assertEqual(0, scheduler.run_pending(datetime(2026, 10, 19, 3, 1)))
+        self.assertEqual(2, scheduler.skipped)
+        release.set()
+        scheduler.join()
+
+        import json
+        for ext_sys, other in (('KOSIS', 'GBIS'), ('GBIS', 'KOSIS')):
+            path, text = paths[ext_sys]
+            with open(path, encoding='utf-8') as f:
+                report = json.load(f)
+            self.assertEqual(ext_sys, report['run']['ext_sys'])
+            self.assertEqual([ext_sys], list(report['tables']))
+            self.assertIn(f'ext_sys="{ext_sys}"', text)
+            self.assertNotIn(f'ext_sys="{other}"', text)
+
+    def test_failing_job_does_not_kill_scheduler(self):
+        def boom(args):
+            raise RuntimeError('x')
+
+        scheduler = Scheduler(parse_schedules('KOSIS=* * * * *'), boom)
+        scheduler.plan(datetime(2026, 10, 19, 2, 59))
+        with self.assertLogs('scheduler', level='ERROR'):
+            scheduler.run_pending(datetime(2026, 10, 19, 3, 0))
+            scheduler.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Unit tests for single_flight (같은 요청 합치기, 최근 결과 LRU) / KOSIS meta·latest 요청 공유
+"""
+import os
+import sys
+import threading
+import unittest
+from unittest.mock import patch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import single_flight  # noqa: E402
+from single_flight import SingleFlight  # noqa: E402
+
+
+class SingleFlightTests(unittest.TestCase):
+    def test_concurrent_identical_calls_share_one_execution(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {'meta': 1}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do('k', fetch))) for _ in range(5)]
+        for t in threads:
+            t.start()
+        while flight.calls < 5:
+            threading.Event().wait(0.01)
+        release.set()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(shared for _, shared in results), [False, True, True, True, True])
+        self.assertTrue(all(value is results[0][0] for value, _ in results))
+
+    def test_lru_keeps_recent_results(self):
+        flight = SingleFlight(maxsize=2)
+        for key in ('a', 'b', 'a', 'c'):          # c 가 들어오며 가장 오래 안 쓴 b 가 빠짐
+            flight.do(key, lambda key=key: key.upper())
+        self.assertEqual(flight.do('a', lambda: 'new'), ('A', True))
+        self.assertEqual(flight.do('b', lambda: 'new'), ('new', False))
+
+    def test_failure_is_shared_but_not_cached(self):
+        flight = SingleFlight()
+        with self.assertRaises(RuntimeError):
+            flight.do('k', lambda: (_ for _ in ()).throw(RuntimeError('503')))
+        self.assertEqual(flight.do('k', lambda: 'ok'), ('ok', False))
+
+    def test_module_api_is_passthrough_outside_a_run(self):
+        single_flight.finish()
+        calls = []
+        for _ in range(2):
+            single_flight.do('k', lambda: calls.append(1))
+        self.assertEqual(len(calls), 2)
+
+    def test_store_does_not_leak_to_threads_outside_the_run(self):
+        import run_report
+        flight = single_flight.reset()
+        try:
+            seen = {}
+            other = threading.Thread(target=lambda: seen.update(outside=single_flight.do('k', lambda: 1)))
+            other.start()
+            other.join()
+            inherited = threading.Thread(
+                target=run_report.in_context(lambda: seen.update(inside=single_flight.do('k', lambda: 2))))
+            inherited.start()
+            inherited.join()
+        finally:
+            single_flight.finish()
+        self.assertEqual(seen['outside'], (1, False))
+        self.assertEqual(seen['inside'], (2, False))
+        self.assertEqual(flight.calls, 1)
+
+
+class KosisSharedRequestTests(unittest.TestCase):
+    STATS_SRC = {
+        'api_meta_url': '{"url": "https://kosis.kr/meta?apiKey={API_AUTH_KEY}&tblId=T1", "format": "json"}',
+        'api_latest_chn_dt_url': '{"url": "https://kosis.kr/latest?apiKey={API_AUTH_KEY}&tblId=T1", "format": "json"}',
+    }
+
+    def tearDown(self):
+        single_flight.finish()
+
+    def test_meta_and_latest_are_fetched_once_per_run(self):
+        import kosis_api
+
+        single_flight.reset()
+        api_info = {'auth': 'SECRET'}
+        with patch.object(kosis_api, '_http_get', return_value=[{'ok': 1}]) as http_get:
+            for _ in range(3):
+                kosis_api.fetch_kosis_meta(api_info, dict(self.STATS_SRC), {})
+                kosis_api.fetch_kosis_latest(api_info, dict(self.STATS_SRC), {})
+        self.assertEqual([c.args[1] for c in http_get.call_args_list], ['meta', 'latest'])
+
+        single_flight.finish()                     # 다음 실행은 다시 요청
+        with patch.object(kosis_api, '_http_get', return_value=[{'ok': 2}]) as http_get:
+            kosis_api.fetch_kosis_meta(api_info, dict(self.STATS_SRC), {})
+            kosis_api.fetch_kosis_meta(api_info, dict(self.STATS_SRC), {})
+        self.assertEqual(http_get.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Unit tests for table_history (실행 이력 누적, LPT 순서, 워커 수, 신규 통계표 fallback)
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import table_history  # noqa: E402
+from table_history import TableHistory, pool_size, period_cost  # noqa: E402
+
+
+def _report(tables):
+    return {'run': {}, 'stages': {}, 'tables': tables}
+
+
+def _bucket(total_sec, **counters):
+    return dict({'count': 1, 'total_sec': total_sec, 'max_sec': total_sec}, **counters)
+
+
+class TableHistoryTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_record_run_accumulates_ewma_and_skips_errors(self):
+        report_path = os.path.join(self.tmp, 'report.json')
+        for file_sec in (10.0, 20.0):
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(_report({
+                    'T1': {'file.total': _bucket(file_sec), 'file.save_data': _bucket(0.1, bytes=2048)},
+                    'T2': {'file.total': _bucket(5.0, errors=1)},
+                    '_run': {'db.cleanup': _bucket(1.0)},
+                }), f)
+            table_history.record_run('kosis', report_path, history_dir=self.tmp)
+
+        history = table_history.load('KOSIS', history_dir=self.tmp)
+        self.assertEqual(15.0, history.seconds('T1', 'file'))         # 0.5*20 + 0.5*10
+        self.assertEqual(2048, history.tables['T1']['bytes'])
+        self.assertEqual(2, history.tables['T1']['runs'])
+        self.assertIsNone(history.seconds('T2', 'file'))               # 오류 난 실행은 이력에 넣지 않음
+        self.assertNotIn('_run', history.tables)
+        self.assertIsNone(history.seconds('T1', 'db'))
+
+    def test_order_longest_first_with_fallback_calibration(self):
+        history = TableHistory('KOSIS', os.path.join(self.tmp, 'KOSIS.json'), {
+            'SMALL': {'file_sec': 2.0},
+            'BIG': {'file_sec': 60.0},
+        })
+        items = [
+            {'id': 'SMALL', 'years': 1},
+            {'id': 'NEW_HUGE', 'years': 50},   # 이력 없음 -> 1년당 2초 환산 = 100초
+            {'id': 'BIG', 'years': 30},
+            {'id': 'NEW_TINY', 'years': 1},
+        ]
+        ordered, estimates = history.order_longest_first(
+            items, 'file', table_of=lambda i: i['id'], fallback=lambda i: float(i['years']))
+        self.assertEqual(['NEW_HUGE', 'BIG', 'SMALL', 'NEW_TINY'], [i['id'] for i in ordered])
+        self.assertAlmostEqual(100.0, estimates['NEW_HUGE'])
+
+    def test_order_without_history_uses_fallback_units(self):
+        history = TableHistory('KOSIS', os.path.join(self.tmp, 'KOSIS.json'))
+        ordered, _ = history.order_longest_first(
+            ['a', 'b', 'c'], 'db', table_of=str, fallback={'a': 1.0, 'b': 30.0, 'c': 1.0}.get)
+        self.assertEqual(['b', 'a', 'c'], ordered)
+
+    def test_pool_size(self):
+        self.assertEqual(3, pool_size({'giant': 100.0, 'a': 1.0, 'b': 1.0, 'c': 1.0, 'd': 1.0}, 8))
+        self.assertEqual(4, pool_size({str(i): 1.0 for i in range(20)}, 4))
+        self.assertEqual(3, pool_size({'a': 0.0, 'b': 0.0, 'c': 0.0}, 8))
+        self.assertEqual(1, pool_size({}, 4))
+
+    def test_period_cost(self):
+        self.assertEqual(120.0, period_cost({'collect_start_dt': '2015', 'collect_end_dt': '2024', 'periodicity': '월'}))
+        self.assertEqual(40.0, period_cost({'collect_start_dt': '20150101', 'collect_end_dt': '2024', 'periodicity': 'Q'}))
+        self.assertEqual(10.0, period_cost({'collect_start_dt': '2015', 'collect_end_dt': '2024', 'periodicity': '년'}))
+        self.assertEqual(1.0, period_cost({}))
+
+    def test_corrupt_history_is_ignored(self):
+        with open(table_history.history_path('KOSIS', self.tmp), 'w', encoding='utf-8') as f:
+            f.write('{broken')
+        with self.assertLogs('table_history', level='WARNING'):
+            history = table_history.load('KOSIS', history_dir=self.tmp)
+        self.assertEqual({}, history.tables)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,261 @@
+"""
+Unit tests for work_queue (작업자 루프: 재시도·실패·1회 마무리) / mobility 분산 작업 단위 분할
+"""
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import uuid
+from unittest.mock import MagicMock, patch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import work_queue  # noqa: E402
+from sqlalchemy import create_engine, text  # noqa: E402
+from work_queue import WorkUnit, run_worker  # noqa: E402
+
+
+class _MemoryQueue:
+    """WorkQueue 와 같은 인터페이스의 메모리 구현 (PostgreSQL 없이 작업자 루프 검증용)."""
+
+    def __init__(self, units, max_attempts=2):
+        self.lease_sec = 600
+        self.owner = 'test'
+        self.lock = threading.Lock()
+        self.units = {u: {'status': 'pending', 'attempts': 0, 'priority': p} for u, p in units.items()}
+        self.max_attempts = max_attempts
+        self.finalized = 0
+
+    def claim(self):
+        with self.lock:
+            pending = [(k, u) for k, u in self.units.items()
+                       if u['status'] == 'pending' and u['attempts'] < self.max_attempts]
+            if not pending:
+                return None
+            key, unit = max(pending, key=lambda item: item[1]['priority'])
+            unit['status'] = 'running'
+            unit['attempts'] += 1
+            return WorkUnit(key, 'stat', {}, unit['attempts'], self.max_attempts)
+
+    def heartbeat(self, unit_key):
+        return True
+
+    def complete(self, unit_key):
+        with self.lock:
+            self.units[unit_key]['status'] = 'done'
+        return True
+
+    def fail(self, unit_key, error):
+        with self.lock:
+            unit = self.units[unit_key]
+            unit['status'] = 'failed' if unit['attempts'] >= self.max_attempts else 'pending'
+
+    def counts(self):
+        with self.lock:
+            result = {}
+            for unit in self.units.values():
+                result[unit['status']] = result.get(unit['status'], 0) + 1
+            return result
+
+    def try_finalize(self, finalize):
+        with self.lock:
+            if self.finalized or any(u['status'] != 'done' for u in self.units.values()):
+                return False
+            finalize()
+            self.finalized += 1
+            return True
+
+
+class RunWorkerTests(unittest.TestCase):
+    def test_processes_highest_priority_first_and_finalizes_once(self):
+        queue = _MemoryQueue({'a': 1, 'b': 5, 'c': 3})
+        handled = []
+        finalize = MagicMock()
+
+        result = run_worker(queue, lambda unit: handled.append(unit.unit_key), finalize=finalize)
+
+        self.assertEqual(handled, ['b', 'c', 'a'])
+        self.assertEqual(result, {'done': 3, 'failed': 0, 'finalized': True})
+        finalize.assert_called_once_with()
+
+    def test_transient_failure_is_retried(self):
+        queue = _MemoryQueue({'a': 1})
+        calls = []
+
+        def handler(unit):
+            calls.append(unit.attempts)
+            if unit.attempts == 1:
+                raise RuntimeError('timeout')
+
+        result = run_worker(queue, handler, finalize=MagicMock())
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual((result['done'], result['failed'], result['finalized']), (1, 1, True))
+
+    def test_exhausted_unit_blocks_finalize(self):
+        queue = _MemoryQueue({'a': 1, 'b': 2})
+        finalize = MagicMock()
+
+        def handler(unit):
+            if unit.unit_key == 'b':
+                raise RuntimeError('bad table')
+
+        result = run_worker(queue, handler, finalize=finalize)
+        self.assertEqual(queue.units['b']['status'], 'failed')
+        self.assertFalse(result['finalized'])
+        finalize.assert_not_called()
+
+    def test_concurrent_workers_share_units_and_finalize_once(self):
+        queue = _MemoryQueue({f'u{i}': i for i in range(20)})
+        handled = []
+        finalize = MagicMock()
+        threads = [threading.Thread(target=run_worker, args=(queue, lambda u: handled.append(u.unit_key)),
+                                    kwargs={'finalize': finalize}) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sorted(handled), sorted(queue.units))
+        finalize.assert_called_once_with()
+
+    def test_waits_while_other_worker_holds_lease(self):
+        queue = _MemoryQueue({'a': 1})
+        queue.units['a']['status'] = 'running'       # 다른 호스트가 처리 중
+        stop = threading.Event()
+        polls = []
+
+        def wait(timeout):
+            polls.append(timeout)
+            queue.units['a']['status'] = 'done'      # 그 사이 다른 작업자가 완료
+            return False
+
+        stop.wait = wait
+        finalize = MagicMock()
+        result = run_worker(queue, MagicMock(), finalize=finalize, stop_event=stop, idle_poll_sec=7)
+        self.assertEqual(polls, [7])
+        self.assertTrue(result['finalized'])
+
+
+class HeartbeatTests(unittest.TestCase):
+    def test_lost_lease_is_flagged(self):
+        queue = MagicMock(lease_sec=3)
+        queue.heartbeat.return_value = False
+        with work_queue._Heartbeat(queue, 'a') as hb:
+            hb._thread.join(timeout=5)
+        self.assertTrue(hb.lost)
+        queue.heartbeat.assert_called_once_with('a')
+
+
+@unittest.skipUnless(os.getenv('DB_URL'), 'DB_URL 미설정 — PostgreSQL 작업 큐 테스트 생략')
+class PostgresWorkQueueTests(unittest.TestCase):
+    """실제 PostgreSQL 에서 SKIP LOCKED 가져가기·하트비트·리스 만료 이어받기·마무리."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_engine(os.getenv('DB_URL'))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def setUp(self):
+        self.queue = work_queue.WorkQueue(self.engine, f'test:{uuid.uuid4().hex[:12]}', owner='A', lease_sec=60)
+        self.queue.ensure_schema()
+        self.queue.create_run('KOSIS', 'db', [
+            {'unit_key': 'slow', 'kind': 'stat', 'payload': {'stat_tbl_id': 'T1'}, 'priority': 10},
+            {'unit_key': 'fast', 'kind': 'stat', 'priority': 1},
+        ])
+        self.other = self.queue.with_owner('B')
+
+    def tearDown(self):
+        with self.engine.begin() as conn:
+            conn.execute(text(f'DELETE FROM {work_queue.RUN_TABLE} WHERE run_key = :run_key'),
+                         {'run_key': self.queue.run_key})
+
+    def _expire_lease(self, unit_key):
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                f"UPDATE {work_queue.QUEUE_TABLE} SET lease_until = now() - interval '1 second' "
+                f"WHERE run_key = :run_key AND unit_key = :unit_key"
+            ), {'run_key': self.queue.run_key, 'unit_key': unit_key})
+
+    def test_claim_is_exclusive_and_heartbeat_checks_owner(self):
+        unit = self.queue.claim()
+        self.assertEqual((unit.unit_key, unit.payload, unit.attempts), ('slow', {'stat_tbl_id': 'T1'}, 1))
+        self.assertEqual(self.other.claim().unit_key, 'fast')
+        self.assertIsNone(self.other.claim())
+        self.assertTrue(self.queue.heartbeat('slow'))
+        self.assertFalse(self.other.heartbeat('slow'))
+        self.assertEqual(self.queue.counts(), {work_queue.STATUS_RUNNING: 2})
+
+    def test_expired_lease_is_taken_over(self):
+        self.queue.claim()
+        self._expire_lease('slow')
+        self.assertEqual(self.queue.counts().get('expired'), 1)
+        unit = self.other.claim()
+        self.assertEqual((unit.unit_key, unit.attempts), ('slow', 2))
+        self.assertFalse(self.queue.heartbeat('slow'))
+        self.assertFalse(self.queue.complete('slow'))
+        self.assertTrue(self.other.complete('slow'))
+
+    def test_finalize_runs_once_after_commit_and_reopens_on_failure(self):
+        for queue in (self.queue, self.other):
+            queue.complete(queue.claim().unit_key)
+        statuses = []
+
+        def fail():
+            statuses.append(self.queue.run_info()['status'])
+            raise RuntimeError('cleanup failed')
+
+        with self.assertRaises(RuntimeError):
+            self.queue.try_finalize(fail)
+        self.assertEqual(statuses, [work_queue.RUN_FINALIZING])
+        self.assertEqual(self.queue.run_info()['status'], work_queue.RUN_OPEN)
+
+        self.assertTrue(self.other.try_finalize(lambda: None))
+        self.assertFalse(self.queue.try_finalize(lambda: None))
+        info = self.queue.run_info()
+        self.assertEqual((info['status'], info['finalized_by']), (work_queue.RUN_FINALIZED, 'B'))
+
+
+class MobilityUnitPlanTests(unittest.TestCase):
+    def test_gbis_routes_are_batched(self):
+        import mobility_pipeline
+
+        collector = MagicMock()
+        collector.target_route_ids.return_value = list(range(120))
+        with patch.object(mobility_pipeline, '_mobility_collector', return_value=collector):
+            units = mobility_pipeline.plan_mobility_units('GBIS')
+        self.assertEqual([u['unit_key'] for u in units], ['gbis:0000', 'gbis:0001', 'gbis:0002'])
+        self.assertEqual([len(u['payload']['route_ids']) for u in units], [50, 50, 20])
+
+    def test_kowsi_pages_are_split_into_ranges(self):
+        import mobility_pipeline
+
+        collector = MagicMock(max_pages=10)
+        collector.total_pages.return_value = 25
+        with patch.object(mobility_pipeline, '_mobility_collector', return_value=collector):
+            units = mobility_pipeline.plan_mobility_units('KOWSI_FACL')
+        self.assertEqual([(u['payload']['start'], u['payload']['end']) for u in units], [(1, 10), (11, 20), (21, 25)])
+
+    def test_kowsi_unit_scans_its_page_range(self):
+        import mobility_pipeline
+
+        collector = MagicMock()
+        collector.scan_pages.return_value = ([{'wfclt_id': 'X'}], False, 20)
+        collector.enrich_eval.side_effect = lambda rows: rows
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(mobility_pipeline, 'GENERIC_EXT_DATA_ROOT', tmp), \
+                patch.object(mobility_pipeline, '_mobility_collector', return_value=collector):
+            summary = mobility_pipeline.run_mobility_unit(
+                'KOWSI_FACL', 'file', 'kowsi:p00011', 'kowsi_pages', {'start': 11, 'end': 20})
+        collector.scan_pages.assert_called_once_with(11, 20)
+        self.assertEqual(summary['targets'], 1)
+        save_dir = collector.save_response.call_args[0][1]
+        self.assertTrue(save_dir.endswith(os.path.join('units', 'kowsi_p00011')))
+
+
+if __name__ == '__main__':
+    unittest.main()
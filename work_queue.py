@@ -0,0 +1,384 @@
+"""DB 기반 분산 작업 큐 — 여러 호스트가 같은 PostgreSQL 의 작업 단위를 나눠 처리.
+
+작업 단위(통계표 1건, GBIS 노선 묶음, KOWSI 페이지 범위 등)를 sys_batch_work_queue 에 넣고,
+작업자는 ``SELECT ... FOR UPDATE SKIP LOCKED`` 로 한 건씩 가져가 리스(lease)를 잡는다.
+작업 중에는 하트비트 스레드가 리스를 연장하고, 작업자가 죽어 리스가 만료되면 다른 작업자가
+다시 가져간다(attempts 증가, max_attempts 초과 시 failed). 모든 단위가 done 이 되면
+sys_batch_work_run 행을 finalizing 으로 먼저 커밋한 작업자 한 명만 마무리 작업(동기화 시각
+갱신·cleanup)을 실행하고 finalized 로 바꾼다.
+
+    queue = WorkQueue(get_engine(), 'KOSIS:20261019')
+    queue.ensure_schema()
+    queue.create_run('KOSIS', 'db', units)                  # 멱등 (이미 있는 단위는 유지)
+    run_worker(queue, handler, finalize=finalize_fn)        # 호스트마다 1개 이상
+
+테이블은 처음 쓸 때 CREATE TABLE IF NOT EXISTS 로 만든다 (앱 계정에 public 스키마 CREATE 권한 필요).
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+RUN_TABLE = 'sys_batch_work_run'
+QUEUE_TABLE = 'sys_batch_work_queue'
+
+STATUS_PENDING = 'pending'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+RUN_OPEN = 'open'
+RUN_FINALIZING = 'finalizing'
+RUN_FINALIZED = 'finalized'
+
+DEFAULT_LEASE_SEC = 600
+DEFAULT_MAX_ATTEMPTS = 3
+IDLE_POLL_SEC = 10.0
+
+_DDL = (
+    f"""
+    CREATE TABLE IF NOT EXISTS {RUN_TABLE} (
+        run_key      varchar(100) PRIMARY KEY,
+        ext_sys      varchar(50)  NOT NULL,
+        mode         varchar(10)  NOT NULL,
+        status       varchar(20)  NOT NULL DEFAULT '{RUN_OPEN}',
+        created_at   timestamptz  NOT NULL DEFAULT now(),
+        finalized_by varchar(200),
+        finalized_at timestamptz,
+        finalize_until timestamptz
+    )
+    """,
+    # finalize_until 이전에 만든 테이블 보정
+    f"ALTER TABLE {RUN_TABLE} ADD COLUMN IF NOT EXISTS finalize_until timestamptz",
+    f"""
+    CREATE TABLE IF NOT EXISTS {QUEUE_TABLE} (
+        run_key      varchar(100) NOT NULL REFERENCES {RUN_TABLE}(run_key) ON DELETE CASCADE,
+        unit_key     varchar(200) NOT NULL,
+        kind         varchar(30)  NOT NULL,
+        payload      jsonb        NOT NULL DEFAULT '{{}}'::jsonb,
+        priority     double precision NOT NULL DEFAULT 0,
+        status       varchar(20)  NOT NULL DEFAULT '{STATUS_PENDING}',
+        attempts     integer      NOT NULL DEFAULT 0,
+        max_attempts integer      NOT NULL DEFAULT {DEFAULT_MAX_ATTEMPTS},
+        lease_owner  varchar(200),
+        lease_until  timestamptz,
+        heartbeat_at timestamptz,
+        last_error   text,
+        created_at   timestamptz  NOT NULL DEFAULT now(),
+        updated_at   timestamptz  NOT NULL DEFAULT now(),
+        PRIMARY KEY (run_key, unit_key)
+    )
+    """,
+    f"CREATE INDEX IF NOT EXISTS idx_{QUEUE_TABLE}_claim ON {QUEUE_TABLE} (run_key, status, priority DESC)",
+)
+
+# 남은 시도가 있는 pending 또는 리스가 만료된 running 중 우선순위(예상 소요 시간)가 가장 높은 1건
+_CLAIM_SQL = f"""
+    WITH next AS (
+        SELECT run_key, unit_key FROM {QUEUE_TABLE}
+        WHERE run_key = :run_key AND attempts < max_attempts
+          AND (status = '{STATUS_PENDING}' OR (status = '{STATUS_RUNNING}' AND lease_until < now()))
+        ORDER BY priority DESC, unit_key
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE {QUEUE_TABLE} q
+    SET status = '{STATUS_RUNNING}', attempts = q.attempts + 1, lease_owner = :owner,
+        lease_until = now() + make_interval(secs => :lease_sec), heartbeat_at = now(), updated_at = now()
+    FROM next
+    WHERE q.run_key = next.run_key AND q.unit_key = next.unit_key
+    RETURNING q.unit_key, q.kind, q.payload, q.attempts, q.max_attempts
+"""
+
+
+def default_owner() -> str:
+    """작업자 식별자 <호스트>:<pid>:<스레드>."""
+    return f'{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}'
+
+
+class WorkUnit:
+    __slots__ = ('unit_key', 'kind', 'payload', 'attempts', 'max_attempts')
+
+    def __init__(self, unit_key, kind, payload=None, attempts=0, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.unit_key = unit_key
+        self.kind = kind
+        self.payload = payload or {}
+        self.attempts = attempts
+        self.max_attempts = max_attempts
+
+    def __repr__(self):
+        return f'WorkUnit({self.unit_key!r}, attempt {self.attempts}/{self.max_attempts})'
+
+
+class WorkQueue:
+    """run_key 1개(분산 실행 1회)의 작업 단위 큐."""
+
+    def __init__(self, engine, run_key: str, owner: Optional[str] = None,
+                 lease_sec: int = DEFAULT_LEASE_SEC, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        if engine is None:
+            raise RuntimeError('DB engine not configured (DB_URL)')
+        self.engine = engine
+        self.run_key = run_key
+        self.owner = owner or default_owner()
+        self.lease_sec = lease_sec
+        self.max_attempts = max_attempts
+
+    def with_owner(self, owner: str) -> 'WorkQueue':
+        """같은 큐를 다른 작업자 이름으로 (프로세스 안 작업자 스레드별)."""
+        return WorkQueue(self.engine, self.run_key, owner, self.lease_sec, self.max_attempts)
+
+    # --- 준비 ----------------------------------------------------------------
+    def ensure_schema(self) -> None:
+        with self.engine.begin() as conn:
+            for ddl in _DDL:
+                conn.execute(text(ddl))
+
+    def create_run(self, ext_sys: str, mode: str, units) -> int:
+        """실행 + 작업 단위 등록 (이미 있는 run_key/unit_key 는 그대로 둔다). 반환: 새로 넣은 단위 수."""
+        inserted = 0
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                f"INSERT INTO {RUN_TABLE} (run_key, ext_sys, mode) VALUES (:run_key, :ext_sys, :mode) "
+                f"ON CONFLICT (run_key) DO NOTHING"
+            ), {'run_key': self.run_key, 'ext_sys': ext_sys, 'mode': mode})
+            for unit in units:
+                result = conn.execute(text(
+                    f"INSERT INTO {QUEUE_TABLE} (run_key, unit_key, kind, payload, priority, max_attempts) "
+                    f"VALUES (:run_key, :unit_key, :kind, CAST(:payload AS jsonb), :priority, :max_attempts) "
+                    f"ON CONFLICT (run_key, unit_key) DO NOTHING"
+                ), {
+                    'run_key': self.run_key, 'unit_key': unit['unit_key'], 'kind': unit['kind'],
+                    'payload': json.dumps(unit.get('payload') or {}, ensure_ascii=False),
+                    'priority': unit.get('priority') or 0, 'max_attempts': self.max_attempts,
+                })
+                inserted += result.rowcount
+        return inserted
+
+    def run_info(self) -> Optional[dict]:
+        with self.engine.connect() as conn:
+            row = conn.execute(text(
+                f"SELECT run_key, ext_sys, mode, status, finalized_by, finalized_at FROM {RUN_TABLE} "
+                f"WHERE run_key = :run_key"
+            ), {'run_key': self.run_key}).fetchone()
+        return dict(row._mapping) if row else None
+
+    # --- 작업자 ----------------------------------------------------------------
+    def claim(self) -> Optional[WorkUnit]:
+        """다음 작업 단위 1건을 리스와 함께 가져온다. 없으면 None."""
+        with self.engine.begin() as conn:
+            # 시도 횟수를 다 쓴 채 리스가 만료된 단위는 failed 로 정리
+            conn.execute(text(
+                f"UPDATE {QUEUE_TABLE} SET status = '{STATUS_FAILED}', updated_at = now(), "
+                f"last_error = coalesce(last_error, 'lease expired') "
+                f"WHERE run_key = :run_key AND status = '{STATUS_RUNNING}' AND lease_until < now() "
+                f"AND attempts >= max_attempts"
+            ), {'run_key': self.run_key})
+            row = conn.execute(text(_CLAIM_SQL), {
+                'run_key': self.run_key, 'owner': self.owner, 'lease_sec': self.lease_sec,
+            }).fetchone()
+        if row is None:
+            return None
+        payload = row.payload if isinstance(row.payload, dict) else json.loads(row.payload or '{}')
+        return WorkUnit(row.unit_key, row.kind, payload, row.attempts, row.max_attempts)
+
+    def heartbeat(self, unit_key: str) -> bool:
+        """리스 연장. 리스를 잃었으면(만료 후 다른 작업자가 가져감) False."""
+        with self.engine.begin() as conn:
+            result = conn.execute(text(
+                f"UPDATE {QUEUE_TABLE} SET lease_until = now() + make_interval(secs => :lease_sec), "
+                f"heartbeat_at = now() "
+                f"WHERE run_key = :run_key AND unit_key = :unit_key AND lease_owner = :owner "
+                f"AND status = '{STATUS_RUNNING}'"
+            ), {'run_key': self.run_key, 'unit_key': unit_key, 'owner': self.owner, 'lease_sec': self.lease_sec})
+        return result.rowcount == 1
+
+    def complete(self, unit_key: str) -> bool:
+        with self.engine.begin() as conn:
+            result = conn.execute(text(
+                f"UPDATE {QUEUE_TABLE} SET status = '{STATUS_DONE}', lease_until = NULL, last_error = NULL, "
+                f"updated_at = now() "
+                f"WHERE run_key = :run_key AND unit_key = :unit_key AND lease_owner = :owner "
+                f"AND status = '{STATUS_RUNNING}'"
+            ), {'run_key': self.run_key, 'unit_key': unit_key, 'owner': self.owner})
+        if result.rowcount != 1:
+            logger.warning('work queue: %s 완료 기록 실패 — 리스를 잃음 (다른 작업자가 재시도 중)', unit_key)
+        return result.rowcount == 1
+
+    def fail(self, unit_key: str, error) -> None:
+        """실패 기록. 남은 시도가 있으면 pending 으로 되돌려 다른 작업자도 가져갈 수 있게 한다."""
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                f"UPDATE {QUEUE_TABLE} SET lease_until = NULL, updated_at = now(), last_error = :error, "
+                f"status = CASE WHEN attempts >= max_attempts THEN '{STATUS_FAILED}' ELSE '{STATUS_PENDING}' END "
+                f"WHERE run_key = :run_key AND unit_key = :unit_key AND lease_owner = :owner "
+                f"AND status = '{STATUS_RUNNING}'"
+            ), {'run_key': self.run_key, 'unit_key': unit_key, 'owner': self.owner, 'error': str(error)[:2000]})
+
+    def counts(self) -> dict:
+        """{status: 단위 수} (리스가 만료된 running 은 'expired' 로 따로 센다)."""
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(
+                f"SELECT CASE WHEN status = '{STATUS_RUNNING}' AND lease_until < now() THEN 'expired' "
+                f"ELSE status END AS status, count(*) AS n "
+                f"FROM {QUEUE_TABLE} WHERE run_key = :run_key GROUP BY 1"
+            ), {'run_key': self.run_key}).fetchall()
+        return {row.status: row.n for row in rows}
+
+    def failed_units(self) -> list:
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(
+                f"SELECT unit_key, attempts, last_error FROM {QUEUE_TABLE} "
+                f"WHERE run_key = :run_key AND status = '{STATUS_FAILED}' ORDER BY unit_key"
+            ), {'run_key': self.run_key}).fetchall()
+        return [dict(row._mapping) for row in rows]
+
+    def retry_failed(self) -> int:
+        """failed 단위를 시도 횟수 0 으로 되돌린다 (원인 조치 후 재실행용)."""
+        with self.engine.begin() as conn:
+            result = conn.execute(text(
+                f"UPDATE {QUEUE_TABLE} SET status = '{STATUS_PENDING}', attempts = 0, lease_owner = NULL, "
+                f"lease_until = NULL, updated_at = now() "
+                f"WHERE run_key = :run_key AND status = '{STATUS_FAILED}'"
+            ), {'run_key': self.run_key})
+        return result.rowcount
+
+    def try_finalize(self, finalize: Callable[[], None]) -> bool:
+        """모든 단위가 done 이면 finalize() 를 이 작업자만 실행. 반환: 실행했으면 True.
+
+        실행 행을 FOR UPDATE SKIP LOCKED 로 잠가 finalizing(+ 리스) 으로 바꾸고 바로 커밋한 뒤
+        트랜잭션 밖에서 finalize() 를 실행하고 finalized 로 바꾼다. 긴 cleanup 동안 행 잠금이나
+        DB 연결을 잡고 있지 않고, finalize() 가 실패하면 open 으로 되돌려 다음 작업자가 재시도한다.
+        마무리하던 작업자가 죽으면 리스가 만료된 뒤 다른 작업자가 이어받으므로 finalize() 는 다시
+        실행돼도 결과가 같아야 한다(동기화 시각 갱신·cleanup 은 그렇다).
+        """
+        if not self._claim_finalize():
+            return False
+        try:
+            with _Heartbeat(self, RUN_FINALIZING, beat=self._extend_finalize):
+                finalize()
+        except BaseException:
+            self._release_finalize(RUN_OPEN)
+            raise
+        if not self._release_finalize(RUN_FINALIZED):
+            logger.warning('work queue: %s 마무리 기록 실패 — 리스를 잃음 (다른 작업자가 다시 마무리)', self.run_key)
+        logger.info('work queue: %s 마무리 완료 (by %s)', self.run_key, self.owner)
+        return True
+
+    def _claim_finalize(self) -> bool:
+        with self.engine.begin() as conn:
+            run = conn.execute(text(
+                f"SELECT status, finalize_until < now() AS expired FROM {RUN_TABLE} "
+                f"WHERE run_key = :run_key FOR UPDATE SKIP LOCKED"
+            ), {'run_key': self.run_key}).fetchone()
+            if run is None or not (run.status == RUN_OPEN or (run.status == RUN_FINALIZING and run.expired)):
+                return False
+            remaining = conn.execute(text(
+                f"SELECT count(*) FROM {QUEUE_TABLE} WHERE run_key = :run_key AND status <> '{STATUS_DONE}'"
+            ), {'run_key': self.run_key}).scalar()
+            if remaining:
+                return False
+            if run.status == RUN_FINALIZING:
+                logger.warning('work queue: %s 마무리 리스 만료 — 이어서 마무리', self.run_key)
+            conn.execute(text(
+                f"UPDATE {RUN_TABLE} SET status = '{RUN_FINALIZING}', finalized_by = :owner, "
+                f"finalize_until = now() + make_interval(secs => :lease_sec) WHERE run_key = :run_key"
+            ), {'run_key': self.run_key, 'owner': self.owner, 'lease_sec': self.lease_sec})
+        return True
+
+    def _extend_finalize(self) -> bool:
+        with self.engine.begin() as conn:
+            result = conn.execute(text(
+                f"UPDATE {RUN_TABLE} SET finalize_until = now() + make_interval(secs => :lease_sec) "
+                f"WHERE run_key = :run_key AND status = '{RUN_FINALIZING}' AND finalized_by = :owner"
+            ), {'run_key': self.run_key, 'owner': self.owner, 'lease_sec': self.lease_sec})
+        return result.rowcount == 1
+
+    def _release_finalize(self, status: str) -> bool:
+        """finalizing 을 status(finalized / open) 로. 리스를 잃었으면 False."""
+        with self.engine.begin() as conn:
+            result = conn.execute(text(
+                f"UPDATE {RUN_TABLE} SET status = :status, finalize_until = NULL, "
+                f"finalized_by = CASE WHEN :status = '{RUN_FINALIZED}' THEN finalized_by END, "
+                f"finalized_at = CASE WHEN :status = '{RUN_FINALIZED}' THEN now() END "
+                f"WHERE run_key = :run_key AND status = '{RUN_FINALIZING}' AND finalized_by = :owner"
+            ), {'run_key': self.run_key, 'owner': self.owner, 'status': status})
+        return result.rowcount == 1
+
+
+class _Heartbeat:
+    """작업 단위(또는 마무리) 처리 중 lease_sec/3 마다 리스를 연장하는 백그라운드 스레드."""
+
+    def __init__(self, queue, unit_key: str, beat: Optional[Callable[[], bool]] = None):
+        self.queue = queue
+        self.unit_key = unit_key
+        self.beat = beat or (lambda: queue.heartbeat(unit_key))
+        self.interval = max(1.0, queue.lease_sec / 3)
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f'heartbeat-{unit_key}', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                if not self.beat():
+                    self.lost = True
+                    logger.warning('work queue: %s 리스를 잃었습니다', self.unit_key)
+                    return
+            except Exception as e:  # 일시적 DB 단절 — 다음 주기에 재시도
+                logger.warning('work queue: %s 하트비트 실패: %s', self.unit_key, e)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_worker(queue, handler: Callable[[WorkUnit], None], finalize: Optional[Callable[[], None]] = None,
+               stop_event: Optional[threading.Event] = None, idle_poll_sec: float = IDLE_POLL_SEC) -> dict:
+    """단위를 가져와 handler(unit) 로 처리하는 작업자 루프.
+
+    가져올 단위가 없으면 다른 작업자가 처리 중인(리스 유효) 단위가 남아 있는 동안
+    idle_poll_sec 마다 다시 확인하고(그 작업자가 죽으면 리스 만료 후 이어받음),
+    남은 단위가 없으면 try_finalize(finalize) 후 종료한다.
+    반환: {'done': n, 'failed': n, 'finalized': bool}
+    """
+    result = {'done': 0, 'failed': 0, 'finalized': False}
+    stop_event = stop_event or threading.Event()
+    while not stop_event.is_set():
+        unit = queue.claim()
+        if unit is None:
+            counts = queue.counts()
+            if counts.get(STATUS_PENDING) or counts.get(STATUS_RUNNING) or counts.get('expired'):
+                stop_event.wait(idle_poll_sec)
+                continue
+            break
+        logger.info('work queue: %s 처리 시작 (%s, 시도 %d/%d)', unit.unit_key, queue.owner,
+                    unit.attempts, unit.max_attempts)
+        started = time.perf_counter()
+        try:
+            with _Heartbeat(queue, unit.unit_key):
+                handler(unit)
+        except Exception as e:
+            logger.error('work queue: %s 실패 (시도 %d/%d): %s', unit.unit_key, unit.attempts,
+                         unit.max_attempts, e, exc_info=True)
+            queue.fail(unit.unit_key, e)
+            result['failed'] += 1
+            continue
+        if queue.complete(unit.unit_key):
+            result['done'] += 1
+            logger.info('work queue: %s 완료 (%.1fs)', unit.unit_key, time.perf_counter() - started)
+    if finalize is not None and not stop_event.is_set():
+        result['finalized'] = queue.try_finalize(finalize)
+    return result